@@ -0,0 +1,77 @@
+"""Command line entry point: `python -m benchmarks --help`."""
+
+import argparse
+import sys
+
+from benchmarks import cases, generators, runner
+
+
+def main(_argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the honeybee-ph hot paths on synthetic models, and compare against a baseline.",
+    )
+    parser.add_argument("--size", default="small", choices=sorted(generators.SIZES), help="The model size.")
+    parser.add_argument("--only", default="", help="Comma-separated names of the benchmarks to run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs of each benchmark.")
+    parser.add_argument("--warmup", type=int, default=1, help="Number of un-timed runs before timing.")
+    parser.add_argument("--output", help="Write the results to this JSON file (e.g. to record a new baseline).")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare the results against this baseline file.")
+    parser.add_argument(
+        "--current",
+        metavar="RESULTS",
+        help="With --compare, compare this existing results file instead of running the benchmarks.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=runner.DEFAULT_THRESHOLD,
+        help="Fractional slow-down flagged as a regression. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--metric",
+        default=runner.DEFAULT_METRIC,
+        choices=("min_s", "median_s", "mean_s"),
+        help="The timing statistic compared. Default: %(default)s",
+    )
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit.")
+    args = parser.parse_args(_argv)
+
+    if args.list:
+        for benchmark in cases.BENCHMARKS:
+            print("{:<22} {}".format(benchmark.name, benchmark.description))
+        return 0
+
+    if args.current:
+        if not args.compare:
+            parser.error("--current can only be used with --compare")
+        results = runner.load_results(args.current)
+    else:
+        names = [n.strip() for n in args.only.split(",") if n.strip()]
+        results = runner.run_benchmarks(args.size, names, args.repeat, args.warmup, _progress=runner._print_progress)
+        print(runner.format_results(results))
+
+    if args.output:
+        runner.write_results(results, args.output)
+        print("Results written to: {}".format(args.output))
+
+    if not args.compare:
+        return 0
+
+    baseline = runner.load_results(args.compare)
+    rows = runner.compare_results(baseline, results, args.threshold, args.metric)
+    print("")
+    print(runner.format_comparison(rows, baseline, results))
+
+    failed = runner.regressions(rows)
+    if failed:
+        print("")
+        print(
+            "{} regression(s) beyond {:.0%}: {}".format(len(failed), args.threshold, ", ".join(r.name for r in failed))
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""The benchmark cases: one per Honeybee-PH hot path used by the batch pipelines.
+
+Each case has a `setup` function, which builds its inputs and is not timed, and a
+`run` function, which is the code being timed. `run` is called several times on
+the same inputs, so it must not depend on the inputs being un-modified.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from honeybee.model import Model
+from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
+
+from benchmarks import generators
+from honeybee_energy_ph.dwellings import group_rooms_by_dwelling, total_dwelling_count
+from honeybee_energy_ph.load import phius_residential
+from honeybee_energy_ph.load.phius_mf import PhiusMFWorkbookData
+from honeybee_ph import ph_pickle
+from honeybee_ph._epw import convert_epw
+from honeybee_ph.properties.room import RoomPhProperties
+from honeybee_ph_standards.sourcefactors import factors, phius_CO2_factors, phius_source_energy_factors
+from honeybee_ph_utils.face_tools import group_hb_faces
+from honeybee_phhvac.properties.room import RoomPhHvacProperties
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A single named benchmark case.
+
+    Attributes:
+        name (str): The unique name of the case, used as its key in the results file.
+        description (str): A short description of what is being timed.
+        setup (Callable[[ModelSize, str], Any]): Builds the inputs, given the size and a scratch folder.
+        run (Callable[[Any], Any]): The timed code, given the output of `setup`.
+    """
+
+    name: str
+    description: str
+    setup: Callable[[generators.ModelSize, str], Any]
+    run: Callable[[Any], Any]
+
+
+def _model(_size, _folder):
+    return generators.synthetic_model(_size)
+
+
+# -----------------------------------------------------------------------------
+# -- HBJSON
+
+
+def _setup_hbjson_read(_size, _folder):
+    path = os.path.join(_folder, "benchmark_model.hbjson")
+    with open(path, "w") as f:
+        json.dump(generators.synthetic_model(_size).to_dict(), f)
+    return path
+
+
+def _run_hbjson_read(_path):
+    return Model.from_hbjson(_path)
+
+
+def _run_hbjson_write(_model):
+    return json.dumps(_model.to_dict())
+
+
+def _run_hbjson_round_trip(_model):
+    return Model.from_dict(json.loads(json.dumps(_model.to_dict())))
+
+
+# -----------------------------------------------------------------------------
+# -- PH object graphs
+
+
+def _setup_ph_graph(_size, _folder):
+    model = generators.synthetic_model(_size)
+    return model, [(rm.properties.ph, rm.properties.ph_hvac) for rm in model.rooms]
+
+
+def _run_ph_graph_json_round_trip(_inputs):
+    model, room_props = _inputs
+    data = json.dumps([(ph.to_dict()["ph"], ph_hvac.to_dict()["ph_hvac"]) for ph, ph_hvac in room_props])
+    return [
+        (RoomPhProperties.from_dict(ph, rm), RoomPhHvacProperties.from_dict(ph_hvac, rm))
+        for rm, (ph, ph_hvac) in zip(model.rooms, json.loads(data))
+    ]
+
+
+def _run_ph_graph_pickle_round_trip(_inputs):
+    model, room_props = _inputs
+    return ph_pickle.loads(ph_pickle.dumps(room_props), model)
+
+
+# -----------------------------------------------------------------------------
+# -- Duplication and transforms
+
+
+def _run_duplicate(_model):
+    return _model.duplicate()
+
+
+def _run_transforms(_model):
+    # -- Each transform is followed by its inverse so the inputs do not drift between runs
+    origin = Point3D(0, 0, 0)
+    _model.move(Vector3D(1, 2, 3))
+    _model.move(Vector3D(-1, -2, -3))
+    _model.rotate_xy(30, origin)
+    _model.rotate_xy(-30, origin)
+    _model.scale(2.0, origin)
+    _model.scale(0.5, origin)
+    return _model
+
+
+# -----------------------------------------------------------------------------
+# -- Geometry
+
+
+def _setup_face_grouping(_size, _folder):
+    model = generators.synthetic_model(_size)
+    return [face for room in model.rooms for face in room.faces], model.tolerance, model.angle_tolerance
+
+
+def _run_face_grouping(_inputs):
+    faces, tolerance, angle_tolerance = _inputs
+    return group_hb_faces(faces, tolerance, angle_tolerance)
+
+
+# -----------------------------------------------------------------------------
+# -- Climate
+
+
+def _setup_epw(_size, _folder):
+    return generators.write_synthetic_epw(os.path.join(_folder, "benchmark.epw"))
+
+
+def _run_epw_conversion(_path):
+    result = convert_epw(_path)
+    if result.issues:
+        raise RuntimeError("EPW conversion failed: {}".format(result.issues))
+    return result
+
+
+# -----------------------------------------------------------------------------
+# -- Loads
+
+
+def _run_dwelling_grouping(_model):
+    return group_rooms_by_dwelling(_model.rooms), total_dwelling_count(_model.rooms)
+
+
+def _run_phius_mf(_model):
+    return PhiusMFWorkbookData.from_hb_model(_model)
+
+
+# -- The number of dwelling variants in the Phius residential load cases (independent of the model size)
+PHIUS_RESIDENTIAL_ROWS = 100000
+
+
+def _setup_phius_residential(_size, _folder):
+    rows = range(PHIUS_RESIDENTIAL_ROWS)
+    bedrooms = [i % 6 for i in rows]
+    areas = [400.0 + (i % 3000) * 1.25 for i in rows]
+    dwellings = [1 + i % 4 for i in rows]
+    return bedrooms, areas, dwellings
+
+
+def _run_phius_residential_scalar(_inputs):
+    bedrooms, areas, dwellings = _inputs
+    return [
+        (
+            phius_residential.misc_electrical(b, a, d),
+            phius_residential.lighting_interior(a, 1.0, d),
+            phius_residential.lighting_exterior(a, 1.0, d),
+            phius_residential.lighting_garage(1.0, d),
+        )
+        for b, a, d in zip(bedrooms, areas, dwellings)
+    ]
+
+
+def _run_phius_residential_batch(_inputs):
+    bedrooms, areas, dwellings = _inputs
+    return (
+        phius_residential.misc_electrical_array(bedrooms, areas, dwellings),
+        phius_residential.lighting_interior_array(areas, 1.0, dwellings),
+        phius_residential.lighting_exterior_array(areas, 1.0, dwellings),
+        phius_residential.lighting_garage_array(1.0, dwellings),
+    )
+
+
+# -----------------------------------------------------------------------------
+# -- Source energy and CO2e
+
+
+# -- The number of rows (ie: rooms) in the source-factor cases (independent of the model size)
+SOURCE_FACTOR_ROWS = 100000
+
+
+def _setup_source_factors(_size, _folder):
+    source_energy_factors = factors.FactorCollection(
+        "Source_Energy", factors.build_factors_from_library(phius_source_energy_factors.factors_2024)
+    )
+    co2e_factors = factors.FactorCollection("CO2", factors.build_factors_from_library(phius_CO2_factors.factors_2024))
+    rows = range(SOURCE_FACTOR_ROWS)
+    energy_table = {
+        "Electricity Mix": [1000.0 + (i % 500) for i in rows],
+        "Natural Gas": [2000.0 + (i % 700) for i in rows],
+        "Wood": [float(i % 3) * 100.0 for i in rows],
+    }
+    return energy_table, source_energy_factors, co2e_factors
+
+
+def _run_source_factors_scalar(_inputs):
+    energy_table, source_energy_factors, co2e_factors = _inputs
+    fuel_names = list(energy_table.keys())
+    results = []
+    for i in range(SOURCE_FACTOR_ROWS):
+        source_energy = 0.0
+        co2e = 0.0
+        for fuel_name in fuel_names:
+            energy = energy_table[fuel_name][i]
+            source_energy += energy * source_energy_factors.get_value(fuel_name)
+            co2e += energy * co2e_factors.get_value(fuel_name)
+        results.append((source_energy, co2e))
+    return results
+
+
+def _run_source_factors_table(_inputs):
+    return factors.convert_energy_table(*_inputs)
+
+
+BENCHMARKS = [
+    Benchmark("model_build", "Build the synthetic model", lambda size, folder: size, generators.synthetic_model),
+    Benchmark("hbjson_write", "Model.to_dict() + json.dumps()", _model, _run_hbjson_write),
+    Benchmark("hbjson_read", "Model.from_hbjson()", _setup_hbjson_read, _run_hbjson_read),
+    Benchmark("hbjson_round_trip", "to_dict -> JSON -> from_dict", _model, _run_hbjson_round_trip),
+    Benchmark(
+        "ph_graph_json_round_trip",
+        "Room .ph / .ph_hvac to_dict -> JSON -> from_dict",
+        _setup_ph_graph,
+        _run_ph_graph_json_round_trip,
+    ),
+    Benchmark(
+        "ph_graph_pickle_round_trip",
+        "Room .ph / .ph_hvac ph_pickle.dumps -> loads",
+        _setup_ph_graph,
+        _run_ph_graph_pickle_round_trip,
+    ),
+    Benchmark("model_duplicate", "Model.duplicate()", _model, _run_duplicate),
+    Benchmark("model_transforms", "move, rotate_xy and scale (and back)", _model, _run_transforms),
+    Benchmark("face_grouping", "group_hb_faces() on all room faces", _setup_face_grouping, _run_face_grouping),
+    Benchmark("epw_conversion", "convert_epw() on a synthetic EPW", _setup_epw, _run_epw_conversion),
+    Benchmark(
+        "dwelling_grouping", "group_rooms_by_dwelling() + total_dwelling_count()", _model, _run_dwelling_grouping
+    ),
+    Benchmark("phius_mf", "PhiusMFWorkbookData.from_hb_model()", _model, _run_phius_mf),
+    Benchmark(
+        "phius_residential_scalar",
+        "Phius residential loads, scalar functions, 100k rows",
+        _setup_phius_residential,
+        _run_phius_residential_scalar,
+    ),
+    Benchmark(
+        "phius_residential_batch",
+        "Phius residential loads, *_array functions, 100k rows",
+        _setup_phius_residential,
+        _run_phius_residential_batch,
+    ),
+    Benchmark(
+        "source_factors_scalar",
+        "Source energy / CO2e, FactorCollection.get_value per row and fuel, 100k rows",
+        _setup_source_factors,
+        _run_source_factors_scalar,
+    ),
+    Benchmark(
+        "source_factors_table",
+        "Source energy / CO2e, convert_energy_table(), 100k rows",
+        _setup_source_factors,
+        _run_source_factors_table,
+    ),
+]  # type: List[Benchmark]
+
+
+def benchmark_by_name():
+    # type: () -> Dict[str, Benchmark]
+    """Return a dict of all the BENCHMARKS, keyed by their name."""
+    return {b.name: b for b in BENCHMARKS}
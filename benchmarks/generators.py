@@ -0,0 +1,318 @@
+"""Synthetic Honeybee-PH model and EPW generators used by the benchmark cases.
+
+Every generator is deterministic: the same size parameters always produce the same
+geometry, loads and PH-property layout (identifiers are the only random values) so
+that timings recorded on one run can be compared against another.
+"""
+
+import os
+from dataclasses import asdict, dataclass, replace
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee_energy.construction.window import WindowConstruction
+from honeybee_energy.lib.programtypes import office_program
+from honeybee_energy.load.people import People
+from honeybee_energy.material.glazing import EnergyWindowMaterialSimpleGlazSys
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.datacollection import MonthlyCollection
+from ladybug.datatype.temperature import GroundTemperature
+from ladybug.epw import EPW
+from ladybug.header import Header
+from ladybug.location import Location
+from ladybug_geometry.geometry3d.face import Face3D
+from ladybug_geometry.geometry3d.pointvector import Point3D
+from ladybug_geometry.geometry3d.polyline import LineSegment3D
+
+from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge
+from honeybee_energy_ph.construction.window import PhWindowFrame, PhWindowGlazing
+from honeybee_energy_ph.properties.load.people import PhDwellings
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_ph.space import Space, SpaceFloor, SpaceFloorSegment, SpaceVolume
+from honeybee_phhvac.ducting import PhDuctElement, PhDuctSegment
+from honeybee_phhvac.hot_water_piping import PhHvacPipeBranch, PhHvacPipeElement, PhHvacPipeSegment, PhHvacPipeTrunk
+from honeybee_phhvac.hot_water_system import PhHotWaterSystem
+from honeybee_phhvac.ventilation import PhVentilationSystem, Ventilator
+
+ROOM_WIDTH = 6.0
+ROOM_DEPTH = 8.0
+ROOM_HEIGHT = 3.0
+
+
+@dataclass(frozen=True)
+class ModelSize:
+    """The size parameters for a synthetic model.
+
+    Attributes:
+        rooms (int): Total number of HB-Rooms.
+        stories (int): Number of stories the rooms are spread over.
+        spaces_per_room (int): Number of PH-Spaces in each room.
+        bldg_segments (int): Number of shared BldgSegments the rooms are spread over.
+        thermal_bridges_per_segment (int): Number of thermal bridges on each BldgSegment.
+        apertures_per_wall (int): Number of apertures on each exterior wall.
+        nonres_room_every (int): Every Nth room is non-residential (0 for none).
+        dhw_branches (int): Number of branches on each DHW trunk.
+        dhw_twigs (int): Number of fixture (twig) pipes on each DHW branch.
+        dhw_segments (int): Number of segments in each DHW pipe element (the tree 'depth').
+        duct_segments (int): Number of segments in each supply and exhaust duct.
+    """
+
+    rooms: int = 20
+    stories: int = 2
+    spaces_per_room: int = 3
+    bldg_segments: int = 2
+    thermal_bridges_per_segment: int = 10
+    apertures_per_wall: int = 3
+    nonres_room_every: int = 5
+    dhw_branches: int = 4
+    dhw_twigs: int = 4
+    dhw_segments: int = 3
+    duct_segments: int = 10
+
+    def to_dict(self):
+        return asdict(self)
+
+
+SIZES = {
+    "small": ModelSize(),
+    "medium": ModelSize(rooms=100, stories=5, bldg_segments=4, dhw_branches=10, duct_segments=40),
+    "large": ModelSize(
+        rooms=400,
+        stories=10,
+        spaces_per_room=4,
+        bldg_segments=8,
+        thermal_bridges_per_segment=40,
+        apertures_per_wall=6,
+        dhw_branches=20,
+        dhw_twigs=6,
+        dhw_segments=5,
+        duct_segments=100,
+    ),
+}
+
+
+def model_size(_name, **overrides):
+    # type: (str, **int) -> ModelSize
+    """Return one of the named SIZES, with any of its parameters overridden."""
+    try:
+        return replace(SIZES[_name], **overrides)
+    except KeyError:
+        raise ValueError("Unknown size '{}'. Valid sizes are: {}".format(_name, sorted(SIZES)))
+
+
+# -----------------------------------------------------------------------------
+# -- Building blocks
+
+
+def _line(_x, _y, _z, _length, _axis=0):
+    # type: (float, float, float, float, int) -> LineSegment3D
+    end = [_x, _y, _z]
+    end[_axis] += _length
+    return LineSegment3D.from_end_points(Point3D(_x, _y, _z), Point3D(*end))
+
+
+def bldg_segment(_name, _num_thermal_bridges):
+    # type: (str, int) -> BldgSegment
+    """Return a new BldgSegment with the specified number of thermal bridges."""
+    segment = BldgSegment()
+    segment.display_name = _name
+    for i in range(_num_thermal_bridges):
+        tb = PhThermalBridge("{}_TB_{}".format(_name, i), _line(i, 0, 0, 1.0 + i % 5))
+        tb.psi_value = 0.01 * (i % 7)
+        segment.add_new_thermal_bridge(tb)
+    return segment
+
+
+def dhw_system(_size, _name="DHW"):
+    # type: (ModelSize, str) -> PhHotWaterSystem
+    """Return a new hot-water system with a single trunk -> branch -> twig piping tree."""
+
+    def _pipe_element(_x, _y, _z, _axis):
+        element = PhHvacPipeElement()
+        for i in range(_size.dhw_segments):
+            element.add_segment(PhHvacPipeSegment(_line(_x + i, _y, _z, 1.0, _axis)))
+        return element
+
+    trunk = PhHvacPipeTrunk()
+    trunk.display_name = "{}_Trunk".format(_name)
+    trunk.pipe_element = _pipe_element(0, 0, 0, 2)
+    for b in range(_size.dhw_branches):
+        branch = PhHvacPipeBranch()
+        branch.pipe_element = _pipe_element(0, b, 0, 0)
+        for t in range(_size.dhw_twigs):
+            branch.add_fixture(_pipe_element(t, b, 0, 1))
+        trunk.add_branch(branch)
+
+    system = PhHotWaterSystem()
+    system.display_name = _name
+    system.add_distribution_piping(trunk)
+    return system
+
+
+def ventilation_system(_size, _name="ERV"):
+    # type: (ModelSize, str) -> PhVentilationSystem
+    """Return a new balanced HRV system with supply and exhaust ducts of _size.duct_segments each."""
+
+    def _duct(_duct_type):
+        element = PhDuctElement("{}_Duct_{}".format(_name, _duct_type), _duct_type)
+        for i in range(_size.duct_segments):
+            element.add_segment(PhDuctSegment(_line(i, _duct_type, 0, 1.0)))
+        return element
+
+    unit = Ventilator()
+    unit.sensible_heat_recovery = 0.8
+    return PhVentilationSystem.balanced_hrv(unit, [_duct(1)], [_duct(2)], display_name=_name)
+
+
+def window_construction():
+    # type: () -> WindowConstruction
+    """Return a window construction with a PH-Frame and PH-Glazing."""
+    glazing = EnergyWindowMaterialSimpleGlazSys("Benchmark_Glazing", 0.8, 0.5)
+    construction = WindowConstruction("Benchmark_Window", [glazing])
+    construction.properties.ph.ph_frame = PhWindowFrame("Benchmark_Frame")
+    construction.properties.ph.ph_glazing = PhWindowGlazing("Benchmark_PH_Glazing")
+    return construction
+
+
+def _add_spaces(_room, _origin, _num_spaces):
+    # type: (Room, Point3D, int) -> None
+    """Split the room's floor into equal strips and add a PH-Space for each."""
+    strip_width = ROOM_WIDTH / _num_spaces
+    for i in range(_num_spaces):
+        x = _origin.x + i * strip_width
+        geometry = Face3D(
+            [
+                Point3D(x, _origin.y, _origin.z),
+                Point3D(x + strip_width, _origin.y, _origin.z),
+                Point3D(x + strip_width, _origin.y + ROOM_DEPTH, _origin.z),
+                Point3D(x, _origin.y + ROOM_DEPTH, _origin.z),
+            ]
+        )
+        floor_segment = SpaceFloorSegment()
+        floor_segment.geometry = geometry
+        floor = SpaceFloor()
+        floor.geometry = geometry
+        floor.add_floor_segment(floor_segment)
+        volume = SpaceVolume()
+        volume.floor = floor
+        volume.avg_ceiling_height = ROOM_HEIGHT - 0.5
+
+        space = Space(_room)
+        space.name = "{}_Space_{}".format(_room.display_name, i)
+        space.add_new_volumes([volume])
+        _room.properties.ph.add_new_space(space)
+
+
+def _add_apertures(_room, _num_per_wall, _construction):
+    # type: (Room, int, WindowConstruction) -> None
+    if _num_per_wall < 1:
+        return
+    separation = ROOM_WIDTH / float(_num_per_wall)
+    for face in _room.faces:
+        if str(face.type) != "Wall":
+            continue
+        face.apertures_by_ratio_rectangle(0.4, 1.5, 0.8, separation, 0, 0.01)
+        for aperture in face.apertures:
+            aperture.properties.energy.construction = _construction
+
+
+# -----------------------------------------------------------------------------
+# -- Models
+
+
+def synthetic_model(_size, _name="BenchmarkModel"):
+    # type: (ModelSize, str) -> Model
+    """Return a new HB-Model with rooms, spaces, segments, apertures and HVAC of the given size.
+
+    Rooms are laid out in a row on each story. Residential rooms each carry their own
+    single-dwelling PhDwellings; every `_size.nonres_room_every` room is instead given a
+    non-residential (office) program. All rooms share one hot-water system and one
+    ventilation system.
+    """
+    segments = [
+        bldg_segment("Segment_{}".format(i), _size.thermal_bridges_per_segment)
+        for i in range(max(1, _size.bldg_segments))
+    ]
+    hot_water = dhw_system(_size)
+    ventilation = ventilation_system(_size)
+    construction = window_construction()
+    occupancy = ScheduleRuleset.from_constant_value("Benchmark_Occupancy", 1.0)
+
+    stories = max(1, _size.stories)
+    rooms_per_story = -(-_size.rooms // stories)  # -- ceiling division
+
+    rooms = []
+    for i in range(_size.rooms):
+        story, position = divmod(i, rooms_per_story)
+        origin = Point3D(position * ROOM_WIDTH, 0, story * ROOM_HEIGHT)
+        room = Room.from_box("Room_{}".format(i), ROOM_WIDTH, ROOM_DEPTH, ROOM_HEIGHT, origin=origin)
+        room.story = "Story_{:03d}".format(story + 1)
+
+        if _size.nonres_room_every and (i + 1) % _size.nonres_room_every == 0:
+            room.properties.energy.program_type = office_program
+        else:
+            people = People("Room_{}_People".format(i), 0.05, occupancy)
+            people.properties.ph.number_bedrooms = 2
+            people.properties.ph.number_people = 2.5
+            people.properties.ph.dwellings = PhDwellings(1)
+            room.properties.energy.people = people
+
+        room.properties.ph.ph_bldg_segment = segments[i % len(segments)]
+        _add_spaces(room, origin, max(1, _size.spaces_per_room))
+        _add_apertures(room, _size.apertures_per_wall, construction)
+        room.properties.ph_hvac.set_hot_water_system(hot_water)
+        room.properties.ph_hvac.set_ventilation_system(ventilation)
+        rooms.append(room)
+
+    return Model(_name, rooms=rooms, tolerance=0.01, angle_tolerance=1.0)
+
+
+# -----------------------------------------------------------------------------
+# -- Weather
+
+
+def write_synthetic_epw(_file_path):
+    # type: (str) -> str
+    """Write an EPW file with generated (not observed) hourly weather and return its path."""
+    epw = EPW.from_missing_values()
+    epw.location = Location(
+        city="Synthetic Benchmark City",
+        country="Synthetic",
+        latitude=42.0,
+        longitude=-73.0,
+        time_zone=-5.0,
+        elevation=100.0,
+        station_id="BENCHMARK-001",
+        source="Generated benchmark data",
+    )
+
+    dry_bulb = []
+    dew_point = []
+    for dt in epw.dry_bulb_temperature.datetimes:
+        offset = -2.0 if dt.hour < 12 else 2.0
+        dry_bulb.append(float(dt.month) + offset)
+        dew_point.append(float(dt.month) - 5.0 + offset)
+    length = len(dry_bulb)
+    epw.dry_bulb_temperature.values = dry_bulb
+    epw.dew_point_temperature.values = dew_point
+    epw.wind_speed.values = [3.0] * length
+    epw.horizontal_infrared_radiation_intensity.values = [300.0] * length
+    epw.opaque_sky_cover.values = [5] * length
+    epw.global_horizontal_radiation.values = [100.0] * length
+    epw.direct_normal_radiation.values = [50.0] * length
+    epw.diffuse_horizontal_radiation.values = [50.0] * length
+
+    header = Header(
+        GroundTemperature(),
+        "C",
+        AnalysisPeriod(),
+        {"depth": 0.5, "soil conductivity": "1.5", "soil density": "1800", "soil specific heat": "900"},
+    )
+    epw.monthly_ground_temperature = {0.5: MonthlyCollection(header, [10.0] * 12, list(range(12)))}
+
+    folder = os.path.dirname(os.path.abspath(_file_path))
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    epw.write(_file_path)
+    return _file_path
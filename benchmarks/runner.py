@@ -0,0 +1,250 @@
+"""Run the benchmark cases, record the results, and compare them against a baseline."""
+
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from benchmarks import cases, generators
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_METRIC = "min_s"
+PACKAGES = ("honeybee-ph", "honeybee-core", "honeybee-energy", "ladybug-core", "ladybug-geometry", "PH-units")
+
+
+def environment():
+    # type: () -> Dict[str, Any]
+    """Return a description of the interpreter, machine and package versions the results came from."""
+    packages = {}
+    for name in PACKAGES:
+        try:
+            packages[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            packages[name] = None
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "packages": packages,
+    }
+
+
+def time_benchmark(_benchmark, _size, _folder, _repeat=5, _warmup=1):
+    # type: (cases.Benchmark, generators.ModelSize, str, int, int) -> Dict[str, Any]
+    """Set up and time a single benchmark case, returning its timing statistics in seconds."""
+    inputs = _benchmark.setup(_size, _folder)
+    for _ in range(_warmup):
+        _benchmark.run(inputs)
+
+    runs = []
+    for _ in range(max(1, _repeat)):
+        start = time.perf_counter()
+        _benchmark.run(inputs)
+        runs.append(time.perf_counter() - start)
+
+    return {
+        "description": _benchmark.description,
+        "min_s": min(runs),
+        "median_s": statistics.median(runs),
+        "mean_s": statistics.mean(runs),
+        "max_s": max(runs),
+        "runs": runs,
+    }
+
+
+def run_benchmarks(_size_name="small", _names=None, _repeat=5, _warmup=1, _size=None, _progress=None):
+    # type: (str, Optional[Iterable[str]], int, int, Optional[generators.ModelSize], Optional[Callable[[str], None]]) -> Dict[str, Any]
+    """Run the benchmark cases and return the results, ready to be written to a results file.
+
+    Arguments:
+    ----------
+        * _size_name (str): The name of the model size to use (see `generators.SIZES`).
+        * _names (Optional[Iterable[str]]): The names of the cases to run. Default: all of them.
+        * _repeat (int): The number of timed runs of each case.
+        * _warmup (int): The number of un-timed runs of each case before the timed runs.
+        * _size (Optional[ModelSize]): A custom model size, used in place of the named size.
+        * _progress (Optional[Callable[[str], None]]): Called with the name of each case before it runs.
+
+    Returns:
+    --------
+        * Dict[str, Any]: The results, with the timings for each case under "benchmarks".
+    """
+    size = _size or generators.model_size(_size_name)
+    by_name = cases.benchmark_by_name()
+    names = list(_names) if _names else [b.name for b in cases.BENCHMARKS]
+    unknown = [n for n in names if n not in by_name]
+    if unknown:
+        raise ValueError("Unknown benchmark(s): {}. Valid names are: {}".format(unknown, sorted(by_name)))
+
+    results = {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "environment": environment(),
+        "size_name": _size_name if _size is None else "custom",
+        "size": size.to_dict(),
+        "repeat": _repeat,
+        "warmup": _warmup,
+        "benchmarks": {},
+    }
+
+    folder = tempfile.mkdtemp(prefix="honeybee_ph_benchmarks_")
+    try:
+        for name in names:
+            if _progress:
+                _progress(name)
+            results["benchmarks"][name] = time_benchmark(by_name[name], size, folder, _repeat, _warmup)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    return results
+
+
+def write_results(_results, _path):
+    # type: (Dict[str, Any], str) -> str
+    """Write the results to a JSON file and return its path."""
+    folder = os.path.dirname(os.path.abspath(_path))
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    with open(_path, "w") as f:
+        json.dump(_results, f, indent=2, sort_keys=True)
+    return _path
+
+
+def load_results(_path):
+    # type: (str) -> Dict[str, Any]
+    """Load a results file, checking that it was written in a readable format."""
+    with open(_path, "r") as f:
+        results = json.load(f)
+    if results.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(
+            "Results file '{}' has format version {}, expected {}.".format(
+                _path, results.get("format_version"), RESULTS_FORMAT_VERSION
+            )
+        )
+    return results
+
+
+# -----------------------------------------------------------------------------
+# -- Comparison
+
+
+@dataclass(frozen=True)
+class ComparisonRow:
+    """The comparison of a single benchmark case against its baseline.
+
+    Attributes:
+        name (str): The name of the benchmark case.
+        status (str): One of "ok", "regression", "improvement", "new" or "missing".
+        baseline_s (Optional[float]): The baseline time in seconds, or None if the case is new.
+        current_s (Optional[float]): The current time in seconds, or None if the case is missing.
+    """
+
+    name: str
+    status: str
+    baseline_s: Optional[float]
+    current_s: Optional[float]
+
+    @property
+    def change(self):
+        # type: () -> Optional[float]
+        """The fractional change from the baseline (0.25 is 25% slower), or None if not comparable."""
+        if not self.baseline_s or self.current_s is None:
+            return None
+        return (self.current_s - self.baseline_s) / self.baseline_s
+
+
+def compare_results(_baseline, _current, _threshold=DEFAULT_THRESHOLD, _metric=DEFAULT_METRIC):
+    # type: (Dict[str, Any], Dict[str, Any], float, str) -> List[ComparisonRow]
+    """Compare current results against a baseline, flagging cases slower than the threshold.
+
+    Arguments:
+    ----------
+        * _baseline (Dict[str, Any]): The baseline results (see `run_benchmarks`).
+        * _current (Dict[str, Any]): The current results.
+        * _threshold (float): The fractional slow-down beyond which a case is a regression
+            (0.2 = 20% slower). The same fractional speed-up is reported as an improvement.
+        * _metric (str): The timing statistic to compare. Default: "min_s", the least noisy.
+
+    Returns:
+    --------
+        * List[ComparisonRow]: One row per case found in either set of results.
+    """
+    base_cases = _baseline["benchmarks"]
+    current_cases = _current["benchmarks"]
+
+    rows = []
+    for name in list(base_cases) + [n for n in current_cases if n not in base_cases]:
+        if name not in current_cases:
+            rows.append(ComparisonRow(name, "missing", base_cases[name][_metric], None))
+            continue
+        if name not in base_cases:
+            rows.append(ComparisonRow(name, "new", None, current_cases[name][_metric]))
+            continue
+
+        row = ComparisonRow(name, "ok", base_cases[name][_metric], current_cases[name][_metric])
+        change = row.change
+        if change is not None and change > _threshold:
+            row = ComparisonRow(name, "regression", row.baseline_s, row.current_s)
+        elif change is not None and change < -_threshold:
+            row = ComparisonRow(name, "improvement", row.baseline_s, row.current_s)
+        rows.append(row)
+
+    return rows
+
+
+def regressions(_rows):
+    # type: (Iterable[ComparisonRow]) -> List[ComparisonRow]
+    """Return only the rows which are regressions."""
+    return [row for row in _rows if row.status == "regression"]
+
+
+def format_comparison(_rows, _baseline=None, _current=None):
+    # type: (List[ComparisonRow], Optional[Dict[str, Any]], Optional[Dict[str, Any]]) -> str
+    """Return a plain-text table of the comparison rows."""
+
+    def _ms(_seconds):
+        return "-" if _seconds is None else "{:.2f}".format(_seconds * 1000)
+
+    lines = []
+    if _baseline is not None and _current is not None and _baseline.get("size") != _current.get("size"):
+        lines.append("WARNING: The baseline and current results used different model sizes.")
+
+    lines.append("{:<22} {:>12} {:>12} {:>9}  {}".format("benchmark", "baseline ms", "current ms", "change", "status"))
+    for row in _rows:
+        change = "-" if row.change is None else "{:+.1%}".format(row.change)
+        lines.append(
+            "{:<22} {:>12} {:>12} {:>9}  {}".format(
+                row.name, _ms(row.baseline_s), _ms(row.current_s), change, row.status.upper()
+            )
+        )
+    return "\n".join(lines)
+
+
+def format_results(_results):
+    # type: (Dict[str, Any]) -> str
+    """Return a plain-text table of the timings in a set of results."""
+    lines = ["{:<22} {:>10} {:>10} {:>10}".format("benchmark", "min ms", "median ms", "max ms")]
+    for name, timing in _results["benchmarks"].items():
+        lines.append(
+            "{:<22} {:>10.2f} {:>10.2f} {:>10.2f}".format(
+                name, timing["min_s"] * 1000, timing["median_s"] * 1000, timing["max_s"] * 1000
+            )
+        )
+    return "\n".join(lines)
+
+
+def _print_progress(_name):
+    sys.stderr.write("running {}...\n".format(_name))
+    sys.stderr.flush()
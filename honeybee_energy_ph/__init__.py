@@ -13,3 +13,8 @@ to add relevant Passive House fields and functions.
 import honeybee_energy._extend_honeybee
 
 import honeybee_energy_ph._extend_honeybee_energy_ph
+
+# -- Opt-in profiling, switched on with the 'HONEYBEE_PH_PROFILE' environment variable
+from honeybee_ph_utils.profiling import enable_from_environment as _enable_profiling_from_environment
+
+_enable_profiling_from_environment()
@@ -6,7 +6,7 @@
 from math import radians
 
 try:
-    from typing import Any, Union
+    from typing import Any, Optional, Union
 except ImportError:
     pass  # IronPython 2.7
 
@@ -24,6 +24,7 @@ except ImportError as e:
 
 try:
     from honeybee_ph_utils import enumerables
+    from honeybee_ph_utils import geometry_encoding as geom_encoding
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
 
@@ -107,8 +108,20 @@ class PhThermalBridge(_base._Base):
         # type: (Union[str, int]) -> None
         self._group_type = PhThermalBridgeType(_in)
 
-    def to_dict(self):
-        # type: () -> dict[str, Any]
+    def to_dict(self, geometry_encoding=None):
+        # type: (Optional[str]) -> dict[str, Any]
+        """Return a dict of the thermal bridge.
+
+        Arguments:
+        ----------
+            * geometry_encoding (Optional[str]): Set to "float64" or "float32" to store the
+                geometry in a packed vertex table (see honeybee_ph_utils.geometry_encoding).
+                Default: None (standard Ladybug-Geometry dicts).
+
+        Returns:
+        --------
+            * (dict[str, Any]): The thermal bridge as a dict.
+        """
         d = super(PhThermalBridge, self).to_dict()
         d["quantity"] = self.quantity
         d["_group_type"] = self._group_type.to_dict()
@@ -116,11 +129,12 @@ class PhThermalBridge(_base._Base):
         d["fRsi_value"] = self.fRsi_value
         d["is_interior_pipe"] = self.is_interior_pipe
         d["geometry"] = self.geometry.to_dict()
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (dict) -> PhThermalBridge
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
 
         # -- Geom might be either type
         try:
@@ -37,6 +37,7 @@ except ImportError:
 
 try:
     from honeybee_ph_utils.input_tools import input_to_int
+    from honeybee_ph_utils.schedule_statistics import schedule_statistics
 except ImportError as e:
     raise ImportError("Failed to import honeybee_ph_utils: {}".format(e))
 
@@ -207,7 +208,7 @@ class PhEquipment(_base._Base):
 
         if _schedule is not None:
             # -- Consider the host schedule....
-            sched_factor_sum = sum(_schedule.values())
+            sched_factor_sum = schedule_statistics(_schedule).full_load_hours
         else:
             sched_factor_sum = 8760
 
@@ -5,11 +5,12 @@
 
 
 try:
-    from typing import Any, ValuesView
+    from typing import Any, Dict, List, Optional, ValuesView
 except ImportError:
     pass  # IronPython 2.7
 
 try:
+    from honeybee.model import Model
     from honeybee.room import Room
 except ImportError as e:
     raise ImportError("Failed to import honeybee: {}".format(e))
@@ -22,7 +23,7 @@ except ImportError as e:
     raise ImportError("Failed to import honeybee_energy: {}".format(e))
 
 try:
-    from honeybee_energy_ph.dwellings import total_dwelling_count
+    from honeybee_energy_ph.dwellings import get_dwelling_obj, total_dwelling_count
     from honeybee_energy_ph.load import phius_residential
 except ImportError as e:
     raise ImportError("Failed to import honeybee_energy_ph: {}".format(e))
@@ -32,12 +33,92 @@ try:
 except ImportError as e:
     raise ImportError("Failed to import honeybee_ph: {}".format(e))
 
+try:
+    from honeybee_ph_utils.schedule_statistics import schedule_statistics
+except ImportError as e:
+    raise ImportError("Failed to import honeybee_ph_utils: {}".format(e))
+
 try:
     from ph_units.converter import convert
 except ImportError as e:
     raise ImportError("Failed to import ph_units: {}".format(e))
 
 
+# -- The area unit of the PH-Space floor areas, for each Honeybee Model unit
+MODEL_AREA_UNITS = {
+    "Meters": "M2",
+    "Millimeters": "MM2",
+    "Centimeters": "CM2",
+    "Feet": "FT2",
+    "Inches": "IN2",
+}
+
+
+def _area_to_ft2(_area, _area_unit):
+    # type: (float, str) -> float
+    area_ft2 = convert(_area, _area_unit, "FT2")
+    if area_ft2 is None:
+        raise ValueError("Error: Failed to convert '{}' floor area from {} to FT2".format(_area, _area_unit))
+    return area_ft2
+
+
+class PhiusStoryTotals(object):
+    """Running totals for one residential story, added to room-by-room.
+
+    Collects everything a PhiusResidentialStory needs in a single pass over its rooms,
+    so that the rooms do not have to be pre-grouped and walked once per quantity.
+
+    Attributes:
+        story (Any): The HB-Room 'story' of the rooms. Taken from the first room added if not set.
+        room_count (int): The number of rooms added.
+        floor_area (float): The total weighted floor area of the rooms' PH-Spaces (model units).
+        number_bedrooms (int): The total number of bedrooms.
+        number_people (float): The total PH design occupancy.
+        number_dwellings (int): The number of dwelling units. A dwelling spanning several
+            rooms is counted once, the same as `dwellings.total_dwelling_count`.
+    """
+
+    def __init__(self, _story=None):
+        # type: (Any) -> None
+        self.story = _story
+        self.room_count = 0
+        self.floor_area = 0.0
+        self.number_bedrooms = 0
+        self.number_people = 0.0
+        self.number_dwellings = 0
+        self._dwelling_ids = set()  # type: set[str]
+
+    def add_room(self, _hb_room):
+        # type: (Room) -> None
+        """Add the floor area, bedrooms, occupancy and dwellings of an HB-Room to the totals."""
+        if self.room_count == 0 and self.story is None:
+            self.story = _hb_room.story
+        self.room_count += 1
+
+        for ph_space in getattr(_hb_room.properties, "ph").spaces:
+            self.floor_area += ph_space.weighted_floor_area
+
+        ph_people = getattr(_hb_room.properties, "energy").people.properties.ph
+        self.number_bedrooms += ph_people.number_bedrooms
+        self.number_people += ph_people.number_people
+
+        dwelling = get_dwelling_obj(_hb_room)
+        if dwelling is not None and dwelling.identifier not in self._dwelling_ids:
+            self._dwelling_ids.add(dwelling.identifier)
+            self.number_dwellings += int(dwelling.num_dwellings)
+
+    def __str__(self):
+        return "{}(story={}, room_count={}, floor_area={}, number_dwellings={})".format(
+            self.__class__.__name__, self.story, self.room_count, self.floor_area, self.number_dwellings
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
 class PhiusResidentialStory(object):
     """One residential story in the Phius Multifamily Calculator (v4.2).
 
@@ -62,17 +143,38 @@ class PhiusResidentialStory(object):
 
     def __init__(self, _hb_rooms, _area_unit):
         # type: (list[Room], str) -> None
+        totals = PhiusStoryTotals()
+        for hb_room in _hb_rooms:
+            totals.add_room(hb_room)
+        self._set_totals(totals, _area_unit)
 
-        try:
-            self.story_number = _hb_rooms[0].story
-        except:
-            self.story_number = 1
+    @classmethod
+    def from_story_totals(cls, _totals, _area_unit):
+        # type: (PhiusStoryTotals, str) -> PhiusResidentialStory
+        """Return a new PhiusResidentialStory from totals which have already been accumulated.
+
+        Arguments:
+        ----------
+            * _totals (PhiusStoryTotals): The story's totals.
+            * _area_unit (str): The unit of the totals' floor area (ie: "M2").
+
+        Returns:
+        --------
+            * (PhiusResidentialStory): The new story.
+        """
+        obj = cls.__new__(cls)
+        obj._set_totals(_totals, _area_unit)
+        return obj
+
+    def _set_totals(self, _totals, _area_unit):
+        # type: (PhiusStoryTotals, str) -> None
+        self.story_number = _totals.story if _totals.room_count else 1
 
-        self.total_floor_area_ft2 = self.calc_story_floor_area_ft2(_hb_rooms, _area_unit)
-        self.total_number_dwellings = self.calc_num_dwellings(_hb_rooms)
-        self.total_number_bedrooms = self.calc_story_bedrooms(_hb_rooms)
+        self.total_floor_area_ft2 = _area_to_ft2(_totals.floor_area, _area_unit)
+        self.total_number_dwellings = _totals.number_dwellings
+        self.total_number_bedrooms = _totals.number_bedrooms
 
-        self.design_occupancy = self.calc_passive_house_occupancy(_hb_rooms)
+        self.design_occupancy = _totals.number_people
         self.mel = phius_residential.misc_electrical(
             self.total_number_bedrooms, self.total_floor_area_ft2, self.total_number_dwellings
         )
@@ -99,16 +201,13 @@ class PhiusResidentialStory(object):
         # -- If the input is a single integer value, enforce padding
         try:
             self._story_number = "{:03d}".format(int(value))
-        except ValueError:
+        except (ValueError, TypeError):
             self._story_number = str(value)
 
     def calc_story_floor_area_ft2(self, _hb_rooms, _area_unit):
         # type: (list[Room], str) -> float
         area = sum(space.weighted_floor_area for rm in _hb_rooms for space in getattr(rm.properties, "ph").spaces)
-        area_ft2 = convert(area, _area_unit, "FT2")
-        if area_ft2 is None:
-            raise ValueError("Error: Failed to convert '{}' floor area from {} to FT2".format(area, _area_unit))
-        return area_ft2
+        return _area_to_ft2(area, _area_unit)
 
     def calc_story_bedrooms(self, _hb_rooms):
         # type: (list[Room]) -> int
@@ -232,7 +331,7 @@ class PhiusNonResProgram(object):
                     _hb_elec_equip.schedule.display_name, type(_hb_elec_equip.schedule)
                 )
             )
-        annual_full_load_hours = sum(_hb_elec_equip.schedule.values())
+        annual_full_load_hours = schedule_statistics(_hb_elec_equip.schedule).full_load_hours
 
         # -- Calc total usage in kWh
         return (_hb_elec_equip.watts_per_area * annual_full_load_hours) / 1000
@@ -240,8 +339,7 @@ class PhiusNonResProgram(object):
     def _operating_hours_day_from_hb_schedule(self, _hb_lght_sched):
         # type: (ruleset.ScheduleRuleset) -> float
         """Return a daily operating period (num. hours) from an HB-Lighting-Schedule"""
-        operating_frac = sum(_hb_lght_sched.values()) / len(_hb_lght_sched.values())
-        return operating_frac * 24
+        return schedule_statistics(_hb_lght_sched).daily_operating_hours
 
     def __str__(self):
         return "{}(name={})".format(self.__class__.__name__, self.name)
@@ -366,14 +464,19 @@ class PhiusNonResRoom(object):
         )
 
     @classmethod
-    def from_ph_space(cls, _ph_space, _area_unit):
-        # type: (space.Space, str) -> PhiusNonResRoom
-        """Returns a new PhiusNonResSpace with properties based on a PH-Space."""
+    def from_ph_space(cls, _ph_space, _area_unit, _program_type=None):
+        # type: (space.Space, str, Optional[PhiusNonResProgram]) -> PhiusNonResRoom
+        """Returns a new PhiusNonResSpace with properties based on a PH-Space.
+
+        If no _program_type is supplied, a new one is built from the PH-Space's host HB-Room.
+        """
         obj = cls()
 
         obj.name = _ph_space.full_name
         obj.reference_floor_area_m2 = convert(_ph_space.weighted_net_floor_area, _area_unit, "M2") or 0.0
-        if _ph_space.host is not None:
+        if _program_type is not None:
+            obj.program_type = _program_type
+        elif _ph_space.host is not None:
             obj.program_type = PhiusNonResProgram.from_hb_room(_ph_space.host)
 
         return obj
@@ -392,3 +495,92 @@ class PhiusNonResRoom(object):
 
     def ToString(self):
         return str(self)
+
+
+# -----------------------------------------------------------------------------
+# -- Calculator
+
+
+class PhiusMFWorkbookData(object):
+    """All of the Phius Multifamily Calculator (v4.2) inputs for a set of HB-Rooms.
+
+    Attributes:
+        stories (list[PhiusResidentialStory]): The residential stories, sorted by story number.
+        non_res_rooms (list[PhiusNonResRoom]): One item per PH-Space of the non-residential rooms.
+        non_res_programs (PhiusNonResProgramCollection): The non-residential program types.
+    """
+
+    def __init__(self):
+        self.stories = []  # type: List[PhiusResidentialStory]
+        self.non_res_rooms = []  # type: List[PhiusNonResRoom]
+        self.non_res_programs = PhiusNonResProgramCollection()
+
+    @classmethod
+    def from_hb_rooms(cls, _hb_rooms, _area_unit):
+        # type: (list[Room], str) -> PhiusMFWorkbookData
+        """Return the workbook data for a set of HB-Rooms, collected in a single pass over the rooms.
+
+        Rooms with a dwelling set are residential, and are grouped into stories by their
+        'story' attribute. All other rooms are non-residential: each of their PH-Spaces
+        becomes a PhiusNonResRoom, sharing one PhiusNonResProgram per HB-Room.
+
+        Arguments:
+        ----------
+            * _hb_rooms (list[Room]): The HB-Rooms to collect the data from.
+            * _area_unit (str): The unit of the PH-Space floor areas (ie: "M2").
+
+        Returns:
+        --------
+            * (PhiusMFWorkbookData): The new workbook data.
+        """
+        obj = cls()
+        totals_by_story = {}  # type: Dict[Any, PhiusStoryTotals]
+
+        for hb_room in _hb_rooms:
+            if get_dwelling_obj(hb_room) is not None:
+                if hb_room.story not in totals_by_story:
+                    totals_by_story[hb_room.story] = PhiusStoryTotals(hb_room.story)
+                totals_by_story[hb_room.story].add_room(hb_room)
+                continue
+
+            program = None  # type: Optional[PhiusNonResProgram]
+            for ph_space in getattr(hb_room.properties, "ph").spaces:
+                if program is None:
+                    program = PhiusNonResProgram.from_hb_room(hb_room)
+                    obj.non_res_programs.add_program(program)
+                obj.non_res_rooms.append(PhiusNonResRoom.from_ph_space(ph_space, _area_unit, program))
+
+        obj.stories = sorted(
+            PhiusResidentialStory.from_story_totals(totals, _area_unit) for totals in totals_by_story.values()
+        )
+        return obj
+
+    @classmethod
+    def from_hb_model(cls, _hb_model):
+        # type: (Model) -> PhiusMFWorkbookData
+        """Return the workbook data for all the rooms of an HB-Model, using the Model's units."""
+        try:
+            area_unit = MODEL_AREA_UNITS[_hb_model.units]
+        except KeyError:
+            raise ValueError("Error: Unsupported HB-Model units: '{}'".format(_hb_model.units))
+        return cls.from_hb_rooms(_hb_model.rooms, area_unit)
+
+    def to_phius_mf_workbook(self):
+        # type: () -> Dict[str, List[str]]
+        """Returns the non-residential text blocks formatted to match the Phius MF Calculator."""
+        return {
+            "non_res_programs": self.non_res_programs.to_phius_mf_workbook(),
+            "non_res_rooms": [rm.to_phius_mf_workbook() for rm in self.non_res_rooms],
+            "non_res_results": [rm.to_phius_mf_workbook_results() for rm in self.non_res_rooms],
+        }
+
+    def __str__(self):
+        return "{}(stories={}, non_res_rooms={}, non_res_programs={})".format(
+            self.__class__.__name__, len(self.stories), len(self.non_res_rooms), len(self.non_res_programs.programs)
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
@@ -1,7 +1,26 @@
 # -*- Python Version: 2.7 -*-
 # -*- coding: utf-8 -*-
 
-"""Calculations for Phius Residential Electrical Energy Consumption."""
+"""Calculations for Phius Residential Electrical Energy Consumption.
+
+Each calculation has a scalar form (ie: `misc_electrical`) for a single dwelling, and a
+batched form (ie: `misc_electrical_array`) which takes sequences of inputs (one item per
+dwelling variant) and returns a list of results. The batched forms use NumPy when it is
+installed, and plain Python otherwise. Both evaluate the scalar formula, term for term,
+so the results are identical to calling the scalar form on each row.
+"""
+
+from itertools import repeat
+
+try:
+    from typing import Any, Callable, List, Sequence, Union
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # -- NumPy is optional (and not available in IronPython)
 
 
 def cooktop(_num_occupants, _energy_demand):
@@ -123,3 +142,84 @@ def lighting_garage(_frac_high_efficiency, _num_dwellings=1):
     b = 25 * _frac_high_efficiency
 
     return _num_dwellings * (GARAGE_LIGHTING_KWH_YR_PER_DWELLING * a + b) * PHIUS_RESNET_FRACTION
+
+
+# -----------------------------------------------------------------------------
+# -- Batched (array-in / array-out) versions
+
+
+def _row_count(_columns):
+    # type: (Sequence[Any]) -> int
+    """Return the length shared by all of the sequence inputs. Scalars match any length."""
+    lengths = set(len(c) for c in _columns if hasattr(c, "__len__"))
+    if len(lengths) > 1:
+        raise ValueError(
+            "Error: All of the input sequences must be the same length. Got lengths: {}".format(sorted(lengths))
+        )
+    return lengths.pop() if lengths else 1
+
+
+def _evaluate(_func, _columns, _use_numpy=None):
+    # type: (Callable[..., Any], Sequence[Union[float, Sequence[float]]], bool | None) -> List[float]
+    """Evaluate a scalar formula for every row of the input columns.
+
+    The scalar functions only use arithmetic operators, so passing them NumPy arrays
+    evaluates the same expression element-wise, in the same order.
+    """
+    n = _row_count(_columns)
+    if _use_numpy is None:
+        _use_numpy = np is not None
+    elif _use_numpy and np is None:
+        raise ImportError("Error: NumPy is not installed. Use _use_numpy=False or None.")
+
+    if _use_numpy:
+        arrays = [np.broadcast_to(np.asarray(c, dtype=float), (n,)) for c in _columns]
+        return np.broadcast_to(_func(*arrays), (n,)).tolist()
+
+    columns = [c if hasattr(c, "__len__") else repeat(c, n) for c in _columns]
+    return list(map(_func, *columns))
+
+
+def cooktop_array(_num_occupants, _energy_demand, _use_numpy=None):
+    # type: (Sequence[float], Union[float, Sequence[float]], bool | None) -> List[float]
+    """Return the `cooktop` energy consumption [kWh] for each row of the inputs.
+
+    Arguments:
+    ----------
+        * _num_occupants (Sequence[float]): The number of occupants of each dwelling.
+        * _energy_demand (float | Sequence[float]): The cooktop energy per meal [kWh].
+        * _use_numpy (bool | None): Default=None (use NumPy if it is installed). Set
+            False to force the plain-Python evaluation.
+
+    Returns:
+    --------
+        * (List[float]): The annual energy consumption [kWh] of each row.
+    """
+    return _evaluate(cooktop, (_num_occupants, _energy_demand), _use_numpy)
+
+
+def misc_electrical_array(_num_bedrooms, _floor_area_ft2, _num_dwellings=1, _use_numpy=None):
+    # type: (Sequence[float], Sequence[float], Union[int, Sequence[int]], bool | None) -> List[float]
+    """Return the `misc_electrical` (MEL) energy consumption [kWh] for each row of the inputs.
+
+    Scalar inputs are applied to every row. See `cooktop_array` for the `_use_numpy` option.
+    """
+    return _evaluate(misc_electrical, (_num_bedrooms, _floor_area_ft2, _num_dwellings), _use_numpy)
+
+
+def lighting_interior_array(_floor_area_ft2, _frac_high_efficiency, _num_dwellings=1, _use_numpy=None):
+    # type: (Sequence[float], Union[float, Sequence[float]], Union[int, Sequence[int]], bool | None) -> List[float]
+    """Return the `lighting_interior` energy consumption [kWh] for each row of the inputs."""
+    return _evaluate(lighting_interior, (_floor_area_ft2, _frac_high_efficiency, _num_dwellings), _use_numpy)
+
+
+def lighting_exterior_array(_floor_area_ft2, _frac_high_efficiency, _num_dwellings=1, _use_numpy=None):
+    # type: (Sequence[float], Union[float, Sequence[float]], Union[int, Sequence[int]], bool | None) -> List[float]
+    """Return the `lighting_exterior` energy consumption [kWh] for each row of the inputs."""
+    return _evaluate(lighting_exterior, (_floor_area_ft2, _frac_high_efficiency, _num_dwellings), _use_numpy)
+
+
+def lighting_garage_array(_frac_high_efficiency, _num_dwellings=1, _use_numpy=None):
+    # type: (Union[float, Sequence[float]], Union[int, Sequence[int]], bool | None) -> List[float]
+    """Return the `lighting_garage` energy consumption [kWh] for each row of the inputs."""
+    return _evaluate(lighting_garage, (_frac_high_efficiency, _num_dwellings), _use_numpy)
@@ -25,6 +25,10 @@ class WindowConstructionPhProperties(object):
         self.ph_frame = None  # type: Optional[window.PhWindowFrame]
         self.ph_glazing = None  # type: Optional[window.PhWindowGlazing]
 
+        # -- Model window-library keys, loaded from a compact HBJSON and not yet resolved
+        self._ph_frame_ref = None  # type: Optional[str]
+        self._ph_glazing_ref = None  # type: Optional[str]
+
     @property
     def host(self):
         return self._host
@@ -43,6 +47,8 @@ class WindowConstructionPhProperties(object):
             new_obj.ph_frame = self.ph_frame.duplicate()
         if self.ph_glazing:
             new_obj.ph_glazing = self.ph_glazing.duplicate()
+        new_obj._ph_frame_ref = self._ph_frame_ref
+        new_obj._ph_glazing_ref = self._ph_glazing_ref
 
         return new_obj
 
@@ -55,6 +61,17 @@ class WindowConstructionPhProperties(object):
         else:
             d["type"] = "WindowConstructionPhProperties"
 
+        # -- The window library is only written by compact_model_dict, after to_dict, so
+        # -- a reference here would point to a library which is not in the output.
+        if self.has_library_refs:
+            raise ValueError(
+                "Error: The PH frame / glazing of WindowConstruction '{}' is an unresolved "
+                "window-library reference (frame: {!r}, glazing: {!r}). Apply the Model's "
+                "window library before serializing.".format(
+                    getattr(self.host, "identifier", None), self._ph_frame_ref, self._ph_glazing_ref
+                )
+            )
+
         d["id_num"] = self.id_num
         if self.ph_frame:
             d["ph_frame"] = self.ph_frame.to_dict()
@@ -78,8 +95,35 @@ class WindowConstructionPhProperties(object):
             new_obj.ph_frame = window.PhWindowFrame.from_dict(_input_dict["ph_frame"])
         if "ph_glazing" in _input_dict:
             new_obj.ph_glazing = window.PhWindowGlazing.from_dict(_input_dict["ph_glazing"])
+
+        # -- A compact HBJSON holds library references instead, resolved by the Model
+        new_obj._ph_frame_ref = _input_dict.get("ph_frame_ref", None)
+        new_obj._ph_glazing_ref = _input_dict.get("ph_glazing_ref", None)
         return new_obj
 
+    @property
+    def has_library_refs(self):
+        # type: () -> bool
+        """Return True if the frame or glazing is a window-library reference which is not yet resolved."""
+        return bool(self._ph_frame_ref or self._ph_glazing_ref)
+
+    def apply_window_library(self, _window_library):
+        # type: (Any) -> None
+        """Set the ph_frame and ph_glazing from their window-library references, if any.
+
+        The objects are shared with every other construction referencing the same library key.
+
+        Arguments:
+        ----------
+            * _window_library (honeybee_ph.window_library.PhWindowLibrary): The Model's window library.
+        """
+        if self._ph_frame_ref:
+            self.ph_frame = _window_library.frames[self._ph_frame_ref]
+            self._ph_frame_ref = None
+        if self._ph_glazing_ref:
+            self.ph_glazing = _window_library.glazings[self._ph_glazing_ref]
+            self._ph_glazing_ref = None
+
     def __str__(self):
         return "{}(frame={!r}, glazing={!r})".format(self.__class__.__name__, self.ph_frame, self.ph_glazing)
 
@@ -3,6 +3,7 @@
 
 """Properties for Honeybee-Energy-PH | Load | People"""
 
+from threading import Lock
 from uuid import uuid4
 
 try:
@@ -24,6 +25,7 @@ class PhDwellings(object):
     """A Dwelling Object to store information on the number of dwelling units."""
 
     _default = None  # type: Optional[PhDwellings]
+    _default_lock = Lock()
 
     def __init__(self, _num_dwellings=0):
         # type: (int) -> None
@@ -55,8 +57,11 @@ class PhDwellings(object):
     @classmethod
     def default(cls):
         # type: () -> PhDwellings
+        """Return the single shared 'un-set' PhDwellings object, creating it on first use (thread-safe)."""
         if cls._default is None:
-            cls._default = cls()
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
         return cls._default
 
     def duplicate(self, new_host=None):
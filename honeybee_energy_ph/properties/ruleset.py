@@ -4,8 +4,8 @@
 """Properties classes for PH-ScheduleRuleset objects."""
 
 try:
-    pass
-except:
+    from typing import Any, Generator, List, Optional
+except ImportError:
     pass  # IronPython
 
 
@@ -112,10 +112,12 @@ class DailyOperatingPeriodCollection(object):
 
     def __init__(self):
         self._collection = []
+        self._version = 0  # -- Incremented on every change, so summaries know to recalculate
 
     def add_period_to_collection(self, _period):
         # type: (DailyOperationPeriod) -> None
         self._collection.append(_period)
+        self._version += 1
 
     @property
     def fist_period(self):
@@ -166,6 +168,57 @@ class DailyOperatingPeriodCollection(object):
         return str(self)
 
 
+class OperatingPeriodSummary(object):
+    """Totals of a ScheduleRulesetPhProperties' daily operating periods.
+
+    Attributes:
+        total_hours (float): The sum of the periods' operation hours.
+        weighted_hours (float): The sum of the periods' weighted (operation_fraction) hours.
+        operating_days_year (float): The schedule's operating days per year.
+        annual_average_operating_fraction (float): The annual average operating fraction (0-1.0).
+        daily_values (List[float]): The 24 hourly operating fractions of an operating day.
+    """
+
+    def __init__(self, _ph_properties):
+        # type: (ScheduleRulesetPhProperties) -> None
+        self.operating_days_year = _ph_properties.operating_days_year
+        self.total_hours = 0
+        self.weighted_hours = 0.0
+        self.daily_values = [0.0] * 24
+
+        wtd_total = 0.0
+        for op_period in _ph_properties.daily_operating_periods:
+            self.total_hours += op_period.operation_hours
+            self.weighted_hours += op_period.weighted_operation_hours
+            wtd_total += op_period.weighted_operation_hours * self.operating_days_year
+            self._add_to_daily_values(op_period)
+
+        annual_operating_hours = self.operating_days_year * 24.0
+        try:
+            self.annual_average_operating_fraction = wtd_total / annual_operating_hours
+        except ZeroDivisionError:
+            self.annual_average_operating_fraction = 0.0
+
+    def _add_to_daily_values(self, _op_period):
+        # type: (DailyOperationPeriod) -> None
+        """Add the period's operation fraction to each hour it overlaps (clipped to 0-24)."""
+        for hour in range(24):
+            overlap = min(_op_period.end_hour, hour + 1) - max(_op_period.start_hour, hour)
+            if overlap > 0:
+                self.daily_values[hour] += overlap * _op_period.operation_fraction
+
+    def __str__(self):
+        return "{}(total_hours={}, weighted_hours={}, annual_average_operating_fraction={})".format(
+            self.__class__.__name__, self.total_hours, self.weighted_hours, self.annual_average_operating_fraction
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
 class ScheduleRulesetPhProperties(object):
     """Honeybee-Energy-PH ScheduleRulesetPhProperties for managing PH-style schedule data."""
 
@@ -175,6 +228,8 @@ class ScheduleRulesetPhProperties(object):
         self.operating_weeks_year = 52.1429
         self.operating_days_wk = 7.0
         self.daily_operating_periods = DailyOperatingPeriodCollection()
+        self._summary = None  # type: Optional[OperatingPeriodSummary]
+        self._summary_key = None  # type: Any
 
     @classmethod
     def from_days_per_week(cls, _days_per_wk, _wks_per_year, _host):
@@ -210,36 +265,65 @@ class ScheduleRulesetPhProperties(object):
     def host(self):
         return self._host
 
+    @property
+    def operating_period_summary(self):
+        # type: () -> OperatingPeriodSummary
+        """The totals of the daily operating periods.
+
+        Calculated once, and only re-calculated after a period is added to the collection
+        or the collection, operating_days_wk or operating_weeks_year is changed. Editing a
+        DailyOperationPeriod in place, after it is added, is not detected.
+        """
+        key = (
+            self.daily_operating_periods,
+            self.daily_operating_periods._version,
+            self.operating_weeks_year,
+            self.operating_days_wk,
+        )
+        if self._summary is None or self._summary_key != key:
+            self._summary = OperatingPeriodSummary(self)
+            self._summary_key = key
+        return self._summary
+
     @property
     def annual_average_operating_fraction(self):
         # type: () -> float
         """The annual average operating (utilization) fraction (0-1.0)."""
-
-        wtd_total = 0.0
-        for op_period in self.daily_operating_periods:
-            wtd_total += op_period.weighted_operation_hours * self.operating_days_year
-
-        annual_operating_hours = self.operating_days_year * 24.0
-        try:
-            wtd_annual_avg = wtd_total / annual_operating_hours
-        except ZeroDivisionError:
-            wtd_annual_avg = 0.0
-
-        return wtd_annual_avg
+        return self.operating_period_summary.annual_average_operating_fraction
 
     def validate_operating_period_hours(self, _total_period_hours=24.0):
         # type: (float) -> str | None
         """Returns a warning if the total daily operating period hours do not equal the specified _total_period_hours."""
-
-        total_hours = 0
-        for op_period in self.daily_operating_periods:
-            total_hours += op_period.operation_hours
+        total_hours = self.operating_period_summary.total_hours
 
         if abs(_total_period_hours - total_hours) > 0.001:
             return "Error: Total Operating Hours={}, not {}?".format(total_hours, _total_period_hours)
         else:
             return None
 
+    def hourly_values(self, _leap_year=False):
+        # type: (bool) -> List[float]
+        """Return the annual hourly values (8760, or 8784 for a leap-year) equivalent to the operating periods.
+
+        Every day gets the same 24-hour profile built from the periods, so the average of the
+        values is the annual_average_operating_fraction. The profile is built once from the
+        periods, without creating any ScheduleDay or ScheduleRule objects.
+
+        Arguments:
+        ----------
+            * _leap_year (bool): Default=False. Set True to return 366 days of values.
+
+        Returns:
+        --------
+            * (List[float]): The hourly values, starting Jan-1 at 00:00.
+        """
+        summary = self.operating_period_summary
+        if not summary.operating_days_year:
+            daily_values = [0.0] * 24
+        else:
+            daily_values = summary.daily_values
+        return daily_values * (366 if _leap_year else 365)
+
     @property
     def first_operating_period(self):
         # type: () -> Optional[DailyOperationPeriod]
@@ -13,3 +13,8 @@ relevant Honeybee entities and logged for later use.
 import honeybee_energy._extend_honeybee
 
 import honeybee_ph._extend_honeybee_ph
+
+# -- Opt-in profiling, switched on with the 'HONEYBEE_PH_PROFILE' environment variable
+from honeybee_ph_utils.profiling import enable_from_environment as _enable_profiling_from_environment
+
+_enable_profiling_from_environment()
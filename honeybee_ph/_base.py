@@ -6,6 +6,16 @@
 import uuid
 from copy import copy
 
+try:
+    from typing import Any, Dict
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_ph_utils import stable_hash as _stable_hash
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+
 
 class _Base(object):
     """Base class for all Honeybee-PH model objects.
@@ -71,6 +81,23 @@ class _Base(object):
         self._display_name = _source._display_name
         return self
 
+    def stable_hash(self):
+        # type: () -> str
+        """Return a deterministic hash of this object's content, without its identifier.
+
+        Objects with the same content have the same stable-hash, in any session, so it can
+        be used to de-duplicate objects or to find the ones changed since the last export.
+        The hash is memoized until the object (or anything it holds) is changed.
+        """
+        return _stable_hash.stable_hash(self)
+
+    def __getstate__(self):
+        # type: () -> Dict[str, Any]
+        # -- The memoized stable-hash snapshot holds object ids, which are only valid in this session.
+        state = self.__dict__.copy()
+        state.pop(_stable_hash.STABLE_HASH_ATTR, None)
+        return state
+
     def __str__(self):
         return "HBPH_{}: ID-{}".format(self.__class__.__name__, self.identifier_short)
 
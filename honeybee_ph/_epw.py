@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
 # -*- Python Version: 2.7 -*-
 
-"""Internal conversion of caller-supplied EPW weather data."""
+"""Internal conversion of caller-supplied EPW weather data.
+
+The monthly statistics of the hourly series are grouped with a month / day index of the
+hours of the year (calculated once per year-length), instead of the DateTime of each
+hour. When NumPy is installed the statistics and the sky-temperature fallback are
+calculated with array operations. Without NumPy (ie: IronPython) the same index is used
+with plain-Python slices.
+"""
 
 import hashlib
 import os
@@ -15,6 +22,11 @@ from ladybug.epw import EPW
 from ladybug.skymodel import calc_horizontal_infrared
 from ladybug.wea import Wea
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # -- NumPy is optional (and not available in IronPython)
+
 from honeybee_ph.site import ClimateProvenance, Climate_MonthlyValueSet
 from honeybee_ph_utils.validation import is_finite_real as _is_finite_real
 
@@ -108,19 +120,9 @@ def _header_float_issue(file_path, field_name, raw_value, minimum=None, maximum=
     return value, None
 
 
-def _validate_header(result, lines):
-    # type: (EPWConversionResult, List[str]) -> bool
-    if len(lines) < 9:
-        result.issues.append(
-            _issue(
-                result.file_path,
-                "header",
-                "expected at least 8 EPW header lines and hourly data; got {} total lines.".format(len(lines)),
-            )
-        )
-        return False
-
-    location_fields = lines[0].split(",")
+def _validate_location(result, location_line):
+    # type: (EPWConversionResult, str) -> bool
+    location_fields = location_line.split(",")
     if len(location_fields) < 10 or location_fields[0].strip().upper() != "LOCATION":
         result.issues.append(_issue(result.file_path, "location", "expected a 10-field EPW LOCATION header."))
         return False
@@ -136,7 +138,22 @@ def _validate_header(result, lines):
         _, issue = _header_float_issue(result.file_path, field_name, raw_value, minimum, maximum)
         if issue:
             result.issues.append(issue)
-    if len(result.issues) != issue_count:
+    return len(result.issues) == issue_count
+
+
+def _validate_header(result, lines):
+    # type: (EPWConversionResult, List[str]) -> bool
+    if len(lines) < 9:
+        result.issues.append(
+            _issue(
+                result.file_path,
+                "header",
+                "expected at least 8 EPW header lines and hourly data; got {} total lines.".format(len(lines)),
+            )
+        )
+        return False
+
+    if not _validate_location(result, lines[0]):
         return False
 
     leap_fields = lines[4].split(",")
@@ -252,46 +269,140 @@ def _validated_series(file_path, field_name, values, missing_value, minimum, max
     return (None if issues else values), issues
 
 
-def _monthly_sums_and_counts(collection):
-    # type: (Any) -> Tuple[List[float], List[int]]
+HOURS_PER_DAY = 24
+SIGMA = 5.6697e-8  # -- Stefan-Boltzmann constant, as used by ladybug.skymodel
+
+
+class _HourIndex(object):
+    """The month and day of each hour of an hourly annual series, starting at Jan-1 hour 0."""
+
+    def __init__(self, is_leap_year):
+        # type: (bool) -> None
+        days_per_month = [31, 29 if is_leap_year else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        self.day_months = [month for month, days in enumerate(days_per_month, start=1) for _ in range(days)]
+        self.month_hour_counts = [days * HOURS_PER_DAY for days in days_per_month]
+        self.month_slices = []  # type: List[Tuple[int, int]]
+        start = 0
+        for hour_count in self.month_hour_counts:
+            self.month_slices.append((start, start + hour_count))
+            start += hour_count
+        self._hour_months_array = None  # type: Any
+
+    @property
+    def hour_months_array(self):
+        # type: () -> Any
+        """The month-index (0-11) of each hour, as a NumPy array."""
+        if self._hour_months_array is None:
+            self._hour_months_array = np.repeat(np.arange(12), self.month_hour_counts)
+        return self._hour_months_array
+
+    def monthly_sums(self, values, use_numpy=False):
+        # type: (Any, bool) -> List[float]
+        """Return the sum of the hourly values in each month."""
+        if use_numpy:
+            weights = np.asarray(values, dtype=float)
+            return np.bincount(self.hour_months_array, weights=weights, minlength=12).tolist()
+        return [sum(values[start:end], 0.0) for start, end in self.month_slices]
+
+
+_HOUR_INDEXES = {}  # type: Dict[int, _HourIndex]
+
+
+def _hour_index(hour_count):
+    # type: (int) -> Optional[_HourIndex]
+    """Return the hour index for an hourly annual series of the length, or None for any other length."""
+    if hour_count not in (8760, 8784):
+        return None
+    if hour_count not in _HOUR_INDEXES:
+        _HOUR_INDEXES[hour_count] = _HourIndex(hour_count == 8784)
+    return _HOUR_INDEXES[hour_count]
+
+
+def _resolve_use_numpy(use_numpy):
+    # type: (Optional[bool]) -> bool
+    if use_numpy is None:
+        return np is not None
+    if use_numpy and np is None:
+        raise ImportError("Error: NumPy is not installed. Use use_numpy=False or None.")
+    return use_numpy
+
+
+def _monthly_sums_and_counts(collection, use_numpy=False):
+    # type: (Any, bool) -> Tuple[List[float], List[int]]
+    values = collection.values
+    hour_index = _hour_index(len(values))
+    if hour_index is not None:
+        return hour_index.monthly_sums(values, use_numpy), list(hour_index.month_hour_counts)
+
     monthly_sums = [0.0] * 12
     monthly_counts = [0] * 12
-    for value, dt in zip(collection.values, collection.datetimes):
+    for value, dt in zip(values, collection.datetimes):
         month_index = dt.month - 1
         monthly_sums[month_index] += value
         monthly_counts[month_index] += 1
     return monthly_sums, monthly_counts
 
 
-def _monthly_means(collection):
-    # type: (Any) -> List[float]
-    monthly_sums, monthly_counts = _monthly_sums_and_counts(collection)
+def _monthly_means(collection, use_numpy=False):
+    # type: (Any, bool) -> List[float]
+    monthly_sums, monthly_counts = _monthly_sums_and_counts(collection, use_numpy)
     return [total / count for total, count in zip(monthly_sums, monthly_counts)]
 
 
-def _monthly_totals_kwh(collection):
-    # type: (Any) -> List[float]
-    monthly_sums, _ = _monthly_sums_and_counts(collection)
+def _monthly_totals_kwh(collection, use_numpy=False):
+    # type: (Any, bool) -> List[float]
+    monthly_sums, _ = _monthly_sums_and_counts(collection, use_numpy)
     return [total / 1000.0 for total in monthly_sums]
 
 
-def _summer_daily_swing(values, datetimes, monthly_means):
-    # type: (List[float], List[Any], List[float]) -> Tuple[float, List[int]]
+def _warmest_months(monthly_means):
+    # type: (List[float]) -> List[int]
     start_month = max(
         range(12),
         key=lambda index: sum(monthly_means[(index + offset) % 12] for offset in range(3)),
     )
-    warmest_months = [((start_month + offset) % 12) + 1 for offset in range(3)]
-    daily_values = {}  # type: Dict[Tuple[int, int], List[float]]
-    for value, dt in zip(values, datetimes):
-        if dt.month in warmest_months:
-            daily_values.setdefault((dt.month, dt.day), []).append(value)
-    daily_ranges = [max(day_values) - min(day_values) for day_values in daily_values.values()]
+    return [((start_month + offset) % 12) + 1 for offset in range(3)]
+
+
+def _summer_daily_swing(values, datetimes, monthly_means, use_numpy=False):
+    # type: (List[float], Any, List[float], bool) -> Tuple[float, List[int]]
+    warmest_months = _warmest_months(monthly_means)
+    hour_index = _hour_index(len(values))
+    if hour_index is None:
+        daily_values = {}  # type: Dict[Tuple[int, int], List[float]]
+        for value, dt in zip(values, datetimes):
+            if dt.month in warmest_months:
+                daily_values.setdefault((dt.month, dt.day), []).append(value)
+        daily_ranges = [max(day_values) - min(day_values) for day_values in daily_values.values()]
+    elif use_numpy:
+        days = np.asarray(values, dtype=float).reshape(-1, HOURS_PER_DAY)
+        warm_days = days[np.isin(hour_index.day_months, warmest_months)]
+        daily_ranges = (warm_days.max(axis=1) - warm_days.min(axis=1)).tolist()
+    else:
+        daily_ranges = []
+        for day, month in enumerate(hour_index.day_months):
+            if month in warmest_months:
+                day_values = values[day * HOURS_PER_DAY : (day + 1) * HOURS_PER_DAY]
+                daily_ranges.append(max(day_values) - min(day_values))
     return sum(daily_ranges) / len(daily_ranges), warmest_months
 
 
-def _resolved_horizontal_infrared(result, epw, dry_bulb, dewpoint):
-    # type: (EPWConversionResult, EPW, Optional[List[float]], Optional[List[float]]) -> Optional[List[float]]
+def _horizontal_infrared_fallback_array(sky_cover, dry_bulb, dew_point):
+    # type: (Any, Any, Any) -> Any
+    """Return `ladybug.skymodel.calc_horizontal_infrared` for arrays of hourly values."""
+    db_k = dry_bulb + 273.15
+    dp_k = dew_point + 273.15
+    sky_emiss = (0.787 + (0.764 * np.log(dp_k / 273.15))) * (
+        1 + (0.022 * sky_cover) - (0.0035 * (sky_cover**2)) + (0.00028 * (sky_cover**3))
+    )
+    return sky_emiss * SIGMA * (db_k**4)
+
+
+def _resolved_horizontal_infrared(result, epw, dry_bulb, dewpoint, use_numpy=False):
+    # type: (EPWConversionResult, EPW, Optional[List[float]], Optional[List[float]], bool) -> Optional[List[float]]
+    if use_numpy:
+        return _resolved_horizontal_infrared_array(result, epw, dry_bulb, dewpoint)
+
     horizontal_ir = list(epw.horizontal_infrared_radiation_intensity.values)
     opaque_sky = list(epw.opaque_sky_cover.values)
     resolved = []
@@ -302,32 +413,80 @@ def _resolved_horizontal_infrared(result, epw, dry_bulb, dewpoint):
             if dry_bulb is None or dewpoint is None:
                 continue
             if not _is_finite_real(sky_cover) or sky_cover < 0 or sky_cover > 10:
-                issues.append(
-                    _issue(
-                        result.file_path,
-                        "opaque_sky_cover hour {}".format(index + 1),
-                        "required for horizontal-infrared fallback; observed {!r}.".format(sky_cover),
-                    )
-                )
+                issues.append(_sky_cover_issue(result, index, sky_cover))
             else:
                 resolved.append(calc_horizontal_infrared(sky_cover, dry_bulb[index], dewpoint[index]))
         elif value < 0:
-            issues.append(
-                _issue(
-                    result.file_path,
-                    "horizontal_infrared_radiation_intensity hour {}".format(index + 1),
-                    "expected a non-negative value; observed {!r}.".format(value),
-                )
-            )
+            issues.append(_negative_infrared_issue(result, index, value))
         else:
             resolved.append(value)
     result.issues.extend(issues)
     return None if issues or len(resolved) != len(horizontal_ir) else resolved
 
 
-def _select_ground_temperature(result, epw, requested_depth):
-    # type: (EPWConversionResult, EPW, Optional[float]) -> None
-    ground_series = epw.monthly_ground_temperature
+def _resolved_horizontal_infrared_array(result, epw, dry_bulb, dewpoint):
+    # type: (EPWConversionResult, EPW, Optional[List[float]], Optional[List[float]]) -> Optional[List[float]]
+    """The NumPy version of `_resolved_horizontal_infrared`, with the same issues in the same order."""
+    horizontal_ir_values = epw.horizontal_infrared_radiation_intensity.values
+    opaque_sky_values = epw.opaque_sky_cover.values
+    horizontal_ir = np.asarray(horizontal_ir_values, dtype=float)
+    opaque_sky = np.asarray(opaque_sky_values, dtype=float)
+    missing = horizontal_ir >= 9999
+    negative = horizontal_ir < 0
+    can_fall_back = dry_bulb is not None and dewpoint is not None
+    # -- NaN compares False, so it is caught by the range check along with infinite values
+    bad_sky_cover = missing & ~((opaque_sky >= 0) & (opaque_sky <= 10)) if can_fall_back else np.zeros_like(missing)
+
+    issues = []
+    for index in np.flatnonzero(bad_sky_cover | negative).tolist():
+        if negative[index]:
+            issues.append(_negative_infrared_issue(result, index, horizontal_ir_values[index]))
+        else:
+            issues.append(_sky_cover_issue(result, index, opaque_sky_values[index]))
+    result.issues.extend(issues)
+    if issues or (missing.any() and not can_fall_back):
+        return None
+
+    if missing.any():
+        horizontal_ir[missing] = _horizontal_infrared_fallback_array(
+            opaque_sky[missing],
+            np.asarray(dry_bulb, dtype=float)[missing],
+            np.asarray(dewpoint, dtype=float)[missing],
+        )
+    return horizontal_ir.tolist()
+
+
+def _sky_cover_issue(result, index, sky_cover):
+    # type: (EPWConversionResult, int, float) -> str
+    return _issue(
+        result.file_path,
+        "opaque_sky_cover hour {}".format(index + 1),
+        "required for horizontal-infrared fallback; observed {!r}.".format(sky_cover),
+    )
+
+
+def _negative_infrared_issue(result, index, value):
+    # type: (EPWConversionResult, int, float) -> str
+    return _issue(
+        result.file_path,
+        "horizontal_infrared_radiation_intensity hour {}".format(index + 1),
+        "expected a non-negative value; observed {!r}.".format(value),
+    )
+
+
+def _monthly_sky_temperatures(epw, horizontal_ir, use_numpy=False):
+    # type: (EPW, List[float], bool) -> List[float]
+    """Return the monthly mean sky temperatures (see `ladybug.skymodel.calc_sky_temperature`)."""
+    hour_index = _hour_index(len(horizontal_ir))
+    if not use_numpy or hour_index is None:
+        return _monthly_means(epw.sky_temperature, use_numpy)
+    sky_temperatures = ((np.asarray(horizontal_ir, dtype=float) / SIGMA) ** 0.25) - 273.15
+    monthly_sums = hour_index.monthly_sums(sky_temperatures, use_numpy)
+    return [total / count for total, count in zip(monthly_sums, hour_index.month_hour_counts)]
+
+
+def _select_ground_temperature(result, ground_series, requested_depth):
+    # type: (EPWConversionResult, Dict[float, List[float]], Optional[float]) -> None
     available_depths = sorted(ground_series.keys())
     if not available_depths:
         result.issues.append(
@@ -357,7 +516,7 @@ def _select_ground_temperature(result, epw, requested_depth):
     else:
         selected_depth = requested_depth
 
-    values = list(ground_series[selected_depth].values)
+    values = list(ground_series[selected_depth])
     if len(values) != 12:
         result.issues.append(
             _issue(
@@ -384,8 +543,10 @@ def _select_ground_temperature(result, epw, requested_depth):
         result.provenance.assumptions["ground_temperature_depth_m"] = selected_depth
 
 
-def _set_directional_radiation(result, epw, direct_normal, diffuse_horizontal, ground_reflectance, diffuse_model):
-    # type: (EPWConversionResult, EPW, Optional[List[float]], Optional[List[float]], float, str) -> None
+def _set_directional_radiation(
+    result, epw, direct_normal, diffuse_horizontal, ground_reflectance, diffuse_model, use_numpy=False
+):
+    # type: (EPWConversionResult, EPW, Optional[List[float]], Optional[List[float]], float, str, bool) -> None
     if direct_normal is None or diffuse_horizontal is None:
         return
     wea = Wea(epw.location, epw.direct_normal_radiation, epw.diffuse_horizontal_radiation)
@@ -403,15 +564,22 @@ def _set_directional_radiation(result, epw, direct_normal, diffuse_horizontal, g
             ground_reflectance=ground_reflectance,
             isotropic=isotropic,
         )[0]
-        setattr(result, field_name, _monthly_totals_kwh(total_irradiance))
+        setattr(result, field_name, _monthly_totals_kwh(total_irradiance, use_numpy))
     result.provenance.assumptions["vertical_plane_azimuths_degrees"] = {
         name: azimuth for name, _, azimuth in orientations
     }
 
 
-def convert_epw(file_path, ground_temperature_depth=None, ground_reflectance=0.2, diffuse_model="isotropic"):
-    # type: (str, Optional[float], float, str) -> EPWConversionResult
-    """Convert EPW monthly-demand fields into an internal result."""
+def convert_epw(
+    file_path, ground_temperature_depth=None, ground_reflectance=0.2, diffuse_model="isotropic", use_numpy=None
+):
+    # type: (str, Optional[float], float, str, Optional[bool]) -> EPWConversionResult
+    """Convert EPW monthly-demand fields into an internal result.
+
+    Set `use_numpy` False to force the plain-Python statistics. Default: None (use
+    NumPy if it is installed).
+    """
+    use_numpy = _resolve_use_numpy(use_numpy)
     path = os.path.abspath(str(file_path))
     result = EPWConversionResult(path)
     _validate_options(result, ground_temperature_depth, ground_reflectance, diffuse_model)
@@ -470,22 +638,22 @@ def convert_epw(file_path, ground_temperature_depth=None, ground_reflectance=0.2
     result.issues.extend(diffuse_issues)
 
     if dry_bulb is not None:
-        result.monthly_air_temperatures = _monthly_means(dry_collection)
+        result.monthly_air_temperatures = _monthly_means(dry_collection, use_numpy)
         result.summer_daily_temperature_swing, warmest_months = _summer_daily_swing(
-            dry_bulb, list(dry_collection.datetimes), result.monthly_air_temperatures
+            dry_bulb, dry_collection.datetimes, result.monthly_air_temperatures, use_numpy
         )
         result.provenance.assumptions["warmest_consecutive_months"] = warmest_months
     if dewpoint is not None:
-        result.monthly_dewpoint_temperatures = _monthly_means(dewpoint_collection)
+        result.monthly_dewpoint_temperatures = _monthly_means(dewpoint_collection, use_numpy)
     if wind_speed is not None:
         result.average_wind_speed = wind_collection.average
     if global_horizontal is not None:
-        result.monthly_global_radiation = _monthly_totals_kwh(global_collection)
+        result.monthly_global_radiation = _monthly_totals_kwh(global_collection, use_numpy)
 
-    horizontal_ir = _resolved_horizontal_infrared(result, epw, dry_bulb, dewpoint)
+    horizontal_ir = _resolved_horizontal_infrared(result, epw, dry_bulb, dewpoint, use_numpy)
     if horizontal_ir is not None:
         epw.horizontal_infrared_radiation_intensity.values = horizontal_ir
-        result.monthly_sky_temperatures = _monthly_means(epw.sky_temperature)
+        result.monthly_sky_temperatures = _monthly_sky_temperatures(epw, horizontal_ir, use_numpy)
     _set_directional_radiation(
         result,
         epw,
@@ -493,8 +661,10 @@ def convert_epw(file_path, ground_temperature_depth=None, ground_reflectance=0.2
         diffuse_horizontal,
         ground_reflectance,
         diffuse_model,
+        use_numpy,
     )
-    _select_ground_temperature(result, epw, ground_temperature_depth)
+    ground_series = {depth: collection.values for depth, collection in epw.monthly_ground_temperature.items()}
+    _select_ground_temperature(result, ground_series, ground_temperature_depth)
     required_monthly_values = (
         result.monthly_air_temperatures,
         result.monthly_dewpoint_temperatures,
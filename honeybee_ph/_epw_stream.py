@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Internal streaming conversion of hourly, sub-hourly and multi-year EPW weather data.
+
+`_epw.convert_epw` loads the whole file with Ladybug, which only supports single-year
+hourly data, and keeps every hourly value in memory. `convert_epw_stream` reads the
+file one record at a time and adds each record to running monthly totals instead:
+
+    * Temperatures and wind speed: the mean of all the records of each calendar month.
+        As in Ladybug, these are readings at the end of each record, so the 24:00 record
+        of the last day of a month is counted in the next month.
+    * Radiation: the sum of (value x record length) of each calendar month, divided by
+        the number of years the month is in the file.
+    * Summer daily temperature swing: the daily min / max of the current day only, with
+        the daily ranges totaled by month.
+
+So the memory used does not depend on the length of the file. The records must be in
+chronological order. The result is the same EPWConversionResult as `convert_epw`, with
+the source time-step recorded in the provenance assumptions.
+"""
+
+import calendar
+import datetime
+import hashlib
+import math
+import os
+
+try:
+    from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+except ImportError:  # pragma: no cover - IronPython 2.7
+    pass
+
+from ladybug.location import Location
+from ladybug.skymodel import calc_horizontal_infrared, calc_sky_temperature
+from ladybug.sunpath import Sunpath
+
+from honeybee_ph._epw import (
+    EPWConversionResult,
+    _issue,
+    _select_ground_temperature,
+    _validate_location,
+    _validate_options,
+    _warmest_months,
+)
+from honeybee_ph_utils.validation import is_finite_real as _is_finite_real
+
+# -- The number of records per hour allowed by EnergyPlus.
+RECORDS_PER_HOUR = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
+# -- Only the first few issues of each field are listed, so the issues can't grow with the file.
+MAX_ISSUES_PER_FIELD = 10
+
+# -- (name, EPW field index, missing sentinel, minimum, maximum)
+VALIDATED_FIELDS = (
+    ("dry_bulb_temperature", 6, 99.9, -70.0, 70.0),
+    ("dew_point_temperature", 7, 99.9, -70.0, 70.0),
+    ("wind_speed", 21, 999, 0.0, 40.0),
+    ("global_horizontal_radiation", 13, 9999, 0.0, 9998.0),
+    ("direct_normal_radiation", 14, 9999, 0.0, 9998.0),
+    ("diffuse_horizontal_radiation", 15, 9999, 0.0, 9998.0),
+)
+# -- The fields which are readings at the end of each record, rather than totals over the record.
+READING_FIELDS = ("dry_bulb_temperature", "dew_point_temperature", "wind_speed")
+HORIZONTAL_INFRARED_FIELD = 12
+OPAQUE_SKY_COVER_FIELD = 23
+ORIENTATIONS = (("north", 0), ("east", 90), ("south", 180), ("west", 270))
+
+
+class _IssueLog(object):
+    """The issues of one field, with only the first MAX_ISSUES_PER_FIELD listed.
+
+    Each issue is labelled with the record_label and the record number. The record_label
+    defaults to '<field_name> record'.
+    """
+
+    def __init__(self, file_path, field_name, record_label=None):
+        # type: (str, str, Optional[str]) -> None
+        self.file_path = file_path
+        self.field_name = field_name
+        self.record_label = record_label or "{} record".format(field_name)
+        self.issues = []  # type: List[str]
+        self.count = 0
+
+    def add(self, record_number, message):
+        # type: (int, str) -> None
+        self.count += 1
+        if self.count <= MAX_ISSUES_PER_FIELD:
+            self.issues.append(_issue(self.file_path, "{} {}".format(self.record_label, record_number), message))
+
+    def all_issues(self):
+        # type: () -> List[str]
+        if self.count <= MAX_ISSUES_PER_FIELD:
+            return self.issues
+        summary = _issue(
+            self.file_path,
+            self.field_name,
+            "{} more issues not listed.".format(self.count - MAX_ISSUES_PER_FIELD),
+        )
+        return self.issues + [summary]
+
+
+class _MonthlyAccumulator(object):
+    """Running totals of one value for each calendar month."""
+
+    def __init__(self):
+        self.sums = [0.0] * 12
+        self.counts = [0] * 12
+
+    def add(self, month_index, value):
+        # type: (int, float) -> None
+        self.sums[month_index] += value
+        self.counts[month_index] += 1
+
+    def means(self):
+        # type: () -> List[float]
+        return [total / count for total, count in zip(self.sums, self.counts)]
+
+    def totals_kwh(self, hours_per_record, years_per_month):
+        # type: (float, List[int]) -> List[float]
+        """The monthly totals [kWh/m2] of a rate [W/m2], averaged over the years of each month."""
+        return [total * hours_per_record / 1000.0 / years for total, years in zip(self.sums, years_per_month)]
+
+
+class _DailyRangeAccumulator(object):
+    """The min / max of the current day only, with the daily ranges totaled by month.
+
+    The first day is kept open until the end: as in Ladybug, the file's final 24:00 reading
+    is the 0:00 reading of the first day (ie: 31 Dec 24:00 is counted on 1 Jan).
+    """
+
+    def __init__(self):
+        self.range_sums = [0.0] * 12
+        self.day_counts = [0] * 12
+        self._first = None  # type: Optional[List[Any]]
+        self._current = None  # type: Optional[List[Any]]
+
+    def add(self, day, value):
+        # type: (datetime.date, float) -> None
+        if self._current is None or day != self._current[0]:
+            self._close(self._current)
+            self._current = [day, value, value, 0]
+            if self._first is None:
+                self._first = self._current
+        extremes = self._current
+        extremes[1] = min(extremes[1], value)
+        extremes[2] = max(extremes[2], value)
+        extremes[3] += 1
+
+    def _close(self, extremes):
+        # type: (Optional[List[Any]]) -> None
+        if extremes is None or extremes is self._first:
+            return
+        month_index = extremes[0].month - 1
+        self.range_sums[month_index] += extremes[2] - extremes[1]
+        self.day_counts[month_index] += 1
+
+    def mean_range(self, months):
+        # type: (List[int]) -> float
+        if self._current is not None and self._current is not self._first:
+            if self._current[3] == 1:
+                self._first[1] = min(self._first[1], self._current[1])
+                self._first[2] = max(self._first[2], self._current[2])
+            else:
+                self._close(self._current)
+        if self._first is not None:
+            first, self._first = self._first, None
+            self._close(first)
+        self._current = None
+        total = sum(self.range_sums[m - 1] for m in months)
+        return total / sum(self.day_counts[m - 1] for m in months)
+
+
+def _iter_lines(result):
+    # type: (EPWConversionResult) -> Iterator[str]
+    """Yield each line of the file, decoded, while updating the provenance checksum."""
+    checksum = hashlib.sha256()
+    try:
+        with open(result.file_path, "rb") as epw_file:
+            for line_number, raw_line in enumerate(epw_file, start=1):
+                checksum.update(raw_line)
+                try:
+                    line = raw_line.decode("utf-8-sig" if line_number == 1 else "utf-8")
+                except UnicodeDecodeError as error:
+                    result.issues.append(
+                        _issue(result.file_path, "file", "EPW is not valid UTF-8 text ({})".format(error))
+                    )
+                    return
+                yield line.rstrip("\r\n")
+    except (IOError, OSError) as error:
+        result.issues.append(_issue(result.file_path, "file", "unable to read EPW ({})".format(error)))
+        return
+    result.provenance.source_checksum = checksum.hexdigest()
+
+
+def _ground_series(ground_line):
+    # type: (str) -> Dict[float, List[float]]
+    """Return the monthly ground temperatures of each depth in the GROUND TEMPERATURES header line."""
+    fields = ground_line.split(",")
+    series = {}  # type: Dict[float, List[float]]
+    try:
+        for i in range(int(fields[1])):
+            start = 2 + (i * 16)
+            series[float(fields[start])] = [float(v) for v in fields[start + 4 : start + 16]]
+    except (IndexError, ValueError):
+        return series
+    return series
+
+
+def _records_per_hour(result, data_periods_line):
+    # type: (EPWConversionResult, str) -> Optional[int]
+    fields = data_periods_line.split(",")
+    raw_value = fields[2].strip() if len(fields) > 2 and fields[0].strip().upper() == "DATA PERIODS" else ""
+    try:
+        records_per_hour = int(raw_value)
+    except ValueError:
+        records_per_hour = None
+    if records_per_hour not in RECORDS_PER_HOUR:
+        result.issues.append(
+            _issue(
+                result.file_path,
+                "header.data_periods",
+                "expected a DATA PERIODS header with {} records per hour; observed {!r}.".format(
+                    RECORDS_PER_HOUR, raw_value
+                ),
+            )
+        )
+        return None
+    return records_per_hour
+
+
+def _surface_irradiance(sun, direct_normal, diffuse_horizontal, azimuth, ground_reflectance, isotropic):
+    # type: (Any, float, float, float, float, bool) -> float
+    """Return the total irradiance on a vertical surface, as in `ladybug.wea.Wea.directional_irradiance`."""
+    sun_altitude = math.radians(sun.altitude)
+    sun_azimuth = math.radians(sun.azimuth)
+    surface_azimuth = math.radians(azimuth)
+    cos_angle = math.cos(sun_altitude) * (
+        math.sin(sun_azimuth) * math.sin(surface_azimuth) + math.cos(sun_azimuth) * math.cos(surface_azimuth)
+    )
+
+    srf_dir = direct_normal * cos_angle if sun.altitude > 0 and cos_angle > 0 else 0
+    if isotropic:
+        srf_dif = diffuse_horizontal * 0.5
+    else:
+        y = max(0.45, 0.55 + (0.437 * cos_angle) + 0.313 * cos_angle * cos_angle)
+        srf_dif = diffuse_horizontal * y
+    e_glob = diffuse_horizontal + direct_normal * math.cos(math.radians(90 - sun.altitude))
+    srf_ref = e_glob * ground_reflectance * 0.5
+    return srf_dir + srf_dif + srf_ref
+
+
+def convert_epw_stream(file_path, ground_temperature_depth=None, ground_reflectance=0.2, diffuse_model="isotropic"):
+    # type: (str, Optional[float], float, str) -> EPWConversionResult
+    """Convert the monthly-demand fields of an hourly, sub-hourly or multi-year EPW, one record at a time."""
+    path = os.path.abspath(str(file_path))
+    result = EPWConversionResult(path)
+    result.provenance.conversion_method = "streaming_epw_monthly"
+    result.provenance.assumptions["sky_temperature"] = (
+        "ladybug calc_sky_temperature with horizontal-infrared fallback from opaque sky cover"
+    )
+    result.provenance.assumptions["monthly_radiation_totals"] = (
+        "sum of each calendar month's records, averaged over the years the month is in the file"
+    )
+    _validate_options(result, ground_temperature_depth, ground_reflectance, diffuse_model)
+    if result.issues:
+        return result
+    isotropic = diffuse_model == "isotropic"
+
+    lines = _iter_lines(result)
+    header = []  # type: List[str]
+    for line in lines:
+        header.append(line)
+        if len(header) == 8:
+            break
+    if len(header) < 8:
+        if not result.issues:
+            result.issues.append(_issue(path, "header", "expected 8 EPW header lines."))
+        return result
+    if not _validate_location(result, header[0]):
+        return result
+    records_per_hour = _records_per_hour(result, header[7])
+    if records_per_hour is None:
+        return result
+    hours_per_record = 1.0 / records_per_hour
+
+    location_fields = header[0].split(",")
+    location = Location(
+        city=location_fields[1],
+        state=location_fields[2],
+        country=location_fields[3],
+        source=location_fields[4],
+        station_id=location_fields[5],
+        latitude=float(location_fields[6]),
+        longitude=float(location_fields[7]),
+        time_zone=float(location_fields[8]),
+        elevation=float(location_fields[9]),
+    )
+    sunpaths = {}  # type: Dict[bool, Sunpath]
+    for is_leap_year in (False, True):
+        sunpaths[is_leap_year] = Sunpath.from_location(location)
+        sunpaths[is_leap_year].is_leap_year = is_leap_year
+
+    logs = {name: _IssueLog(path, name) for name, _, _, _, _ in VALIDATED_FIELDS}
+    record_log = _IssueLog(path, "records", "record")
+    sky_log = _IssueLog(path, "horizontal_infrared_radiation_intensity")
+    monthly = {name: _MonthlyAccumulator() for name, _, _, _, _ in VALIDATED_FIELDS}
+    sky_temperatures = _MonthlyAccumulator()
+    directional = {name: _MonthlyAccumulator() for name, _ in ORIENTATIONS}
+    daily_ranges = _DailyRangeAccumulator()
+    years_by_month = [set() for _ in range(12)]  # type: List[Set[int]]
+    record_count = 0
+
+    for line in lines:
+        if not line.strip():
+            continue
+        record_count += 1
+        fields = line.split(",")
+        try:
+            year, month, day, hour, minute = (int(float(v)) for v in fields[:5])
+            if not (1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1] and 1 <= hour <= 24):
+                raise ValueError
+        except (ValueError, TypeError):
+            record_log.add(
+                record_count, "expected a valid year, month, day, hour and minute; observed {!r}.".format(line[:40])
+            )
+            continue
+        if len(fields) <= OPAQUE_SKY_COVER_FIELD:
+            record_log.add(
+                record_count, "expected at least {} fields; got {}.".format(OPAQUE_SKY_COVER_FIELD + 1, len(fields))
+            )
+            continue
+
+        month_index = month - 1
+        years_by_month[month_index].add(year)
+        # -- The date of the reading at the end of the record (24:00 is 0:00 of the next day)
+        reading_date = datetime.date(year, month, day)
+        if hour == 24 and (minute == 0 or minute >= 60):
+            reading_date += datetime.timedelta(days=1)
+        reading_month_index = reading_date.month - 1
+        values = {}  # type: Dict[str, float]
+        for name, field_index, missing_value, minimum, maximum in VALIDATED_FIELDS:
+            try:
+                value = float(fields[field_index])
+            except ValueError:
+                logs[name].add(record_count, "expected a number; observed {!r}.".format(fields[field_index]))
+                continue
+            if not _is_finite_real(value):
+                logs[name].add(record_count, "observed {!r}.".format(value))
+            elif value == missing_value:
+                logs[name].add(record_count, "observed missing sentinel {!r}.".format(missing_value))
+            elif value < minimum or value > maximum:
+                logs[name].add(record_count, "expected {} through {}; observed {!r}.".format(minimum, maximum, value))
+            else:
+                values[name] = value
+                monthly[name].add(reading_month_index if name in READING_FIELDS else month_index, value)
+
+        dry_bulb = values.get("dry_bulb_temperature")
+        dew_point = values.get("dew_point_temperature")
+        if dry_bulb is not None:
+            daily_ranges.add(reading_date, dry_bulb)
+
+        try:
+            horizontal_ir = float(fields[HORIZONTAL_INFRARED_FIELD])
+            sky_cover = float(fields[OPAQUE_SKY_COVER_FIELD])
+        except ValueError:
+            horizontal_ir = sky_cover = float("nan")
+        if not _is_finite_real(horizontal_ir) or horizontal_ir < 0:
+            sky_log.add(record_count, "expected a non-negative value; observed {!r}.".format(horizontal_ir))
+        elif horizontal_ir >= 9999:
+            if not _is_finite_real(sky_cover) or sky_cover < 0 or sky_cover > 10:
+                sky_log.add(
+                    record_count,
+                    "opaque_sky_cover required for horizontal-infrared fallback; observed {!r}.".format(sky_cover),
+                )
+            elif dry_bulb is not None and dew_point is not None:
+                horizontal_ir = calc_horizontal_infrared(sky_cover, dry_bulb, dew_point)
+                sky_temperatures.add(reading_month_index, calc_sky_temperature(horizontal_ir))
+        else:
+            sky_temperatures.add(reading_month_index, calc_sky_temperature(horizontal_ir))
+
+        direct_normal = values.get("direct_normal_radiation")
+        diffuse_horizontal = values.get("diffuse_horizontal_radiation")
+        if direct_normal is None or diffuse_horizontal is None:
+            continue
+        # -- The sun position at the middle of the record's interval (as Ladybug's hourly Wea)
+        # -- The minute is the end of each record (ie: 15, 30, 45, 60 for 15-minute records)
+        record_in_hour = min(max(int(round(minute / 60.0 * records_per_hour)) - 1, 0), records_per_hour - 1)
+        sun = sunpaths[calendar.isleap(year)].calculate_sun(
+            month, day, (hour - 1) + (record_in_hour + 0.5) * hours_per_record
+        )
+        for name, azimuth in ORIENTATIONS:
+            irradiance = _surface_irradiance(
+                sun, direct_normal, diffuse_horizontal, azimuth, ground_reflectance, isotropic
+            )
+            directional[name].add(month_index, irradiance)
+
+    if result.provenance.source_checksum is None:
+        return result  # -- The file could not be read
+
+    result.issues.extend(record_log.all_issues())
+    for name, _, _, _, _ in VALIDATED_FIELDS:
+        result.issues.extend(logs[name].all_issues())
+    result.issues.extend(sky_log.all_issues())
+    missing_months = [m + 1 for m in range(12) if not years_by_month[m]]
+    if missing_months:
+        result.issues.append(
+            _issue(path, "records", "expected records in every month; none in months {}.".format(missing_months))
+        )
+        return result
+
+    result.location_name = location.city
+    result.latitude = location.latitude
+    result.longitude = location.longitude
+    result.elevation = location.elevation
+    result.utc_offset = location.time_zone
+    result.provenance.source_name = location.city
+    years_per_month = [len(years) for years in years_by_month]
+    result.provenance.assumptions["source_records_per_hour"] = records_per_hour
+    result.provenance.assumptions["source_timestep_minutes"] = 60 // records_per_hour
+    result.provenance.assumptions["source_record_count"] = record_count
+    result.provenance.assumptions["source_years"] = sorted(set().union(*years_by_month))
+
+    if not logs["dry_bulb_temperature"].count:
+        result.monthly_air_temperatures = monthly["dry_bulb_temperature"].means()
+        warmest_months = _warmest_months(result.monthly_air_temperatures)
+        result.summer_daily_temperature_swing = daily_ranges.mean_range(warmest_months)
+        result.provenance.assumptions["warmest_consecutive_months"] = warmest_months
+    if not logs["dew_point_temperature"].count:
+        result.monthly_dewpoint_temperatures = monthly["dew_point_temperature"].means()
+    if not logs["wind_speed"].count:
+        wind = monthly["wind_speed"]
+        result.average_wind_speed = sum(wind.sums) / sum(wind.counts)
+    if not logs["global_horizontal_radiation"].count:
+        result.monthly_global_radiation = monthly["global_horizontal_radiation"].totals_kwh(
+            hours_per_record, years_per_month
+        )
+    sky_sources_valid = not (sky_log.count or logs["dry_bulb_temperature"].count or logs["dew_point_temperature"].count)
+    if sky_sources_valid:
+        result.monthly_sky_temperatures = sky_temperatures.means()
+    if not (logs["direct_normal_radiation"].count or logs["diffuse_horizontal_radiation"].count):
+        for name, azimuth in ORIENTATIONS:
+            field_name = "monthly_{}_radiation".format(name)
+            setattr(result, field_name, directional[name].totals_kwh(hours_per_record, years_per_month))
+        result.provenance.assumptions["vertical_plane_azimuths_degrees"] = dict(ORIENTATIONS)
+
+    _select_ground_temperature(result, _ground_series(header[3]), ground_temperature_depth)
+    required_monthly_values = (
+        result.monthly_air_temperatures,
+        result.monthly_dewpoint_temperatures,
+        result.monthly_sky_temperatures,
+        result.monthly_ground_temperatures,
+        result.monthly_north_radiation,
+        result.monthly_east_radiation,
+        result.monthly_south_radiation,
+        result.monthly_west_radiation,
+        result.monthly_global_radiation,
+    )
+    result.provenance.monthly_data_available = not result.issues and all(
+        values is not None for values in required_monthly_values
+    )
+    return result
@@ -3,11 +3,12 @@
 
 """Building 'Segment' Level Data Attributes"""
 
+import threading
 import warnings
 from copy import copy
 
 try:
-    from typing import Any, Dict, Union
+    from typing import Any, Dict, List, Optional, Union
 except ImportError:
     pass  # Python2.7
 
@@ -24,6 +25,7 @@ except ImportError as e:
 
 try:
     from honeybee_ph import _base, phi, phius, site
+    from honeybee_ph.thermal_bridge_collection import PhThermalBridgeCollection
     from honeybee_ph_standards.sourcefactors import factors
     from honeybee_ph_utils import enumerables
 except ImportError as e:
@@ -305,8 +307,8 @@ class BldgSegment(_base._Base):
             Default: 20.0.
         non_combustible_materials (bool): True if non-combustible construction.
             Default: False.
-        thermal_bridges (Dict[str, PhThermalBridge]): Thermal bridges keyed by
-            identifier.
+        thermal_bridges (PhThermalBridgeCollection): Thermal bridges keyed by
+            identifier, with the running totals of each thermal bridge group-type.
         wind_exposure_type (PhWindExposureType): Wind exposure classification.
         summer_ventilation (SummerVentilation): Summer ventilation parameters.
     """
@@ -324,7 +326,7 @@ class BldgSegment(_base._Base):
         self.set_points = SetPoints()
         self.mech_room_temp = 20.0
         self.non_combustible_materials = False
-        self.thermal_bridges = {}  # type: Dict[str, PhThermalBridge]
+        self._thermal_bridges = PhThermalBridgeCollection()
         self.wind_exposure_type = PhWindExposureType("1-SEVERAL_SIDES_EXPOSED_NO_SCREENING")
         self.summer_ventilation = SummerVentilation()
 
@@ -350,6 +352,18 @@ class BldgSegment(_base._Base):
         else:
             self.summer_ventilation.summer_bypass_mode = PhVentilationSummerBypassMode(value)
 
+    @property
+    def thermal_bridges(self):
+        # type: () -> PhThermalBridgeCollection
+        return self._thermal_bridges
+
+    @thermal_bridges.setter
+    def thermal_bridges(self, _thermal_bridges):
+        # type: (Dict[str, PhThermalBridge]) -> None
+        if not isinstance(_thermal_bridges, PhThermalBridgeCollection):
+            _thermal_bridges = PhThermalBridgeCollection(_thermal_bridges)
+        self._thermal_bridges = _thermal_bridges
+
     def add_new_thermal_bridge(self, tb):
         # type: (PhThermalBridge) -> None
         """Add a thermal bridge to this building segment.
@@ -408,8 +422,7 @@ class BldgSegment(_base._Base):
         obj.mech_room_temp = _dict["mech_room_temp"]
         obj.non_combustible_materials = _dict.get("non_combustible_materials", False)
         for tb_dict in _dict.get("thermal_bridges", {}).values():
-            tb_obj = PhThermalBridge.from_dict(tb_dict)
-            obj.thermal_bridges[tb_obj.identifier] = tb_obj
+            obj.add_new_thermal_bridge(PhThermalBridge.from_dict(tb_dict))
         # Support both new and old serialization formats
         if "summer_ventilation" in _dict:
             obj.summer_ventilation = SummerVentilation.from_dict(_dict["summer_ventilation"])
@@ -419,8 +432,8 @@ class BldgSegment(_base._Base):
 
         return obj
 
-    def __copy__(self):
-        # type () -> BldgSegment
+    def __copy__(self, _include_thermal_bridges=True):
+        # type: (bool) -> BldgSegment
         new_obj = BldgSegment()
         new_obj.set_base_attrs_from_source(self)
         new_obj.num_floor_levels = self.num_floor_levels
@@ -433,9 +446,8 @@ class BldgSegment(_base._Base):
         new_obj.set_points = self.set_points.duplicate()
         new_obj.mech_room_temp = self.mech_room_temp
         new_obj.non_combustible_materials = self.non_combustible_materials
-        new_obj.thermal_bridges = {}
-        for tb_k, tb_v in self.thermal_bridges.items():
-            new_obj.thermal_bridges[tb_k] = tb_v.duplicate()
+        if _include_thermal_bridges:
+            new_obj.thermal_bridges = self.thermal_bridges.duplicate()
         new_obj.summer_ventilation = self.summer_ventilation.duplicate()
         new_obj.wind_exposure_type = PhWindExposureType(self.wind_exposure_type.value)
         return new_obj
@@ -456,9 +468,8 @@ class BldgSegment(_base._Base):
         --------
             * BldgSegment: A new BldgSegment with the move applied.
         """
-        new_seg = self.duplicate()
-        for k, tb in new_seg.thermal_bridges.items():
-            new_seg.thermal_bridges[k] = tb.move(moving_vec3D)
+        new_seg = self.__copy__(_include_thermal_bridges=False)
+        new_seg.thermal_bridges = self.thermal_bridges.transformed(lambda tb: tb.move(moving_vec3D))
         new_seg.phius_certification = new_seg.phius_certification.move(moving_vec3D)
         new_seg.phi_certification = new_seg.phi_certification.move(moving_vec3D)
         return new_seg
@@ -481,9 +492,10 @@ class BldgSegment(_base._Base):
         --------
             * BldgSegment: A new BldgSegment with the rotation applied.
         """
-        new_seg = self.duplicate()
-        for k, tb in new_seg.thermal_bridges.items():
-            new_seg.thermal_bridges[k] = tb.rotate(axis_vec3D, angle_degrees, origin_pt3D)
+        new_seg = self.__copy__(_include_thermal_bridges=False)
+        new_seg.thermal_bridges = self.thermal_bridges.transformed(
+            lambda tb: tb.rotate(axis_vec3D, angle_degrees, origin_pt3D)
+        )
         new_seg.phius_certification = new_seg.phius_certification.rotate(axis_vec3D, angle_degrees, origin_pt3D)
         new_seg.phi_certification = new_seg.phi_certification.rotate(axis_vec3D, angle_degrees, origin_pt3D)
         return new_seg
@@ -501,9 +513,8 @@ class BldgSegment(_base._Base):
         --------
             * BldgSegment: A new BldgSegment with the rotation applied.
         """
-        new_seg = self.duplicate()
-        for k, tb in new_seg.thermal_bridges.items():
-            new_seg.thermal_bridges[k] = tb.rotate_xy(angle_degrees, origin_pt3D)
+        new_seg = self.__copy__(_include_thermal_bridges=False)
+        new_seg.thermal_bridges = self.thermal_bridges.transformed(lambda tb: tb.rotate_xy(angle_degrees, origin_pt3D))
         new_seg.phius_certification = new_seg.phius_certification.rotate_xy(angle_degrees, origin_pt3D)
         new_seg.phi_certification = new_seg.phi_certification.rotate_xy(angle_degrees, origin_pt3D)
         return new_seg
@@ -520,9 +531,8 @@ class BldgSegment(_base._Base):
         --------
             * BldgSegment: A new BldgSegment with the reflection applied.
         """
-        new_seg = self.duplicate()
-        for k, tb in new_seg.thermal_bridges.items():
-            new_seg.thermal_bridges[k] = tb.reflect(plane)
+        new_seg = self.__copy__(_include_thermal_bridges=False)
+        new_seg.thermal_bridges = self.thermal_bridges.transformed(lambda tb: tb.reflect(plane))
         new_seg.phius_certification = new_seg.phius_certification.reflect(plane)
         new_seg.phi_certification = new_seg.phi_certification.reflect(plane)
         return new_seg
@@ -541,10 +551,118 @@ class BldgSegment(_base._Base):
         --------
             * BldgSegment: A new BldgSegment with the scaling applied.
         """
-        new_seg = self.duplicate()
-        for k, tb in new_seg.thermal_bridges.items():
-            new_seg.thermal_bridges[k] = tb.scale(scale_factor, origin_pt3D)
+        new_seg = self.__copy__(_include_thermal_bridges=False)
+        new_seg.thermal_bridges = self.thermal_bridges.transformed(
+            lambda tb: tb.scale(scale_factor, origin_pt3D), abs(scale_factor)
+        )
         new_seg.phius_certification = new_seg.phius_certification.scale(scale_factor, origin_pt3D)
         new_seg.phi_certification = new_seg.phi_certification.scale(scale_factor, origin_pt3D)
 
         return new_seg
+
+
+## --------------------------------------------------------------------------------------
+## -- Building Segment Registry
+
+
+class BldgSegmentRegistry(object):
+    """A collection of BldgSegments with only one (shared) BldgSegment per identifier.
+
+    A BldgSegment can hold the Site / Climate data and thousands of thermal bridges, so the
+    Rooms of a Model share one BldgSegment object per identifier rather than each keeping
+    its own copy. `ModelPhProperties.intern_bldg_segments` uses a registry to do this for a
+    Model, and the registry can also be used as a context-manager while loading Rooms one
+    at a time from non-abridged dicts:
+
+    >>> with BldgSegmentRegistry():
+    >>>     rooms = [Room.from_dict(d) for d in room_dicts]  # -- Rooms share their BldgSegments
+
+    Attributes:
+        segments (List[BldgSegment]): The registered BldgSegments.
+    """
+
+    _local = threading.local()
+
+    def __init__(self):
+        self._segments = {}  # type: Dict[str, BldgSegment]
+        self._source_dicts = {}  # type: Dict[str, Dict[str, Any]]
+        self._previous = None  # type: Optional[BldgSegmentRegistry]
+
+    @classmethod
+    def active(cls):
+        # type: () -> Optional[BldgSegmentRegistry]
+        """Return the registry of the current `with BldgSegmentRegistry():` block (in this thread), if any."""
+        return getattr(cls._local, "registry", None)
+
+    @property
+    def segments(self):
+        # type: () -> List[BldgSegment]
+        return list(self._segments.values())
+
+    def get(self, _identifier):
+        # type: (str) -> Optional[BldgSegment]
+        """Return the registered BldgSegment with the identifier, or None if there is none."""
+        return self._segments.get(_identifier)
+
+    def add(self, _segment):
+        # type: (BldgSegment) -> BldgSegment
+        """Register the BldgSegment, and return the shared BldgSegment for its identifier.
+
+        If a BldgSegment with the same identifier is already registered, that one is returned
+        and the new one is not registered. Otherwise the new one is registered and returned.
+        """
+        existing = self._segments.get(_segment.identifier)
+        if existing is not None:
+            return existing
+        self._segments[_segment.identifier] = _segment
+        return _segment
+
+    def from_dict(self, _dict):
+        # type: (Dict[str, Any]) -> BldgSegment
+        """Return the shared BldgSegment for a BldgSegment dict, building it only if needed.
+
+        The registered BldgSegment is only re-used if its dict matches the input exactly.
+        A dict with the identifier of a registered BldgSegment but different values is built
+        into a new (un-registered) BldgSegment, the same as `BldgSegment.from_dict`.
+        """
+        identifier = _dict.get("identifier", "")
+        existing = self._segments.get(identifier)
+        if existing is not None:
+            if identifier not in self._source_dicts:
+                self._source_dicts[identifier] = existing.to_dict()
+            if self._source_dicts[identifier] == _dict:
+                return existing
+            return BldgSegment.from_dict(_dict)
+
+        new_segment = BldgSegment.from_dict(_dict)
+        self._segments[identifier] = new_segment
+        self._source_dicts[identifier] = _dict
+        return new_segment
+
+    def __enter__(self):
+        # type: () -> BldgSegmentRegistry
+        self._previous = self.active()
+        self._local.registry = self
+        return self
+
+    def __exit__(self, *args):
+        self._local.registry = self._previous
+        self._previous = None
+
+    def __len__(self):
+        return len(self._segments)
+
+    def __contains__(self, _identifier):
+        return _identifier in self._segments
+
+    def __iter__(self):
+        return iter(self._segments.values())
+
+    def __str__(self):
+        return "{}(segments={})".format(self.__class__.__name__, len(self))
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Compare the monthly climate data of many sites at once.
+
+A ClimateSet holds any number of PH-Climates (ie: from `Site.from_epw` for each of the
+candidate sites) and stores their monthly temperatures and radiation column-by-column:
+one list per field and month, with one value per Climate. Queries across all of the
+sites (degree-hours, peak months, radiation rankings) then work on those columns
+instead of walking the nested Climate objects of each site:
+
+>>> climates = ClimateSet.from_epw_files(["site_a.epw", "site_b.epw", "site_c.epw"])
+>>> climates.heating_degree_hours(20.0)
+>>> climates.rank_by_radiation("south")
+>>> climates.to_csv("climates.csv")
+
+The values are copied from each Climate when it is added. Call `refresh()` after
+editing any of the Climates.
+"""
+
+import csv
+import json
+
+try:
+    from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from itertools import izip as zip  # type: ignore
+except ImportError:
+    pass  # Python3
+
+try:
+    from honeybee_ph.site import Climate, Climate_MonthlyValueSet, Site
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
+
+
+TEMPERATURE_FIELDS = ("air_temps", "dewpoints", "sky_temps", "ground_temps")
+RADIATION_FIELDS = ("north", "east", "south", "west", "glob")
+MONTHLY_FIELDS = TEMPERATURE_FIELDS + RADIATION_FIELDS
+# -- The hours in each month of a non-leap year.
+HOURS_PER_MONTH = (744, 672, 744, 720, 744, 720, 744, 744, 720, 744, 720, 744)
+CSV_COLUMNS = (
+    ["climate", "identifier", "field"]
+    + Climate_MonthlyValueSet.months
+    + ["annual", "source_type", "source_uri", "source_checksum", "is_certification_approved"]
+)
+
+
+def _climate_value_set(_climate, _field_name):
+    # type: (Climate, str) -> Climate_MonthlyValueSet
+    if _field_name in TEMPERATURE_FIELDS:
+        return getattr(_climate.monthly_temps, _field_name)
+    return getattr(_climate.monthly_radiation, _field_name)
+
+
+def _check_field_name(_field_name, _allowed=MONTHLY_FIELDS):
+    # type: (str, Tuple[str, ...]) -> None
+    if _field_name not in _allowed:
+        raise ValueError("Error: field must be one of {}. Got: {!r}.".format(", ".join(_allowed), _field_name))
+
+
+def _open_csv(_file_path):
+    # type: (str) -> Any
+    try:
+        return open(_file_path, "w", newline="")
+    except TypeError:
+        return open(_file_path, "wb")  # Python 2.7
+
+
+class ClimateSet(object):
+    """A collection of PH-Climates, with their monthly values stored as columns.
+
+    Attributes:
+        climates (List[Climate]): The Climates, in the order they were added.
+    """
+
+    def __init__(self, _climates=None):
+        # type: (Optional[Iterable[Climate]]) -> None
+        self.climates = []  # type: List[Climate]
+        self._columns = self._empty_columns()
+        for climate in _climates or []:
+            self.add(climate)
+
+    @staticmethod
+    def _empty_columns():
+        # type: () -> Dict[str, List[List[float]]]
+        """One list per field and month, for the value of each Climate."""
+        return {field_name: [[] for _ in range(12)] for field_name in MONTHLY_FIELDS}
+
+    @classmethod
+    def from_sites(cls, _sites):
+        # type: (Iterable[Site]) -> ClimateSet
+        """Return a new ClimateSet with the Climate of each of the Sites."""
+        return cls(site.climate for site in _sites)
+
+    @classmethod
+    def from_epw_files(cls, _file_paths, *args, **kwargs):
+        # type: (Iterable[str], Any, Any) -> ClimateSet
+        """Return a new ClimateSet with a Climate converted from each EPW file.
+
+        Any other arguments are passed on to `Site.from_epw`, which raises a
+        ValueError if any of the files can not be converted.
+        """
+        return cls.from_sites(Site.from_epw(file_path, *args, **kwargs) for file_path in _file_paths)
+
+    def add(self, _climate):
+        # type: (Climate) -> None
+        """Add a Climate (and a copy of its monthly values) to the set."""
+        self.climates.append(_climate)
+        for field_name, columns in self._columns.items():
+            for column, value in zip(columns, _climate_value_set(_climate, field_name).values):
+                column.append(value)
+
+    def refresh(self):
+        # type: () -> None
+        """Copy the monthly values from the Climates again, after any of them were edited."""
+        climates, self.climates = self.climates, []
+        self._columns = self._empty_columns()
+        for climate in climates:
+            self.add(climate)
+
+    # -------------------------------------------------------------------------
+    # -- Columns
+
+    @property
+    def names(self):
+        # type: () -> List[str]
+        """The display-name of each Climate."""
+        return [c.display_name for c in self.climates]
+
+    def monthly_column(self, _field_name, _month):
+        # type: (str, int) -> List[float]
+        """Return the value of each Climate for one field (ie: "air_temps") and month (1-12)."""
+        _check_field_name(_field_name)
+        return list(self._columns[_field_name][_month - 1])
+
+    def monthly_values(self, _field_name):
+        # type: (str) -> List[List[float]]
+        """Return the 12 monthly values of each Climate for one field (ie: "south")."""
+        _check_field_name(_field_name)
+        return [list(values) for values in zip(*self._columns[_field_name])]
+
+    def annual_totals(self, _field_name):
+        # type: (str) -> List[float]
+        """Return the sum of the 12 monthly values of each Climate (ie: the annual radiation in kWh/m2)."""
+        _check_field_name(_field_name)
+        totals = [0.0] * len(self.climates)
+        for column in self._columns[_field_name]:
+            totals = [total + value for total, value in zip(totals, column)]
+        return totals
+
+    def annual_means(self, _field_name):
+        # type: (str) -> List[float]
+        """Return the mean of the 12 monthly values of each Climate (ie: the mean air temperature)."""
+        return [total / 12.0 for total in self.annual_totals(_field_name)]
+
+    # -------------------------------------------------------------------------
+    # -- Queries
+
+    def _degree_hours(self, _difference):
+        # type: (Callable[[float], float]) -> List[float]
+        totals = [0.0] * len(self.climates)
+        for column, hours in zip(self._columns["air_temps"], HOURS_PER_MONTH):
+            totals = [total + max(_difference(temp), 0.0) * hours for total, temp in zip(totals, column)]
+        return totals
+
+    def heating_degree_hours(self, _base_temperature=20.0):
+        # type: (float) -> List[float]
+        """Return the heating degree-hours [K-h] of each Climate, from the monthly mean air temperatures.
+
+        Arguments:
+        ----------
+            * _base_temperature (float): The interior (base) temperature [C]. Default: 20.0
+
+        Returns:
+        --------
+            * (List[float]): The sum of (base - monthly air temperature) x hours of each
+                month colder than the base, for each Climate. A non-leap year is used.
+        """
+        return self._degree_hours(lambda temp: _base_temperature - temp)
+
+    def cooling_degree_hours(self, _base_temperature=25.0):
+        # type: (float) -> List[float]
+        """Return the cooling degree-hours [K-h] of each Climate, from the monthly mean air temperatures.
+
+        Arguments:
+        ----------
+            * _base_temperature (float): The interior (base) temperature [C]. Default: 25.0
+
+        Returns:
+        --------
+            * (List[float]): The sum of (monthly air temperature - base) x hours of each
+                month warmer than the base, for each Climate. A non-leap year is used.
+        """
+        return self._degree_hours(lambda temp: temp - _base_temperature)
+
+    def peak_months(self, _field_name, _lowest=False):
+        # type: (str, bool) -> List[int]
+        """Return the month (1-12) with the highest (or lowest) value of the field, for each Climate.
+
+        Arguments:
+        ----------
+            * _field_name (str): The monthly field (ie: "air_temps" or "glob").
+            * _lowest (bool): Set True to find the lowest month. Default: False.
+
+        Returns:
+        --------
+            * (List[int]): The month number of each Climate. Ties go to the earlier month.
+        """
+        select = min if _lowest else max
+        return [select(range(12), key=values.__getitem__) + 1 for values in self.monthly_values(_field_name)]
+
+    def rank_by_radiation(self, _orientation="south", _months=None):
+        # type: (str, Optional[Iterable[int]]) -> List[Tuple[Climate, float]]
+        """Return the Climates sorted by their radiation on one orientation, highest first.
+
+        Arguments:
+        ----------
+            * _orientation (str): One of "north", "east", "south", "west" or "glob". Default: "south".
+            * _months (Optional[Iterable[int]]): The months (1-12) to total. Default: None (all year).
+
+        Returns:
+        --------
+            * (List[Tuple[Climate, float]]): Each Climate and its total radiation [kWh/m2].
+                Climates with equal totals keep the order they were added in.
+        """
+        _check_field_name(_orientation, RADIATION_FIELDS)
+        if _months is None:
+            totals = self.annual_totals(_orientation)
+        else:
+            totals = [0.0] * len(self.climates)
+            for month in _months:
+                column = self._columns[_orientation][month - 1]
+                totals = [total + value for total, value in zip(totals, column)]
+        return sorted(zip(self.climates, totals), key=lambda item: -item[1])
+
+    # -------------------------------------------------------------------------
+    # -- Export
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        """Return the ClimateSet as column-oriented dict: each field has the 12 values of each Climate."""
+        d = {}
+        d["names"] = self.names
+        d["identifiers"] = [c.identifier for c in self.climates]
+        d["provenance"] = [c.provenance.to_dict() if c.provenance is not None else None for c in self.climates]
+        d["station_elevation"] = [c.station_elevation for c in self.climates]
+        d["summer_daily_temperature_swing"] = [c.summer_daily_temperature_swing for c in self.climates]
+        d["average_wind_speed"] = [c.average_wind_speed for c in self.climates]
+        d["monthly"] = {field_name: self.monthly_values(field_name) for field_name in MONTHLY_FIELDS}
+        return d
+
+    def to_json(self, _file_path, _indent=None):
+        # type: (str, Optional[int]) -> str
+        """Write the ClimateSet's dict (see `to_dict`) to a JSON file, and return the file path."""
+        with open(_file_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=_indent)
+        return _file_path
+
+    def iter_rows(self):
+        # type: () -> Iterator[List[Any]]
+        """Yield one row (see CSV_COLUMNS) for each Climate and monthly field.
+
+        The 'annual' value is the mean of the 12 months for the temperature fields,
+        and the total of the 12 months for the radiation fields.
+        """
+        for i, climate in enumerate(self.climates):
+            provenance = climate.provenance
+            source = (
+                [None] * 4
+                if provenance is None
+                else [
+                    provenance.source_type,
+                    provenance.source_uri,
+                    provenance.source_checksum,
+                    provenance.is_certification_approved,
+                ]
+            )
+            for field_name in MONTHLY_FIELDS:
+                values = [column[i] for column in self._columns[field_name]]
+                annual = sum(values) / 12.0 if field_name in TEMPERATURE_FIELDS else sum(values)
+                yield [climate.display_name, climate.identifier, field_name] + values + [annual] + source
+
+    def to_csv(self, _file_path):
+        # type: (str) -> str
+        """Write the rows (see `iter_rows`) to a CSV file with a header row, and return the file path."""
+        with _open_csv(_file_path) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            for row in self.iter_rows():
+                writer.writerow(["" if v is None else v for v in row])
+        return _file_path
+
+    # -------------------------------------------------------------------------
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.climates)
+
+    def __iter__(self):
+        # type: () -> Iterator[Climate]
+        return iter(self.climates)
+
+    def __getitem__(self, _index):
+        # type: (int) -> Climate
+        return self.climates[_index]
+
+    def __str__(self):
+        return "{}(climates={})".format(self.__class__.__name__, len(self))
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
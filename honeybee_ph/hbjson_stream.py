@@ -0,0 +1,624 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Streaming HBJSON writer and reader for Honeybee Models with Passive-House (.ph / .ph_hvac) properties.
+
+`Model.to_dict()` builds the complete nested dict of the model before `json.dump` can
+run. The functions here write the same HBJSON schema incrementally instead: the model
+'skeleton' is written key-by-key, and the Rooms, orphaned objects and the model-level
+BldgSegments are each serialized and written one at a time. Peak memory is therefore
+bounded by the largest single Room rather than by the whole Model.
+
+Going the other way, `Model.from_hbjson()` loads the entire HBJSON dict before any
+PH properties are applied. `iter_hbjson_rooms()` instead reads the file incrementally:
+a first pass builds an index of the BldgSegments and mechanical systems, and a second
+pass rebuilds one Room (with its .ph and .ph_hvac properties) at a time.
+
+Usage:
+>>> from honeybee_ph import hbjson_stream
+>>> hbjson_stream.write_hbjson(model, name="my_model", folder="/tmp")
+>>> for room in hbjson_stream.iter_hbjson_rooms("/tmp/my_model.hbjson"):
+>>>     print(room.properties.ph.total_space_floor_area)
+"""
+
+import io
+import json
+import os
+import types
+
+try:
+    from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from itertools import izip as zip  # type: ignore
+except ImportError:
+    pass  # Python3
+
+try:
+    from honeybee.config import folders
+    from honeybee.model import Model
+    from honeybee.room import Room
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from honeybee_ph.bldg_segment import BldgSegment
+    from honeybee_ph.team import ProjectTeam
+    from honeybee_ph.window_library import WINDOW_LIBRARY_KEY, PhWindowLibrary
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
+
+try:
+    from honeybee_phhvac.properties.model import ModelPhHvacProperties
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_phhvac:\n\t{}".format(e))
+
+
+class StreamObject(dict):
+    """A JSON-object whose values are written one key at a time.
+
+    Any value of a StreamObject may be a generator, which will be written as a JSON
+    array, with each item created (and released) as it is written. Generator items
+    may themselves be StreamObjects. All other values are encoded in a single step.
+    """
+
+    __slots__ = ()
+
+
+def _encode(_obj, _indent, _level):
+    # type: (Any, Optional[int], int) -> str
+    """Return the JSON text for a fully-built object, indented to the current level."""
+    if _indent is None:
+        return json.dumps(_obj)
+    return json.dumps(_obj, indent=_indent).replace("\n", "\n" + " " * (_indent * _level))
+
+
+def _encode_key(_key):
+    # type: (Any) -> str
+    if isinstance(_key, str):
+        return json.dumps(_key)
+    return json.dumps(str(_key))
+
+
+def iter_json_chunks(_obj, _indent=None, _level=0):
+    # type: (Any, Optional[int], int) -> Iterator[str]
+    """Yield the JSON text of an object as a series of string chunks.
+
+    StreamObjects are written key-by-key and generators are written as JSON arrays,
+    item-by-item. All other values are encoded using the standard `json` module.
+
+    Arguments:
+    ----------
+        * _obj (Any): The object to encode.
+        * _indent (Optional[int]): The JSON indentation. Default: None (compact).
+        * _level (int): The current nesting level. Default: 0.
+
+    Yields:
+    -------
+        * str: The next chunk of JSON text.
+    """
+    if _indent is None:
+        item_sep, key_sep, open_pad, close_pad = ", ", ": ", "", ""
+    else:
+        item_sep = ",\n" + " " * (_indent * (_level + 1))
+        key_sep = ": "
+        open_pad = "\n" + " " * (_indent * (_level + 1))
+        close_pad = "\n" + " " * (_indent * _level)
+
+    if isinstance(_obj, StreamObject):
+        if not _obj:
+            yield "{}"
+            return
+        yield "{" + open_pad
+        for i, (key, value) in enumerate(_obj.items()):
+            if i:
+                yield item_sep
+            yield _encode_key(key) + key_sep
+            for chunk in iter_json_chunks(value, _indent, _level + 1):
+                yield chunk
+        yield close_pad + "}"
+
+    elif isinstance(_obj, types.GeneratorType):
+        is_empty = True
+        for item in _obj:
+            yield ("[" + open_pad) if is_empty else item_sep
+            is_empty = False
+            for chunk in iter_json_chunks(item, _indent, _level + 1):
+                yield chunk
+        yield "[]" if is_empty else (close_pad + "]")
+
+    else:
+        yield _encode(_obj, _indent, _level)
+
+
+def dump(_obj, _file, _indent=None):
+    # type: (Any, IO[str], Optional[int]) -> None
+    """Write an object (which may contain StreamObjects and generators) as JSON to an open file.
+
+    Arguments:
+    ----------
+        * _obj (Any): The object to write.
+        * _file (IO[str]): The open (text-mode) file-handle to write to.
+        * _indent (Optional[int]): The JSON indentation. Default: None (compact).
+
+    Returns:
+    --------
+        * None
+    """
+    for chunk in iter_json_chunks(_obj, _indent):
+        _file.write(chunk)
+
+
+# -----------------------------------------------------------------------------
+# -- Honeybee-Model
+
+
+def _model_ph_stream_dict(_model_ph_properties):
+    # type: (Any) -> Dict[str, StreamObject]
+    """Return the un-abridged ModelPhProperties dict with the BldgSegments as a generator.
+
+    Matches the schema of `ModelPhProperties.to_dict(abridged=False)`.
+    """
+    d = StreamObject()
+    d["type"] = "ModelPhPropertiesAbridged"
+    d["id_num"] = _model_ph_properties.id_num
+    d["bldg_segments"] = _model_ph_properties._iter_bldg_segment_dicts()
+    d["team"] = _model_ph_properties.team.to_dict()
+    return {"ph": d}
+
+
+def _model_properties_stream_dict(_model, _included_prop=None):
+    # type: (Model, Optional[List[str]]) -> StreamObject
+    """Return the Model's extension properties, matching the schema of `ModelProperties.to_dict()`."""
+    base = StreamObject()
+    base["type"] = "ModelProperties"
+    attrs = _included_prop if _included_prop is not None else _model.properties._extension_attributes
+    for atr in attrs:
+        var = getattr(_model.properties, atr)
+        if not hasattr(var, "to_dict"):
+            continue
+        if atr == "ph":
+            base.update(_model_ph_stream_dict(var))
+        else:
+            base.update(var.to_dict())
+    return base
+
+
+def model_stream_dict(_model, _included_prop=None, _include_plane=True):
+    # type: (Model, Optional[List[str]], bool) -> StreamObject
+    """Return a StreamObject of the Model, matching the schema of `Model.to_dict()`.
+
+    Nothing below the Model level is serialized until the StreamObject is written.
+
+    Arguments:
+    ----------
+        * _model (Model): The Honeybee-Model to serialize.
+        * _included_prop (Optional[List[str]]): List of the extension properties to
+            include. If None, all extension properties are included. Default: None.
+        * _include_plane (bool): Include the planes of the Face3Ds. Default: True.
+
+    Returns:
+    --------
+        * StreamObject: The Model 'skeleton' with a generator for each list of sub-objects.
+    """
+    base = StreamObject()
+    base["type"] = "Model"
+    base["identifier"] = _model.identifier
+    base["display_name"] = _model.display_name
+    base["units"] = _model.units
+    base["properties"] = _model_properties_stream_dict(_model, _included_prop)
+    if _model.rooms:
+        base["rooms"] = (r.to_dict(True, _included_prop, _include_plane) for r in _model.rooms)
+    if _model.orphaned_faces:
+        base["orphaned_faces"] = (f.to_dict(True, _included_prop, _include_plane) for f in _model.orphaned_faces)
+    if _model.orphaned_apertures:
+        base["orphaned_apertures"] = (
+            ap.to_dict(True, _included_prop, _include_plane) for ap in _model.orphaned_apertures
+        )
+    if _model.orphaned_doors:
+        base["orphaned_doors"] = (dr.to_dict(True, _included_prop, _include_plane) for dr in _model.orphaned_doors)
+    if _model.orphaned_shades:
+        base["orphaned_shades"] = (shd.to_dict(True, _included_prop, _include_plane) for shd in _model.orphaned_shades)
+    if _model.shade_meshes:
+        base["shade_meshes"] = (sm.to_dict(True, _included_prop) for sm in _model.shade_meshes)
+    if _model.tolerance != 0:
+        base["tolerance"] = _model.tolerance
+    if _model.angle_tolerance != 0:
+        base["angle_tolerance"] = _model.angle_tolerance
+    if _model.user_data is not None:
+        base["user_data"] = _model.user_data
+    if folders.honeybee_schema_version is not None:
+        base["version"] = folders.honeybee_schema_version_str
+    return base
+
+
+def dump_model(_model, _file, _indent=None, _included_prop=None, _include_plane=True):
+    # type: (Model, IO[str], Optional[int], Optional[List[str]], bool) -> None
+    """Stream a Honeybee-Model as HBJSON to an open (text-mode) file.
+
+    Arguments:
+    ----------
+        * _model (Model): The Honeybee-Model to write.
+        * _file (IO[str]): The open file-handle to write to.
+        * _indent (Optional[int]): The JSON indentation. Default: None (compact).
+        * _included_prop (Optional[List[str]]): List of the extension properties to
+            include. If None, all extension properties are included. Default: None.
+        * _include_plane (bool): Include the planes of the Face3Ds. Default: True.
+
+    Returns:
+    --------
+        * None
+    """
+    dump(model_stream_dict(_model, _included_prop, _include_plane), _file, _indent)
+
+
+def write_hbjson(_model, name=None, folder=None, indent=None, included_prop=None):
+    # type: (Model, Optional[str], Optional[str], Optional[int], Optional[List[str]]) -> str
+    """Stream a Honeybee-Model to an HBJSON file. A drop-in for `Model.to_hbjson()`.
+
+    Sub-face triangulation (`triangulate_sub_faces`) is not supported when streaming.
+
+    Arguments:
+    ----------
+        * _model (Model): The Honeybee-Model to write.
+        * name (Optional[str]): The name of the HBJSON file. If None, the model
+            identifier will be used. Default: None.
+        * folder (Optional[str]): The directory to write the file to. If None, the
+            Honeybee default simulation folder is used. Default: None.
+        * indent (Optional[int]): The JSON indentation. Default: None (compact).
+        * included_prop (Optional[List[str]]): List of the extension properties to
+            include. If None, all extension properties are included. Default: None.
+
+    Returns:
+    --------
+        * str: The path to the HBJSON file.
+    """
+    if name is None:
+        name = _model.identifier
+    if name.lower().endswith(".hbjson") or name.lower().endswith(".json"):
+        file_name = name
+    else:
+        file_name = "{}.hbjson".format(name)
+    folder = folder if folder is not None else folders.default_simulation_folder
+    hb_file = os.path.join(folder, file_name)
+
+    with open(hb_file, "w") as fp:
+        dump_model(_model, fp, indent, included_prop)
+    return hb_file
+
+
+# -----------------------------------------------------------------------------
+# -- Incremental Reader
+
+
+class IncrementalJsonReader(object):
+    """Read the items of a JSON document from an open file without loading the whole document.
+
+    The file is read in chunks. Individual values are decoded with the standard `json`
+    module once they are complete, and any value which is an array may instead be
+    consumed one item at a time with `iter_array()`.
+
+    Attributes:
+        chunk_size (int): The number of characters to read from the file at a time.
+    """
+
+    _WHITESPACE = " \t\n\r"
+    _NUMBER_CHARS = "0123456789.eE+-"
+
+    def __init__(self, _file, _chunk_size=65536):
+        # type: (IO[str], int) -> None
+        self._file = _file
+        self.chunk_size = _chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, _size=None):
+        # type: (Optional[int]) -> bool
+        """Read more text into the buffer, discarding what was consumed. Return False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._file.read(_size or self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        # type: () -> str
+        """Return the next non-whitespace character (without consuming it), or "" at EOF."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, _char):
+        # type: (str) -> None
+        """Consume the next non-whitespace character, which must be the one given."""
+        found = self.peek()
+        if found != _char:
+            raise ValueError("Invalid JSON: expected {!r} but found {!r}.".format(_char, found))
+        self._pos += 1
+
+    def read_value(self):
+        # type: () -> Any
+        """Decode and return the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                # -- The value is not yet complete. Double the read each time so that
+                # -- large values are only re-scanned a logarithmic number of times.
+                if not self._fill(max(self.chunk_size, len(self._buf))):
+                    raise
+                continue
+
+            if self._may_be_truncated(value, end) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _may_be_truncated(self, _value, _end):
+        # type: (Any, int) -> bool
+        """Return True if the decoded value may continue past the end of the buffered text.
+
+        Only numbers can be cut short and still decode (ie: "12" from "12.5").
+        """
+        if _end >= len(self._buf):
+            return True
+        if isinstance(_value, bool) or not isinstance(_value, (int, float)):
+            return False
+        return self._buf[_end] in self._NUMBER_CHARS
+
+    def iter_array(self):
+        # type: () -> Iterator[Any]
+        """Yield the items of the next JSON array, one at a time."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if self.peek() == ",":
+                self._pos += 1
+            else:
+                self.expect("]")
+                return
+
+    def iter_object_items(self, _stream_keys=()):
+        # type: (Iterable[str]) -> Iterator[Tuple[str, Any]]
+        """Yield the (key, value) pairs of the next JSON object, one at a time.
+
+        For any key in `_stream_keys` whose value is an array, the value yielded is a
+        generator of the array items instead of a list. Any items not consumed
+        before the next pair is requested are skipped.
+
+        Arguments:
+        ----------
+            * _stream_keys (Iterable[str]): The keys whose array-values should be streamed.
+
+        Yields:
+        -------
+            * Tuple[str, Any]: The key and the (decoded or streamed) value.
+        """
+        stream_keys = set(_stream_keys)
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            if key in stream_keys and self.peek() == "[":
+                items = self.iter_array()
+                yield key, items
+                for _ in items:
+                    pass
+            else:
+                yield key, self.read_value()
+
+            if self.peek() == ",":
+                self._pos += 1
+            else:
+                self.expect("}")
+                return
+
+
+def iter_hbjson_items(_file_path, _stream_keys=("rooms",), _chunk_size=65536):
+    # type: (str, Iterable[str], int) -> Iterator[Tuple[str, Any]]
+    """Yield the top-level (key, value) pairs of an HBJSON file without loading the whole file.
+
+    Arguments:
+    ----------
+        * _file_path (str): The path to the HBJSON file.
+        * _stream_keys (Iterable[str]): The top-level keys whose list-values should be
+            yielded as generators of their items. Default: ("rooms",).
+        * _chunk_size (int): The number of characters to read from the file at a time.
+
+    Yields:
+    -------
+        * Tuple[str, Any]: The top-level key and its (decoded or streamed) value.
+    """
+    with io.open(_file_path, "r", encoding="utf-8") as f:
+        reader = IncrementalJsonReader(f, _chunk_size)
+        for item in reader.iter_object_items(_stream_keys):
+            yield item
+
+
+def _room_ph_hvac_dicts(_room_dicts):
+    # type: (Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]
+    """Yield the .ph_hvac properties dict of each room-dict that has one."""
+    for room_dict in _room_dicts:
+        ph_hvac_dict = room_dict.get("properties", {}).get("ph_hvac")
+        if ph_hvac_dict:
+            yield ph_hvac_dict
+
+
+class HbjsonPhIndex(object):
+    """The model-level Passive-House objects collected by a first pass over an HBJSON file.
+
+    Attributes:
+        identifier (str): The Model identifier.
+        units (str): The Model units.
+        tolerance (float): The Model tolerance.
+        angle_tolerance (float): The Model angle-tolerance.
+        room_count (int): The number of Rooms in the Model.
+        id_num (int): The ModelPhProperties id_num.
+        bldg_segments (Dict[str, BldgSegment]): The BldgSegments, keyed by identifier.
+        team (ProjectTeam): The ModelPhProperties project team.
+        mechanical_systems (Dict[str, Dict[str, Any]]): The mechanical systems, keyed
+            by system-type then identifier.
+        window_library (Optional[PhWindowLibrary]): The window library of a compact HBJSON, or None.
+    """
+
+    def __init__(self):
+        self.identifier = None  # type: Optional[str]
+        self.units = "Meters"
+        self.tolerance = 0.0
+        self.angle_tolerance = 1.0
+        self.room_count = 0
+        self.id_num = 0
+        self.bldg_segments = {}  # type: Dict[str, BldgSegment]
+        self.team = ProjectTeam()
+        self.mechanical_systems = ModelPhHvacProperties._build_mechanical_devices_from_dict([])
+        self.window_library = None  # type: Optional[PhWindowLibrary]
+
+    @classmethod
+    def from_hbjson(cls, _file_path, _chunk_size=65536):
+        # type: (str, int) -> HbjsonPhIndex
+        """Build the index with a single incremental pass over an HBJSON file.
+
+        Arguments:
+        ----------
+            * _file_path (str): The path to the HBJSON file.
+            * _chunk_size (int): The number of characters to read from the file at a time.
+
+        Returns:
+        --------
+            * HbjsonPhIndex: The new index.
+        """
+        obj = cls()
+        tolerance = None
+        for key, value in iter_hbjson_items(_file_path, ("rooms",), _chunk_size):
+            if key == "identifier":
+                obj.identifier = value
+            elif key == "units" and value is not None:
+                obj.units = value
+            elif key == "tolerance":
+                tolerance = value
+            elif key == "angle_tolerance" and value is not None:
+                obj.angle_tolerance = value
+            elif key == "properties":
+                obj._load_model_ph_properties((value or {}).get("ph") or {})
+            elif key == "rooms" and value is not None:
+                obj.mechanical_systems = ModelPhHvacProperties._build_mechanical_devices_from_dict(
+                    _room_ph_hvac_dicts(obj._count_rooms(value))
+                )
+
+        if tolerance is None:
+            obj.tolerance = Model.UNITS_TOLERANCES[obj.units]
+        else:
+            obj.tolerance = tolerance
+        return obj
+
+    def _count_rooms(self, _room_dicts):
+        # type: (Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]
+        for room_dict in _room_dicts:
+            self.room_count += 1
+            yield room_dict
+
+    def _load_model_ph_properties(self, _model_ph_dict):
+        # type: (Dict[str, Any]) -> None
+        self.id_num = _model_ph_dict.get("id_num", 0)
+        for seg_dict in _model_ph_dict.get("bldg_segments", []):
+            self.bldg_segments[seg_dict["identifier"]] = BldgSegment.from_dict(seg_dict)
+        self.team = ProjectTeam.from_dict(_model_ph_dict.get("team", {}))
+        if WINDOW_LIBRARY_KEY in _model_ph_dict:
+            self.window_library = PhWindowLibrary.from_dict(_model_ph_dict[WINDOW_LIBRARY_KEY])
+
+    def __str__(self):
+        return "{}(identifier={}, room_count={}, bldg_segments={})".format(
+            self.__class__.__name__, self.identifier, self.room_count, len(self.bldg_segments)
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+def room_from_dict(_room_dict, _index):
+    # type: (Dict[str, Any], HbjsonPhIndex) -> Room
+    """Rebuild a single (abridged) HBJSON room-dict as a Room with its .ph and .ph_hvac properties.
+
+    Only the .ph and .ph_hvac properties are applied to the Room, its Faces and its
+    Apertures. Other extension properties (ie: '.energy') require the whole Model.
+
+    Arguments:
+    ----------
+        * _room_dict (Dict[str, Any]): The Room dict, as found in an HBJSON 'rooms' list.
+        * _index (HbjsonPhIndex): The index of the Model's BldgSegments and mechanical systems.
+
+    Returns:
+    --------
+        * Room: The new Honeybee-Room.
+    """
+    room = Room.from_dict(_room_dict, _index.tolerance, _index.angle_tolerance)
+    prop_dict = _room_dict.get("properties", {})
+
+    ph_dict = prop_dict.get("ph")
+    if ph_dict:
+        room.properties.ph.apply_properties_from_dict(ph_dict, _index.bldg_segments)
+
+    ph_hvac_dict = prop_dict.get("ph_hvac")
+    if ph_hvac_dict:
+        room.properties.ph_hvac.apply_properties_from_dict(ph_hvac_dict, _index.mechanical_systems)
+
+    for face, face_dict in zip(room.faces, _room_dict.get("faces", [])):
+        face_ph_dict = face_dict.get("properties", {}).get("ph")
+        if face_ph_dict:
+            face.properties.ph.apply_properties_from_dict(face_ph_dict)
+        for aperture, ap_dict in zip(face.apertures, face_dict.get("apertures", [])):
+            ap_ph_dict = ap_dict.get("properties", {}).get("ph")
+            if ap_ph_dict:
+                aperture.properties.ph.apply_properties_from_dict(ap_ph_dict, _index.window_library)
+
+    return room
+
+
+def iter_hbjson_rooms(_file_path, _index=None, _chunk_size=65536):
+    # type: (str, Optional[HbjsonPhIndex], int) -> Iterator[Room]
+    """Yield each Room of an HBJSON file, with its .ph and .ph_hvac properties, one at a time.
+
+    Only a single room-dict is held in memory at any time. The Model's BldgSegments
+    and mechanical systems are resolved from the index, which is built with a
+    separate first pass over the file if it is not supplied.
+
+    Arguments:
+    ----------
+        * _file_path (str): The path to the HBJSON file.
+        * _index (Optional[HbjsonPhIndex]): A previously built index of the file. Default: None.
+        * _chunk_size (int): The number of characters to read from the file at a time.
+
+    Yields:
+    -------
+        * Room: The next Honeybee-Room in the file.
+    """
+    index = _index or HbjsonPhIndex.from_hbjson(_file_path, _chunk_size)
+    for key, value in iter_hbjson_items(_file_path, ("rooms",), _chunk_size):
+        if key != "rooms" or value is None:
+            continue
+        for room_dict in value:
+            yield room_from_dict(room_dict, index)
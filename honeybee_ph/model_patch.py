@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Incremental 'patches' of the Passive House properties of an HB-Model.
+
+A PhModelPatch holds only the PH objects which were added, removed or modified between
+two versions of a Model, keyed by section and identifier:
+
+    {
+        "type": "PhModelPatch",
+        "added":    {"rooms": {"Room_5": {...}}, ...},
+        "modified": {"bldg_segments": {"seg-id": {...}}, "constructions": {"Wall": {...}}, ...},
+        "removed":  {"rooms": ["Room_2"], ...},
+    }
+
+The sections are:
+
+    * "model": The ModelPhProperties (id_num, team), keyed by the Model identifier.
+    * "bldg_segments": The BldgSegments used by the Rooms.
+    * "rooms": The RoomPhProperties ("ph") and RoomPhHvacProperties ("ph_hvac") of each Room,
+        with the Room's segment and mechanical systems referenced by identifier. Only the
+        changed one of the two is stored for a modified Room. Added Rooms also store the
+        full Room dict ("room"), since the Room does not exist yet in the Model being patched.
+    * "ventilation_systems", "heating_systems", "heat_pump_systems", "exhaust_vent_devices",
+        "supportive_devices", "renewable_devices", "hot_water_systems": The PH-HVAC systems.
+    * "constructions", "materials", "schedules", "people", "lighting", "electric_equipment",
+        "service_hot_water", "process_loads": The .ph properties of the HB-Energy objects.
+
+Only the PH properties are compared: changes to the Room geometry or to the HB-Energy
+properties themselves are not part of the patch.
+
+>>> patch = PhModelPatch.from_models(old_model, new_model)
+>>> patch.apply(loaded_old_model)  # -- the loaded model's PH properties now match 'new_model'
+"""
+
+try:
+    from typing import Any, Callable, Dict, Iterable, List, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.room import Room
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+try:
+    from honeybee_ph.bldg_segment import BldgSegment
+    from honeybee_ph.properties.room import RoomPhProperties
+    from honeybee_ph.team import ProjectTeam
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
+
+try:
+    from honeybee_phhvac.heat_pumps import PhHeatPumpSystemBuilder
+    from honeybee_phhvac.heating import PhHeatingSystemBuilder
+    from honeybee_phhvac.hot_water_system import PhHotWaterSystem
+    from honeybee_phhvac.properties.room import RoomPhHvacProperties
+    from honeybee_phhvac.renewable_devices import PhRenewableEnergyDeviceBuilder
+    from honeybee_phhvac.supportive_device import PhSupportiveDevice
+    from honeybee_phhvac.ventilation import PhExhaustDeviceBuilder, PhVentilationSystem
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_phhvac:\n\t{}".format(e))
+
+
+# -- Section name, RoomPhHvacProperties attribute name, and the 'from_dict' to rebuild the system.
+MECH_SYSTEM_SECTIONS = (
+    ("ventilation_systems", "ventilation_system", PhVentilationSystem.from_dict),
+    ("heating_systems", "heating_systems", PhHeatingSystemBuilder.from_dict),
+    ("heat_pump_systems", "heat_pump_systems", PhHeatPumpSystemBuilder.from_dict),
+    ("exhaust_vent_devices", "exhaust_vent_devices", PhExhaustDeviceBuilder.from_dict),
+    ("supportive_devices", "supportive_devices", PhSupportiveDevice.from_dict),
+    ("renewable_devices", "renewable_devices", PhRenewableEnergyDeviceBuilder.from_dict),
+    ("hot_water_systems", "hot_water_system", PhHotWaterSystem.from_dict),
+)  # type: Tuple[Tuple[str, str, Callable[[Dict[str, Any]], Any]], ...]
+
+# -- The HB-Energy ModelEnergyProperties collections with .ph properties.
+ENERGY_MODEL_SECTIONS = ("constructions", "materials", "schedules")
+
+# -- The HB-Energy RoomEnergyProperties loads with .ph properties.
+ENERGY_LOAD_SECTIONS = ("people", "lighting", "electric_equipment", "service_hot_water", "process_loads")
+
+
+def _mech_systems(_room_ph_hvac, _attr_name):
+    # type: (RoomPhHvacProperties, str) -> List[Any]
+    """Return the Room's systems for one attribute as a list (the vent and hot-water systems are single)."""
+    value = getattr(_room_ph_hvac, _attr_name)
+    if value is None:
+        return []
+    if isinstance(value, (set, list, tuple)):
+        return [_ for _ in value if _ is not None]
+    return [value]
+
+
+def _iter_system_refs(_room_ph_hvac_patch_dict):
+    # type: (Dict[str, Any]) -> Iterable[Dict[str, str]]
+    """Yield each {'identifier': ...} system reference in a RoomPhHvacProperties patch dict."""
+    for _, attr_name, _ in MECH_SYSTEM_SECTIONS:
+        value = _room_ph_hvac_patch_dict.get(attr_name)
+        if isinstance(value, dict):
+            yield value
+        elif isinstance(value, list):
+            for ref in value:
+                yield ref
+
+
+def _energy_objects(_model):
+    # type: (Any) -> Dict[str, Dict[str, List[Any]]]
+    """Return the HB-Energy objects with .ph properties, by section then identifier."""
+    sections = {}  # type: Dict[str, Dict[str, List[Any]]]
+
+    def _add(_section, _obj):
+        if _obj is None or getattr(_obj.properties, "ph", None) is None:
+            return
+        objs = sections.setdefault(_section, {}).setdefault(_obj.identifier, [])
+        if not any(_obj is _ for _ in objs):
+            objs.append(_obj)
+
+    energy_prop = getattr(_model.properties, "energy", None)
+    if energy_prop is None:
+        return sections
+
+    for section in ENERGY_MODEL_SECTIONS:
+        for obj in getattr(energy_prop, section):
+            _add(section, obj)
+
+    for room in _model.rooms:
+        room_energy_prop = room.properties.energy
+        for section in ENERGY_LOAD_SECTIONS:
+            value = getattr(room_energy_prop, section)
+            for obj in value if isinstance(value, (list, tuple)) else [value]:
+                _add(section, obj)
+
+    return sections
+
+
+def room_patch_dict(_room):
+    # type: (Room) -> Dict[str, Dict[str, Any]]
+    """Return the 'rooms' section entry for a Room: its .ph and .ph_hvac patch dicts."""
+    return {
+        "ph": _room.properties.ph.to_patch_dict(),
+        "ph_hvac": _room.properties.ph_hvac.to_patch_dict(),
+    }
+
+
+def ph_object_dicts(_model):
+    # type: (Any) -> Dict[str, Dict[str, Dict[str, Any]]]
+    """Return the dicts of all the PH objects in a Model, by section then identifier.
+
+    Arguments:
+    ----------
+        * _model (Model): The HB-Model.
+
+    Returns:
+    --------
+        * Dict[str, Dict[str, Dict[str, Any]]]: The PH object dicts. Objects which are
+            shared by several Rooms (segments, mechanical systems, constructions...) are
+            only included once.
+    """
+    model_ph = _model.properties.ph.to_dict(abridged=True)["ph"]
+    sections = {
+        "model": {_model.identifier: {"id_num": model_ph["id_num"], "team": model_ph["team"]}},
+        "bldg_segments": {},
+        "rooms": {},
+    }  # type: Dict[str, Dict[str, Dict[str, Any]]]
+    for section, _, _ in MECH_SYSTEM_SECTIONS:
+        sections[section] = {}
+
+    for room in _model.rooms:
+        sections["rooms"][room.identifier] = room_patch_dict(room)
+
+        segment = room.properties.ph.ph_bldg_segment
+        if segment.identifier not in sections["bldg_segments"]:
+            sections["bldg_segments"][segment.identifier] = segment.to_dict()
+
+        for section, attr_name, _ in MECH_SYSTEM_SECTIONS:
+            for system in _mech_systems(room.properties.ph_hvac, attr_name):
+                if system.identifier not in sections[section]:
+                    sections[section][system.identifier] = system.to_dict()
+
+    for section, objs_by_id in _energy_objects(_model).items():
+        sections[section] = {
+            identifier: objs[0].properties.ph.to_dict(abridged=True)["ph"] for identifier, objs in objs_by_id.items()
+        }
+
+    return sections
+
+
+class PhModelPatch(object):
+    """The PH objects added, removed and modified between two versions of an HB-Model.
+
+    Attributes:
+        added (Dict[str, Dict[str, Dict[str, Any]]]): The new object dicts, by section then identifier.
+        modified (Dict[str, Dict[str, Dict[str, Any]]]): The changed object dicts, by section then identifier.
+        removed (Dict[str, List[str]]): The identifiers of the removed objects, by section.
+    """
+
+    def __init__(self):
+        self.added = {}  # type: Dict[str, Dict[str, Dict[str, Any]]]
+        self.modified = {}  # type: Dict[str, Dict[str, Dict[str, Any]]]
+        self.removed = {}  # type: Dict[str, List[str]]
+
+    @property
+    def is_empty(self):
+        # type: () -> bool
+        """True if the patch does not add, remove or modify anything."""
+        return not (self.added or self.modified or self.removed)
+
+    @classmethod
+    def from_object_dicts(cls, _old_dicts, _new_dicts):
+        # type: (Dict[str, Dict[str, Dict[str, Any]]], Dict[str, Dict[str, Dict[str, Any]]]) -> PhModelPatch
+        """Return the patch between two sets of PH object dicts (from `ph_object_dicts`).
+
+        Note that the entries of added Rooms do not include the full Room dict. Use
+        `PhModelPatch.from_models` for a patch which can add Rooms to the Model.
+        """
+        obj = cls()
+        for section in sorted(set(_old_dicts) | set(_new_dicts)):
+            old = _old_dicts.get(section, {})
+            new = _new_dicts.get(section, {})
+
+            added = {k: v for k, v in new.items() if k not in old}
+            removed = sorted(k for k in old if k not in new)
+            modified = {}
+            for k, v in new.items():
+                if k not in old or old[k] == v:
+                    continue
+                if section == "rooms":
+                    v = {key: value for key, value in v.items() if old[k].get(key) != value}
+                modified[k] = v
+
+            if added:
+                obj.added[section] = added
+            if modified:
+                obj.modified[section] = modified
+            if removed:
+                obj.removed[section] = removed
+        return obj
+
+    @classmethod
+    def from_models(cls, _old_model, _new_model):
+        # type: (Any, Any) -> PhModelPatch
+        """Return the patch which updates the PH properties of '_old_model' to match '_new_model'.
+
+        Arguments:
+        ----------
+            * _old_model (Model): The previous version of the HB-Model.
+            * _new_model (Model): The new version of the HB-Model.
+
+        Returns:
+        --------
+            * (PhModelPatch): The new patch.
+        """
+        obj = cls.from_object_dicts(ph_object_dicts(_old_model), ph_object_dicts(_new_model))
+        added_rooms = obj.added.get("rooms", {})
+        for room in _new_model.rooms:
+            if room.identifier in added_rooms:
+                added_rooms[room.identifier]["room"] = room.to_dict()
+        return obj
+
+    def _dicts_to_apply(self, _section):
+        # type: (str) -> Dict[str, Dict[str, Any]]
+        """Return the added and the modified dicts of a section."""
+        dicts = dict(self.added.get(_section, {}))
+        dicts.update(self.modified.get(_section, {}))
+        return dicts
+
+    def apply(self, _model):
+        # type: (Any) -> None
+        """Update the PH properties of a Model in place to match the patch.
+
+        Rooms in the 'removed' section are removed from the Model, and Rooms in the 'added'
+        section are added to it. The new and modified BldgSegments and mechanical systems are
+        built once, and assigned to every Room which references them.
+
+        Arguments:
+        ----------
+            * _model (Model): The HB-Model to update. This should be the same version
+                of the Model the patch was created from.
+
+        Returns:
+        --------
+            * None
+        """
+        # -- Model
+        for model_ph_dict in self._dicts_to_apply("model").values():
+            _model.properties.ph.id_num = model_ph_dict.get("id_num", 0)
+            _model.properties.ph.team = ProjectTeam.from_dict(model_ph_dict.get("team", {}))
+
+        # -- Rooms which were removed
+        if self.removed.get("rooms"):
+            _model.remove_rooms(self.removed["rooms"])
+
+        # -- Objects shared by the Rooms
+        segments = {
+            rm.properties.ph.ph_bldg_segment.identifier: rm.properties.ph.ph_bldg_segment for rm in _model.rooms
+        }
+        new_segments = {k: BldgSegment.from_dict(d) for k, d in self._dicts_to_apply("bldg_segments").items()}
+        segments.update(new_segments)
+
+        mech_systems = {}  # type: Dict[str, Dict[str, Any]]
+        new_system_ids = set()
+        for section, attr_name, from_dict in MECH_SYSTEM_SECTIONS:
+            systems = {}
+            for room in _model.rooms:
+                for system in _mech_systems(room.properties.ph_hvac, attr_name):
+                    systems[system.identifier] = system
+            for identifier, system_dict in self._dicts_to_apply(section).items():
+                systems[identifier] = from_dict(system_dict)
+                new_system_ids.add(identifier)
+            mech_systems[section] = systems
+
+        # -- Rooms which were added. Their segment and systems are re-linked to the shared ones below.
+        for room_entry in self.added.get("rooms", {}).values():
+            if "room" not in room_entry:
+                raise ValueError("Error: The patch entry for an added Room has no 'room' dict.")
+            _model.add_room(Room.from_dict(room_entry["room"]))
+
+        # -- HB-Energy object .ph properties
+        energy_objects = _energy_objects(_model)
+        for section in ENERGY_MODEL_SECTIONS + ENERGY_LOAD_SECTIONS:
+            for identifier, ph_dict in self._dicts_to_apply(section).items():
+                for obj in energy_objects.get(section, {}).get(identifier, []):
+                    obj.properties._ph = obj.properties.ph.__class__.from_dict(ph_dict, obj)
+
+        # -- Rooms
+        room_dicts = self._dicts_to_apply("rooms")
+        for room in _model.rooms:
+            room_entry = room_dicts.get(room.identifier, {})
+
+            if "ph" in room_entry:
+                room_ph = RoomPhProperties(room)
+                room_ph.id_num = room_entry["ph"].get("id_num", 0)
+                room_ph.apply_properties_from_dict(room_entry["ph"], segments)
+                room.properties._ph = room_ph
+            elif room.properties.ph.ph_bldg_segment.identifier in new_segments:
+                room.properties.ph.ph_bldg_segment = new_segments[room.properties.ph.ph_bldg_segment.identifier]
+
+            ph_hvac_dict = room_entry.get("ph_hvac")
+            if ph_hvac_dict is None:
+                current_dict = room.properties.ph_hvac.to_patch_dict()
+                if any(_["identifier"] in new_system_ids for _ in _iter_system_refs(current_dict)):
+                    ph_hvac_dict = current_dict
+            if ph_hvac_dict is not None:
+                room_ph_hvac = RoomPhHvacProperties(room)
+                room_ph_hvac.apply_properties_from_dict(ph_hvac_dict, mech_systems)
+                room.properties._ph_hvac = room_ph_hvac
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        d = {}
+        d["type"] = "PhModelPatch"
+        d["added"] = self.added
+        d["modified"] = self.modified
+        d["removed"] = self.removed
+        return d
+
+    @classmethod
+    def from_dict(cls, _input_dict):
+        # type: (Dict[str, Any]) -> PhModelPatch
+        if _input_dict.get("type") != "PhModelPatch":
+            raise ValueError("Error: Expected a 'PhModelPatch' dict. Got: {}".format(_input_dict.get("type")))
+        obj = cls()
+        obj.added = _input_dict.get("added", {})
+        obj.modified = _input_dict.get("modified", {})
+        obj.removed = _input_dict.get("removed", {})
+        return obj
+
+    def __len__(self):
+        return (
+            sum(len(_) for _ in self.added.values())
+            + sum(len(_) for _ in self.modified.values())
+            + sum(len(_) for _ in self.removed.values())
+        )
+
+    def __str__(self):
+        return "{}(added={}, modified={}, removed={})".format(
+            self.__class__.__name__,
+            sum(len(_) for _ in self.added.values()),
+            sum(len(_) for _ in self.modified.values()),
+            sum(len(_) for _ in self.removed.values()),
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Read-only snapshots of the derived Passive House values of an HB-Model.
+
+Many of the Honeybee-PH values used by reports (Space areas and volumes, pipe lengths,
+dwelling groupings...) are calculated on the fly from the Model's geometry each time
+they are read, and reading them can fill lazy caches on the objects. `freeze` calculates
+them all once, and stores them in immutable (namedtuple and FrozenDict) objects which
+can be shared safely by any number of threads:
+
+>>> snapshot = freeze(model)
+>>> with ThreadPoolExecutor() as pool:
+>>>     reports = list(pool.map(build_report, [snapshot] * 8))
+
+The snapshot does not change when the Model is edited. Call `freeze` again to update it.
+"""
+
+from collections import namedtuple
+
+try:
+    from typing import Any, Dict, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_energy_ph.dwellings import dwelling_key, get_dwelling_obj, group_rooms_by_dwelling
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
+
+
+class FrozenDict(dict):
+    """A dict which can not be changed after it is created."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Error: {} can not be changed.".format(self.__class__.__name__))
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, _memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+SpaceSnapshot = namedtuple(
+    "SpaceSnapshot",
+    [
+        "identifier",
+        "name",
+        "number",
+        "floor_area",
+        "weighted_floor_area",
+        "net_floor_area",
+        "weighted_net_floor_area",
+        "net_volume",
+        "avg_clear_height",
+    ],
+)
+
+RoomSnapshot = namedtuple(
+    "RoomSnapshot",
+    [
+        "identifier",
+        "display_name",
+        "floor_area",
+        "volume",
+        "ph_bldg_segment_id",
+        "dwelling_key",
+        "number_dwellings",
+        "number_bedrooms",
+        "number_people",
+        "ventilation_system_id",
+        "hot_water_system_id",
+        "spaces",
+    ],
+)
+
+HotWaterSystemSnapshot = namedtuple(
+    "HotWaterSystemSnapshot",
+    [
+        "identifier",
+        "display_name",
+        "total_distribution_pipe_length",
+        "total_home_run_fixture_pipe_length",
+        "total_recirc_pipe_length",
+        "room_ids",
+    ],
+)
+
+
+def _space_snapshot(_space):
+    # type: (Any) -> SpaceSnapshot
+    return SpaceSnapshot(
+        _space.identifier,
+        _space.name,
+        _space.number,
+        _space.floor_area,
+        _space.weighted_floor_area,
+        _space.net_floor_area,
+        _space.weighted_net_floor_area,
+        _space.net_volume,
+        _space.avg_clear_height,
+    )
+
+
+def _people_ph_values(_hb_room):
+    # type: (Any) -> Tuple[float, float]
+    """Return the (number_bedrooms, number_people) from the Room's People load, or (0, 0)."""
+    prop_energy = getattr(_hb_room.properties, "energy", None)
+    people = getattr(prop_energy, "people", None)
+    prop_ph = getattr(getattr(people, "properties", None), "ph", None)
+    if prop_ph is None:
+        return 0, 0.0
+    return prop_ph.number_bedrooms, prop_ph.number_people
+
+
+def _room_snapshot(_hb_room):
+    # type: (Any) -> RoomSnapshot
+    prop_ph = _hb_room.properties.ph
+    prop_ph_hvac = getattr(_hb_room.properties, "ph_hvac", None)
+    vent_system = getattr(prop_ph_hvac, "ventilation_system", None)
+    hot_water_system = getattr(prop_ph_hvac, "hot_water_system", None)
+    dwelling = get_dwelling_obj(_hb_room)
+    number_bedrooms, number_people = _people_ph_values(_hb_room)
+
+    return RoomSnapshot(
+        _hb_room.identifier,
+        _hb_room.display_name,
+        _hb_room.floor_area,
+        _hb_room.volume,
+        prop_ph.ph_bldg_segment.identifier,
+        dwelling_key(_hb_room),
+        dwelling.num_dwellings if dwelling else 0,
+        number_bedrooms,
+        number_people,
+        vent_system.identifier if vent_system else None,
+        hot_water_system.identifier if hot_water_system else None,
+        tuple(_space_snapshot(sp) for sp in prop_ph.spaces),
+    )
+
+
+class PhModelSnapshot(
+    namedtuple(
+        "_PhModelSnapshot",
+        ["identifier", "display_name", "units", "rooms", "bldg_segments", "dwellings", "hot_water_systems"],
+    )
+):
+    """An immutable snapshot of the derived PH values of an HB-Model. Create it with `freeze`.
+
+    Attributes:
+        identifier (str): The Model identifier.
+        display_name (str): The Model display-name.
+        units (str): The Model units (ie: "Meters"). All the areas and lengths are in these units.
+        rooms (Tuple[RoomSnapshot, ...]): The Rooms, in the Model's order.
+        bldg_segments (FrozenDict[str, Tuple[str, ...]]): The Room identifiers of each BldgSegment, by identifier.
+        dwellings (Tuple[Tuple[str, ...], ...]): The Room identifiers of each dwelling group.
+            (see `honeybee_energy_ph.dwellings.group_rooms_by_dwelling`).
+        hot_water_systems (FrozenDict[str, HotWaterSystemSnapshot]): The Hot-Water Systems, by identifier.
+    """
+
+    __slots__ = ()
+
+    def get_room(self, _identifier):
+        # type: (str) -> Optional[RoomSnapshot]
+        """Return the RoomSnapshot with the identifier, or None if it is not in the snapshot."""
+        for rm in self.rooms:
+            if rm.identifier == _identifier:
+                return rm
+        return None
+
+    @property
+    def spaces(self):
+        # type: () -> Tuple[SpaceSnapshot, ...]
+        """All the Spaces of all the Rooms."""
+        return tuple(sp for rm in self.rooms for sp in rm.spaces)
+
+    @property
+    def total_floor_area(self):
+        # type: () -> float
+        """The total floor area of all the HB-Rooms."""
+        return sum(rm.floor_area for rm in self.rooms)
+
+    @property
+    def total_weighted_floor_area(self):
+        # type: () -> float
+        """The total weighted (iCFA / TFA) floor area of all the PH-Spaces."""
+        return sum(sp.weighted_floor_area for sp in self.spaces)
+
+    @property
+    def total_net_volume(self):
+        # type: () -> float
+        """The total net interior volume of all the PH-Spaces."""
+        return sum(sp.net_volume for sp in self.spaces)
+
+    @property
+    def total_dwelling_count(self):
+        # type: () -> int
+        """The total number of dwelling units. A dwelling spanning several Rooms is counted once."""
+        counted = set()
+        total = 0
+        for rm in self.rooms:
+            if rm.number_dwellings and rm.dwelling_key not in counted:
+                counted.add(rm.dwelling_key)
+                total += int(rm.number_dwellings)
+        return total
+
+    def __str__(self):
+        return "{}(identifier={}, rooms={}, dwellings={})".format(
+            self.__class__.__name__, self.identifier, len(self.rooms), len(self.dwellings)
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+def freeze(_model):
+    # type: (Any) -> PhModelSnapshot
+    """Return an immutable snapshot of the derived PH values of an HB-Model.
+
+    Arguments:
+    ----------
+        * _model (Model): The HB-Model.
+
+    Returns:
+    --------
+        * (PhModelSnapshot): The snapshot, which is safe to share across threads.
+    """
+    rooms = tuple(_room_snapshot(rm) for rm in _model.rooms)
+
+    segment_room_ids = {}  # type: Dict[str, list]
+    for rm in rooms:
+        segment_room_ids.setdefault(rm.ph_bldg_segment_id, []).append(rm.identifier)
+
+    hot_water_systems = {}  # type: Dict[str, Any]
+    hot_water_room_ids = {}  # type: Dict[str, list]
+    for hb_room in _model.rooms:
+        system = getattr(getattr(hb_room.properties, "ph_hvac", None), "hot_water_system", None)
+        if system is None:
+            continue
+        hot_water_systems[system.identifier] = system
+        hot_water_room_ids.setdefault(system.identifier, []).append(hb_room.identifier)
+
+    return PhModelSnapshot(
+        _model.identifier,
+        _model.display_name,
+        _model.units,
+        rooms,
+        FrozenDict((k, tuple(v)) for k, v in segment_room_ids.items()),
+        tuple(tuple(rm.identifier for rm in group) for group in group_rooms_by_dwelling(_model.rooms)),
+        FrozenDict(
+            (
+                identifier,
+                HotWaterSystemSnapshot(
+                    identifier,
+                    system.display_name,
+                    system.total_distribution_pipe_length,
+                    system.total_home_run_fixture_pipe_length,
+                    system.total_recirc_pipe_length,
+                    tuple(hot_water_room_ids[identifier]),
+                ),
+            )
+            for identifier, system in hot_water_systems.items()
+        ),
+    )
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Build the PH Spaces and Foundations of a Model's Rooms in a pool of worker processes.
+
+When an HB-Model is loaded with `Model.from_dict`, ModelPhProperties rebuilds the
+Spaces (with all their volumes and floor segments) and Foundations of each Room from
+the Room's .ph dict. The Rooms are independent of each other, so inside a ParallelLoad
+block the Rooms are split into chunks which are built in worker processes, pickled
+back, and attached to their host Rooms:
+
+>>> with ParallelLoad(processes=8):
+>>>     model = Model.from_dict(model_dict)
+
+The result is identical to the serial load. Everything which is shared between Rooms
+(BldgSegments, mechanical systems) is still resolved in the main process. In IronPython
+(no 'concurrent.futures') the Rooms are always loaded serially.
+"""
+
+import threading
+
+try:
+    from typing import Any, Dict, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None  # IronPython 2.7
+
+try:
+    from honeybee_ph import space
+    from honeybee_ph.foundations import PhFoundation, PhFoundationFactory
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
+
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+def build_room_ph_objects(_room_ph_dict):
+    # type: (Optional[Dict[str, Any]]) -> Optional[Tuple[List[space.Space], List[PhFoundation]]]
+    """Return the new (un-hosted) Spaces and Foundations of one Room's .ph dict, or None if there is no dict."""
+    if not _room_ph_dict:
+        return None
+    spaces = [space.Space.from_dict(d, None) for d in _room_ph_dict.get("spaces", [])]
+    foundations = [PhFoundationFactory.from_dict(d) for d in _room_ph_dict.get("ph_foundations", [])]
+    return spaces, foundations
+
+
+def _build_chunk(_room_ph_dicts):
+    # type: (List[Optional[Dict[str, Any]]]) -> List[Optional[Tuple[List[space.Space], List[PhFoundation]]]]
+    return [build_room_ph_objects(d) for d in _room_ph_dicts]
+
+
+class ParallelLoad(object):
+    """Settings for loading the PH properties of the Rooms in worker processes.
+
+    Use as a context-manager around `Model.from_dict` (in the current thread).
+
+    Attributes:
+        processes (int): The number of worker processes.
+        chunk_size (int): The number of Rooms sent to a worker at a time. Default: 50.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        # type: (Optional[int], int) -> None
+        self.processes = processes
+        self.chunk_size = max(int(chunk_size), 1)
+        self._previous = None  # type: Optional[ParallelLoad]
+
+    @classmethod
+    def active(cls):
+        # type: () -> Optional[ParallelLoad]
+        """Return the settings of the current `with ParallelLoad():` block (in this thread), if any."""
+        return getattr(cls._local, "settings", None)
+
+    def build_room_ph_objects(self, _room_ph_dicts):
+        # type: (List[Optional[Dict[str, Any]]]) -> Optional[List[Optional[Tuple[List[space.Space], List[PhFoundation]]]]]
+        """Return the Spaces and Foundations of each Room's .ph dict, built in the worker processes.
+
+        Arguments:
+        ----------
+            * _room_ph_dicts (List[Optional[Dict[str, Any]]]): The .ph dict of each Room (or None).
+
+        Returns:
+        --------
+            * (Optional[List]): The (spaces, foundations) of each Room, in the same order
+                as the input (None for Rooms without a dict), or None if there are too few
+                Rooms for more than one chunk or no process-pool is available. The Spaces
+                are not hosted yet.
+        """
+        if ProcessPoolExecutor is None or (self.processes is not None and self.processes < 2):
+            return None
+
+        chunks = [_room_ph_dicts[i : i + self.chunk_size] for i in range(0, len(_room_ph_dicts), self.chunk_size)]
+        if len(chunks) < 2:
+            return None
+
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            results = []
+            for chunk_result in pool.map(_build_chunk, chunks):
+                results.extend(chunk_result)
+        return results
+
+    def __enter__(self):
+        # type: () -> ParallelLoad
+        self._previous = self.active()
+        self._local.settings = self
+        return self
+
+    def __exit__(self, *args):
+        self._local.settings = self._previous
+        self._previous = None
+
+    def __str__(self):
+        return "{}(processes={}, chunk_size={})".format(self.__class__.__name__, self.processes, self.chunk_size)
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
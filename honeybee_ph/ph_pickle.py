@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Pickle Honeybee-PH object graphs directly, without the to_dict / from_dict round-trip.
+
+`dumps` pickles any Honeybee-PH, Honeybee-Energy-PH or Honeybee-PHHVAC objects (or a
+list / dict of them) in one pass, so every object which is used in several places (ie:
+a Ventilation System serving many Rooms, or a PhDwellings shared by their People loads)
+is stored once, and is still shared after `loads`:
+
+>>> data = dumps([rm.properties.ph_hvac for rm in model.rooms])
+>>> hvac_props = loads(data, model)
+
+The Honeybee and Honeybee-Energy objects the PH objects refer to (the 'host' Rooms,
+Faces, loads, schedules...) are not pickled. Honeybee-Energy objects are locked, and
+can not be re-built by pickle, so they are stored as references (their type and
+identifier) instead, and are found again on load in the Model (or other host objects)
+passed to `loads`. References which can not be found are loaded as None.
+"""
+
+import io
+import pickle
+
+try:
+    from typing import Any, Dict, Iterable, Optional, Tuple, Union
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee.model import Model
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
+
+
+HOST_PACKAGES = ("honeybee", "honeybee_energy")
+ROOM_ENERGY_LOAD_ATTRS = (
+    "people",
+    "lighting",
+    "electric_equipment",
+    "gas_equipment",
+    "service_hot_water",
+    "infiltration",
+    "ventilation",
+    "setpoint",
+)
+MODEL_ENERGY_RESOURCE_ATTRS = (
+    "materials",
+    "constructions",
+    "construction_sets",
+    "schedule_type_limits",
+    "schedules",
+    "program_types",
+    "hvacs",
+    "shws",
+)
+
+
+def host_key(_obj):
+    # type: (Any) -> Optional[Tuple[str, str]]
+    """Return the (type-name, identifier) reference of a Honeybee / Honeybee-Energy object, or None for any other object."""
+    if type(_obj).__module__.split(".")[0] not in HOST_PACKAGES:
+        return None
+    identifier = getattr(_obj, "identifier", None)
+    if identifier is None:
+        return None
+    return type(_obj).__name__, identifier
+
+
+def _iter_model_hosts(_hb_model):
+    # type: (Model) -> Iterable[Any]
+    """Yield the Model, all of its geometry objects and all of its Honeybee-Energy resources and loads."""
+    yield _hb_model
+    for group in (_hb_model.rooms, _hb_model.faces, _hb_model.apertures, _hb_model.doors, _hb_model.shades):
+        for hb_obj in group:
+            yield hb_obj
+
+    model_prop_energy = getattr(_hb_model.properties, "energy", None)
+    if model_prop_energy is None:
+        return
+    for attr_name in MODEL_ENERGY_RESOURCE_ATTRS:
+        for resource in getattr(model_prop_energy, attr_name, None) or []:
+            yield resource
+
+    for hb_room in _hb_model.rooms:
+        for attr_name in ROOM_ENERGY_LOAD_ATTRS:
+            load = getattr(hb_room.properties.energy, attr_name, None)
+            if load is not None:
+                yield load
+        for process_load in hb_room.properties.energy.process_loads:
+            yield process_load
+
+
+def host_lookup(_hosts):
+    # type: (Union[Model, Iterable[Any], None]) -> Dict[Tuple[str, str], Any]
+    """Return a dict of the host objects by their (type-name, identifier) reference.
+
+    Arguments:
+    ----------
+        * _hosts (Model | Iterable[Any] | None): An HB-Model (all of its Rooms, Faces,
+            Apertures, Doors, Shades, Honeybee-Energy resources and Room loads are
+            added), or any collection of Honeybee / Honeybee-Energy objects.
+
+    Returns:
+    --------
+        * (Dict[Tuple[str, str], Any]): The host objects.
+    """
+    if _hosts is None:
+        return {}
+    if isinstance(_hosts, Model):
+        _hosts = _iter_model_hosts(_hosts)
+
+    lookup = {}  # type: Dict[Tuple[str, str], Any]
+    for hb_obj in _hosts:
+        key = host_key(hb_obj)
+        if key is not None:
+            lookup.setdefault(key, hb_obj)
+    return lookup
+
+
+class _PhPickler(pickle.Pickler):
+    """Pickle the Honeybee / Honeybee-Energy objects as references, and everything else by value."""
+
+    def persistent_id(self, _obj):
+        # type: (Any) -> Optional[Tuple[str, str]]
+        return host_key(_obj)
+
+
+class _PhUnpickler(pickle.Unpickler):
+    """Resolve the Honeybee / Honeybee-Energy references from a lookup of the host objects."""
+
+    def __init__(self, _file, _hosts):
+        # type: (Any, Dict[Tuple[str, str], Any]) -> None
+        pickle.Unpickler.__init__(self, _file)
+        self.hosts = _hosts
+
+    def persistent_load(self, _pid):
+        # type: (Tuple[str, str]) -> Any
+        return self.hosts.get(tuple(_pid))
+
+
+def dump(_obj, _file, _protocol=pickle.HIGHEST_PROTOCOL):
+    # type: (Any, Any, int) -> None
+    """Write a pickle of the Honeybee-PH object (or collection of objects) to an open binary file."""
+    _PhPickler(_file, _protocol).dump(_obj)
+
+
+def dumps(_obj, _protocol=pickle.HIGHEST_PROTOCOL):
+    # type: (Any, int) -> bytes
+    """Return a pickle of the Honeybee-PH object (or collection of objects).
+
+    Arguments:
+    ----------
+        * _obj (Any): The Honeybee-PH object(s). Any Honeybee / Honeybee-Energy
+            objects they refer to are stored as references only.
+        * _protocol (int): The pickle protocol. Default: the highest available.
+
+    Returns:
+    --------
+        * (bytes): The pickled data.
+    """
+    f = io.BytesIO()
+    dump(_obj, f, _protocol)
+    return f.getvalue()
+
+
+def load(_file, _hosts=None):
+    # type: (Any, Union[Model, Iterable[Any], None]) -> Any
+    """Read the Honeybee-PH object(s) from an open binary file written by `dump`."""
+    return _PhUnpickler(_file, host_lookup(_hosts)).load()
+
+
+def loads(_data, _hosts=None):
+    # type: (bytes, Union[Model, Iterable[Any], None]) -> Any
+    """Return the Honeybee-PH object(s) from the data returned by `dumps`.
+
+    Arguments:
+    ----------
+        * _data (bytes): The pickled data.
+        * _hosts (Model | Iterable[Any] | None): The HB-Model (or any collection of
+            Honeybee / Honeybee-Energy objects) used to resolve the host references.
+            Default: None, in which case all the references are loaded as None.
+
+    Returns:
+    --------
+        * (Any): The Honeybee-PH object(s), with all their shared objects still shared.
+    """
+    return load(io.BytesIO(_data), _hosts)
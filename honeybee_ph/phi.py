@@ -336,6 +336,16 @@ class _PHPPSettingsBase(object):
         # type: () -> _PHPPSettingsBase
         return self.__copy__()
 
+    def __getstate__(self):
+        # type: () -> Dict[str, Any]
+        # -- The Enum classes are created by the EnumProperty descriptors, and can't be pickled. Store their values.
+        return {k: getattr(v, "value", v) for k, v in vars(self).items()}
+
+    def __setstate__(self, _state):
+        # type: (Dict[str, Any]) -> None
+        for k, v in _state.items():
+            setattr(self, k, v)
+
 
 class PHPPSettings10(_PHPPSettingsBase):
     """Settings for PHPP v10.
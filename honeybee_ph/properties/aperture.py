@@ -54,13 +54,37 @@ class AperturePsiInstalls(object):
         return d
 
     @classmethod
-    def from_dict(cls, _input_dict):
-        # type: (Dict[str, Any]) -> AperturePsiInstalls
+    def from_dict(cls, _input_dict, _install_types=None):
+        # type: (Dict[str, Any], Optional[Dict[str, PhApertureInstallType]]) -> AperturePsiInstalls
+        """Return a new AperturePsiInstalls from a dict.
+
+        In a compact HBJSON, each side holds the key of a shared Install Type in the
+        Model's window library, rather than the Install Type dict.
+
+        Arguments:
+        ----------
+            * _input_dict (Dict[str, Any]): The AperturePsiInstalls dict.
+            * _install_types (Optional[Dict[str, PhApertureInstallType]]): The window-library
+                Install Types, by key. Required only if the dict holds library keys.
+
+        Returns:
+        --------
+            * (AperturePsiInstalls): The new object.
+        """
         new_obj = cls()
         for side in cls.SIDES:
             install_type_dict = _input_dict.get(side, None)
-            if install_type_dict:
+            if not install_type_dict:
+                continue
+            if isinstance(install_type_dict, dict):
                 setattr(new_obj, side, PhApertureInstallType.from_dict(install_type_dict))
+            elif _install_types is None:
+                raise ValueError(
+                    "Error: The '{}' Install Type '{}' is a window-library reference, "
+                    "but no window library was supplied.".format(side, install_type_dict)
+                )
+            else:
+                setattr(new_obj, side, _install_types[install_type_dict])
         return new_obj
 
     def duplicate(self):
@@ -238,14 +262,16 @@ class AperturePhProperties(object):
 
         return new_prop
 
-    def apply_properties_from_dict(self, _aperture_prop_dict):
-        # type: (Dict[str, Any]) -> None
+    def apply_properties_from_dict(self, _aperture_prop_dict, _window_library=None):
+        # type: (Dict[str, Any], Any) -> None
         """Apply properties from an AperturePhPropertiesAbridged dictionary.
 
         Arguments:
         ----------
             * _aperture_prop_dict (dict): An AperturePhPropertiesAbridged dictionary loaded from
                 the Aperture object itself. Unabridged.
+            * _window_library (Optional[PhWindowLibrary]): The Model's window library, used to
+                resolve the Install Types of a compact HBJSON. Default: None.
         """
 
         self.winter_shading_factor = _aperture_prop_dict["winter_shading_factor"]
@@ -266,6 +292,7 @@ class AperturePhProperties(object):
         # Use get to ensure backwards compatibility: older HBJSON has no install_types
         install_types_dict = _aperture_prop_dict.get("install_types", None)
         if install_types_dict:
-            self.install_types = AperturePsiInstalls.from_dict(install_types_dict)
+            library_install_types = _window_library.install_types if _window_library else None
+            self.install_types = AperturePsiInstalls.from_dict(install_types_dict, library_install_types)
 
         return None
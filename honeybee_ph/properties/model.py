@@ -4,7 +4,7 @@
 """HB-PH Model Properties."""
 
 try:
-    from typing import Any, Dict, Tuple
+    from typing import Any, Dict, Iterator, Optional, Tuple
 except ImportError:
     pass  # Python 2.7
 
@@ -24,8 +24,10 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
 
 try:
-    from honeybee_ph.bldg_segment import BldgSegment
+    from honeybee_ph.bldg_segment import BldgSegment, BldgSegmentRegistry
+    from honeybee_ph.parallel_load import ParallelLoad
     from honeybee_ph.team import ProjectTeam
+    from honeybee_ph.window_library import PhWindowLibrary
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
 
@@ -47,6 +49,11 @@ class ModelPhProperties(object):
         new_properties_obj.id_num = self.id_num
         new_properties_obj.team = self.team.duplicate()
 
+        # -- The duplicated Rooms still share the original Model's BldgSegments. Give the
+        # -- new Model its own copy of each one, shared by all of its Rooms in the segment.
+        if new_host is not None and new_host is not self._host:
+            new_properties_obj.intern_bldg_segments(duplicate=True)
+
         return new_properties_obj
 
     def duplicate(self, new_host=None):
@@ -62,6 +69,78 @@ class ModelPhProperties(object):
     def ToString(self):
         return self.__repr__()
 
+    def intern_bldg_segments(self, duplicate=False):
+        # type: (bool) -> BldgSegmentRegistry
+        """Make all the Rooms of the host Model with the same BldgSegment identifier share one BldgSegment object.
+
+        The first BldgSegment found (in the Room order) for each identifier is kept.
+
+        Arguments:
+        ----------
+            * duplicate (bool): If True, the Rooms get a new copy of each BldgSegment
+                instead of the existing one. Default: False.
+
+        Returns:
+        --------
+            * (BldgSegmentRegistry): The registry of the Model's BldgSegments.
+        """
+        registry = BldgSegmentRegistry()
+        for rm in self.host.rooms:
+            seg = rm.properties.ph.ph_bldg_segment
+            if seg is None:
+                continue
+            if duplicate and seg.identifier not in registry:
+                seg = seg.duplicate()
+            rm.properties.ph.ph_bldg_segment = registry.add(seg)
+        return registry
+
+    def move(self, moving_vec3D):
+        # type: (Vector3D) -> None
+        """Re-share the BldgSegments after the Rooms (and their BldgSegments) were moved."""
+        self.intern_bldg_segments()
+
+    def rotate(self, axis_vec3D, angle_degrees, origin_pt3D):
+        # type: (Vector3D, float, Point3D) -> None
+        """Re-share the BldgSegments after the Rooms (and their BldgSegments) were rotated."""
+        self.intern_bldg_segments()
+
+    def rotate_xy(self, angle_degrees, origin_pt3D):
+        # type: (float, Point3D) -> None
+        """Re-share the BldgSegments after the Rooms (and their BldgSegments) were rotated."""
+        self.intern_bldg_segments()
+
+    def reflect(self, plane):
+        # type: (Plane) -> None
+        """Re-share the BldgSegments after the Rooms (and their BldgSegments) were reflected."""
+        self.intern_bldg_segments()
+
+    def scale(self, scale_factor, origin_pt3D=None):
+        # type: (float, Optional[Point3D]) -> None
+        """Re-share the BldgSegments after the Rooms (and their BldgSegments) were scaled."""
+        self.intern_bldg_segments()
+
+    def _iter_bldg_segment_dicts(self):
+        # type: () -> Iterator[dict[str, Any]]
+        """Yield each unique bldg_segment found on the model's rooms as a dict, one at a time.
+
+        Only the segment being serialized is held as a dict, which allows the segments
+        to be streamed to a file without first building the complete list. As with
+        `intern_bldg_segments`, the first BldgSegment found (in the Room order) for
+        each identifier is the one kept.
+
+        Yields:
+        -------
+            * dict[str, Any]: A single BldgSegment dict.
+        """
+        # -- Collect all the unique BldgSegments in the Model's Rooms
+        registry = BldgSegmentRegistry()
+        for rm in self.host.rooms:
+            seg = rm.properties.ph.ph_bldg_segment
+            if seg is not None:
+                registry.add(seg)
+        for seg in registry.segments:
+            yield seg.to_dict()
+
     def _get_bldg_segment_dicts(self):
         # type: () -> list[dict[str, Any]]
         """Return a list of all the bldg_segments found on the model's rooms as dicts.
@@ -76,11 +155,7 @@ class ModelPhProperties(object):
             * list[dict[str, Any]]: A list of all the bldg_segments found on the model's
                 rooms as dicts.
         """
-        # -- Collect all the unique BldgSegments in the Model's Rooms
-        ph_bldg_segments = {
-            rm.properties.ph.ph_bldg_segment.identifier: rm.properties.ph.ph_bldg_segment for rm in self.host.rooms
-        }
-        return [seg.to_dict() for seg in ph_bldg_segments.values()]
+        return list(self._iter_bldg_segment_dicts())
 
     def to_dict(self, abridged=False):
         # type: (bool) -> dict[str, dict]
@@ -110,6 +185,38 @@ class ModelPhProperties(object):
 
         return new_prop
 
+    def diff(self, _other):
+        # type: (ModelPhProperties) -> PhModelPatch
+        """Return a PhModelPatch of the PH objects added, removed or modified in the other Model.
+
+        Arguments:
+        ----------
+            * _other (ModelPhProperties): The .ph properties of the new version of the Model.
+
+        Returns:
+        --------
+            * (PhModelPatch): The patch which updates this Model to match the other one.
+        """
+        from honeybee_ph.model_patch import PhModelPatch
+
+        return PhModelPatch.from_models(self.host, _other.host)
+
+    def apply_patch(self, _patch):
+        # type: (PhModelPatch | Dict[str, Any]) -> None
+        """Update the PH properties of the host Model in place from a PhModelPatch (or its dict)."""
+        from honeybee_ph.model_patch import PhModelPatch
+
+        if isinstance(_patch, dict):
+            _patch = PhModelPatch.from_dict(_patch)
+        _patch.apply(self.host)
+
+    def freeze(self):
+        # type: () -> PhModelSnapshot
+        """Return an immutable, thread-safe snapshot of the derived PH values of the host Model."""
+        from honeybee_ph.model_snapshot import freeze
+
+        return freeze(self.host)
+
     @staticmethod
     def load_properties_from_dict(data):
         # type: (Dict[str, Dict]) -> Tuple[Dict[str, BldgSegment], ProjectTeam]
@@ -189,11 +296,19 @@ class ModelPhProperties(object):
         # re-build all of the .ph property objects from the HB-Model dict as python objects
         bldg_segments, self.team = self.load_properties_from_dict(data)
 
+        # -- Inside a 'with ParallelLoad():' block, the Spaces and Foundations are built in worker processes
+        parallel_load = ParallelLoad.active()
+        room_ph_objects = None
+        if parallel_load is not None:
+            room_ph_objects = parallel_load.build_room_ph_objects(list(room_ph_dicts))
+        if room_ph_objects is None:
+            room_ph_objects = [None] * len(room_ph_dicts)
+
         # apply the .ph properties to all the sub-model objects in the HB-Model
-        for room, room_dict in zip(self.host.rooms, room_ph_dicts):
+        for room, room_dict, ph_objects in zip(self.host.rooms, room_ph_dicts, room_ph_objects):
             if not room_dict:
                 continue
-            room.properties.ph.apply_properties_from_dict(room_dict, bldg_segments)
+            room.properties.ph.apply_properties_from_dict(room_dict, bldg_segments, ph_objects)
 
         apertures = []
         faces = []
@@ -206,5 +321,25 @@ class ModelPhProperties(object):
         for face, face_dict in zip(faces, face_ph_dicts):
             face.properties.ph.apply_properties_from_dict(face_dict)
 
+        # -- A compact HBJSON stores the window frames, glazings and install types once
+        window_library = PhWindowLibrary.from_model_dict(data)
+
         for aperture, ap_dict in zip(apertures, ap_ph_dicts):
-            aperture.properties.ph.apply_properties_from_dict(ap_dict)
+            aperture.properties.ph.apply_properties_from_dict(ap_dict, window_library)
+
+        if window_library:
+            self._apply_window_library(window_library)
+
+    def _apply_window_library(self, _window_library):
+        # type: (PhWindowLibrary) -> None
+        """Resolve the window-library references of all the window constructions on the Model.
+
+        This includes the window constructions which are only used by a Room's ConstructionSet.
+        """
+        prop_energy = getattr(self.host.properties, "energy", None)
+        if prop_energy is None:
+            return
+        for construction in prop_energy.constructions:
+            prop_ph = getattr(construction.properties, "ph", None)
+            if prop_ph is not None and getattr(prop_ph, "has_library_refs", False):
+                prop_ph.apply_window_library(_window_library)
@@ -4,7 +4,7 @@
 """HB-Room Passive House (PH) Properties."""
 
 try:
-    from typing import Any, Dict, List, Optional, Union
+    from typing import Any, Dict, List, Optional, Tuple, Union
 except ImportError:
     pass  # Python2.7
 
@@ -21,7 +21,7 @@ except ImportError as e:
 
 try:
     from honeybee_ph import space
-    from honeybee_ph.bldg_segment import BldgSegment
+    from honeybee_ph.bldg_segment import BldgSegment, BldgSegmentRegistry
     from honeybee_ph.foundations import PhFoundation, PhFoundationFactory
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
@@ -106,8 +106,23 @@ class RoomPhProperties(object):
         # type: (Any, bool) -> RoomPhProperties
         return self.duplicate(new_host=new_host, include_spaces=True)
 
-    def duplicate(self, new_host=None, include_spaces=True):
-        # type: (Any, bool) -> RoomPhProperties
+    def duplicate(self, new_host=None, include_spaces=True, duplicate_bldg_segment=False):
+        # type: (Any, bool, bool) -> RoomPhProperties
+        """Return a copy of the RoomPhProperties.
+
+        Arguments:
+        ----------
+            * new_host (Optional[Room]): The Room to host the new properties. Default: the current host.
+            * include_spaces (bool): Duplicate the Spaces as well. Default: True.
+            * duplicate_bldg_segment (bool): Give the new properties their own copy of the
+                BldgSegment. By default the new properties share the same BldgSegment object,
+                since a BldgSegment (with its climate data and thermal bridges) is shared
+                by all of the Rooms in the segment. Default: False.
+
+        Returns:
+        --------
+            * (RoomPhProperties): The new RoomPhProperties.
+        """
         _host = new_host or self._host
         new_obj = RoomPhProperties(_host)
         new_obj.id_num = self.id_num
@@ -118,7 +133,10 @@ class RoomPhProperties(object):
             for sp in self._spaces:
                 new_obj._spaces.append(sp.duplicate(_host))
 
-        new_obj.ph_bldg_segment = self.ph_bldg_segment.duplicate()
+        if duplicate_bldg_segment:
+            new_obj.ph_bldg_segment = self.ph_bldg_segment.duplicate()
+        else:
+            new_obj.ph_bldg_segment = self.ph_bldg_segment
 
         for f in self.ph_foundations:
             new_obj.add_foundation(f.duplicate())
@@ -151,6 +169,13 @@ class RoomPhProperties(object):
 
         return {"ph": d}
 
+    def to_patch_dict(self):
+        # type: () -> Dict[str, Any]
+        """Return the Abridged dict (with the id_num) used for the Room's entry in a PhModelPatch."""
+        d = self.to_dict(abridged=True)["ph"]
+        d["id_num"] = self.id_num
+        return d
+
     @classmethod
     def from_dict(cls, _input_dict, host):
         # type: (Dict[str, Any], Any) -> RoomPhProperties
@@ -166,7 +191,12 @@ class RoomPhProperties(object):
         new_prop.specific_heat_capacity_wh_m2k = _input_dict.get("specific_heat_capacity_wh_m2k", None)
 
         if "ph_bldg_segment" in _input_dict.keys():
-            new_prop.ph_bldg_segment = BldgSegment.from_dict(_input_dict.get("ph_bldg_segment", {}))
+            # -- Inside a 'with BldgSegmentRegistry():' block, Rooms with the same BldgSegment share it.
+            registry = BldgSegmentRegistry.active()
+            if registry is not None:
+                new_prop.ph_bldg_segment = registry.from_dict(_input_dict.get("ph_bldg_segment", {}))
+            else:
+                new_prop.ph_bldg_segment = BldgSegment.from_dict(_input_dict.get("ph_bldg_segment", {}))
         else:
             new_prop.ph_bldg_segment = None
 
@@ -178,8 +208,8 @@ class RoomPhProperties(object):
 
         return new_prop
 
-    def apply_properties_from_dict(self, room_prop_dict, bldg_segments):
-        # type: (Dict[str, Any], Dict[str, BldgSegment]) -> None
+    def apply_properties_from_dict(self, room_prop_dict, bldg_segments, ph_objects=None):
+        # type: (Dict[str, Any], Dict[str, BldgSegment], Optional[Tuple[List[space.Space], List[PhFoundation]]]) -> None
         """Apply properties from a RoomPhPropertiesAbridged dictionary.
 
         Arguments:
@@ -192,6 +222,10 @@ class RoomPhProperties(object):
             * bldg_segments (dict[str: BldgSegment]): A dict of the BldgSegment
                 objects found at the Model level. Segment-id is used as the key.
 
+            * ph_objects (Optional[Tuple[List[Space], List[PhFoundation]]]): The Spaces and
+                Foundations already built from the dict (ie: by a worker process, see
+                honeybee_ph.parallel_load). Default: None (build them from the dict).
+
         Returns:
         --------
             * None
@@ -207,6 +241,15 @@ class RoomPhProperties(object):
         if room_ph_bldg_segment_id:
             self.ph_bldg_segment = bldg_segments[room_ph_bldg_segment_id]
 
+        if ph_objects is not None:
+            spaces, foundations = ph_objects
+            for sp in spaces:
+                sp.host = self.host
+                self.add_new_space(sp)
+            for foundation in foundations:
+                self.add_foundation(foundation)
+            return None
+
         # -- Rebuild the Spaces hosted on the room
         space_dicts = room_prop_dict.get("spaces", [])
 
@@ -1082,8 +1082,10 @@ class Site(_base._Base):
         self.phpp_library_codes = _phpp_library_codes if _phpp_library_codes is not None else PHPPCodes()
 
     @classmethod
-    def from_epw(cls, file_path, ground_temperature_depth=None, ground_reflectance=0.2, diffuse_model="isotropic"):
-        # type: (str, Optional[float], float, str) -> Site
+    def from_epw(
+        cls, file_path, ground_temperature_depth=None, ground_reflectance=0.2, diffuse_model="isotropic", stream=False
+    ):
+        # type: (str, Optional[float], float, str, bool) -> Site
         """Create a preliminary monthly-demand Site from a caller-supplied EPW.
 
         EPW-derived values are not PHI/Phius certification climate data. The
@@ -1098,6 +1100,9 @@ class Site(_base._Base):
             * ground_reflectance (float): Finite directional-radiation ground
                 reflectance from 0 through 1. Default: 0.2.
             * diffuse_model (str): ``"isotropic"`` or ``"anisotropic"``.
+            * stream (bool): Set True to read the file one record at a time, for
+                sub-hourly or multi-year EPW files (which Ladybug can not load).
+                Default: False.
 
         Returns:
         --------
@@ -1108,7 +1113,10 @@ class Site(_base._Base):
             * ValueError: If options or required EPW source data are invalid.
                 All independently detected conversion issues are included.
         """
-        from honeybee_ph._epw import convert_epw
+        if stream:
+            from honeybee_ph._epw_stream import convert_epw_stream as convert_epw
+        else:
+            from honeybee_ph._epw import convert_epw
 
         result = convert_epw(
             file_path,
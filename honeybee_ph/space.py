@@ -8,12 +8,13 @@ from math import isinf, isnan, radians
 from numbers import Real
 
 try:
-    pass
-except:
+    from typing import Any, Dict, List, Optional, Tuple
+except ImportError:
     pass  # IronPython
 
 try:
     from ladybug_geometry.geometry3d.face import Face3D as LBFace3D
+    from ladybug_geometry.geometry3d.mesh import Mesh3D
     from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
     from ladybug_geometry.geometry3d.polyface import Polyface3D
 except ImportError as e:
@@ -30,6 +31,11 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_ph:\n\t{}".format(e))
 
+try:
+    from honeybee_ph_utils import geometry_encoding as geom_encoding
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+
 
 class SpaceFloorSegment(_base._Base):
     """A single floor area polygon within a PH Space.
@@ -52,7 +58,8 @@ class SpaceFloorSegment(_base._Base):
 
     def __init__(self):
         super(SpaceFloorSegment, self).__init__()
-        self.geometry = None  # type: Optional[LBFace3D]
+        self._geometry = None  # type: Optional[LBFace3D]
+        self._geometry_cache = {}  # type: Dict[str, Any]
         self.weighting_factor = 1.0
         self.net_area_factor = 1.0
 
@@ -63,23 +70,66 @@ class SpaceFloorSegment(_base._Base):
         # -- SpaceFloorSegment 'inside' an HB-Room.
         self.reference_point = None  # type: Optional[Point3D]
 
+    @property
+    def geometry(self):
+        # type: () -> Optional[LBFace3D]
+        """The planar 3D geometry of this segment, or None if not yet assigned."""
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, _geometry):
+        # type: (Optional[LBFace3D]) -> None
+        self._geometry = _geometry
+        self._geometry_cache = {}
+
+    def _cached_geometry_values(self):
+        # type: () -> Dict[str, Any]
+        """Return the cache of values derived from the current geometry.
+
+        The cache is keyed on the geometry object itself: LBFace3D objects are never
+        modified in place, so a new geometry (assigned directly, or by a transform)
+        always means a new, empty, cache.
+        """
+        if self._geometry_cache.get("geometry") is not self._geometry:
+            self._geometry_cache = {"geometry": self._geometry}
+        return self._geometry_cache
+
+    @property
+    def mesh3d(self):
+        # type: () -> Optional[Mesh3D]
+        """The triangulated Mesh3D of the segment's geometry, or None if there is no geometry."""
+        if not self.geometry:
+            return None
+        cache = self._cached_geometry_values()
+        if "mesh3d" not in cache:
+            cache["mesh3d"] = self.geometry.triangulated_mesh3d
+        return cache["mesh3d"]
+
+    def _mesh_dict(self):
+        # type: () -> Dict[str, Any]
+        """Return a copy of the (cached) dict of the triangulated mesh."""
+        cache = self._cached_geometry_values()
+        if "mesh_dict" not in cache:
+            cache["mesh_dict"] = self.mesh3d.to_dict()  # type: ignore
+        # -- Copy the vertex and face lists too (their items are tuples), so the cache can't be edited.
+        return {k: list(v) if isinstance(v, list) else v for k, v in cache["mesh_dict"].items()}
+
     @property
     def weighted_floor_area(self):
         # type: () -> float
         """The floor area of the floor segment weighted by any reduction factors (iFCA, TFA)"""
-        if self.geometry:
-            return self.geometry.area * self.weighting_factor
-        else:
-            return 0
+        return self.floor_area * self.weighting_factor
 
     @property
     def floor_area(self):
         # type: () -> float
         """The floor area of the floor segment UN-weighted by any reduction factors (iFCA, TFA)"""
-        if self.geometry:
-            return self.geometry.area
-        else:
+        if not self.geometry:
             return 0
+        cache = self._cached_geometry_values()
+        if "area" not in cache:
+            cache["area"] = self.geometry.area
+        return cache["area"]
 
     @property
     def net_floor_area(self):
@@ -105,10 +155,11 @@ class SpaceFloorSegment(_base._Base):
 
         # -- serialize the properties as well, in case they are needed by the user
         # -- outside the 3D model (ie: in a web-API, etc..)
-        d["floor_area"] = self.floor_area
-        d["weighted_floor_area"] = self.weighted_floor_area
-        d["net_floor_area"] = self.net_floor_area
-        d["weighted_net_floor_area"] = self.weighted_net_floor_area
+        floor_area = self.floor_area
+        d["floor_area"] = floor_area
+        d["weighted_floor_area"] = floor_area * self.weighting_factor
+        d["net_floor_area"] = floor_area * self.net_area_factor
+        d["weighted_net_floor_area"] = floor_area * self.net_area_factor * self.weighting_factor
 
         if self.reference_point:
             d["reference_point"] = self.reference_point.to_dict()
@@ -116,7 +167,7 @@ class SpaceFloorSegment(_base._Base):
         d["geometry"] = None
         if include_mesh and self.geometry:
             geom_dict = self.geometry.to_dict()  # type: dict[str, Any]
-            geom_dict["mesh"] = self.geometry.triangulated_mesh3d.to_dict()
+            geom_dict["mesh"] = self._mesh_dict()
             d["geometry"] = geom_dict
         elif self.geometry:
             d["geometry"] = self.geometry.to_dict()
@@ -126,6 +177,7 @@ class SpaceFloorSegment(_base._Base):
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict[str, Any]) -> SpaceFloorSegment
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls()
 
         new_obj.identifier = _input_dict["identifier"]
@@ -154,6 +206,10 @@ class SpaceFloorSegment(_base._Base):
 
         if self.geometry is not None:
             new_obj.geometry = self.duplicate_geometry()
+            # -- The duplicate geometry is identical, so the derived values still apply
+            cache = dict(self._cached_geometry_values())
+            cache["geometry"] = new_obj.geometry
+            new_obj._geometry_cache = cache
 
         if self.reference_point is not None:
             new_obj.reference_point = self.reference_point.duplicate()
@@ -421,6 +477,7 @@ class SpaceFloor(_base._Base):
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict[str, Any]) -> SpaceFloor
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls()
 
         new_obj.identifier = _input_dict["identifier"]
@@ -645,8 +702,22 @@ class SpaceVolume(_base._Base):
         # type: (bool) -> SpaceVolume
         return self.__copy__(_include_floor)
 
-    def to_dict(self, include_mesh=False, *args, **kwargs):
-        # type: (bool, list, dict) -> Dict[str, Any]
+    def to_dict(self, include_mesh=False, geometry_encoding=None, *args, **kwargs):
+        # type: (bool, Optional[str], list, dict) -> Dict[str, Any]
+        """Return the SpaceVolume as a dict.
+
+        Arguments:
+        ----------
+            * include_mesh (bool): Default=False. Set True to include the triangulated
+                mesh of each geometry face.
+            * geometry_encoding (Optional[str]): Default=None. Set to "float64" or "float32"
+                to store the geometry in the packed vertex-table form (see
+                honeybee_ph_utils.geometry_encoding). SpaceVolume.from_dict reads either form.
+
+        Returns:
+        --------
+            * (Dict[str, Any]): The SpaceVolume dict.
+        """
         d = {}  # type: dict[str, Any]
 
         d["identifier"] = self.identifier
@@ -662,11 +733,12 @@ class SpaceVolume(_base._Base):
                 g_dict["mesh"] = geom.triangulated_mesh3d.to_dict()
             d["geometry"].append(g_dict)
 
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict[str, Any]) -> SpaceVolume
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls()
 
         new_obj.identifier = _input_dict["identifier"]
@@ -997,6 +1069,70 @@ class Space(_base._Base):
         # type: () -> List[SpaceFloorSegment]
         return [f for v in self.volumes for f in v.floor_segments]
 
+    def floor_segments_mesh_dict(self):
+        # type: () -> Dict[str, Any]
+        """Return a single indexed mesh of all the Space's floor segments.
+
+        Vertices shared by neighboring floor segments are only included once, and
+        each mesh face records the index of the floor segment it came from. This is
+        much smaller (and faster to build) than one mesh dict per floor segment.
+
+        Returns:
+        --------
+            * Dict[str, Any]: ie:
+                {
+                    "type": "SpaceFloorSegmentsMesh",
+                    "vertices": [(x, y, z), ...],
+                    "faces": [(i, j, k), ...],
+                    "face_segment_indices": [0, 0, 1, ...],  # -- One per face
+                    "segments": [{"identifier": ..., "weighting_factor": ..., ...}, ...],
+                }
+        """
+        vertices = []  # type: List[Tuple[float, float, float]]
+        vertex_indices = {}  # type: Dict[Tuple[float, float, float], int]
+        faces = []  # type: List[Tuple[int, ...]]
+        face_segment_indices = []  # type: List[int]
+        segments = []  # type: List[Dict[str, Any]]
+
+        for flr_seg in self.floor_segments:
+            mesh = flr_seg.mesh3d
+            if mesh is None:
+                continue
+
+            segment_index = len(segments)
+            floor_area = flr_seg.floor_area
+            segments.append(
+                {
+                    "identifier": flr_seg.identifier,
+                    "display_name": flr_seg.display_name,
+                    "weighting_factor": flr_seg.weighting_factor,
+                    "net_area_factor": flr_seg.net_area_factor,
+                    "floor_area": floor_area,
+                    "weighted_floor_area": floor_area * flr_seg.weighting_factor,
+                }
+            )
+
+            # -- Re-index the segment's vertices into the shared vertex list
+            local_to_shared = []  # type: List[int]
+            for pt in mesh.vertices:
+                key = (pt.x, pt.y, pt.z)
+                if key not in vertex_indices:
+                    vertex_indices[key] = len(vertices)
+                    vertices.append(key)
+                local_to_shared.append(vertex_indices[key])
+
+            for mesh_face in mesh.faces:
+                faces.append(tuple(local_to_shared[i] for i in mesh_face))
+                face_segment_indices.append(segment_index)
+
+        return {
+            "type": "SpaceFloorSegmentsMesh",
+            "vertices": vertices,
+            "faces": faces,
+            "face_segment_indices": face_segment_indices,
+            "segments": segments,
+        }
+
     def add_new_volumes(self, _new_volumes):
         # type: (Union[SpaceVolume, list[SpaceVolume]]) -> None
         """Add a new SpaceVolume or list of SpaceVolumes to the Space.
@@ -1046,8 +1182,12 @@ class Space(_base._Base):
         # type: (Any, bool) -> Space
         return self.__copy__(_host, _include_volumes)
 
-    def to_dict(self, include_mesh=False, *args, **kwargs):
-        # type: (bool, list, dict) -> Dict[str, Any]
+    def to_dict(self, include_mesh=False, geometry_encoding=None, *args, **kwargs):
+        # type: (bool, Optional[str], list, dict) -> Dict[str, Any]
+        """Return the Space as a dict. Arguments as for SpaceVolume.to_dict.
+
+        With a geometry_encoding, the geometry of all the Space's volumes shares a single vertex table.
+        """
         d = {}
 
         d["identifier"] = self.identifier
@@ -1060,11 +1200,12 @@ class Space(_base._Base):
         d["volumes"] = [vol.to_dict(include_mesh) for vol in self.volumes]
         d["properties"] = self.properties.to_dict()
 
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict, _host):
         # type: (Dict[str, Any], Any) -> Space
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls(_host)
 
         new_obj.identifier = _input_dict["identifier"]
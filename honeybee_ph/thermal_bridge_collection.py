@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""An indexed collection of the PhThermalBridges of a BldgSegment, with running totals by group-type.
+
+The PHPP 'Areas' worksheet and the WUFI-Passive 'Thermal Bridges' list both need the
+total length and psi*length of each PhThermalBridgeType group ("15-Ambient",
+"16-Perimeter", "17-FS/BC"). PhThermalBridgeCollection is a dict of the thermal bridges
+(keyed by identifier, the same as before) which also keeps those totals up to date as
+thermal bridges are added, removed or transformed. The length of each thermal bridge's
+geometry is only calculated once, when the geometry is first seen.
+
+Thermal bridges can still be edited after they are added (ie: `tb.psi_value = 0.05`).
+Before the totals are read, each thermal bridge is checked for changes to its geometry,
+quantity, psi-value, group-type and interior-pipe setting, and the totals of any changed
+thermal bridges are updated.
+"""
+
+import uuid
+
+try:
+    from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from ladybug_geometry.geometry3d.polyline import LineSegment3D, Polyline3D
+except ImportError as e:
+    raise ImportError("\nFailed to import ladybug_geometry:\n\t{}".format(e))
+
+try:
+    from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge, PhThermalBridgeType
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
+
+
+class PhThermalBridgeGroupTotals(object):
+    """The totals of all the thermal bridges of one PhThermalBridgeType group.
+
+    Attributes:
+        group_type (str): The PhThermalBridgeType value (ie: "15-AMBIENT").
+        count (int): The number of PhThermalBridge objects in the group.
+        quantity (float): The total quantity of the thermal bridges.
+        length (float): The total length (length * quantity) of the thermal bridges.
+        psi_length (float): The total psi-value * length * quantity (W/K) of the thermal bridges.
+        radiative_length (float): The total length, not including interior pipes.
+        radiative_psi_length (float): The total psi-value * length * quantity, not including
+            interior pipes. Used for the thermal-bridge radiative/convective corrections.
+    """
+
+    def __init__(self, _group_type):
+        # type: (str) -> None
+        self.group_type = _group_type
+        self.count = 0
+        self.quantity = 0.0
+        self.length = 0.0
+        self.psi_length = 0.0
+        self.radiative_length = 0.0
+        self.radiative_psi_length = 0.0
+
+    def _add(self, _length, _quantity, _psi_value, _is_interior_pipe, _sign=1):
+        # type: (float, float, float, bool, int) -> None
+        self.count += _sign
+        if self.count == 0:
+            # -- Reset, so that the float round-off from the subtractions is not kept.
+            self.__init__(self.group_type)
+            return
+
+        length = _length * _quantity * _sign
+        self.quantity += _quantity * _sign
+        self.length += length
+        self.psi_length += length * _psi_value
+        if not _is_interior_pipe:
+            self.radiative_length += length
+            self.radiative_psi_length += length * _psi_value
+
+    @property
+    def average_psi_value(self):
+        # type: () -> float
+        """The length-weighted average psi-value (W/mK) of the group."""
+        if not self.length:
+            return 0.0
+        return self.psi_length / self.length
+
+    def duplicate(self):
+        # type: () -> PhThermalBridgeGroupTotals
+        new_obj = PhThermalBridgeGroupTotals(self.group_type)
+        new_obj.__dict__.update(self.__dict__)
+        return new_obj
+
+    def __eq__(self, other):
+        # type: (PhThermalBridgeGroupTotals) -> bool
+        if not isinstance(other, PhThermalBridgeGroupTotals):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        # type: (PhThermalBridgeGroupTotals) -> bool
+        return not self == other
+
+    def __str__(self):
+        return "{}(group_type={}, count={}, length={:.3f}, psi_length={:.3f})".format(
+            self.__class__.__name__, self.group_type, self.count, self.length, self.psi_length
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+def _signature(_tb):
+    # type: (PhThermalBridge) -> Tuple[Any, ...]
+    """Return the values of a thermal bridge which its group totals depend on."""
+    return (_tb.geometry, _tb.quantity, _tb.psi_value, _tb.group_type.value, _tb.is_interior_pipe)
+
+
+class PhThermalBridgeCollection(dict):
+    """A dict of PhThermalBridges (keyed by identifier) with running totals by PhThermalBridgeType.
+
+    Attributes:
+        group_totals (Dict[str, PhThermalBridgeGroupTotals]): The totals of each group-type.
+        total_length (float): The total length (length * quantity) of all the thermal bridges.
+        total_psi_length (float): The total psi-value * length * quantity (W/K) of all the thermal bridges.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(PhThermalBridgeCollection, self).__init__()
+        self._totals = {}  # type: Dict[str, PhThermalBridgeGroupTotals]
+        # -- The (signature, length) of each thermal bridge, as it was added to the totals.
+        self._index = {}  # type: Dict[str, Tuple[Tuple[Any, ...], float]]
+        self.update(*args, **kwargs)
+
+    # -------------------------------------------------------------------------
+    # -- Index
+
+    def _add_to_totals(self, _signature, _length, _sign=1):
+        # type: (Tuple[Any, ...], float, int) -> None
+        _, quantity, psi_value, group_type, is_interior_pipe = _signature
+        try:
+            group = self._totals[group_type]
+        except KeyError:
+            group = self._totals[group_type] = PhThermalBridgeGroupTotals(group_type)
+        group._add(_length, quantity, psi_value, is_interior_pipe, _sign)
+
+    def _index_add(self, _key, _tb, _length=None):
+        # type: (str, PhThermalBridge, Optional[float]) -> None
+        signature = _signature(_tb)
+        length = _tb.length if _length is None else _length
+        self._index[_key] = (signature, length)
+        self._add_to_totals(signature, length)
+
+    def _index_remove(self, _key):
+        # type: (str) -> None
+        signature, length = self._index.pop(_key)
+        self._add_to_totals(signature, length, -1)
+
+    def refresh(self):
+        # type: () -> None
+        """Update the totals of any thermal bridges which were edited since they were added."""
+        for key, tb in self.items():
+            signature, length = self._index[key]
+            new_signature = _signature(tb)
+            geometry_changed = new_signature[0] is not signature[0]
+            if not geometry_changed and new_signature[1:] == signature[1:]:
+                continue
+            if geometry_changed:
+                length = tb.length  # -- Only re-calculate the length if the geometry changed
+            self._add_to_totals(signature, self._index[key][1], -1)
+            self._index[key] = (new_signature, length)
+            self._add_to_totals(new_signature, length)
+
+    # -------------------------------------------------------------------------
+    # -- dict
+
+    def __setitem__(self, _key, _tb):
+        # type: (str, PhThermalBridge) -> None
+        if _key in self:
+            self._index_remove(_key)
+        super(PhThermalBridgeCollection, self).__setitem__(_key, _tb)
+        self._index_add(_key, _tb)
+
+    def __delitem__(self, _key):
+        # type: (str) -> None
+        super(PhThermalBridgeCollection, self).__delitem__(_key)
+        self._index_remove(_key)
+
+    def pop(self, _key, *args):
+        # type: (str, Any) -> Any
+        if _key not in self:
+            return super(PhThermalBridgeCollection, self).pop(_key, *args)
+        tb = self[_key]
+        del self[_key]
+        return tb
+
+    def popitem(self):
+        # type: () -> Tuple[str, PhThermalBridge]
+        key, tb = super(PhThermalBridgeCollection, self).popitem()
+        self._index_remove(key)
+        return key, tb
+
+    def setdefault(self, _key, _default=None):
+        # type: (str, Any) -> Any
+        if _key not in self:
+            self[_key] = _default
+        return self[_key]
+
+    def update(self, *args, **kwargs):
+        # type: (Any, Any) -> None
+        for key, tb in dict(*args, **kwargs).items():
+            self[key] = tb
+
+    def clear(self):
+        # type: () -> None
+        super(PhThermalBridgeCollection, self).clear()
+        self._index.clear()
+        self._totals.clear()
+
+    def __reduce__(self):
+        # -- Keep the stored lengths and totals, so the geometry is not measured again on load.
+        return (self.__class__, (), (dict(self), self._index, self._totals))
+
+    def __setstate__(self, _state):
+        # type: (Tuple[Dict[str, PhThermalBridge], Dict[str, Any], Dict[str, PhThermalBridgeGroupTotals]]) -> None
+        items, index, totals = _state
+        dict.update(self, items)
+        self._index = dict(index)
+        self._totals = {k: v.duplicate() for k, v in totals.items()}
+
+    # -------------------------------------------------------------------------
+    # -- Thermal Bridges
+
+    def add(self, _tb):
+        # type: (PhThermalBridge) -> None
+        """Add a thermal bridge to the collection, replacing any with the same identifier."""
+        self[_tb.identifier] = _tb
+
+    def remove(self, _tb):
+        # type: (Union[str, PhThermalBridge]) -> None
+        """Remove a thermal bridge (or the thermal bridge with the identifier) from the collection."""
+        del self[getattr(_tb, "identifier", _tb)]
+
+    def add_from_geometry(
+        self,
+        _geometry,
+        _psi_value=0.1,
+        _group_type=15,
+        _quantity=1.0,
+        _fRsi_value=0.75,
+        _is_interior_pipe=False,
+        _display_name="_unnamed_thermal_bridge_",
+        _identifiers=None,
+    ):
+        # type: (Iterable[Union[LineSegment3D, Polyline3D]], float, Union[str, int], float, float, bool, str, Optional[Iterable[str]]) -> List[PhThermalBridge]
+        """Create and add a new PhThermalBridge (with the same properties) for each geometry.
+
+        Arguments:
+        ----------
+            * _geometry (Iterable[LineSegment3D | Polyline3D]): The thermal bridge geometry.
+            * _psi_value (float): The psi-value (W/mK) of the thermal bridges. Default: 0.1.
+            * _group_type (str | int): The PhThermalBridgeType of the thermal bridges. Default: 15.
+            * _quantity (float): The quantity of each thermal bridge. Default: 1.0.
+            * _fRsi_value (float): The fRsi-value of the thermal bridges. Default: 0.75.
+            * _is_interior_pipe (bool): Set True for interior drain / vent pipes. Default: False.
+            * _display_name (str): The display-name of the thermal bridges.
+            * _identifiers (Optional[Iterable[str]]): The identifier of each thermal bridge,
+                in the same order as the geometry. Default: None (new uuid4 identifiers).
+
+        Returns:
+        --------
+            * (List[PhThermalBridge]): The new thermal bridges.
+        """
+        geometry = list(_geometry)
+        if _identifiers is None:
+            identifiers = [str(uuid.uuid4()) for _ in geometry]
+        else:
+            identifiers = [str(_) for _ in _identifiers]
+            if len(identifiers) != len(geometry):
+                raise ValueError(
+                    "Error: Got {} identifiers for {} thermal bridge geometries.".format(
+                        len(identifiers), len(geometry)
+                    )
+                )
+
+        new_tbs = []
+        for identifier, geom in zip(identifiers, geometry):
+            tb = PhThermalBridge(identifier, geom)
+            tb.display_name = _display_name
+            tb.psi_value = _psi_value
+            tb.group_type = _group_type
+            tb.quantity = _quantity
+            tb.fRsi_value = _fRsi_value
+            tb.is_interior_pipe = _is_interior_pipe
+            self[identifier] = tb
+            new_tbs.append(tb)
+        return new_tbs
+
+    def transformed(self, _transform, _length_factor=1.0):
+        # type: (Callable[[PhThermalBridge], PhThermalBridge], float) -> PhThermalBridgeCollection
+        """Return a new collection with the transform applied to each thermal bridge.
+
+        The lengths are carried over (times the length-factor) instead of being re-calculated.
+
+        Arguments:
+        ----------
+            * _transform (Callable[[PhThermalBridge], PhThermalBridge]): A function which returns
+                a new transformed thermal bridge (ie: `lambda tb: tb.move(vec)`).
+            * _length_factor (float): The change in length from the transform. Use the absolute
+                value of the scale-factor for a scale transform. Default: 1.0.
+
+        Returns:
+        --------
+            * (PhThermalBridgeCollection): The new collection.
+        """
+        self.refresh()
+        new_obj = self.__class__()
+        for key, tb in self.items():
+            new_tb = _transform(tb)
+            dict.__setitem__(new_obj, key, new_tb)
+            new_obj._index_add(key, new_tb, self._index[key][1] * _length_factor)
+        return new_obj
+
+    def duplicate(self):
+        # type: () -> PhThermalBridgeCollection
+        """Return a new collection with a copy of each thermal bridge."""
+        return self.transformed(lambda tb: tb.duplicate())
+
+    # -------------------------------------------------------------------------
+    # -- Totals
+
+    @property
+    def group_totals(self):
+        # type: () -> Dict[str, PhThermalBridgeGroupTotals]
+        self.refresh()
+        return {k: v.duplicate() for k, v in self._totals.items() if v.count}
+
+    def get_group_totals(self, _group_type):
+        # type: (Union[str, int, PhThermalBridgeType]) -> PhThermalBridgeGroupTotals
+        """Return the totals of one group-type (ie: 15, "16-PERIMETER" or a PhThermalBridgeType)."""
+        if not isinstance(_group_type, PhThermalBridgeType):
+            _group_type = PhThermalBridgeType(_group_type)
+        self.refresh()
+        group = self._totals.get(_group_type.value)
+        if group is None:
+            return PhThermalBridgeGroupTotals(_group_type.value)
+        return group.duplicate()
+
+    def lengths(self):
+        # type: () -> Dict[str, float]
+        """Return the (indexed) geometry length of each thermal bridge, by identifier."""
+        self.refresh()
+        return {k: v[1] for k, v in self._index.items()}
+
+    @property
+    def total_length(self):
+        # type: () -> float
+        return sum(g.length for g in self.group_totals.values())
+
+    @property
+    def total_psi_length(self):
+        # type: () -> float
+        return sum(g.psi_length for g in self.group_totals.values())
+
+    def __str__(self):
+        return "{}(thermal_bridges={}, groups={})".format(
+            self.__class__.__name__, len(self), sorted(self.group_totals.keys())
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
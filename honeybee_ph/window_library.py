@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""A model-level library of the PH window frames, glazings and install types.
+
+In a standard HBJSON file every WindowConstruction carries its full PhWindowFrame
+(with four PhWindowFrameElement dicts) and PhWindowGlazing, and every Aperture its
+own PhApertureInstallType dicts, even when hundreds of them are identical.
+
+`compact_model_dict` moves each unique (by content) frame element, frame, glazing and
+install type into a single 'window_library' section of the ModelPhProperties dict:
+
+    "properties": {
+        "ph": {
+            ...
+            "window_library": {
+                "type": "PhWindowLibrary",
+                "frame_elements": {"PhWindowFrameElement": {...}},
+                "frames": {"Frame_A": {..., "top": "PhWindowFrameElement", ...}},
+                "glazings": {"Glazing_A": {...}},
+                "install_types": {"Mid_Wall": {...}},
+            }
+        }
+    }
+
+and replaces the objects with references to their library key, which is their
+identifier (with a content-hash suffix if two different objects share an identifier):
+
+    WindowConstructionPhProperties: "ph_frame_ref": "Frame_A", "ph_glazing_ref": "Glazing_A"
+    AperturePhProperties:           "install_types": {"top": "Mid_Wall", ...}
+
+When the compact dict is loaded with `Model.from_dict`, ModelPhProperties builds each
+library object once, and the constructions and apertures referencing it share that
+one object (the same way Rooms share their BldgSegment).
+"""
+
+try:
+    from typing import Any, Dict, Optional
+except ImportError:
+    pass  # IronPython 2.7
+
+try:
+    from honeybee_energy_ph.construction.window import (
+        PhApertureInstallType,
+        PhWindowFrame,
+        PhWindowFrameElement,
+        PhWindowGlazing,
+    )
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
+
+try:
+    from honeybee_ph_utils.stable_hash import content_hash
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+
+
+WINDOW_LIBRARY_KEY = "window_library"
+FRAME_SIDES = ("top", "right", "bottom", "left")
+WINDOW_CONSTRUCTION_PH_TYPES = ("WindowConstructionPhProperties", "WindowConstructionPhPropertiesAbridged")
+APERTURE_PH_TYPES = ("AperturePhProperties", "AperturePhPropertiesAbridged")
+
+
+class _LibrarySection(object):
+    """One section of the library dict (ie: 'frames'), de-duplicating the dicts added to it."""
+
+    def __init__(self):
+        self.dicts = {}  # type: Dict[str, Dict[str, Any]]
+        self._keys_by_hash = {}  # type: Dict[str, str]
+
+    def add(self, _input_dict):
+        # type: (Dict[str, Any]) -> str
+        """Add the dict (if its content is not already in the section), and return its key."""
+        hash_ = content_hash(_input_dict)
+        key = self._keys_by_hash.get(hash_)
+        if key is not None:
+            return key
+
+        key = str(_input_dict.get("identifier", ""))
+        if key in self.dicts:
+            key = "{}|{}".format(key, hash_[:10])
+        self._keys_by_hash[hash_] = key
+        self.dicts[key] = _input_dict
+        return key
+
+
+class _LibraryBuilder(object):
+    def __init__(self):
+        self.frame_elements = _LibrarySection()
+        self.frames = _LibrarySection()
+        self.glazings = _LibrarySection()
+        self.install_types = _LibrarySection()
+
+    def add_frame(self, _frame_dict):
+        # type: (Dict[str, Any]) -> str
+        frame_dict = dict(_frame_dict)
+        for side in FRAME_SIDES:
+            if isinstance(frame_dict.get(side), dict):
+                frame_dict[side] = self.frame_elements.add(frame_dict[side])
+        return self.frames.add(frame_dict)
+
+    def compact_construction_ph(self, _ph_dict):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        new_dict = dict(_ph_dict)
+        if new_dict.get("ph_frame"):
+            new_dict["ph_frame_ref"] = self.add_frame(new_dict.pop("ph_frame"))
+        if new_dict.get("ph_glazing"):
+            new_dict["ph_glazing_ref"] = self.glazings.add(new_dict.pop("ph_glazing"))
+        return new_dict
+
+    def compact_aperture_ph(self, _ph_dict):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        install_types = _ph_dict.get("install_types")
+        if not install_types:
+            return _ph_dict
+        new_dict = dict(_ph_dict)
+        new_dict["install_types"] = {
+            side: self.install_types.add(value) if isinstance(value, dict) else value
+            for side, value in install_types.items()
+        }
+        return new_dict
+
+    def walk(self, _value):
+        # type: (Any) -> Any
+        """Return a copy of the value, with every window construction and aperture .ph dict compacted."""
+        if isinstance(_value, dict):
+            type_ = _value.get("type")
+            if type_ in WINDOW_CONSTRUCTION_PH_TYPES:
+                return self.compact_construction_ph(_value)
+            if type_ in APERTURE_PH_TYPES:
+                return self.compact_aperture_ph(_value)
+            return {k: self.walk(v) for k, v in _value.items()}
+        if isinstance(_value, list):
+            return [self.walk(v) for v in _value]
+        return _value
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        return {
+            "type": "PhWindowLibrary",
+            "frame_elements": self.frame_elements.dicts,
+            "frames": self.frames.dicts,
+            "glazings": self.glazings.dicts,
+            "install_types": self.install_types.dicts,
+        }
+
+
+def is_compact(_model_dict):
+    # type: (Dict[str, Any]) -> bool
+    """Return True if the HB-Model dict has a PH window library."""
+    ph_dict = (_model_dict.get("properties") or {}).get("ph") or {}
+    return WINDOW_LIBRARY_KEY in ph_dict
+
+
+def compact_model_dict(_model_dict):
+    # type: (Dict[str, Any]) -> Dict[str, Any]
+    """Return a copy of an HB-Model dict with its PH window objects moved into a shared library.
+
+    The input dict is not modified. A dict which is already compact is returned as it is.
+
+    Arguments:
+    ----------
+        * _model_dict (Dict[str, Any]): The HB-Model dict (ie: from `Model.to_dict()`).
+            The Model must have ModelPhProperties.
+
+    Returns:
+    --------
+        * Dict[str, Any]: The new HB-Model dict, with the "window_library" section added
+            to its ModelPhProperties.
+    """
+    if is_compact(_model_dict):
+        return _model_dict
+
+    builder = _LibraryBuilder()
+    new_dict = builder.walk(_model_dict)
+    new_dict["properties"]["ph"][WINDOW_LIBRARY_KEY] = builder.to_dict()
+    return new_dict
+
+
+class PhWindowLibrary(object):
+    """The PH window objects loaded from the 'window_library' of an HB-Model dict.
+
+    Attributes:
+        frames (Dict[str, PhWindowFrame]): The window frames, by library key.
+        glazings (Dict[str, PhWindowGlazing]): The window glazings, by library key.
+        install_types (Dict[str, PhApertureInstallType]): The aperture install types, by library key.
+    """
+
+    def __init__(self):
+        self.frames = {}  # type: Dict[str, PhWindowFrame]
+        self.glazings = {}  # type: Dict[str, PhWindowGlazing]
+        self.install_types = {}  # type: Dict[str, PhApertureInstallType]
+
+    @classmethod
+    def from_dict(cls, _input_dict):
+        # type: (Dict[str, Any]) -> PhWindowLibrary
+        """Return a new PhWindowLibrary, building each frame, glazing and install type once.
+
+        Frames which share a frame element also share the PhWindowFrameElement object.
+        """
+        obj = cls()
+
+        elements = {key: PhWindowFrameElement.from_dict(d) for key, d in _input_dict.get("frame_elements", {}).items()}
+        for key, frame_dict in _input_dict.get("frames", {}).items():
+            frame = PhWindowFrame(frame_dict["identifier"])
+            frame.set_base_attrs_from_dict(frame_dict)
+            for side in FRAME_SIDES:
+                value = frame_dict[side]
+                if isinstance(value, dict):
+                    setattr(frame, side, PhWindowFrameElement.from_dict(value))
+                else:
+                    setattr(frame, side, elements[value])
+            obj.frames[key] = frame
+
+        for key, glazing_dict in _input_dict.get("glazings", {}).items():
+            obj.glazings[key] = PhWindowGlazing.from_dict(glazing_dict)
+        for key, install_type_dict in _input_dict.get("install_types", {}).items():
+            obj.install_types[key] = PhApertureInstallType.from_dict(install_type_dict)
+
+        return obj
+
+    @classmethod
+    def from_model_dict(cls, _model_dict):
+        # type: (Dict[str, Any]) -> Optional[PhWindowLibrary]
+        """Return the PhWindowLibrary of an HB-Model dict, or None if the dict is not compact."""
+        if not is_compact(_model_dict):
+            return None
+        return cls.from_dict(_model_dict["properties"]["ph"][WINDOW_LIBRARY_KEY])
+
+    def __str__(self):
+        return "{}(frames={}, glazings={}, install_types={})".format(
+            self.__class__.__name__, len(self.frames), len(self.glazings), len(self.install_types)
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
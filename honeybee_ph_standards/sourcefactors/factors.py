@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 # -*- Python Version: 2.7 -*-
 
-"""Energy conversion factor (CO2, Source) functions"""
+"""Energy conversion factor (CO2, Source) functions
+
+Each FactorCollection keeps an index of its factors by the clean (upper-case) fuel name,
+built the first time a factor is looked up, so that converting the annual energy of many
+rooms does not repeat the fuel-name cleaning and the search of the factor list:
+
+>>> table = {"ELECTRICITY_MIX": [1200.0, 950.0, ...], "NATURAL_GAS": [3400.0, 0.0, ...]}
+>>> source_energy, co2e = convert_energy_table(table, source_energy_factors, co2e_factors)
+"""
 
 try:
-    from typing import Dict, Generator, List, Optional, Union
+    from typing import Dict, Generator, List, Optional, Tuple, Union
 except ImportError:
     pass  # IronPython 2.7
 
@@ -31,6 +39,15 @@ def clean_input(input):
     return str(input).lstrip().rstrip().replace(" ", "_").upper()
 
 
+def check_row_counts(_table):
+    # type: (Dict[str, List[float]]) -> int
+    """Return the number of rows of a fuel-by-fuel table. Raises a ValueError if the columns differ in length."""
+    row_counts = {fuel_name: len(column) for fuel_name, column in _table.items()}
+    if len(set(row_counts.values())) > 1:
+        raise ValueError("Error: every fuel must have the same number of rows. Got: {}".format(row_counts))
+    return next(iter(row_counts.values()), 0)
+
+
 def build_factors_from_library(_factor_dict):
     # type: (Dict[str, Dict[str, Union[float, str]]]) -> List[Factor]
     """Returns a list of factors based on an input data dict from the library."""
@@ -101,6 +118,9 @@ class Factor(_base._Base):
 class FactorCollection(_base._Base):
     """A named collection of energy conversion factors keyed by fuel type.
 
+    The fuel-name index is re-built whenever factors are added or the factors list is
+    replaced. Call `refresh_index()` after changing the fuel_name of any of the factors.
+
     Attributes:
         name (str): Collection name (e.g. "Phius 2024 Source Energy").
         factors (List[Factor]): The conversion factors in this collection.
@@ -114,6 +134,24 @@ class FactorCollection(_base._Base):
             self.factors = _factors
         else:
             self.factors = []
+        self._index = {}  # type: Dict[str, Factor]
+        self._indexed_factors = None  # type: Optional[List[Factor]]
+        self._indexed_count = 0
+
+    @property
+    def index(self):
+        # type: () -> Dict[str, Factor]
+        """The factors, by their clean fuel name. The first factor with each fuel name is used."""
+        if self._indexed_factors is not self.factors or self._indexed_count != len(self.factors):
+            self.refresh_index()
+        return self._index
+
+    def refresh_index(self):
+        # type: () -> None
+        """Re-build the fuel-name index from the current factors."""
+        self._index = {clean_input(factor.fuel_name): factor for factor in reversed(self.factors)}
+        self._indexed_factors = self.factors
+        self._indexed_count = len(self.factors)
 
     def add_factor(self, _new_factor):
         # type: (Factor) -> None
@@ -122,17 +160,58 @@ class FactorCollection(_base._Base):
         for i, exg_factor in enumerate(self.factors):
             if exg_factor.fuel_name == _new_factor.fuel_name:
                 self.factors[i] = _new_factor
+                self._indexed_factors = None
                 return None
         self.factors.append(_new_factor)
         return None
 
     def get_factor(self, _fuel_name):
         # type: (str) -> Factor
-        """Get a factor by fuel name."""
-        for factor in self.factors:
-            if factor.fuel_name == _fuel_name:
-                return factor
-        raise ValueError("No factor found for fuel: '{}'".format(_fuel_name))
+        """Get a factor by fuel name (ie: "NATURAL_GAS" or "natural gas")."""
+        index = self.index
+        try:
+            return index[_fuel_name]
+        except KeyError:
+            pass
+        try:
+            return index[clean_input(_fuel_name)]
+        except KeyError:
+            raise ValueError("No factor found for fuel: '{}'".format(_fuel_name))
+
+    def get_value(self, _fuel_name):
+        # type: (str) -> float
+        """Get the value of the factor for a fuel name."""
+        return float(self.get_factor(_fuel_name).value)
+
+    def convert_table(self, _energy_table):
+        # type: (Dict[str, List[float]]) -> Dict[str, List[float]]
+        """Return a fuel-by-fuel energy table with every value multiplied by the fuel's factor.
+
+        Arguments:
+        ----------
+            * _energy_table (Dict[str, List[float]]): The annual energy [kWh] of each
+                row (ie: each room), by fuel name. All the lists must be the same length.
+
+        Returns:
+        --------
+            * (Dict[str, List[float]]): The converted values of each row, by clean fuel name.
+                The columns of any fuel names which are the same once cleaned are added together.
+
+        Raises:
+        -------
+            * ValueError: If there is no factor for any of the fuels, or if the columns
+                are not all the same length.
+        """
+        check_row_counts(_energy_table)
+        converted = {}  # type: Dict[str, List[float]]
+        for fuel_name, column in _energy_table.items():
+            value = self.get_value(fuel_name)
+            new_column = [energy * value for energy in column]
+            key = clean_input(fuel_name)
+            if key in converted:
+                new_column = [a + b for a, b in zip(converted[key], new_column)]
+            converted[key] = new_column
+        return converted
 
     def validate_fuel_types(self, _allowed_fuels):
         for factor in self.factors:
@@ -166,6 +245,7 @@ class FactorCollection(_base._Base):
         obj.set_base_attrs_from_source(self)
         obj.name = self.name
         obj.factors = [f for f in self.factors]
+        obj.refresh_index()
 
         return obj
 
@@ -183,3 +263,42 @@ class FactorCollection(_base._Base):
 
     def ToString(self):
         return str(self)
+
+
+def row_totals(_table):
+    # type: (Dict[str, List[float]]) -> List[float]
+    """Return the total of each row of a fuel-by-fuel table (the sum across all the fuels).
+
+    Raises a ValueError if the columns are not all the same length.
+    """
+    totals = [0.0] * check_row_counts(_table)
+    for column in _table.values():
+        totals = [total + v for total, v in zip(totals, column)]
+    return totals
+
+
+def convert_energy_table(_energy_table, _source_energy_factors, _co2e_factors):
+    # type: (Dict[str, List[float]], FactorCollection, FactorCollection) -> Tuple[List[float], List[float]]
+    """Return the total source energy and CO2e of each row of a fuel-by-fuel annual energy table.
+
+    Arguments:
+    ----------
+        * _energy_table (Dict[str, List[float]]): The annual site energy [kWh] of each
+            row (ie: each room), by fuel name. All the lists must be the same length.
+        * _source_energy_factors (FactorCollection): The source energy factors [kWh/kWh].
+        * _co2e_factors (FactorCollection): The CO2e emission factors (ie: [g/kWh]).
+
+    Returns:
+    --------
+        * (Tuple[List[float], List[float]]): The source energy [kWh] and the CO2e emissions
+            (in the units of the factors x kWh) of each row, summed across all the fuels.
+
+    Raises:
+    -------
+        * ValueError: If either collection has no factor for any of the fuels, or if
+            the columns are not all the same length.
+    """
+    return (
+        row_totals(_source_energy_factors.convert_table(_energy_table)),
+        row_totals(_co2e_factors.convert_table(_energy_table)),
+    )
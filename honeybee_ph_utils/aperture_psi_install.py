@@ -15,10 +15,17 @@ Resolution, per side (top / right / bottom / left):
     2. Otherwise inherit the psi_install of the window construction's
        PhWindowFrameElement for that side.
 There are no other hidden defaults.
+
+Effective frames are cached, keyed on the frame (identifier and element values) and
+the four Install Types (identifier and psi_install). All the apertures with the same
+combination share one read-only effective frame, so a facade with thousands of
+apertures and a handful of window / install-type combinations only builds a handful
+of frames. The frame's user_data is not part of the key, so it is not copied onto the
+shared effective frame.
 """
 
 try:
-    from typing import Any, Dict, Optional
+    from typing import Any, Dict, Optional, Tuple
 except ImportError:
     pass  # IronPython 2.7
 
@@ -28,10 +35,57 @@ except ImportError as e:
     raise ImportError("\nFailed to import honeybee:\n\t{}".format(e))
 
 try:
-    from honeybee_energy_ph.construction.window import PhWindowFrame, PhWindowGlazing
+    from honeybee_energy_ph.construction.window import PhWindowFrame, PhWindowFrameElement, PhWindowGlazing
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_energy_ph:\n\t{}".format(e))
 
+try:
+    from honeybee_ph_utils.input_tools import BoundedCache
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+
+
+EFFECTIVE_FRAME_CACHE_SIZE = 512
+FRAME_ELEMENT_ATTRS = (
+    "identifier",
+    "display_name",
+    "width",
+    "u_factor",
+    "psi_glazing",
+    "psi_install",
+    "chi_value",
+    "solar_absorptance",
+    "thermal_emissivity",
+)
+
+_EFFECTIVE_FRAME_CACHE = BoundedCache(EFFECTIVE_FRAME_CACHE_SIZE)
+
+
+class _ReadOnly(object):
+    """Mixin which blocks any attribute changes once the object is locked."""
+
+    _locked = False
+
+    def _lock(self):
+        # type: () -> None
+        object.__setattr__(self, "_locked", True)
+
+    def __setattr__(self, _name, _value):
+        if self._locked:
+            raise AttributeError(
+                "Error: The {} is shared by many Apertures and can not be changed. "
+                "Use '.duplicate()' to get an editable copy.".format(self.__class__.__name__)
+            )
+        super(_ReadOnly, self).__setattr__(_name, _value)
+
+
+class EffectivePhWindowFrameElement(_ReadOnly, PhWindowFrameElement):
+    """A read-only PhWindowFrameElement with the resolved psi-install value."""
+
+
+class EffectivePhWindowFrame(_ReadOnly, PhWindowFrame):
+    """A read-only PhWindowFrame with the resolved psi-install value on each side."""
+
 
 def _get_window_construction_ph_properties(_hb_aperture):
     # type: (Aperture) -> Optional[Any]
@@ -91,13 +145,64 @@ def resolve_psi_install_values(_hb_aperture):
     }
 
 
+def _frame_key(_ph_frame):
+    # type: (PhWindowFrame) -> Tuple
+    """Return a key of the frame's identifier and the values of all its elements."""
+    return (_ph_frame.identifier, _ph_frame.display_name, _ph_frame.id_num) + tuple(
+        tuple(getattr(element, attr) for attr in FRAME_ELEMENT_ATTRS) for element in _ph_frame.elements
+    )
+
+
+def _install_types_key(_install_types):
+    # type: (Any) -> Tuple
+    """Return a key of the identifier and psi_install of each side's Install Type (or None)."""
+    key = []
+    for side in _install_types.SIDES:
+        install_type = _install_types.get_side(side)
+        key.append(None if install_type is None else (install_type.identifier, install_type.psi_install))
+    return tuple(key)
+
+
+def _build_effective_frame(_ph_frame, _install_types, _aperture_display_name):
+    # type: (PhWindowFrame, Any, str) -> EffectivePhWindowFrame
+    # -- Only the base attributes in the cache key are copied. The user_data is left
+    # -- out, as the frame is shared with every other frame which has the same key.
+    effective_frame = EffectivePhWindowFrame(_ph_frame.identifier)
+    effective_frame.id_num = _ph_frame.id_num
+    effective_frame.display_name = _ph_frame.display_name
+    for side in _install_types.SIDES:
+        element = EffectivePhWindowFrameElement(getattr(_ph_frame, side).identifier)
+        for attr in FRAME_ELEMENT_ATTRS[1:]:
+            setattr(element, attr, getattr(getattr(_ph_frame, side), attr))
+        element.psi_install = _resolve_side_psi_install(side, _install_types, _ph_frame, _aperture_display_name)
+        element._lock()
+        setattr(effective_frame, side, element)
+    effective_frame._lock()
+    return effective_frame
+
+
+def _get_effective_frame(_hb_aperture, _ph_frame, _ph_frame_key):
+    # type: (Aperture, PhWindowFrame, Tuple) -> EffectivePhWindowFrame
+    """Return the cached effective frame for the Aperture, building it if it is not in the cache."""
+    install_types = _hb_aperture.properties.ph.install_types  # type: ignore
+    key = (_ph_frame_key, _install_types_key(install_types))
+    effective_frame = _EFFECTIVE_FRAME_CACHE.get(key)
+    if effective_frame is None:
+        effective_frame = _build_effective_frame(_ph_frame, install_types, _hb_aperture.display_name)
+        _EFFECTIVE_FRAME_CACHE.set(key, effective_frame)
+    return effective_frame
+
+
 def resolve_effective_frame(_hb_aperture):
-    # type: (Aperture) -> PhWindowFrame
-    """Return a transient duplicate of the Aperture's PH frame with resolved psi-install values.
+    # type: (Aperture) -> EffectivePhWindowFrame
+    """Return the Aperture's PH frame with resolved psi-install values.
+
+    Each side's psi_install is overridden by the aperture's assigned Install Type
+    (where one is assigned). Nothing new is serialized: the result is an in-memory
+    frame for calculations (eg. ISO 10077-1 U-w) only.
 
-    The duplicate has each side's psi_install overridden by the aperture's assigned
-    Install Type (where one is assigned). Nothing new is serialized: the result is an
-    in-memory frame for calculations (eg. ISO 10077-1 U-w) only.
+    The result is read-only, and is shared by all of the Apertures with the same frame
+    and Install Types. Use `.duplicate()` on it to get an editable copy.
     Raises ValueError if the window construction has no PH frame.
     """
     ph_frame = get_ph_frame(_hb_aperture)
@@ -107,10 +212,42 @@ def resolve_effective_frame(_hb_aperture):
             "has no PH frame.".format(_hb_aperture.display_name)
         )
 
-    effective_frame = ph_frame.duplicate()
-    install_types = _hb_aperture.properties.ph.install_types  # type: ignore
-    for side in install_types.SIDES:
-        getattr(effective_frame, side).psi_install = _resolve_side_psi_install(
-            side, install_types, ph_frame, _hb_aperture.display_name
-        )
-    return effective_frame
+    return _get_effective_frame(_hb_aperture, ph_frame, _frame_key(ph_frame))
+
+
+def resolve_all(_hb_model):
+    # type: (Any) -> Dict[str, Optional[EffectivePhWindowFrame]]
+    """Return the effective frame of every Aperture in an HB-Model, in one pass.
+
+    Arguments:
+    ----------
+        * _hb_model (Model): The Honeybee Model.
+
+    Returns:
+    --------
+        * (Dict[str, Optional[EffectivePhWindowFrame]]): The (shared, read-only) effective
+            frame of each Aperture, by Aperture identifier. Apertures whose window construction
+            has no PH frame are None.
+    """
+    frames = {}  # type: Dict[str, Optional[EffectivePhWindowFrame]]
+    frame_keys = {}  # type: Dict[int, Tuple]
+    for hb_aperture in _hb_model.apertures:
+        ph_frame = get_ph_frame(hb_aperture)
+        if ph_frame is None:
+            frames[hb_aperture.identifier] = None
+            continue
+
+        # -- Many Apertures share each frame, so only build each frame's key once.
+        try:
+            frame_key = frame_keys[id(ph_frame)]
+        except KeyError:
+            frame_key = frame_keys[id(ph_frame)] = _frame_key(ph_frame)
+
+        frames[hb_aperture.identifier] = _get_effective_frame(hb_aperture, ph_frame, frame_key)
+    return frames
+
+
+def clear_effective_frame_cache():
+    # type: () -> None
+    """Remove all the cached effective frames."""
+    _EFFECTIVE_FRAME_CACHE.clear()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Compact 'packed' encoding for the Ladybug-Geometry inside a Honeybee-PH object dict.
+
+Ladybug-Geometry objects serialize every point as a nested JSON list, which makes up
+most of the size (and parse time) of a Space, pipe or duct dict. The packed encoding
+collects every point and vector in an object's dict into one de-duplicated vertex
+table, stored once at the top of the dict as base64-encoded float64 (or float32) data.
+The geometry dicts then only hold integer indices into that table:
+
+    {
+        "identifier": ...,
+        "geometry": {"type": "LineSegment3D", "p": 0, "v": 1},
+        ...
+        "vertex_table": {"dtype": "float64", "count": 2, "data": "AAAAAAAA..."},
+    }
+
+The packed dict is not readable by Ladybug-Geometry directly; use `unpack_geometry`
+(called by the Honeybee-PH 'from_dict' methods) to restore the standard form first.
+"""
+
+import base64
+import struct
+from copy import copy
+
+try:
+    from typing import Any, Dict, List, Optional, Sequence, Tuple
+except ImportError:
+    pass  # IronPython
+
+VERTEX_TABLE_KEY = "vertex_table"
+
+# -- The struct format character and the byte-size of each supported number type
+DTYPES = {"float64": ("d", 8), "float32": ("f", 4)}
+
+# -- For each geometry type: the dict keys holding points (or vectors), and how many
+# -- levels of lists wrap each point (0 = a single point, 1 = a list of points, etc.)
+GEOMETRY_POINT_KEYS = {
+    "Face3D": {"boundary": 1, "holes": 2},
+    "Plane": {"n": 0, "o": 0, "x": 0},
+    "LineSegment3D": {"p": 0, "v": 0},
+    "Polyline3D": {"vertices": 1},
+    "Mesh3D": {"vertices": 1},
+}  # type: Dict[str, Dict[str, int]]
+
+
+class VertexTable(object):
+    """A de-duplicated list of 3D points (or vectors), used by the packed geometry encoding.
+
+    Attributes:
+        vertices (List[Tuple[float, float, float]]): The unique vertices, in the order they were added.
+    """
+
+    def __init__(self):
+        self.vertices = []  # type: List[Tuple[float, float, float]]
+        self._indices = {}  # type: Dict[Tuple[float, float, float], int]
+
+    def add(self, _xyz):
+        # type: (Sequence[float]) -> int
+        """Add a vertex to the table (if it is not already there) and return its index."""
+        key = (float(_xyz[0]), float(_xyz[1]), float(_xyz[2]))
+        index = self._indices.get(key)
+        if index is None:
+            index = len(self.vertices)
+            self._indices[key] = index
+            self.vertices.append(key)
+        return index
+
+    def to_dict(self, _dtype="float64"):
+        # type: (str) -> Dict[str, Any]
+        """Return the table as a dict with the vertex data packed as little-endian base64."""
+        try:
+            format_char, _ = DTYPES[_dtype]
+        except KeyError:
+            raise ValueError("Error: Unsupported geometry encoding '{}'. Use one of: {}".format(_dtype, sorted(DTYPES)))
+
+        values = [v for xyz in self.vertices for v in xyz]
+        data = struct.pack("<{}{}".format(len(values), format_char), *values)
+        return {
+            "dtype": _dtype,
+            "count": len(self.vertices),
+            "data": base64.b64encode(data).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, _input_dict):
+        # type: (Dict[str, Any]) -> VertexTable
+        """Return a new VertexTable from a dict created by `VertexTable.to_dict`."""
+        dtype = _input_dict.get("dtype", "float64")
+        try:
+            format_char, size = DTYPES[dtype]
+        except KeyError:
+            raise ValueError("Error: Unsupported geometry encoding '{}'. Use one of: {}".format(dtype, sorted(DTYPES)))
+
+        data = base64.b64decode(_input_dict["data"])
+        count = len(data) // size
+        if count != 3 * int(_input_dict.get("count", count // 3)):
+            raise ValueError("Error: The vertex-table data does not match its vertex count.")
+
+        values = struct.unpack("<{}{}".format(count, format_char), data)
+        obj = cls()
+        obj.vertices = [values[i : i + 3] for i in range(0, count, 3)]
+        return obj
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __str__(self):
+        return "{}(count={})".format(self.__class__.__name__, len(self))
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+# -----------------------------------------------------------------------------
+
+
+def _pack_points(_value, _depth, _table):
+    # type: (Any, int, VertexTable) -> Any
+    if _value is None:
+        return None
+    if _depth == 0:
+        return _table.add(_value)
+    return [_pack_points(v, _depth - 1, _table) for v in _value]
+
+
+def _unpack_points(_value, _depth, _vertices):
+    # type: (Any, int, List[Tuple[float, float, float]]) -> Any
+    if _value is None:
+        return None
+    if _depth == 0:
+        if isinstance(_value, int):
+            return _vertices[_value]
+        return _value  # -- Already un-packed
+    return [_unpack_points(v, _depth - 1, _vertices) for v in _value]
+
+
+def _walk(_value, _convert_points):
+    # type: (Any, Any) -> Any
+    """Return a copy of the value, with the points of every geometry dict converted."""
+    if isinstance(_value, dict):
+        point_keys = GEOMETRY_POINT_KEYS.get(_value.get("type"), {})  # type: ignore
+        new_dict = {}
+        for k, v in _value.items():
+            if k in point_keys:
+                new_dict[k] = _convert_points(v, point_keys[k])
+            else:
+                new_dict[k] = _walk(v, _convert_points)
+        return new_dict
+    if isinstance(_value, (list, tuple)):
+        return [_walk(v, _convert_points) for v in _value]
+    return _value
+
+
+def is_packed(_input_dict):
+    # type: (Dict[str, Any]) -> bool
+    """Return True if the dict uses the packed geometry encoding."""
+    return isinstance(_input_dict, dict) and VERTEX_TABLE_KEY in _input_dict
+
+
+def pack_geometry(_input_dict, _dtype="float64"):
+    # type: (Dict[str, Any], str) -> Dict[str, Any]
+    """Return a copy of an object dict with all of its geometry packed into a shared vertex table.
+
+    Arguments:
+    ----------
+        * _input_dict (Dict[str, Any]): An object dict (from 'to_dict') in the standard form.
+        * _dtype (str): The number type used to store the vertices: "float64" (exact)
+            or "float32" (half the size, but rounded to ~7 significant digits).
+
+    Returns:
+    --------
+        * Dict[str, Any]: A new dict, with the geometry points replaced by indices
+            into the vertex table stored under the "vertex_table" key.
+    """
+    if is_packed(_input_dict):
+        return _input_dict
+
+    table = VertexTable()
+    packed = _walk(_input_dict, lambda v, depth: _pack_points(v, depth, table))
+    packed[VERTEX_TABLE_KEY] = table.to_dict(_dtype)
+    return packed
+
+
+def unpack_geometry(_input_dict):
+    # type: (Dict[str, Any]) -> Dict[str, Any]
+    """Return the object dict in the standard form, un-packing the geometry if it is packed.
+
+    Dicts which are not packed are returned as they are, so this is safe to call on
+    any input to 'from_dict'.
+
+    Arguments:
+    ----------
+        * _input_dict (Dict[str, Any]): An object dict, in either the packed or standard form.
+
+    Returns:
+    --------
+        * Dict[str, Any]: The dict in the standard form.
+    """
+    if not is_packed(_input_dict):
+        return _input_dict
+
+    vertices = VertexTable.from_dict(_input_dict[VERTEX_TABLE_KEY]).vertices
+    input_dict = copy(_input_dict)
+    input_dict.pop(VERTEX_TABLE_KEY)
+    return _walk(input_dict, lambda v, depth: _unpack_points(v, depth, vertices))
+
+
+def encode_geometry(_input_dict, _geometry_encoding=None):
+    # type: (Dict[str, Any], Optional[str]) -> Dict[str, Any]
+    """Return the dict packed with the given encoding, or unchanged if the encoding is None.
+
+    This is the helper used by the 'to_dict' methods which take a 'geometry_encoding' argument.
+    """
+    if not _geometry_encoding:
+        return _input_dict
+    return pack_geometry(_input_dict, _geometry_encoding)
@@ -14,9 +14,14 @@ except ImportError:
 try:
     from scriptcontext import sticky  # type: ignore
 except ImportError:
-    pass  # Not in Rhino Grasshopper
+    sticky = None  # Not in Rhino Grasshopper
 
 import re
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+
+DEFAULT_MEMOIZE_SIZE = 128
 
 
 def input_to_int(_input_value, _default=None):
@@ -129,10 +134,72 @@ def cleaner_get(_list, _i, _default):
             return _default
 
 
+class BoundedCache(object):
+    """A thread-safe, size-limited cache. When full, the least-recently-used value is evicted.
+
+    Attributes:
+        max_size (int): The maximum number of values to keep.
+    """
+
+    def __init__(self, _max_size=DEFAULT_MEMOIZE_SIZE):
+        # type: (int) -> None
+        if _max_size < 1:
+            raise ValueError("Error: max_size must be 1 or more. Got: {}".format(_max_size))
+        self.max_size = _max_size
+        self._items = OrderedDict()  # type: OrderedDict[Any, Any]
+        self._lock = Lock()
+
+    def get(self, _key, _default=None):
+        # type: (Any, Any) -> Any
+        """Return the value for the key (marking it as most-recently-used), or the default if not found."""
+        with self._lock:
+            try:
+                value = self._items.pop(_key)
+            except KeyError:
+                return _default
+            self._items[_key] = value
+            return value
+
+    def set(self, _key, _value):
+        # type: (Any, Any) -> None
+        """Add the value to the cache, evicting the least-recently-used values if the cache is full."""
+        with self._lock:
+            self._items.pop(_key, None)
+            self._items[_key] = _value
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        # type: () -> None
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, _key):
+        return _key in self._items
+
+    def __str__(self):
+        return "{}(size={}/{})".format(self.__class__.__name__, len(self), self.max_size)
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+_MISSING = object()
+
+
 def memoize(func):
     """Simple caching decorator using function arguments as key.
 
-    Uses the Grasshopper 'sticky' dict to store values.
+    Inside Rhino Grasshopper, uses the Grasshopper 'sticky' dict to store values.
+    Everywhere else, each decorated function gets its own thread-safe BoundedCache
+    (available as 'func.cache') so that it is safe to call from a thread pool, and
+    does not grow without limit in long-running processes.
 
     https://book.pythontips.com/en/latest/function_caching.html
 
@@ -144,13 +211,26 @@ def memoize(func):
     >>>
     >>> fibonacci(25)
     """
+    cache = BoundedCache()
 
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        try:
-            return sticky[args]
-        except KeyError:
+        if sticky is not None:
+            try:
+                return sticky[args]
+            except KeyError:
+                rv = func(*args, **kwargs)
+                sticky[args] = rv
+                return rv
+
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        rv = cache.get(key, _MISSING)
+        if rv is _MISSING:
+            # -- Calculated outside the lock. If two threads miss on the same key at once,
+            # -- both calculate it and the last one wins.
             rv = func(*args, **kwargs)
-            sticky[args] = rv
-            return rv
+            cache.set(key, rv)
+        return rv
 
+    wrapper.cache = cache  # type: ignore
     return wrapper
@@ -3,7 +3,7 @@
 
 """Utility functions for working with Honeybee-Energy Occupancy Loads and Schedules"""
 
-import statistics
+from honeybee_ph_utils.schedule_statistics import schedule_statistics
 
 
 def hb_room_ppl_per_area(_hb_room):
@@ -70,6 +70,6 @@ def hb_room_annual_avg_occupancy(_hb_room):
     try:
         mean_occupancy = _hb_room.properties.energy.people.occupancy_schedule.mean_occupancy
     except AttributeError:
-        mean_occupancy = statistics.mean(_hb_room.properties.energy.people.occupancy_schedule.values())
+        mean_occupancy = schedule_statistics(_hb_room.properties.energy.people.occupancy_schedule).mean
 
     return peak_occupancy * mean_occupancy
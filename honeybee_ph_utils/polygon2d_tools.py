@@ -4,13 +4,19 @@
 """Tools for working with Ladybug.geometry2d.Polygon2D objects."""
 
 import math
+import warnings
 from copy import copy
 
 try:
-    from typing import List
+    from typing import Dict, List, Optional, Tuple
 except ImportError:
     pass  # Python 2.7
 
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None  # IronPython 2.7
+
 try:
     from ladybug_geometry.geometry2d.pointvector import Point2D, Vector2D
     from ladybug_geometry.geometry2d.polygon import Polygon2D
@@ -123,6 +129,139 @@ def get_lbt_Face3D_planes(_lbt_face3Ds):
     return [copy(f.plane) for f in _lbt_face3Ds]
 
 
+def cluster_polygon2Ds(_polygon2Ds, _tolerance):
+    # type: (List[Polygon2D], float) -> List[List[int]]
+    """Group the Polygon2Ds into clusters whose bounding-boxes overlap (directly or through others).
+
+    Polygons in different clusters can never touch, so each cluster can be merged on its own.
+
+    Arguments:
+    ----------
+        * _polygon2Ds (List[Polygon2D]): The polygons to cluster.
+        * _tolerance (float): Bounding-boxes closer than this are treated as overlapping.
+
+    Returns:
+    --------
+        * List[List[int]]: The indices of the polygons in each cluster, ordered by
+            the first polygon (input order) of each cluster.
+    """
+    boxes = [
+        (p.min.x - _tolerance, p.min.y - _tolerance, p.max.x + _tolerance, p.max.y + _tolerance) for p in _polygon2Ds
+    ]
+    parents = list(range(len(boxes)))
+
+    def _root(_i):
+        while parents[_i] != _i:
+            parents[_i] = parents[parents[_i]]
+            _i = parents[_i]
+        return _i
+
+    # -- Sweep along X, only comparing each box with the boxes which reach its min-X
+    active = []  # type: List[int]
+    for i in sorted(range(len(boxes)), key=lambda _: boxes[_][0]):
+        x_min, y_min, _, y_max = boxes[i]
+        active = [j for j in active if boxes[j][2] >= x_min]
+        for j in active:
+            if boxes[j][1] <= y_max and y_min <= boxes[j][3]:
+                parents[_root(j)] = _root(i)
+        active.append(i)
+
+    clusters = {}  # type: Dict[int, List[int]]
+    for i in range(len(boxes)):
+        clusters.setdefault(_root(i), []).append(i)
+    return sorted(clusters.values(), key=lambda _: _[0])
+
+
+def _union_cluster(_args):
+    # type: (Tuple[List[Polygon2D], float]) -> Tuple[List[Polygon2D], Optional[str]]
+    """Return the merged polygons of one cluster, or the unmerged polygons and the error."""
+    polygon2Ds, tolerance = _args
+    if len(polygon2Ds) < 2:
+        return list(polygon2Ds), None
+    try:
+        return Polygon2D.boolean_union_all(list(polygon2Ds), tolerance), None
+    except Exception as e:
+        return list(polygon2Ds), "{}: {}".format(e.__class__.__name__, e)
+
+
+class PolygonMergeResult(object):
+    """The result of merging Polygon2Ds cluster-by-cluster.
+
+    Attributes:
+        polygon2Ds (List[Polygon2D]): The merged polygons. The polygons of any failed
+            cluster are included unmerged.
+        clusters (List[List[int]]): The input-polygon indices of each cluster.
+        failed_clusters (Dict[int, str]): The error message of each cluster which
+            could not be merged, by cluster index.
+    """
+
+    def __init__(self):
+        self.polygon2Ds = []  # type: List[Polygon2D]
+        self.clusters = []  # type: List[List[int]]
+        self.failed_clusters = {}  # type: Dict[int, str]
+
+    @property
+    def succeeded(self):
+        # type: () -> bool
+        """True if every cluster was merged."""
+        return not self.failed_clusters
+
+    def __str__(self):
+        return "{}(polygon2Ds={}, clusters={}, failed_clusters={})".format(
+            self.__class__.__name__, len(self.polygon2Ds), len(self.clusters), sorted(self.failed_clusters)
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+def merge_polygon2Ds_by_cluster(_polygon2Ds, _tolerance, _processes=None):
+    # type: (List[Polygon2D], float, Optional[int]) -> PolygonMergeResult
+    """Merge the Polygon2Ds by boolean union, one cluster of overlapping polygons at a time.
+
+    Arguments:
+    ----------
+        * _polygon2Ds (List[Polygon2D]): Polygons to merge. They must all be in the same plane-space.
+        * _tolerance (float): Boolean-union tolerance.
+        * _processes (Optional[int]): If set (and more than 1), the clusters are merged
+            in a pool of this many processes. Not available in IronPython. Default: None.
+
+    Returns:
+    --------
+        * PolygonMergeResult: The merged polygons, and any clusters which failed to merge.
+    """
+    result = PolygonMergeResult()
+    result.clusters = cluster_polygon2Ds(_polygon2Ds, _tolerance)
+    jobs = [([_polygon2Ds[i] for i in cluster], _tolerance) for cluster in result.clusters]
+
+    multi_polygon_jobs = sum(1 for polygon2Ds, _ in jobs if len(polygon2Ds) > 1)
+    if ProcessPoolExecutor is not None and _processes and _processes > 1 and multi_polygon_jobs > 1:
+        with ProcessPoolExecutor(max_workers=_processes) as pool:
+            cluster_results = list(pool.map(_union_cluster, jobs))
+    else:
+        cluster_results = [_union_cluster(job) for job in jobs]
+
+    for cluster_index, (polygon2Ds, error) in enumerate(cluster_results):
+        result.polygon2Ds.extend(polygon2Ds)
+        if error is not None:
+            result.failed_clusters[cluster_index] = error
+    return result
+
+
+def _warn_failed_clusters(_result):
+    # type: (PolygonMergeResult) -> None
+    if _result.succeeded:
+        return
+    warnings.warn(
+        "Failed to merge {} of {} polygon clusters. The polygons in those clusters are returned unmerged: {}".format(
+            len(_result.failed_clusters), len(_result.clusters), _result.failed_clusters
+        )
+    )
+
+
 def merge_polygon_2ds(_lbt_polygon_2ds, _tolerance):
     # type: (List[Polygon2D], float) -> List[Polygon2D]
     """Merge together a list of Polygon2Ds via boolean union.
@@ -134,32 +273,33 @@ def merge_polygon_2ds(_lbt_polygon_2ds, _tolerance):
 
     Returns:
     --------
-        * List[Polygon2D]: Merged polygons, or the originals if union fails.
+        * List[Polygon2D]: Merged polygons. Any cluster of overlapping polygons which
+            fails to merge is returned unmerged (with a warning).
     """
 
-    try:
-        merged_polygon2Ds = Polygon2D.boolean_union_all(_lbt_polygon_2ds, _tolerance)
-    except Exception:
-        merged_polygon2Ds = _lbt_polygon_2ds
-
-    return merged_polygon2Ds
+    result = merge_polygon2Ds_by_cluster(_lbt_polygon_2ds, _tolerance)
+    _warn_failed_clusters(result)
+    return result.polygon2Ds
 
 
-def merge_lbt_face_polygons(_lbt_face3Ds, _tolerance):
-    # type: (List[Face3D], float) -> List[Polygon2D]
+def merge_lbt_face_polygons(_lbt_face3Ds, _tolerance, _processes=None):
+    # type: (List[Face3D], float, Optional[int]) -> List[Polygon2D]
     """Merge together the Polygon2Ds of a list of LBT-Face3Ds.
 
     Translates each Face3D's 2D polygon into a common reference plane,
-    then performs a boolean union.
+    then merges each cluster of overlapping polygons by boolean union.
 
     Arguments:
     ----------
         * _lbt_face3Ds (List[Face3D]): The 3D faces whose 2D polygons to merge.
         * _tolerance (float): Boolean-union tolerance.
+        * _processes (Optional[int]): The number of processes to merge the clusters
+            with (see `merge_polygon2Ds_by_cluster`). Default: None (no process pool).
 
     Returns:
     --------
-        * List[Polygon2D]: Merged polygons in the first face's plane space.
+        * List[Polygon2D]: Merged polygons in the first face's plane space. Any cluster
+            of overlapping polygons which fails to merge is returned unmerged (with a warning).
     """
 
     lbt_face3D_polygon2Ds = get_lbt_Face3D_polygon2Ds(_lbt_face3Ds)
@@ -172,11 +312,11 @@ def merge_lbt_face_polygons(_lbt_face3Ds, _tolerance):
         translated_polygon2Ds = []  # type: List[Polygon2D]
         for face3D_poly_2D, face3D_plane in zip(lbt_face3D_polygon2Ds, lbt_face3D_planes):
             translated_polygon2Ds.append(translate_polygon2D(face3D_poly_2D, face3D_plane, reference_plane, _tolerance))
-
-        # ---------------------------------------------------------------------
-        # -- Try and merge all the new Polygon2Ds together into a single one.
-        merged_polygon2Ds = Polygon2D.boolean_union_all(translated_polygon2Ds, _tolerance)
     except Exception:
-        merged_polygon2Ds = list(lbt_face3D_polygon2Ds)
+        return list(lbt_face3D_polygon2Ds)
 
-    return merged_polygon2Ds
+    # -------------------------------------------------------------------------
+    # -- Merge each cluster of overlapping Polygon2Ds together.
+    result = merge_polygon2Ds_by_cluster(translated_polygon2Ds, _tolerance, _processes)
+    _warn_failed_clusters(result)
+    return result.polygon2Ds
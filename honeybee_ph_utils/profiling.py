@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Opt-in profiling of the main Honeybee-PH entry points.
+
+While a Profiler is running, the main entry points of the Honeybee-PH packages are
+temporarily replaced with timing wrappers. These include `to_dict`/`from_dict` on every
+class, `apply_properties_from_dict`, `duplicate`, the geometry transforms, the
+`*Builder.from_dict` dispatchers, `convert_epw` and `group_hb_faces`. The originals
+are put back when the Profiler stops. Nothing is wrapped while profiling is off, so
+there is no cost to leaving this module in place.
+
+Usage:
+>>> from honeybee_ph_utils import profiling
+>>> with profiling.Profiler(trace=True) as prof:
+>>>     model.to_dict()
+>>> print(prof.report())
+>>> prof.write_json("profile.json")
+>>> prof.write_chrome_trace("profile.trace.json")  # open with chrome://tracing or Perfetto
+
+Profiling may also be switched on for a whole process with the environment variable
+`HONEYBEE_PH_PROFILE`. Set it to "1" to print a summary at exit, or to a file path to
+write the results there at exit. `HONEYBEE_PH_PROFILE_FORMAT` may be set to "chrome"
+to write a Chrome trace instead of the default JSON summary.
+
+Note: functions bound into another module with `from module import function` *before*
+the Profiler starts keep a reference to the un-instrumented function.
+"""
+
+import atexit
+import inspect
+import json
+import os
+import sys
+import threading
+
+try:
+    from time import perf_counter as _clock
+except ImportError:
+    from time import time as _clock  # IronPython 2.7
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython 2.7
+
+
+ENV_VAR = "HONEYBEE_PH_PROFILE"
+ENV_VAR_FORMAT = "HONEYBEE_PH_PROFILE_FORMAT"
+
+# -- The packages whose classes are instrumented
+INSTRUMENTED_PACKAGES = (
+    "honeybee_ph",
+    "honeybee_energy_ph",
+    "honeybee_phhvac",
+    "honeybee_ph_utils",
+    "honeybee_ph_standards",
+)
+
+# -- Methods instrumented on any class (in the packages above) which defines them
+INSTRUMENTED_METHODS = (
+    "to_dict",
+    "from_dict",
+    "apply_properties_from_dict",
+    "load_properties_from_dict",
+    "duplicate",
+    "move",
+    "rotate",
+    "rotate_xy",
+    "reflect",
+    "scale",
+)
+
+# -- Module-level functions to instrument: (module-name, function-name)
+INSTRUMENTED_FUNCTIONS = [
+    ("honeybee_ph._epw", "convert_epw"),
+    ("honeybee_ph_utils.face_tools", "group_hb_faces"),
+]
+
+
+class ProfilerError(Exception):
+    def __init__(self, _msg):
+        self.msg = _msg
+        super(ProfilerError, self).__init__(self.msg)
+
+
+class CallStats(object):
+    """The call-count and cumulative time recorded for a single instrumented function.
+
+    Attributes:
+        name (str): The full name of the function (module.Class.method).
+        count (int): The number of calls.
+        cumulative_time (float): Total time (seconds) spent in the function, including
+            any functions it calls. Recursive calls are only timed once. Calls on
+            different threads are each timed, so this may be more than the elapsed time.
+    """
+
+    __slots__ = ("name", "count", "cumulative_time", "_local", "_lock")
+
+    def __init__(self, _name):
+        # type: (str) -> None
+        self.name = _name
+        self.count = 0
+        self.cumulative_time = 0.0
+        self._local = threading.local()  # -- The recursion depth of each thread
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        # type: () -> None
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        with self._lock:
+            self.count += 1
+
+    def _exit(self, _elapsed):
+        # type: (float) -> None
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            with self._lock:
+                self.cumulative_time += _elapsed
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        d = {}
+        d["count"] = self.count
+        d["cumulative_time_s"] = self.cumulative_time
+        return d
+
+    def __repr__(self):
+        return "{}(name={!r}, count={}, cumulative_time={:.6f})".format(
+            self.__class__.__name__, self.name, self.count, self.cumulative_time
+        )
+
+
+_ACTIVE_PROFILER = None  # type: Optional[Profiler]
+
+
+def _is_instrumented_module(_module_name):
+    # type: (str) -> bool
+    if _module_name == __name__:
+        return False
+    for package in INSTRUMENTED_PACKAGES:
+        if _module_name == package or _module_name.startswith(package + "."):
+            return True
+    return False
+
+
+class Profiler(object):
+    """Record call counts, cumulative time and object counts for the Honeybee-PH entry points.
+
+    Only one Profiler may be running at a time.
+
+    Attributes:
+        trace (bool): If True, record every call as an event for the Chrome trace export.
+        max_trace_events (int): The maximum number of trace events to keep.
+        calls (Dict[str, CallStats]): The call statistics, keyed by function name.
+        objects (Dict[str, int]): The number of objects created, keyed by class name.
+        trace_events (List[Tuple[str, float, float, int]]): The recorded
+            (name, start, duration, thread-id) call events.
+    """
+
+    def __init__(self, trace=False, max_trace_events=1000000):
+        # type: (bool, int) -> None
+        self.trace = trace
+        self.max_trace_events = max_trace_events
+        self.calls = {}  # type: Dict[str, CallStats]
+        self.objects = {}  # type: Dict[str, int]
+        self.trace_events = []  # type: List[Tuple[str, float, float, int]]
+        self.dropped_trace_events = 0
+        self._patches = []  # type: List[Tuple[Any, str, Any, bool]]
+        self._patched_keys = set()
+        self._start_time = None  # type: Optional[float]
+        self._elapsed = 0.0
+
+    # -------------------------------------------------------------------------
+    # -- Start / Stop
+
+    @property
+    def is_running(self):
+        # type: () -> bool
+        return _ACTIVE_PROFILER is self
+
+    def start(self):
+        # type: () -> Profiler
+        """Instrument all of the currently loaded Honeybee-PH modules and start recording."""
+        global _ACTIVE_PROFILER
+        if _ACTIVE_PROFILER is not None and _ACTIVE_PROFILER is not self:
+            raise ProfilerError("Another Profiler is already running. Stop it before starting a new one.")
+        _ACTIVE_PROFILER = self
+        self._start_time = _clock()
+        self.instrument_loaded_modules()
+        return self
+
+    def stop(self):
+        # type: () -> Profiler
+        """Stop recording and restore all of the original (un-instrumented) functions."""
+        global _ACTIVE_PROFILER
+        if not self.is_running:
+            return self
+
+        for owner, attr_name, original, existed in reversed(self._patches):
+            if existed:
+                setattr(owner, attr_name, original)
+            else:
+                delattr(owner, attr_name)
+        self._patches = []
+        self._patched_keys = set()
+        self._elapsed += _clock() - (self._start_time or _clock())
+        self._start_time = None
+        _ACTIVE_PROFILER = None
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    # -------------------------------------------------------------------------
+    # -- Instrumentation
+
+    def instrument_loaded_modules(self):
+        # type: () -> int
+        """Instrument any Honeybee-PH modules loaded since the Profiler started.
+
+        Returns:
+        --------
+            * int: The number of new functions instrumented.
+        """
+        if not self.is_running:
+            raise ProfilerError("The Profiler must be running before instrumenting modules.")
+
+        count_before = len(self._patches)
+        for module_name, module in list(sys.modules.items()):
+            if module is None or not _is_instrumented_module(module_name):
+                continue
+            for obj in list(vars(module).values()):
+                if inspect.isclass(obj) and obj.__module__ == module_name:
+                    self._instrument_class(obj)
+
+        for module_name, function_name in INSTRUMENTED_FUNCTIONS:
+            module = sys.modules.get(module_name)
+            if module is None or not hasattr(module, function_name):
+                continue
+            if (id(module), function_name) in self._patched_keys:
+                continue
+            function = getattr(module, function_name)
+            name = "{}.{}".format(module_name, function_name)
+            self._patch(module, function_name, self._timed(function, name), function, True)
+
+        return len(self._patches) - count_before
+
+    def _patch(self, _owner, _attr_name, _new, _original, _existed):
+        # type: (Any, str, Any, Any, bool) -> None
+        setattr(_owner, _attr_name, _new)
+        self._patches.append((_owner, _attr_name, _original, _existed))
+        self._patched_keys.add((id(_owner), _attr_name))
+
+    def _instrument_class(self, _cls):
+        # type: (type) -> None
+        if (id(_cls), "__init__") in self._patched_keys:
+            return
+
+        base_name = "{}.{}".format(_cls.__module__, _cls.__name__)
+        is_model_class = False
+        for method_name in INSTRUMENTED_METHODS:
+            if hasattr(_cls, method_name):
+                is_model_class = True
+            if method_name not in _cls.__dict__:
+                continue
+
+            raw = _cls.__dict__[method_name]
+            name = "{}.{}".format(base_name, method_name)
+            if isinstance(raw, classmethod):
+                new = classmethod(self._timed(raw.__func__, name))
+            elif isinstance(raw, staticmethod):
+                new = staticmethod(self._timed(raw.__func__, name))
+            elif inspect.isfunction(raw):
+                new = self._timed(raw, name)
+            else:
+                continue  # -- properties, etc.
+            self._patch(_cls, method_name, new, raw, True)
+
+        if is_model_class and not issubclass(_cls, BaseException):
+            self._count_objects(_cls, base_name)
+
+    def _count_objects(self, _cls, _name):
+        # type: (type, str) -> None
+        """Wrap the class's __init__ so that each new instance of exactly this class is counted."""
+        existed = "__init__" in _cls.__dict__
+        original = _cls.__dict__["__init__"] if existed else None
+        init = _cls.__init__
+        objects = self.objects
+        objects.setdefault(_name, 0)
+
+        def __init__(obj, *args, **kwargs):
+            if type(obj) is _cls:
+                objects[_name] += 1
+            init(obj, *args, **kwargs)
+
+        self._patch(_cls, "__init__", __init__, original, existed)
+
+    def _timed(self, _func, _name):
+        # type: (Callable, str) -> Callable
+        """Return a wrapper around the function which records its calls."""
+        stats = self.calls.get(_name)
+        if stats is None:
+            stats = self.calls[_name] = CallStats(_name)
+        profiler = self
+
+        def wrapper(*args, **kwargs):
+            stats._enter()
+            t0 = _clock()
+            try:
+                return _func(*args, **kwargs)
+            finally:
+                elapsed = _clock() - t0
+                stats._exit(elapsed)
+                if profiler.trace:
+                    profiler._add_trace_event(_name, t0, elapsed)
+
+        wrapper.__name__ = getattr(_func, "__name__", "wrapper")
+        wrapper.__doc__ = getattr(_func, "__doc__", None)
+        wrapper.__wrapped__ = _func
+        return wrapper
+
+    def _add_trace_event(self, _name, _start, _duration):
+        # type: (str, float, float) -> None
+        if len(self.trace_events) >= self.max_trace_events:
+            self.dropped_trace_events += 1
+            return
+        self.trace_events.append((_name, _start, _duration, threading.current_thread().ident))
+
+    # -------------------------------------------------------------------------
+    # -- Results
+
+    @property
+    def elapsed_time(self):
+        # type: () -> float
+        """The total time (seconds) the Profiler has been running."""
+        if self._start_time is None:
+            return self._elapsed
+        return self._elapsed + (_clock() - self._start_time)
+
+    def reset(self):
+        # type: () -> None
+        """Clear all of the recorded results."""
+        for stats in self.calls.values():
+            stats.count = 0
+            stats.cumulative_time = 0.0
+        for key in self.objects:
+            self.objects[key] = 0
+        self.trace_events = []
+        self.dropped_trace_events = 0
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        """Return the recorded call- and object-counts (only those with a count > 0)."""
+        d = {}
+        d["elapsed_time_s"] = self.elapsed_time
+        d["calls"] = {name: s.to_dict() for name, s in self.calls.items() if s.count}
+        d["objects"] = {name: count for name, count in self.objects.items() if count}
+        d["dropped_trace_events"] = self.dropped_trace_events
+        return d
+
+    def to_chrome_trace(self):
+        # type: () -> Dict[str, Any]
+        """Return the recorded call events in the Chrome 'Trace Event' format."""
+        t_origin = min([e[1] for e in self.trace_events]) if self.trace_events else 0.0
+        pid = os.getpid()
+        events = []
+        for name, start, duration, thread_id in self.trace_events:
+            events.append(
+                {
+                    "name": name.split(".", 1)[-1],
+                    "cat": name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (start - t_origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": pid,
+                    "tid": thread_id,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, _file_path):
+        # type: (str) -> str
+        """Write the call- and object-counts to a JSON file and return its path."""
+        with open(_file_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+        return _file_path
+
+    def write_chrome_trace(self, _file_path):
+        # type: (str) -> str
+        """Write the call events to a Chrome trace (JSON) file and return its path."""
+        with open(_file_path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return _file_path
+
+    def report(self, _limit=30):
+        # type: (int) -> str
+        """Return a text table of the functions with the highest cumulative time."""
+        rows = sorted((s for s in self.calls.values() if s.count), key=lambda s: s.cumulative_time, reverse=True)
+        lines = ["{:>12} {:>12}  {}".format("calls", "cum-time (s)", "function")]
+        for stats in rows[:_limit]:
+            lines.append("{:>12} {:>12.6f}  {}".format(stats.count, stats.cumulative_time, stats.name))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return "{}(running={}, calls={})".format(
+            self.__class__.__name__, self.is_running, sum(s.count for s in self.calls.values())
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+def active_profiler():
+    # type: () -> Optional[Profiler]
+    """Return the Profiler which is currently running, or None."""
+    return _ACTIVE_PROFILER
+
+
+def _write_environment_results(_profiler, _setting, _format):
+    # type: (Profiler, str, str) -> None
+    _profiler.stop()
+    if _setting.lower() in ("1", "true", "yes", "on"):
+        sys.stderr.write(_profiler.report() + "\n")
+    elif _format.lower() == "chrome":
+        _profiler.write_chrome_trace(_setting)
+    else:
+        _profiler.write_json(_setting)
+
+
+def enable_from_environment():
+    # type: () -> Optional[Profiler]
+    """Start (or extend) a process-wide Profiler if the HONEYBEE_PH_PROFILE variable is set.
+
+    This is called as each Honeybee-PH package is imported. If the process-wide
+    Profiler is already running, any newly loaded modules are instrumented.
+
+    Returns:
+    --------
+        * Optional[Profiler]: The running Profiler, or None if profiling is not enabled.
+    """
+    setting = os.environ.get(ENV_VAR, "").strip()
+    if not setting or setting.lower() in ("0", "false", "no", "off"):
+        return None
+
+    if _ACTIVE_PROFILER is not None:
+        _ACTIVE_PROFILER.instrument_loaded_modules()
+        return _ACTIVE_PROFILER
+
+    fmt = os.environ.get(ENV_VAR_FORMAT, "json")
+    profiler = Profiler(trace=fmt.lower() == "chrome").start()
+    atexit.register(_write_environment_results, profiler, setting, fmt)
+    return profiler
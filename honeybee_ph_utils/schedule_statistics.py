@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Cached summary statistics for Honeybee-Energy schedules.
+
+Expanding a ScheduleRuleset to its 8,760 hourly values is slow, and the Phius
+and IHG calculations reduce the same few schedules over and over. This module
+expands each schedule once, reduces it to a ScheduleStatistics object, and keeps
+that in a size-limited (least-recently-used) cache keyed by the schedule's
+identifier and content-hash. Editing a schedule changes its hash, so edited
+schedules are never served stale statistics.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+try:
+    from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+except ImportError:
+    pass  # IronPython
+
+from honeybee_ph_utils.histogram import generate_histogram
+
+DEFAULT_MAX_SIZE = 256
+DEFAULT_HISTOGRAM_BINS = 4
+
+
+class ScheduleStatistics(object):
+    """Summary statistics of a schedule's annual values.
+
+    Attributes:
+        identifier (str): The identifier of the schedule the statistics were calculated from.
+        value_count (int): The number of values in the schedule (8760 for an hourly year).
+        full_load_hours (float): The sum of all the schedule values.
+        mean (float): The average of all the schedule values.
+        peak (float): The largest schedule value.
+        minimum (float): The smallest schedule value.
+        daily_operating_hours (float): The average number of full-load hours per day (mean * 24).
+        histogram (Dict[int, Dict[str, float]]): The values binned by `histogram.generate_histogram`.
+    """
+
+    def __init__(self, identifier, value_count, full_load_hours, peak, minimum, histogram=None):
+        # type: (str, int, float, float, float, Optional[Dict[int, Dict[str, float]]]) -> None
+        self.identifier = identifier
+        self.value_count = value_count
+        self.full_load_hours = full_load_hours
+        self.peak = peak
+        self.minimum = minimum
+        self.histogram = histogram or {}
+
+    @property
+    def mean(self):
+        # type: () -> float
+        """The average of all the schedule values."""
+        if not self.value_count:
+            return 0.0
+        return self.full_load_hours / self.value_count
+
+    @property
+    def daily_operating_hours(self):
+        # type: () -> float
+        """The average number of full-load hours per day."""
+        return self.mean * 24
+
+    @classmethod
+    def from_values(cls, _identifier, _values, _histogram_bins=DEFAULT_HISTOGRAM_BINS):
+        # type: (str, Iterable[float], int) -> ScheduleStatistics
+        """Return a new ScheduleStatistics calculated from the schedule values.
+
+        Arguments:
+        ----------
+            * _identifier (str): The identifier of the schedule.
+            * _values (Iterable[float]): The schedule values.
+            * _histogram_bins (int): The number of histogram bins. Set to 0 to skip the histogram.
+
+        Returns:
+        --------
+            * (ScheduleStatistics): The new statistics object.
+        """
+        values = list(_values)
+        if not values:
+            return cls(_identifier, 0, 0.0, 0.0, 0.0)
+
+        histogram = generate_histogram(values, _histogram_bins) if _histogram_bins else {}
+        return cls(_identifier, len(values), sum(values), max(values), min(values), histogram)
+
+    def __str__(self):
+        return "{}(identifier={}, full_load_hours={}, mean={}, peak={})".format(
+            self.__class__.__name__, self.identifier, self.full_load_hours, self.mean, self.peak
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+def schedule_values(_schedule):
+    # type: (Any) -> Iterable[float]
+    """Return the annual values of a ScheduleRuleset or ScheduleFixedInterval.
+
+    ScheduleRuleset.values is a method, while ScheduleFixedInterval.values is a property.
+    """
+    values = _schedule.values
+    if callable(values):
+        return values()
+    return values
+
+
+def schedule_key(_schedule):
+    # type: (Any) -> Tuple[str, str, int]
+    """Return the cache-key for a schedule: its type, identifier and content-hash."""
+    return (_schedule.__class__.__name__, _schedule.identifier, hash(_schedule))
+
+
+class ScheduleStatisticsCache(object):
+    """A thread-safe, size-limited cache of ScheduleStatistics, keyed by schedule.
+
+    When the cache is full, the least-recently-used statistics are evicted. Only the
+    statistics are stored, not the schedules (or their values).
+
+    Attributes:
+        max_size (int): The maximum number of schedules to keep statistics for.
+        histogram_bins (int): The number of histogram bins calculated for each schedule.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that had to expand the schedule values.
+    """
+
+    def __init__(self, _max_size=DEFAULT_MAX_SIZE, _histogram_bins=DEFAULT_HISTOGRAM_BINS):
+        # type: (int, int) -> None
+        if _max_size < 1:
+            raise ValueError("Error: max_size must be 1 or more. Got: {}".format(_max_size))
+        self.max_size = _max_size
+        self.histogram_bins = _histogram_bins
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()  # type: OrderedDict[Hashable, ScheduleStatistics]
+        self._lock = Lock()
+
+    def get(self, _schedule):
+        # type: (Any) -> ScheduleStatistics
+        """Return the statistics for the schedule, calculating them only if not already cached.
+
+        Arguments:
+        ----------
+            * _schedule (ScheduleRuleset | ScheduleFixedInterval): The schedule.
+
+        Returns:
+        --------
+            * (ScheduleStatistics): The schedule's statistics.
+        """
+        key = schedule_key(_schedule)
+        with self._lock:
+            stats = self._items.pop(key, None)
+            if stats is not None:
+                self._items[key] = stats  # -- Re-insert as the most-recently-used
+                self.hits += 1
+                return stats
+
+        # -- Expand outside the lock, so other threads are not held up. If two threads
+        # -- miss on the same schedule at once, both calculate it and the last one wins.
+        stats = ScheduleStatistics.from_values(_schedule.identifier, schedule_values(_schedule), self.histogram_bins)
+
+        with self._lock:
+            self.misses += 1
+            self._items[key] = stats
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return stats
+
+    def clear(self):
+        # type: () -> None
+        """Remove all the cached statistics and reset the hit / miss counts."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, _schedule):
+        return schedule_key(_schedule) in self._items
+
+    def __str__(self):
+        return "{}(size={}/{}, hits={}, misses={})".format(
+            self.__class__.__name__, len(self), self.max_size, self.hits, self.misses
+        )
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
+
+
+# -- The cache shared by all the Honeybee-PH calculations
+SCHEDULE_STATISTICS = ScheduleStatisticsCache()
+
+
+def schedule_statistics(_schedule):
+    # type: (Any) -> ScheduleStatistics
+    """Return the (cached) statistics for a ScheduleRuleset or ScheduleFixedInterval.
+
+    Arguments:
+    ----------
+        * _schedule (ScheduleRuleset | ScheduleFixedInterval): The schedule.
+
+    Returns:
+    --------
+        * (ScheduleStatistics): The schedule's statistics.
+    """
+    return SCHEDULE_STATISTICS.get(_schedule)
@@ -5,7 +5,6 @@
 
 import math
 import os
-import subprocess
 
 try:
     from typing import Any, Tuple
@@ -17,7 +16,6 @@ try:
     import ladybug.epw as epw
     from ladybug.config import folders as lb_folders
     from ladybug.dt import DateTime
-    from ladybug.viewsphere import view_sphere
     from ladybug.wea import Wea
 except ImportError as e:
     raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
@@ -41,17 +39,16 @@ except ImportError as e:
 
 
 from honeybee_ph_utils.input_tools import memoize
-
-# -----------------------------------------------------------------------------
-# constants for converting RGB values output by gendaymtx to broadband radiation
-PATCHES_PER_ROW = {
-    1: view_sphere.TREGENZA_PATCHES_PER_ROW + (1,),
-    2: view_sphere.REINHART_PATCHES_PER_ROW + (1,),
-}
-PATCH_ROW_COEFF = {
-    1: view_sphere.TREGENZA_COEFFICIENTS,
-    2: view_sphere.REINHART_COEFFICIENTS,
-}
+from honeybee_ph_utils.sky_matrix_cache import (
+    PATCH_ROW_COEFF,
+    PATCHES_PER_ROW,
+    SkyMatrixCache,
+    broadband_radiation,
+    file_content_hash,
+    parse_mtx_lines,
+    run_gendaymtx,
+    sky_matrix_cache_key,
+)
 
 
 @memoize
@@ -81,29 +78,6 @@ def create_analysis_period_hoys(_period):
     return anp.hoys
 
 
-def broadband_radiation(patch_row_str, row_number, wea_duration, sky_density=1):
-    # type: (str, int, float, int) -> float
-    """Parse a row of gendaymtx RGB patch data in W/sr/m2 to radiation in kWh/m2.
-
-    Applies broadband weighting to the RGB bands, multiplies by the steradians
-    of each patch, and multiplies by the Wea duration in hours.
-
-    Arguments:
-    ----------
-        * patch_row_str (str): Text string for a single row of RGB patch data.
-        * row_number (int): The row number that the patch corresponds to.
-        * wea_duration (float): Duration of the Wea in hours.
-        * sky_density (int): Density setting (1 = Tregenza, 2 = Reinhart). Default: 1.
-
-    Returns:
-    --------
-        * float: Broadband radiation value in kWh/m2.
-    """
-    R, G, B = patch_row_str.split(" ")
-    weight_val = 0.265074126 * float(R) + 0.670114631 * float(G) + 0.064811243 * float(B)
-    return weight_val * PATCH_ROW_COEFF[sky_density][row_number] * wea_duration / 1000
-
-
 def parse_mtx_data(data_str, wea_duration, sky_density=1):
     # type: (str, float, int) -> list[float]
     """Parse a string of Radiance gendaymtx data to a list of radiation-per-patch.
@@ -121,45 +95,74 @@ def parse_mtx_data(data_str, wea_duration, sky_density=1):
     --------
         * list[float]: Broadband radiation values per sky patch in kWh/m2.
     """
-    # split lines and remove the header, ground patch and last line break
-    data_lines = data_str.split("\n")
-    patch_lines = data_lines[9:-1]
+    return parse_mtx_lines(data_str.splitlines(), wea_duration, sky_density)
+
+
+def _north_angle(_north):
+    # type: (Any) -> float
+    """Return the north angle in degrees from a Vector2D, an angle, or None."""
+    if _north is None:
+        return 0
+    try:
+        return math.degrees(to_vector2d(_north).angle_clockwise(Vector2D(0, 1)))
+    except AttributeError:  # north angle instead of vector
+        return float(_north)
+
 
-    # loop through the rows and convert the radiation RGB values
-    broadband_irr = []
-    patch_counter = 0
-    for i, row_patch_count in enumerate(PATCHES_PER_ROW[sky_density]):
-        row_slice = patch_lines[patch_counter : patch_counter + row_patch_count]
-        irr_vals = (broadband_radiation(row, i, wea_duration, sky_density) for row in row_slice)
-        broadband_irr.extend(irr_vals)
-        patch_counter += row_patch_count
-    return broadband_irr
+def _objectify_cached_matrix(_data):
+    # type: (dict) -> Any
+    """Rebuild the objectified sky-matrix output from a cached sky-matrix dict."""
+    metadata = [_data["north"], _data["ground_reflectance"]]
+    metadata.extend([DateTime.from_hoy(h) for h in (_data["st_hoy"], _data["end_hoy"])])
+    metadata.extend(_data["header"])
+    mtx_data = (metadata, _data["direct"], _data["diffuse"])
+    return objectify_output("Cumulative Sky Matrix", mtx_data)
 
 
 @memoize
-def gen_matrix(_epw_file, _period, _north):
-    # type: (str, Tuple[int, int], Any) -> Any
+def gen_matrix(_epw_file, _period, _north, _cache_folder=None):
+    # type: (str, Tuple[int, int], Any, str | None) -> Any
     """Generate a cumulative Radiance sky matrix from an EPW file.
 
+    Results are stored in a persistent on-disk cache keyed on the EPW file content,
+    the analysis period, the north angle and the sky density, so that later
+    processes re-use the sky-matrix without re-writing the Wea or re-running gendaymtx.
+
     Arguments:
     ----------
         * _epw_file (str): Path to the EPW weather file.
         * _period (Tuple[int, int]): Start and end months (1-based) for filtering.
         * _north (Any): North direction as a Vector2D or angle in degrees.
+        * _cache_folder (str | None): Optional folder for the sky-matrix cache. If
+            None, the default Ladybug weather-folder location is used.
 
     Returns:
     --------
         * Any: Objectified Ladybug sky matrix data (metadata, direct, diffuse).
     """
+    high_density_ = None
+    _ground_ref_ = None
+    _folder_ = None
+
+    # -------------------------------------------------------------------------
+    # process and set defaults for all of the global inputs
+    north_ = _north_angle(_north)
+    density = 2 if high_density_ else 1
+    ground_r = 0.2 if _ground_ref_ is None else _ground_ref_
+
+    # -------------------------------------------------------------------------
+    # return the sky-matrix from the disk cache, if it has been generated before
+    cache = SkyMatrixCache(_cache_folder)
+    cache_key = sky_matrix_cache_key(file_content_hash(_epw_file), _period, north_, density, ground_r)
+    cached_data = cache.get(cache_key)
+    if cached_data is not None:
+        return _objectify_cached_matrix(cached_data)
 
     epw_data = epw.EPW(_epw_file)
     _location = epw_data.location
-    high_density_ = None
-    _ground_ref_ = None
     _hoys_ = create_analysis_period_hoys(_period)
     _direct_rad = epw_data.direct_normal_radiation
     _diffuse_rad = epw_data.diffuse_horizontal_radiation
-    _folder_ = None
 
     # -------------------------------------------------------------------------
     # check the installed Radiance date and get the path to the gendaymtx executable
@@ -170,18 +173,6 @@ def gen_matrix(_epw_file, _period, _north):
         else os.path.join(hb_folders.radbin_path, "gendaymtx")
     )
 
-    # -------------------------------------------------------------------------
-    # process and set defaults for all of the global inputs
-    if _north is not None:  # process the north_
-        try:
-            north_ = math.degrees(to_vector2d(_north).angle_clockwise(Vector2D(0, 1)))
-        except AttributeError:  # north angle instead of vector
-            north_ = float(_north)
-    else:
-        north_ = 0
-    density = 2 if high_density_ else 1
-    ground_r = 0.2 if _ground_ref_ is None else _ground_ref_
-
     # -------------------------------------------------------------------------
     # filter the radiation by _hoys if they are input
     if len(_hoys_) != 0:
@@ -199,40 +190,31 @@ def gen_matrix(_epw_file, _period, _north):
     wea_file = wea.write(wea_path)
 
     # -------------------------------------------------------------------------
-    # execute the Radiance gendaymtx command
-    use_shell = True if os.name == "nt" else False
-
-    # -------------------------------------------------------------------------
-    # command for direct patches
-    cmds = [gendaymtx_exe, "-m", str(density), "-d", "-O1", "-A", wea_file]
-    process = subprocess.Popen(cmds, stdout=subprocess.PIPE, shell=use_shell)
-    stdout = process.communicate()
-    dir_data_str = stdout[0]
-
-    # -------------------------------------------------------------------------
-    # command for diffuse patches
-    cmds = [gendaymtx_exe, "-m", str(density), "-s", "-O1", "-A", wea_file]
-    process = subprocess.Popen(cmds, stdout=subprocess.PIPE, shell=use_shell)
-    stdout = process.communicate()
-    diff_data_str = stdout[0]
-
-    # parse the data into a single matrix
-    dir_vals = parse_mtx_data(dir_data_str, wea_duration, density)
-    diff_vals = parse_mtx_data(diff_data_str, wea_duration, density)
+    # execute the Radiance gendaymtx commands for the direct and diffuse patches,
+    # parsing the output as it streams from each process
+    dir_vals = run_gendaymtx(gendaymtx_exe, wea_file, wea_duration, density, "-d")
+    diff_vals = run_gendaymtx(gendaymtx_exe, wea_file, wea_duration, density, "-s")
 
     # -------------------------------------------------------------------------
     # collect sky metadata like the north, which will be used by other components
-    metadata = [north_, ground_r]
     if _hoys_:
-        metadata.extend([DateTime.from_hoy(h) for h in (_hoys_[0], _hoys_[-1])])
+        st_hoy, end_hoy = _hoys_[0], _hoys_[-1]
     else:
-        metadata.extend([wea.analysis_period.st_time, wea.analysis_period.end_time])
-    for key, val in _direct_rad.header.metadata.items():
-        metadata.append("{} : {}".format(key, val))
+        st_hoy, end_hoy = wea.analysis_period.st_time.hoy, wea.analysis_period.end_time.hoy
+    header = ["{} : {}".format(key, val) for key, val in _direct_rad.header.metadata.items()]
 
     # -------------------------------------------------------------------------
-    # wrap everything together into an object to output from the component
-    mtx_data = (metadata, dir_vals, diff_vals)
-    sky_mtx = objectify_output("Cumulative Sky Matrix", mtx_data)
-
-    return sky_mtx
+    # store the results in the disk cache, then wrap everything together into an
+    # object to output from the component
+    mtx_dict = {
+        "north": north_,
+        "ground_reflectance": ground_r,
+        "st_hoy": st_hoy,
+        "end_hoy": end_hoy,
+        "header": header,
+        "direct": dir_vals,
+        "diffuse": diff_vals,
+    }
+    cache.set(cache_key, mtx_dict)
+
+    return _objectify_cached_matrix(mtx_dict)
@@ -0,0 +1,310 @@
+# -*- Python Version: 2.7 -*-
+# -*- coding: utf-8 -*-
+
+"""Persistent disk cache and streaming parser for Radiance gendaymtx sky-matrix data.
+
+These functions do not depend on Rhino or honeybee-radiance so that headless
+workflows (and tests) can generate, parse and cache sky-matrices without a
+Grasshopper session. The Grasshopper-facing entry point is `sky_matrix.gen_matrix`.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+
+try:
+    from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+except ImportError:
+    pass  # IronPython
+
+try:
+    from ladybug.config import folders as lb_folders
+    from ladybug.viewsphere import view_sphere
+except ImportError as e:
+    raise ImportError("\nFailed to import ladybug:\n\t{}".format(e))
+
+
+# -----------------------------------------------------------------------------
+# constants for converting RGB values output by gendaymtx to broadband radiation
+PATCHES_PER_ROW = {
+    1: view_sphere.TREGENZA_PATCHES_PER_ROW + (1,),
+    2: view_sphere.REINHART_PATCHES_PER_ROW + (1,),
+}
+PATCH_ROW_COEFF = {
+    1: view_sphere.TREGENZA_COEFFICIENTS,
+    2: view_sphere.REINHART_COEFFICIENTS,
+}
+
+# -- The gendaymtx header block, plus the ground patch (not used by Ladybug)
+MTX_HEADER_LINE_COUNT = 9
+
+# -- Bump this whenever the layout of the cached JSON files changes
+CACHE_FORMAT_VERSION = 1
+
+
+def broadband_radiation(patch_row_str, row_number, wea_duration, sky_density=1):
+    # type: (str, int, float, int) -> float
+    """Parse a row of gendaymtx RGB patch data in W/sr/m2 to radiation in kWh/m2.
+
+    Applies broadband weighting to the RGB bands, multiplies by the steradians
+    of each patch, and multiplies by the Wea duration in hours.
+
+    Arguments:
+    ----------
+        * patch_row_str (str): Text string for a single row of RGB patch data.
+        * row_number (int): The row number that the patch corresponds to.
+        * wea_duration (float): Duration of the Wea in hours.
+        * sky_density (int): Density setting (1 = Tregenza, 2 = Reinhart). Default: 1.
+
+    Returns:
+    --------
+        * float: Broadband radiation value in kWh/m2.
+    """
+    R, G, B = patch_row_str.split()
+    weight_val = 0.265074126 * float(R) + 0.670114631 * float(G) + 0.064811243 * float(B)
+    return weight_val * PATCH_ROW_COEFF[sky_density][row_number] * wea_duration / 1000
+
+
+def iter_mtx_values(lines, wea_duration, sky_density=1):
+    # type: (Iterable[Any], float, int) -> Iterator[float]
+    """Yield the broadband radiation for each sky patch from an iterable of gendaymtx lines.
+
+    The lines are consumed one at a time, so a process's stdout pipe (or an open
+    file) can be parsed without first reading the whole output into memory. Lines
+    may be either text or bytes. Any lines following the last sky patch are ignored. A
+    ValueError is raised if the output ends before the last sky patch.
+
+    Arguments:
+    ----------
+        * lines (Iterable[str | bytes]): The gendaymtx output lines, including the header.
+        * wea_duration (float): Duration of the Wea in hours.
+        * sky_density (int): Density setting (1 = Tregenza, 2 = Reinhart). Default: 1.
+
+    Yields:
+    -------
+        * float: Broadband radiation value per sky patch in kWh/m2.
+    """
+    line_iter = iter(lines)
+    patch_count = sum(PATCHES_PER_ROW[sky_density])
+
+    # -- Skip the header and the ground patch
+    for _ in range(MTX_HEADER_LINE_COUNT):
+        if next(line_iter, None) is None:
+            raise ValueError("The gendaymtx output ended before the end of the header.")
+
+    coefficients = PATCH_ROW_COEFF[sky_density]
+    for row_number, row_patch_count in enumerate(PATCHES_PER_ROW[sky_density]):
+        row_factor = coefficients[row_number] * wea_duration / 1000
+        for _ in range(row_patch_count):
+            line = next(line_iter, None)
+            if line is None:
+                msg = "The gendaymtx output ended early. Expected {} sky patches for sky-density {}.".format(
+                    patch_count, sky_density
+                )
+                raise ValueError(msg)
+            if not isinstance(line, str):
+                line = line.decode("utf-8")
+            R, G, B = line.split()
+            yield (0.265074126 * float(R) + 0.670114631 * float(G) + 0.064811243 * float(B)) * row_factor
+
+
+def parse_mtx_lines(lines, wea_duration, sky_density=1):
+    # type: (Iterable[Any], float, int) -> List[float]
+    """Parse an iterable of gendaymtx output lines to a list of radiation-per-patch.
+
+    Arguments:
+    ----------
+        * lines (Iterable[str | bytes]): The gendaymtx output lines, including the header.
+        * wea_duration (float): Duration of the Wea in hours.
+        * sky_density (int): Density setting (1 = Tregenza, 2 = Reinhart). Default: 1.
+
+    Returns:
+    --------
+        * list[float]: Broadband radiation values per sky patch in kWh/m2.
+    """
+    return list(iter_mtx_values(lines, wea_duration, sky_density))
+
+
+def run_gendaymtx(gendaymtx_exe, wea_file, wea_duration, sky_density=1, sky_component="-d"):
+    # type: (str, str, float, int, str) -> List[float]
+    """Run gendaymtx and parse its stdout as it streams from the process.
+
+    Arguments:
+    ----------
+        * gendaymtx_exe (str): Path to the gendaymtx executable.
+        * wea_file (str): Path to the Wea file to use as the gendaymtx input.
+        * wea_duration (float): Duration of the Wea in hours.
+        * sky_density (int): Density setting (1 = Tregenza, 2 = Reinhart). Default: 1.
+        * sky_component (str): "-d" for the direct patches, "-s" for the diffuse. Default: "-d".
+
+    Returns:
+    --------
+        * list[float]: Broadband radiation values per sky patch in kWh/m2.
+    """
+    use_shell = True if os.name == "nt" else False
+    cmds = [gendaymtx_exe, "-m", str(sky_density), sky_component, "-O1", "-A", wea_file]
+    process = subprocess.Popen(cmds, stdout=subprocess.PIPE, shell=use_shell)
+    try:
+        values = parse_mtx_lines(process.stdout, wea_duration, sky_density)
+        # -- Drain anything left so the process can exit cleanly
+        for _ in process.stdout:
+            pass
+    finally:
+        process.stdout.close()
+        process.wait()
+    return values
+
+
+# -----------------------------------------------------------------------------
+# -- Persistent cache
+
+
+def file_content_hash(_file_path, _chunk_size=1024 * 1024):
+    # type: (str, int) -> str
+    """Return the SHA-256 hex-digest of a file's content, read in chunks.
+
+    Arguments:
+    ----------
+        * _file_path (str): Path to the file to hash.
+        * _chunk_size (int): The number of bytes to read at a time.
+
+    Returns:
+    --------
+        * str: The hex-digest of the file content.
+    """
+    hasher = hashlib.sha256()
+    with open(_file_path, "rb") as f:
+        chunk = f.read(_chunk_size)
+        while chunk:
+            hasher.update(chunk)
+            chunk = f.read(_chunk_size)
+    return hasher.hexdigest()
+
+
+def sky_matrix_cache_key(_epw_hash, _period, _north, _sky_density=1, _ground_reflectance=0.2):
+    # type: (str, Tuple[int, int], float, int, float) -> str
+    """Return the cache-key for a sky-matrix.
+
+    Arguments:
+    ----------
+        * _epw_hash (str): The content hash of the EPW file (see `file_content_hash`).
+        * _period (Tuple[int, int]): Start and end months (1-based).
+        * _north (float): The north angle in degrees.
+        * _sky_density (int): Density setting (1 = Tregenza, 2 = Reinhart). Default: 1.
+        * _ground_reflectance (float): The ground reflectance. Default: 0.2.
+
+    Returns:
+    --------
+        * str: A hex-digest identifying the sky-matrix inputs.
+    """
+    key_parts = [
+        "v{}".format(CACHE_FORMAT_VERSION),
+        str(_epw_hash),
+        "{}-{}".format(int(_period[0]), int(_period[1])),
+        "{:.6f}".format(float(_north)),
+        str(int(_sky_density)),
+        "{:.6f}".format(float(_ground_reflectance)),
+    ]
+    return hashlib.sha256("|".join(key_parts).encode("utf-8")).hexdigest()
+
+
+def default_cache_folder():
+    # type: () -> str
+    """Return the default folder used to store cached sky-matrices."""
+    return os.path.join(lb_folders.default_epw_folder, "sky_matrices", "cache")
+
+
+class SkyMatrixCache(object):
+    """A folder of JSON files holding previously generated sky-matrix data.
+
+    Each entry is stored in its own file, named by its cache-key, and is written
+    atomically so that multiple processes may safely share the same folder.
+
+    Attributes:
+        folder (str): The folder where the cached sky-matrix files are stored.
+    """
+
+    def __init__(self, _folder=None):
+        # type: (Optional[str]) -> None
+        self.folder = _folder or default_cache_folder()
+
+    def path_for(self, _key):
+        # type: (str) -> str
+        """Return the full path of the cache file for the given key."""
+        return os.path.join(self.folder, "{}.json".format(_key))
+
+    def get(self, _key):
+        # type: (str) -> Optional[Dict[str, Any]]
+        """Return the cached sky-matrix data for the key, or None if not found (or unreadable)."""
+        try:
+            with open(self.path_for(_key), "r") as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if data.get("cache_format_version") != CACHE_FORMAT_VERSION:
+            return None
+        return data
+
+    def set(self, _key, _data):
+        # type: (str, Dict[str, Any]) -> str
+        """Write the sky-matrix data to the cache and return the cache file's path.
+
+        Arguments:
+        ----------
+            * _key (str): The cache-key (see `sky_matrix_cache_key`).
+            * _data (Dict[str, Any]): JSON-serializable sky-matrix data.
+
+        Returns:
+        --------
+            * str: The path to the cache file.
+        """
+        if not os.path.isdir(self.folder):
+            try:
+                os.makedirs(self.folder)
+            except OSError:
+                if not os.path.isdir(self.folder):  # -- Created by another process?
+                    raise
+
+        data = dict(_data)
+        data["cache_format_version"] = CACHE_FORMAT_VERSION
+
+        path = self.path_for(_key)
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # -- Windows will not rename over an existing file. Another process has
+            # -- already written the same entry, so keep theirs.
+            os.remove(tmp_path)
+        return path
+
+    def clear(self):
+        # type: () -> int
+        """Remove all cached sky-matrix files from the folder and return the number removed."""
+        if not os.path.isdir(self.folder):
+            return 0
+
+        count = 0
+        for name in os.listdir(self.folder):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.folder, name))
+                count += 1
+        return count
+
+    def __len__(self):
+        if not os.path.isdir(self.folder):
+            return 0
+        return len([name for name in os.listdir(self.folder) if name.endswith(".json")])
+
+    def __str__(self):
+        return "{}(folder={})".format(self.__class__.__name__, self.folder)
+
+    def __repr__(self):
+        return str(self)
+
+    def ToString(self):
+        return str(self)
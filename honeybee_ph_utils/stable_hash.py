@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 2.7 -*-
+
+"""Deterministic content-hashes of Honeybee-PH objects, for de-duplication and change detection.
+
+Every Honeybee-PH object gets a random uuid4 identifier, so two objects with the same
+content can never be recognized as the same by comparing their dicts. `stable_hash`
+returns a sha1 hash of the object's canonical `to_dict` output, with the volatile
+identifiers removed:
+
+    * 'identifier' keys, and references to other objects' identifiers ('*_id' / '*_identifier').
+    * 'display_name' keys which are only the (default) copy of the identifier.
+    * The keys of dicts keyed by the identifiers of their values (ie: {uuid: device_dict}),
+        which are treated as un-ordered collections.
+
+The hash is stored on the object along with a cheap snapshot of the object's state
+(its attribute values, recursively). The snapshot is compared on every call, and the
+hash is only re-calculated (by a new `to_dict`) if any attribute, nested object or
+container item was changed since the last call.
+"""
+
+import hashlib
+import json
+
+try:
+    from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+except ImportError:
+    pass  # IronPython
+
+try:
+    PRIMITIVE_TYPES = (type(None), bool, int, long, float, str, unicode)  # type: ignore # Python 2.7
+except NameError:
+    PRIMITIVE_TYPES = (type(None), bool, int, float, str, bytes)
+
+STABLE_HASH_ATTR = "_stable_hash_memo"
+VOLATILE_KEYS = ("identifier",)
+VOLATILE_KEY_SUFFIXES = ("_id", "_identifier")
+
+# -- Back-references to the 'host' object. Following them would snapshot the whole model.
+_SNAPSHOT_SKIP_ATTRS = (STABLE_HASH_ATTR, "_host")
+
+
+def content_hash(_input_dict):
+    # type: (Dict[str, Any]) -> str
+    """Return a hash of a dict's content, independent of the order of its keys."""
+    text = json.dumps(_input_dict, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _is_volatile_key(_key):
+    # type: (str) -> bool
+    return _key in VOLATILE_KEYS or _key.endswith(VOLATILE_KEY_SUFFIXES)
+
+
+def _is_keyed_by_identifier(_input_dict):
+    # type: (Dict[str, Any]) -> bool
+    """Return True if every value is an object-dict stored under its own identifier."""
+    if not _input_dict:
+        return False
+    for k, v in _input_dict.items():
+        if not isinstance(v, dict) or v.get("identifier") != k:
+            return False
+    return True
+
+
+def canonical_dict(_value):
+    # type: (Any) -> Any
+    """Return a copy of a 'to_dict' value with all of the volatile identifiers removed.
+
+    Arguments:
+    ----------
+        * _value (Any): A dict (or list, or value) from an object's 'to_dict'.
+
+    Returns:
+    --------
+        * (Any): The canonical copy. Dicts keyed by the identifiers of their values are
+            returned as lists, sorted by the content-hash of each value.
+    """
+    if isinstance(_value, dict):
+        if _is_keyed_by_identifier(_value):
+            items = [canonical_dict(v) for v in _value.values()]
+            return sorted(items, key=content_hash)
+
+        identifier = _value.get("identifier")
+        new_dict = {}
+        for k, v in _value.items():
+            if _is_volatile_key(k):
+                continue
+            if k == "display_name" and identifier is not None and v == identifier:
+                continue
+            new_dict[k] = canonical_dict(v)
+        return new_dict
+    if isinstance(_value, (list, tuple)):
+        return [canonical_dict(v) for v in _value]
+    return _value
+
+
+def state_snapshot(_value, _seen=None):
+    # type: (Any, Optional[Set[int]]) -> Hashable
+    """Return a snapshot of an object's state, used to tell if it changed since the last call.
+
+    Primitive values are compared by value, containers item-by-item and other objects
+    by their identity plus (recursively) their attributes. Objects without a __dict__
+    (ie: Ladybug-Geometry, which is immutable) are compared by identity only.
+    """
+    if isinstance(_value, PRIMITIVE_TYPES):
+        return _value
+
+    if _seen is None:
+        _seen = set()
+    obj_id = id(_value)
+    if obj_id in _seen:
+        return ("ref", obj_id)
+    _seen.add(obj_id)
+
+    if isinstance(_value, (list, tuple, set, frozenset)):
+        return (type(_value).__name__,) + tuple(state_snapshot(v, _seen) for v in _value)
+    if isinstance(_value, dict):
+        return ("dict",) + tuple((state_snapshot(k, _seen), state_snapshot(v, _seen)) for k, v in _value.items())
+
+    attrs = getattr(_value, "__dict__", None)
+    if attrs is None:
+        return ("id", obj_id)
+    return (obj_id,) + tuple((k, state_snapshot(v, _seen)) for k, v in attrs.items() if k not in _SNAPSHOT_SKIP_ATTRS)
+
+
+def stable_hash(_obj):
+    # type: (Any) -> str
+    """Return the content-hash of an object's canonical 'to_dict', re-using the last one if unchanged.
+
+    Arguments:
+    ----------
+        * _obj (Any): The object. It must have a 'to_dict' method.
+
+    Returns:
+    --------
+        * (str): The sha1 hex-digest of the object's content. Objects with the same
+            content (other than their identifiers) have the same hash, in any session.
+    """
+    memo = _obj.__dict__.get(STABLE_HASH_ATTR)
+    if memo is not None and memo[0] == state_snapshot(_obj):
+        return memo[1]
+
+    hash_ = content_hash(canonical_dict(_obj.to_dict()))
+    # -- Snapshot after 'to_dict', since it may fill some of the object's lazy caches.
+    _obj.__dict__[STABLE_HASH_ATTR] = (state_snapshot(_obj), hash_)
+    return hash_
+
+
+def clear_stable_hash(_obj):
+    # type: (Any) -> None
+    """Remove the memoized stable-hash from the object, if it has one."""
+    _obj.__dict__.pop(STABLE_HASH_ATTR, None)
+
+
+def unique_by_stable_hash(_objects):
+    # type: (Iterable[Any]) -> List[Any]
+    """Return the objects with the duplicates (by content) removed, keeping the first of each."""
+    seen = set()
+    unique = []
+    for obj in _objects:
+        hash_ = stable_hash(obj)
+        if hash_ not in seen:
+            seen.add(hash_)
+            unique.append(obj)
+    return unique
+
+
+def changed_objects(_objects, _previous_hashes):
+    # type: (Iterable[Any], Dict[str, str]) -> List[Any]
+    """Return the objects whose stable-hash is not the one recorded for their identifier.
+
+    Arguments:
+    ----------
+        * _objects (Iterable[Any]): The objects to check.
+        * _previous_hashes (Dict[str, str]): The stable-hash of each object from
+            the last export, by identifier (ie: from `stable_hashes`).
+
+    Returns:
+    --------
+        * (List[Any]): The new or changed objects, which need to be re-exported.
+    """
+    return [obj for obj in _objects if _previous_hashes.get(obj.identifier) != stable_hash(obj)]
+
+
+def stable_hashes(_objects):
+    # type: (Iterable[Any]) -> Dict[str, str]
+    """Return a dict of each object's stable-hash, by identifier."""
+    return {obj.identifier: stable_hash(obj) for obj in _objects}
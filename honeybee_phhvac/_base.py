@@ -11,6 +11,11 @@ try:
 except ImportError:
     pass  # IronPython 2.7
 
+try:
+    from honeybee_ph_utils import stable_hash as _stable_hash
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+
 
 class _PhHVACBase(object):
     """Base class for all Honeybee-PH HVAC equipment objects.
@@ -65,6 +70,23 @@ class _PhHVACBase(object):
         """The dictionary key for this object (same as identifier)."""
         return self.identifier
 
+    def stable_hash(self):
+        # type: () -> str
+        """Return a deterministic hash of this object's content, without its identifier.
+
+        Objects with the same content have the same stable-hash, in any session, so it can
+        be used to de-duplicate objects or to find the ones changed since the last export.
+        The hash is memoized until the object (or anything it holds) is changed.
+        """
+        return _stable_hash.stable_hash(self)
+
+    def __getstate__(self):
+        # type: () -> Dict[str, Any]
+        # -- The memoized stable-hash snapshot holds object ids, which are only valid in this session.
+        state = self.__dict__.copy()
+        state.pop(_stable_hash.STABLE_HASH_ATTR, None)
+        return state
+
     def __hash__(self):
         return hash(self.key)
 
@@ -111,6 +133,8 @@ class _PhHVACBase(object):
     def __eq__(self, other):
         # type: (_PhHVACBase) -> bool
         for k, v in self.__dict__.items():
+            if k == _stable_hash.STABLE_HASH_ATTR:
+                continue
             try:
                 if v != getattr(other, k):
                     if str(v) != str(getattr(other, k)):  # Handle UUID Identifier
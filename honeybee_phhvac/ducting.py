@@ -22,6 +22,11 @@ try:
 except ImportError as e:
     raise ImportError("\nFailed to import honeybee_phhvac:\n\t{}".format(e))
 
+try:
+    from honeybee_ph_utils import geometry_encoding as geom_encoding
+except ImportError as e:
+    raise ImportError("\nFailed to import honeybee_ph_utils:\n\t{}".format(e))
+
 
 class PhDuctSegment(_base._PhHVACBase):
     """A single duct segment (linear) with geometry and attributes.
@@ -128,8 +133,20 @@ class PhDuctSegment(_base._PhHVACBase):
         # type: () -> PhDuctSegment
         return self.__copy__()
 
-    def to_dict(self):
-        # type: () -> Dict[str, Union[str, dict]]
+    def to_dict(self, geometry_encoding=None):
+        # type: (Optional[str]) -> Dict[str, Union[str, dict]]
+        """Return a dict of the duct segment.
+
+        Arguments:
+        ----------
+            * geometry_encoding (Optional[str]): Set to "float64" or "float32" to store the
+                geometry in a packed vertex table (see honeybee_ph_utils.geometry_encoding).
+                Default: None (standard Ladybug-Geometry dicts).
+
+        Returns:
+        --------
+            * (Dict): The duct segment as a dict.
+        """
         d = super(PhDuctSegment, self).to_dict()
 
         d["geometry"] = self.geometry.to_dict()
@@ -140,11 +157,12 @@ class PhDuctSegment(_base._PhHVACBase):
         d["height"] = self.height
         d["width"] = self.width
 
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict) -> PhDuctSegment
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls(_geom=LineSegment3D.from_dict(_input_dict["geometry"]))
         new_obj.insulation_thickness = _input_dict["insulation_thickness"]
         new_obj.insulation_conductivity = _input_dict["insulation_conductivity"]
@@ -392,8 +410,9 @@ class PhDuctElement(_base._PhHVACBase):
         # type: () -> PhDuctElement
         return self.__copy__()
 
-    def to_dict(self):
-        # type: () -> Dict[str, Union[str, dict]]
+    def to_dict(self, geometry_encoding=None):
+        # type: (Optional[str]) -> Dict[str, Union[str, dict]]
+        """Return a dict of the duct element and its segments. Arguments as for PhDuctSegment.to_dict."""
         d = super(PhDuctElement, self).to_dict()
 
         d["segments"] = {}
@@ -401,11 +420,12 @@ class PhDuctElement(_base._PhHVACBase):
             d["segments"][segment.identifier] = segment.to_dict()
         d["duct_type"] = self.duct_type
 
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict) -> PhDuctElement
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls()
 
         for seg_dict in _input_dict["segments"].values():
@@ -24,6 +24,7 @@ except ImportError as e:
 
 try:
     from honeybee_ph_utils import enumerables
+    from honeybee_ph_utils import geometry_encoding as geom_encoding
 except ImportError as e:
     raise ImportError("Failed to import honeybee_ph_utils", e)
 
@@ -195,8 +196,21 @@ class PhHvacPipeSegment(_base._PhHVACBase):
         # type: () -> PhHvacPipeSegment
         return self.__copy__()
 
-    def to_dict(self, _include_properties=False):
-        # type: (bool) -> Dict[str, Union[str, Dict]]
+    def to_dict(self, _include_properties=False, geometry_encoding=None):
+        # type: (bool, Optional[str]) -> Dict[str, Union[str, Dict]]
+        """Return a dict of the pipe segment.
+
+        Arguments:
+        ----------
+            * _include_properties (bool): Include the calculated properties (length, etc.). Default: False.
+            * geometry_encoding (Optional[str]): Set to "float64" or "float32" to store all of the
+                geometry in a shared, packed, vertex table (see honeybee_ph_utils.geometry_encoding).
+                Default: None (standard Ladybug-Geometry dicts).
+
+        Returns:
+        --------
+            * (Dict): The pipe segment as a dict.
+        """
         d = super(PhHvacPipeSegment, self).to_dict()
         d["geometry"] = self.geometry.to_dict()
         d["diameter_mm"] = self.diameter_mm
@@ -211,11 +225,12 @@ class PhHvacPipeSegment(_base._PhHVACBase):
         if _include_properties:
             d["length"] = self.length
 
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict) -> PhHvacPipeSegment
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls(_geom=LineSegment3D.from_dict(_input_dict["geometry"]))
         new_obj.diameter_mm = _input_dict["diameter_mm"]
         new_obj.material = PhHvacPipeMaterial(_input_dict["material_value"])
@@ -441,8 +456,9 @@ class PhHvacPipeElement(_base._PhHVACBase):
         # type: () -> PhHvacPipeElement
         return self.__copy__()
 
-    def to_dict(self, _include_properties=False):
-        # type: (bool) -> dict[str, Union[str, dict]]
+    def to_dict(self, _include_properties=False, geometry_encoding=None):
+        # type: (bool, Optional[str]) -> dict[str, Union[str, dict]]
+        """Return a dict of the pipe element and its segments. Arguments as for PhHvacPipeSegment.to_dict."""
         d = super(PhHvacPipeElement, self).to_dict()
         d["segments"] = {}
         for segment in self.segments:
@@ -455,11 +471,12 @@ class PhHvacPipeElement(_base._PhHVACBase):
             d["material_name"] = self.material_name
             d["diameter"] = self.diameter_mm
 
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (dict) -> PhHvacPipeElement
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls()
 
         for seg_dict in _input_dict["segments"].values():
@@ -699,8 +716,9 @@ class PhHvacPipeBranch(_base._PhHVACBase):
         # type: () -> PhHvacPipeBranch
         return self.__copy__()
 
-    def to_dict(self, _include_properties=False):
-        # type: (bool) -> Dict[str, Union[str, Dict]]
+    def to_dict(self, _include_properties=False, geometry_encoding=None):
+        # type: (bool, Optional[str]) -> Dict[str, Union[str, Dict]]
+        """Return a dict of the branch and its fixtures. Arguments as for PhHvacPipeSegment.to_dict."""
         d = super(PhHvacPipeBranch, self).to_dict()
         d["pipe_element"] = self.pipe_element.to_dict(_include_properties)
         d["fixtures"] = {}
@@ -714,11 +732,12 @@ class PhHvacPipeBranch(_base._PhHVACBase):
             d["num_fixtures"] = self.num_fixtures
             d["total_length"] = self.total_length
             d["total_home_run_fixture_length"] = self.total_home_run_fixture_length
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict) -> PhHvacPipeBranch
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls()
 
         new_obj.identifier = _input_dict["identifier"]
@@ -957,8 +976,9 @@ class PhHvacPipeTrunk(_base._PhHVACBase):
         # type: () -> PhHvacPipeTrunk
         return self.__copy__()
 
-    def to_dict(self, _include_properties=False):
-        # type: (bool) -> Dict[str, Union[str, Dict]]
+    def to_dict(self, _include_properties=False, geometry_encoding=None):
+        # type: (bool, Optional[str]) -> Dict[str, Union[str, Dict]]
+        """Return a dict of the trunk and all of its branches. Arguments as for PhHvacPipeSegment.to_dict."""
         d = super(PhHvacPipeTrunk, self).to_dict()
         d["pipe_element"] = self.pipe_element.to_dict(_include_properties)
         d["multiplier"] = self.multiplier
@@ -974,11 +994,12 @@ class PhHvacPipeTrunk(_base._PhHVACBase):
             d["num_fixtures"] = self.num_fixtures
             d["total_length"] = self.total_length
             d["total_home_run_fixture_length"] = self.total_home_run_fixture_length
-        return d
+        return geom_encoding.encode_geometry(d, geometry_encoding)
 
     @classmethod
     def from_dict(cls, _input_dict):
         # type: (Dict) -> PhHvacPipeTrunk
+        _input_dict = geom_encoding.unpack_geometry(_input_dict)
         new_obj = cls()
 
         new_obj.identifier = _input_dict["identifier"]
@@ -178,6 +178,31 @@ class RoomPhHvacProperties(object):
 
         return {"ph_hvac": d}
 
+    def to_patch_dict(self):
+        # type: () -> Dict[str, Any]
+        """Return the Abridged dict used for the Room's entry in a PhModelPatch.
+
+        The systems are only referenced by their identifier, the same as in the dicts
+        passed to `apply_properties_from_dict`. The system dicts are stored once in the patch.
+        """
+        d = {}
+        d["type"] = "RoomPhHvacPropertiesAbridged"
+        d["id_num"] = self.id_num
+        d["ventilation_system"] = (
+            {"identifier": self.ventilation_system.identifier} if self.ventilation_system else None
+        )
+        for attr_name in (
+            "heating_systems",
+            "heat_pump_systems",
+            "exhaust_vent_devices",
+            "supportive_devices",
+            "renewable_devices",
+        ):
+            systems = (_ for _ in getattr(self, attr_name) if _ is not None)
+            d[attr_name] = [{"identifier": identifier} for identifier in sorted(sys.identifier for sys in systems)]
+        d["hot_water_system"] = {"identifier": self.hot_water_system.identifier} if self.hot_water_system else None
+        return d
+
     @classmethod
     def from_dict(cls, _input_dict, host):
         # type: (Dict[str, Any], Optional[RoomProperties]) -> RoomPhHvacProperties
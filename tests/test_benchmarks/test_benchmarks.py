@@ -0,0 +1,108 @@
+import pytest
+
+from benchmarks import cases, generators, runner
+from benchmarks.__main__ import main
+from honeybee_energy_ph.dwellings import total_dwelling_count
+
+TINY = generators.ModelSize(
+    rooms=4,
+    stories=2,
+    spaces_per_room=2,
+    bldg_segments=2,
+    thermal_bridges_per_segment=2,
+    apertures_per_wall=1,
+    nonres_room_every=2,
+    dhw_branches=2,
+    dhw_twigs=2,
+    dhw_segments=2,
+    duct_segments=2,
+)
+
+
+def _results(_timings, _size=None):
+    return {
+        "format_version": runner.RESULTS_FORMAT_VERSION,
+        "size": _size or TINY.to_dict(),
+        "benchmarks": {name: {"min_s": t, "median_s": t, "mean_s": t} for name, t in _timings.items()},
+    }
+
+
+def test_synthetic_model_matches_size():
+    model = generators.synthetic_model(TINY)
+    assert len(model.rooms) == 4
+    assert sorted({rm.story for rm in model.rooms}) == ["Story_001", "Story_002"]
+    assert all(len(rm.properties.ph.spaces) == 2 for rm in model.rooms)
+    assert len({rm.properties.ph.ph_bldg_segment.identifier for rm in model.rooms}) == 2
+    assert total_dwelling_count(model.rooms) == 2
+
+    hot_water = model.rooms[0].properties.ph_hvac.hot_water_system
+    trunk = list(hot_water.distribution_piping)[0]
+    assert len(trunk.branches) == 2
+    assert trunk.num_fixtures == 4
+    assert len(trunk.segments) == 2
+
+    ventilation = model.rooms[0].properties.ph_hvac.ventilation_system
+    assert len(ventilation.supply_ducting[0].segments) == 2
+    assert model.apertures[0].properties.energy.construction.properties.ph.ph_frame is not None
+
+
+def test_model_size_overrides():
+    size = generators.model_size("medium", rooms=7)
+    assert size.rooms == 7
+    assert size.stories == generators.SIZES["medium"].stories
+    with pytest.raises(ValueError):
+        generators.model_size("enormous")
+
+
+def test_run_benchmarks(tmp_path):
+    names = [b.name for b in cases.BENCHMARKS if b.name != "epw_conversion"]
+    results = runner.run_benchmarks(_names=names, _repeat=2, _warmup=0, _size=TINY)
+    assert results["size_name"] == "custom"
+    assert list(results["benchmarks"]) == names
+    for timing in results["benchmarks"].values():
+        assert len(timing["runs"]) == 2
+        assert 0 <= timing["min_s"] <= timing["median_s"] <= timing["max_s"]
+
+    path = runner.write_results(results, str(tmp_path / "results.json"))
+    assert runner.load_results(path) == results
+
+
+def test_run_unknown_benchmark_raises():
+    with pytest.raises(ValueError):
+        runner.run_benchmarks(_names=["not_a_benchmark"], _size=TINY)
+
+
+def test_compare_results():
+    baseline = _results({"a": 1.0, "b": 1.0, "c": 1.0, "gone": 1.0})
+    current = _results({"a": 1.1, "b": 1.5, "c": 0.5, "added": 1.0})
+    rows = {row.name: row for row in runner.compare_results(baseline, current, 0.2)}
+
+    assert rows["a"].status == "ok"
+    assert rows["a"].change == pytest.approx(0.1)
+    assert rows["b"].status == "regression"
+    assert rows["c"].status == "improvement"
+    assert rows["gone"].status == "missing"
+    assert rows["added"].status == "new"
+    assert [r.name for r in runner.regressions(rows.values())] == ["b"]
+
+    text = runner.format_comparison(list(rows.values()), baseline, current)
+    assert "REGRESSION" in text
+    assert "WARNING" not in text
+    assert "WARNING" in runner.format_comparison([], baseline, _results({}, {"rooms": 1}))
+
+
+def test_load_results_checks_format_version(tmp_path):
+    path = runner.write_results({"format_version": 0, "benchmarks": {}}, str(tmp_path / "old.json"))
+    with pytest.raises(ValueError):
+        runner.load_results(path)
+
+
+def test_cli_compare_exit_code(tmp_path, capsys):
+    baseline = runner.write_results(_results({"a": 1.0}), str(tmp_path / "baseline.json"))
+    slower = runner.write_results(_results({"a": 2.0}), str(tmp_path / "slower.json"))
+    same = runner.write_results(_results({"a": 1.0}), str(tmp_path / "same.json"))
+
+    assert main(["--compare", baseline, "--current", same]) == 0
+    assert main(["--compare", baseline, "--current", slower]) == 1
+    assert main(["--compare", baseline, "--current", slower, "--threshold", "1.5"]) == 0
+    assert "REGRESSION" in capsys.readouterr().out
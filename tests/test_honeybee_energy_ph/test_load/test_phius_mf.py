@@ -1,4 +1,12 @@
-from honeybee_energy_ph.load.phius_mf import PhiusNonResRoom, PhiusResidentialStory
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee_energy.lib.programtypes import office_program
+from honeybee_energy.load.people import People
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from ladybug_geometry.geometry3d import Face3D, Point3D
+
+from honeybee_energy_ph.load.phius_mf import PhiusMFWorkbookData, PhiusNonResRoom, PhiusResidentialStory
+from honeybee_energy_ph.properties.load.people import PhDwellings
 from honeybee_ph import space
 
 
@@ -55,3 +63,77 @@ def test_phius_mf_non_res_from_space(floor_segment_geometry):
     a = PhiusNonResRoom.from_ph_space(sp, "M2")
     assert a.reference_floor_area_ft2 == 1076.3899999999999
     assert a.reference_floor_area_m2 == 100
+
+
+# -----------------------------------------------------------------------------
+# -- Single-pass calculator
+
+
+def _hb_room(_name, _story, _origin_x, _dwellings=None, _bedrooms=2, _people=2.5):
+    room = Room.from_box(_name, 10, 10, 3, origin=Point3D(_origin_x, 0, 0))
+    room.story = _story
+
+    if _dwellings is None:
+        room.properties.energy.program_type = office_program
+    else:
+        people = People("{}_People".format(_name), 0.05, ScheduleRuleset.from_constant_value("Occ", 1.0))
+        people.properties.ph.number_bedrooms = _bedrooms
+        people.properties.ph.number_people = _people
+        people.properties.ph.dwellings = _dwellings
+        room.properties.energy.people = people
+
+    flr_seg = space.SpaceFloorSegment()
+    flr_seg.geometry = Face3D([Point3D(_origin_x + x, y, 0) for x, y in ((0, 0), (10, 0), (10, 10), (0, 10))])
+    vol = space.SpaceVolume()
+    vol.floor.add_floor_segment(flr_seg)
+    sp = space.Space(room)
+    sp.add_new_volumes([vol])
+    room.properties.ph.add_new_space(sp)
+    return room
+
+
+def test_phius_story_totals_matches_calc_methods():
+    shared = PhDwellings(1)
+    rooms = [
+        _hb_room("A", "1", 0, shared),
+        _hb_room("B", "1", 10, shared),
+        _hb_room("C", "1", 20, PhDwellings(3), _bedrooms=4, _people=5.0),
+    ]
+    story = PhiusResidentialStory(rooms, "M2")
+
+    assert story.story_number == "001"
+    assert story.total_floor_area_ft2 == story.calc_story_floor_area_ft2(rooms, "M2")
+    assert story.total_number_dwellings == story.calc_num_dwellings(rooms) == 4
+    assert story.total_number_bedrooms == story.calc_story_bedrooms(rooms) == 8
+    assert story.design_occupancy == story.calc_passive_house_occupancy(rooms) == 10.0
+
+
+def test_phius_mf_workbook_data_from_hb_rooms():
+    rooms = [
+        _hb_room("Res_2a", "2", 0, PhDwellings(1)),
+        _hb_room("Res_1a", "1", 10, PhDwellings(1)),
+        _hb_room("Office", "1", 20),
+        _hb_room("Res_2b", "2", 30, PhDwellings(1)),
+    ]
+    data = PhiusMFWorkbookData.from_hb_rooms(rooms, "M2")
+
+    assert [s.story_number for s in data.stories] == ["001", "002"]
+    expected = PhiusResidentialStory([rooms[0], rooms[3]], "M2")
+    assert data.stories[1].total_floor_area_ft2 == expected.total_floor_area_ft2
+    assert data.stories[1].total_number_dwellings == 2
+    assert data.stories[1].mel == expected.mel
+    assert data.stories[1].lighting_int == expected.lighting_int
+
+    assert len(data.non_res_rooms) == 1
+    assert data.non_res_rooms[0].reference_floor_area_m2 == 100
+    assert data.non_res_rooms[0].program_type is data.non_res_programs[office_program.display_name]
+    assert len(data.to_phius_mf_workbook()["non_res_rooms"]) == 1
+
+
+def test_phius_mf_workbook_data_from_hb_model():
+    model = Model("Test", rooms=[_hb_room("Res", "1", 0, PhDwellings(2))], units="Feet")
+    data = PhiusMFWorkbookData.from_hb_model(model)
+
+    assert data.stories[0].total_floor_area_ft2 == 100
+    assert data.stories[0].total_number_dwellings == 2
+    assert not data.non_res_rooms
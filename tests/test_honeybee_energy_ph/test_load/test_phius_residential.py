@@ -1,3 +1,4 @@
+import pytest
 from pytest import approx
 
 from honeybee_energy_ph.load import phius_residential
@@ -21,3 +22,52 @@ def test_mels():
 
 def test_lightingfgarage():
     assert phius_residential.lighting_garage(1.0) == approx(20.0)
+
+
+# -----------------------------------------------------------------------------
+# -- Batched versions
+
+BEDROOMS = [0, 1, 2, 3, 4, 5]
+AREAS = [410.5, 812.25, 1000, 1333.3, 2011.7, 3750.01]
+DWELLINGS = [1, 1, 2, 1, 3, 12]
+FRACTIONS = [0.0, 0.25, 0.5, 0.75, 0.9, 1.0]
+
+
+def test_misc_electrical_array_matches_scalar():
+    expected = [phius_residential.misc_electrical(b, a, d) for b, a, d in zip(BEDROOMS, AREAS, DWELLINGS)]
+    assert phius_residential.misc_electrical_array(BEDROOMS, AREAS, DWELLINGS) == expected
+
+
+def test_lighting_arrays_match_scalar():
+    rows = list(zip(AREAS, FRACTIONS, DWELLINGS))
+    assert phius_residential.lighting_interior_array(AREAS, FRACTIONS, DWELLINGS) == [
+        phius_residential.lighting_interior(*r) for r in rows
+    ]
+    assert phius_residential.lighting_exterior_array(AREAS, FRACTIONS, DWELLINGS) == [
+        phius_residential.lighting_exterior(*r) for r in rows
+    ]
+    assert phius_residential.lighting_garage_array(FRACTIONS, DWELLINGS) == [
+        phius_residential.lighting_garage(f, d) for f, d in zip(FRACTIONS, DWELLINGS)
+    ]
+
+
+def test_cooktop_array_with_scalar_input():
+    occupants = [1.5, 2.0, 3.25]
+    assert phius_residential.cooktop_array(occupants, 0.2) == [phius_residential.cooktop(o, 0.2) for o in occupants]
+
+
+def test_array_python_fallback_matches_default():
+    assert phius_residential.misc_electrical_array(
+        BEDROOMS, AREAS, DWELLINGS, _use_numpy=False
+    ) == phius_residential.misc_electrical_array(BEDROOMS, AREAS, DWELLINGS)
+
+
+def test_array_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        phius_residential.misc_electrical_array([1, 2], [100.0, 200.0, 300.0])
+
+
+def test_array_numpy_matches_scalar():
+    pytest.importorskip("numpy")
+    expected = [phius_residential.lighting_interior(a, f, d) for a, f, d in zip(AREAS, FRACTIONS, DWELLINGS)]
+    assert phius_residential.lighting_interior_array(AREAS, FRACTIONS, DWELLINGS, _use_numpy=True) == expected
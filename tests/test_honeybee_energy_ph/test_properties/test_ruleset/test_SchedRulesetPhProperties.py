@@ -1,3 +1,5 @@
+import pytest
+
 from honeybee_energy_ph.properties import ruleset
 
 
@@ -50,3 +52,49 @@ def test_annual_util_factor_3(
     prop.daily_operating_periods.add_period_to_collection(op_period_12_hour_factor_0_5)
     prop.daily_operating_periods.add_period_to_collection(op_period_12_hour_factor_1)
     assert prop.annual_average_operating_fraction == 0.75
+
+
+# -- Cached summary and hourly values
+
+
+def test_summary_is_cached_until_collection_changes(
+    op_period_12_hour_factor_0_5: ruleset.DailyOperationPeriod,
+    op_period_12_hour_factor_1: ruleset.DailyOperationPeriod,
+):
+    prop = ruleset.ScheduleRulesetPhProperties(_host=None)
+    prop.daily_operating_periods.add_period_to_collection(op_period_12_hour_factor_0_5)
+    summary = prop.operating_period_summary
+    assert prop.operating_period_summary is summary
+    assert summary.total_hours == 12
+    assert prop.validate_operating_period_hours() is not None
+
+    prop.daily_operating_periods.add_period_to_collection(op_period_12_hour_factor_1)
+    assert prop.operating_period_summary is not summary
+    assert prop.operating_period_summary.total_hours == 24
+    assert prop.operating_period_summary.weighted_hours == 18
+    assert prop.validate_operating_period_hours() is None
+
+
+def test_summary_recalculated_when_days_change(op_period_12_hour_factor_1: ruleset.DailyOperationPeriod):
+    prop = ruleset.ScheduleRulesetPhProperties(_host=None)
+    prop.daily_operating_periods.add_period_to_collection(op_period_12_hour_factor_1)
+    assert prop.annual_average_operating_fraction == 0.5
+
+    prop.operating_days_wk = 0
+    assert prop.annual_average_operating_fraction == 0.0
+
+    prop.operating_days_wk = 5
+    assert prop.annual_average_operating_fraction == 0.5
+
+
+def test_hourly_values():
+    prop = ruleset.ScheduleRulesetPhProperties(_host=None)
+    prop.daily_operating_periods.add_period_to_collection(
+        ruleset.DailyOperationPeriod.from_start_end_hours(8, 17.5, 0.5)
+    )
+    values = prop.hourly_values()
+
+    assert len(values) == 8760
+    assert len(prop.hourly_values(_leap_year=True)) == 8784
+    assert values[:24] == [0.0] * 8 + [0.5] * 9 + [0.25] + [0.0] * 6
+    assert sum(values) / len(values) == pytest.approx(prop.annual_average_operating_fraction)
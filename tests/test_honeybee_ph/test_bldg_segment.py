@@ -1,10 +1,11 @@
 import warnings
 
-from ladybug_geometry.geometry3d import LineSegment3D, Point3D
+from ladybug_geometry.geometry3d import LineSegment3D, Point3D, Vector3D
 
 from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge
 from honeybee_ph.bldg_segment import (
     BldgSegment,
+    BldgSegmentRegistry,
     PhSummerVentilationExtractSystemControl,
     PhVentilationSummerBypassMode,
     PhWindExposureType,
@@ -393,3 +394,68 @@ def test_set_wind_exposure_type_duplicate():
     seg2 = seg1.duplicate()
     assert seg2.wind_exposure_type.number == 2
     assert seg2.wind_exposure_type == seg1.wind_exposure_type
+
+
+# -- Registry ------------------------------------------------------------------
+
+
+def test_registry_add_returns_first_segment():
+    registry = BldgSegmentRegistry()
+    seg1 = BldgSegment()
+    seg2 = seg1.duplicate()
+
+    assert registry.add(seg1) is seg1
+    assert registry.add(seg2) is seg1
+    assert len(registry) == 1
+    assert seg1.identifier in registry
+    assert registry.get(seg1.identifier) is seg1
+
+
+def test_registry_from_dict_shares_equal_segments():
+    seg = BldgSegment()
+    tb_geom = LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(10, 0, 0))
+    seg.add_new_thermal_bridge(PhThermalBridge(_identifier="test", _geometry=tb_geom))
+    d = seg.to_dict()
+
+    registry = BldgSegmentRegistry()
+    seg1 = registry.from_dict(d)
+    assert registry.from_dict(seg.to_dict()) is seg1
+    assert seg1.to_dict() == d
+
+    # -- Same identifier, different values: built on its own, not registered
+    seg.display_name = "Changed"
+    seg2 = registry.from_dict(seg.to_dict())
+    assert seg2 is not seg1
+    assert seg2.display_name == "Changed"
+    assert registry.get(seg.identifier) is seg1
+
+
+def test_registry_context_manager():
+    assert BldgSegmentRegistry.active() is None
+    with BldgSegmentRegistry() as outer:
+        assert BldgSegmentRegistry.active() is outer
+        with BldgSegmentRegistry() as inner:
+            assert BldgSegmentRegistry.active() is inner
+        assert BldgSegmentRegistry.active() is outer
+    assert BldgSegmentRegistry.active() is None
+
+
+def test_bdg_segment_move_copies_thermal_bridges_once(monkeypatch):
+    seg = BldgSegment()
+    tb_geom = LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(10, 0, 0))
+    seg.add_new_thermal_bridge(PhThermalBridge(_identifier="test", _geometry=tb_geom))
+
+    copies = []
+    original_duplicate = PhThermalBridge.duplicate
+
+    def _duplicate(self):
+        copies.append(self)
+        return original_duplicate(self)
+
+    monkeypatch.setattr(PhThermalBridge, "duplicate", _duplicate)
+    new_seg = seg.move(Vector3D(0, 0, 5))
+
+    assert len(copies) == 1  # -- Only the copy made by PhThermalBridge.move
+    assert new_seg.thermal_bridges["test"].geometry.p.z == 5
+    assert seg.thermal_bridges["test"].geometry.p.z == 0
+    assert new_seg.thermal_bridges.total_length == seg.thermal_bridges.total_length
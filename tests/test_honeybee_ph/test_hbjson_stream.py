@@ -0,0 +1,222 @@
+import io
+import json
+
+import pytest
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.shade import Shade
+from ladybug_geometry.geometry3d.pointvector import Point3D
+from ladybug_geometry.geometry3d.polyline import LineSegment3D
+
+from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge
+from honeybee_ph import hbjson_stream
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_ph.space import Space
+from honeybee_phhvac.ventilation import PhVentilationSystem, Ventilator
+
+
+def _model():
+    segment = BldgSegment()
+    segment.display_name = "Segment A"
+    tb = PhThermalBridge("tb-1", LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(5, 0, 0)))
+    segment.add_new_thermal_bridge(tb)
+
+    unit = Ventilator()
+    unit.sensible_heat_recovery = 0.8
+    system = PhVentilationSystem.balanced_hrv(unit, display_name="ERV")
+
+    rooms = []
+    for i in range(3):
+        room = Room.from_box("Room_{}".format(i), 5, 5, 3, origin=Point3D(i * 5, 0, 0))
+        room.properties.ph.ph_bldg_segment = segment
+        room.properties.ph.add_new_space(Space.from_room(room, 2.5))
+        room.properties.ph_hvac.set_ventilation_system(system)
+        rooms.append(room)
+
+    shade = Shade.from_vertices("Shade", [(0, 0, 4), (5, 0, 4), (5, 5, 4)])
+    return Model("StreamModel", rooms=rooms, orphaned_shades=[shade])
+
+
+def _normalized(_dict):
+    return json.loads(json.dumps(_dict))
+
+
+def test_iter_json_chunks_plain_values():
+    obj = {"a": [1, 2.5, None], "b": {"c": "d"}}
+    assert "".join(hbjson_stream.iter_json_chunks(obj)) == json.dumps(obj)
+
+
+def test_iter_json_chunks_stream_object_and_generators():
+    obj = hbjson_stream.StreamObject()
+    obj["empty_gen"] = (i for i in [])
+    obj["gen"] = ({"i": i} for i in range(3))
+    obj["empty"] = hbjson_stream.StreamObject()
+    obj[1] = "int-key"
+    text = "".join(hbjson_stream.iter_json_chunks(obj))
+    assert json.loads(text) == {"empty_gen": [], "gen": [{"i": 0}, {"i": 1}, {"i": 2}], "empty": {}, "1": "int-key"}
+
+
+def test_iter_json_chunks_indented_matches_json_module():
+    obj = {"a": [1, {"b": [2, 3]}], "c": "d"}
+    stream_obj = hbjson_stream.StreamObject()
+    stream_obj["a"] = (x for x in [1, {"b": [2, 3]}])
+    stream_obj["c"] = "d"
+    assert "".join(hbjson_stream.iter_json_chunks(stream_obj, 2)) == json.dumps(obj, indent=2)
+
+
+def test_nested_generators():
+    inner = hbjson_stream.StreamObject()
+    inner["values"] = (x for x in range(2))
+    outer = hbjson_stream.StreamObject()
+    outer["items"] = (item for item in [inner])
+    text = "".join(hbjson_stream.iter_json_chunks(outer))
+    assert json.loads(text) == {"items": [{"values": [0, 1]}]}
+
+
+def test_dump_model_matches_model_to_dict():
+    model = _model()
+    fp = io.StringIO()
+    hbjson_stream.dump_model(model, fp)
+    assert json.loads(fp.getvalue()) == _normalized(model.to_dict())
+
+
+def test_dump_model_indented_matches_model_to_dict():
+    model = _model()
+    fp = io.StringIO()
+    hbjson_stream.dump_model(model, fp, _indent=4)
+    assert json.loads(fp.getvalue()) == _normalized(model.to_dict())
+
+
+def test_dump_model_included_prop():
+    model = _model()
+    fp = io.StringIO()
+    hbjson_stream.dump_model(model, fp, _included_prop=["ph"])
+    assert json.loads(fp.getvalue()) == _normalized(model.to_dict(included_prop=["ph"]))
+
+
+def test_model_stream_dict_is_lazy(monkeypatch):
+    model = _model()
+    calls = []
+    original = Room.to_dict
+
+    def _counting_to_dict(self, *args, **kwargs):
+        calls.append(self.identifier)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Room, "to_dict", _counting_to_dict)
+
+    stream_dict = hbjson_stream.model_stream_dict(model)
+    assert calls == []
+
+    hbjson_stream.dump(stream_dict, io.StringIO())
+    assert calls == ["Room_0", "Room_1", "Room_2"]
+
+
+def test_write_hbjson_round_trip(tmp_path):
+    model = _model()
+    path = hbjson_stream.write_hbjson(model, name="streamed", folder=str(tmp_path))
+    assert path.endswith("streamed.hbjson")
+
+    restored = Model.from_hbjson(path)
+    assert len(restored.rooms) == 3
+    seg_ids = {rm.properties.ph.ph_bldg_segment.identifier for rm in restored.rooms}
+    assert seg_ids == {model.rooms[0].properties.ph.ph_bldg_segment.identifier}
+    assert len(restored.rooms[0].properties.ph.spaces) == 1
+    restored_system = restored.rooms[0].properties.ph_hvac.ventilation_system
+    assert restored_system.to_dict() == model.rooms[0].properties.ph_hvac.ventilation_system.to_dict()
+    assert restored.to_dict() == model.to_dict()
+
+
+# -----------------------------------------------------------------------------
+# -- Incremental Reader
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 65536])
+def test_incremental_reader_matches_json_loads(chunk_size):
+    doc = {
+        "a": 12345.678e-3,
+        "b": [1, 22, 333, {"c": ']}[{,:"\\'}],
+        "unicode": "Größe-ü",
+        "empty_list": [],
+        "empty_obj": {},
+        "rooms": [{"n": i, "s": "x" * i} for i in range(5)],
+        "last": -1,
+    }
+    text = json.dumps(doc, ensure_ascii=False, indent=1)
+    reader = hbjson_stream.IncrementalJsonReader(io.StringIO(text), chunk_size)
+    result = {}
+    for key, value in reader.iter_object_items(("rooms", "empty_list")):
+        if key in ("rooms", "empty_list"):
+            value = list(value)
+        result[key] = value
+    assert result == doc
+
+
+def test_incremental_reader_skips_unconsumed_stream_items():
+    text = json.dumps({"rooms": [1, 2, 3], "after": True})
+    reader = hbjson_stream.IncrementalJsonReader(io.StringIO(text), 2)
+    items = reader.iter_object_items(("rooms",))
+    key, rooms = next(items)
+    assert key == "rooms"
+    assert next(rooms) == 1
+    assert next(items) == ("after", True)
+
+
+def test_incremental_reader_invalid_json_raises():
+    reader = hbjson_stream.IncrementalJsonReader(io.StringIO('{"a": [1, 2'), 4)
+    with pytest.raises(ValueError):
+        list(reader.iter_object_items())
+
+    reader = hbjson_stream.IncrementalJsonReader(io.StringIO("[1, 2]"), 4)
+    with pytest.raises(ValueError):
+        list(reader.iter_object_items())
+
+
+@pytest.mark.parametrize("streamed", [True, False])
+def test_hbjson_ph_index(tmp_path, streamed):
+    model = _model()
+    if streamed:
+        path = hbjson_stream.write_hbjson(model, name="indexed", folder=str(tmp_path))
+    else:
+        path = model.to_hbjson(name="indexed", folder=str(tmp_path))
+
+    index = hbjson_stream.HbjsonPhIndex.from_hbjson(path, 128)
+    assert index.identifier == "StreamModel"
+    assert index.room_count == 3
+    assert index.tolerance == model.tolerance
+    seg_id = model.rooms[0].properties.ph.ph_bldg_segment.identifier
+    assert list(index.bldg_segments) == [seg_id]
+    assert len(index.bldg_segments[seg_id].thermal_bridges) == 1
+    system_id = model.rooms[0].properties.ph_hvac.ventilation_system.identifier
+    assert list(index.mechanical_systems["ventilation_systems"]) == [system_id]
+
+
+def test_iter_hbjson_rooms_matches_model_from_hbjson(tmp_path):
+    model = _model()
+    path = model.to_hbjson(name="rooms", folder=str(tmp_path))
+    expected = Model.from_hbjson(path)
+
+    rooms = list(hbjson_stream.iter_hbjson_rooms(path, _chunk_size=256))
+    assert [rm.identifier for rm in rooms] == [rm.identifier for rm in expected.rooms]
+    for room, expected_room in zip(rooms, expected.rooms):
+        assert room.properties.ph.to_dict(abridged=True) == expected_room.properties.ph.to_dict(abridged=True)
+        assert room.properties.ph_hvac.to_dict() == expected_room.properties.ph_hvac.to_dict()
+        for face, expected_face in zip(room.faces, expected_room.faces):
+            assert face.properties.ph.to_dict() == expected_face.properties.ph.to_dict()
+
+    # -- Shared objects are resolved from the index, not rebuilt per room
+    assert rooms[0].properties.ph.ph_bldg_segment is rooms[2].properties.ph.ph_bldg_segment
+    assert rooms[0].properties.ph_hvac.ventilation_system is rooms[2].properties.ph_hvac.ventilation_system
+
+
+def test_iter_hbjson_rooms_is_incremental(tmp_path):
+    model = _model()
+    path = hbjson_stream.write_hbjson(model, name="lazy", folder=str(tmp_path))
+    index = hbjson_stream.HbjsonPhIndex.from_hbjson(path)
+
+    rooms = hbjson_stream.iter_hbjson_rooms(path, index)
+    first = next(rooms)
+    assert first.identifier == "Room_0"
+    assert first.properties.ph.ph_bldg_segment is index.bldg_segments[first.properties.ph.ph_bldg_segment.identifier]
+    assert len(list(rooms)) == 2
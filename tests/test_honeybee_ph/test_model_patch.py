@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee_energy.load.people import People
+from ladybug_geometry.geometry3d.pointvector import Point3D
+
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_ph.model_patch import PhModelPatch, ph_object_dicts
+from honeybee_ph.space import Space
+from honeybee_phhvac.ventilation import PhVentilationSystem, Ventilator
+
+
+def _model():
+    segment = BldgSegment()
+    segment.display_name = "Segment A"
+
+    unit = Ventilator()
+    unit.sensible_heat_recovery = 0.8
+    system = PhVentilationSystem.balanced_hrv(unit, display_name="ERV")
+
+    people = People("People", 0.05)
+
+    rooms = []
+    for i in range(4):
+        room = Room.from_box("Room_{}".format(i), 5, 5, 3, origin=Point3D(i * 5, 0, 0))
+        room.properties.ph.ph_bldg_segment = segment
+        room.properties.ph.add_new_space(Space.from_room(room, 2.5))
+        room.properties.ph_hvac.set_ventilation_system(system)
+        room.properties.energy.people = people
+        rooms.append(room)
+    return Model("PatchModel", rooms=rooms)
+
+
+def test_no_changes_is_empty_patch():
+    model = _model()
+    patch = PhModelPatch.from_models(model, model.duplicate())
+    assert patch.is_empty
+    assert len(patch) == 0
+
+
+def test_modified_room_only():
+    old_model = _model()
+    new_model = old_model.duplicate()
+    new_model.rooms[2].properties.ph.specific_heat_capacity_wh_m2k = 132
+
+    patch = old_model.properties.ph.diff(new_model.properties.ph)
+    assert list(patch.modified) == ["rooms"]
+    assert list(patch.modified["rooms"]) == ["Room_2"]
+    assert list(patch.modified["rooms"]["Room_2"]) == ["ph"]
+    assert not patch.added and not patch.removed
+
+    old_model.properties.ph.apply_patch(json.loads(json.dumps(patch.to_dict())))
+    assert old_model.rooms[2].properties.ph.specific_heat_capacity_wh_m2k == 132
+    assert ph_object_dicts(old_model) == ph_object_dicts(new_model)
+
+    # -- The Rooms still share the one BldgSegment
+    assert old_model.rooms[2].properties.ph.ph_bldg_segment is old_model.rooms[0].properties.ph.ph_bldg_segment
+
+
+def test_modified_shared_objects():
+    old_model = _model()
+    new_model = old_model.duplicate()
+    new_model.rooms[0].properties.ph.ph_bldg_segment.num_floor_levels = 7
+    new_model.rooms[0].properties.ph_hvac.ventilation_system.ventilation_unit.sensible_heat_recovery = 0.9
+    people = new_model.rooms[0].properties.energy.people.duplicate()  # -- Loads are shared by Model.duplicate
+    people.properties.ph.number_bedrooms = 3
+    for room in new_model.rooms:
+        room.properties.energy.people = people
+
+    patch = PhModelPatch.from_models(old_model, new_model)
+    assert sorted(patch.modified) == ["bldg_segments", "people", "ventilation_systems"]
+    assert len(patch) == 3
+
+    patch.apply(old_model)
+    assert ph_object_dicts(old_model) == ph_object_dicts(new_model)
+
+    segments = {id(rm.properties.ph.ph_bldg_segment) for rm in old_model.rooms}
+    systems = {id(rm.properties.ph_hvac.ventilation_system) for rm in old_model.rooms}
+    assert len(segments) == 1 and len(systems) == 1
+    assert old_model.rooms[3].properties.ph_hvac.ventilation_system.ventilation_unit.sensible_heat_recovery == 0.9
+
+
+def test_added_and_removed_rooms():
+    old_model = _model()
+    new_model = old_model.duplicate()
+    new_model.remove_rooms(["Room_1"])
+    new_room = Room.from_box("Room_9", 5, 5, 3, origin=Point3D(50, 0, 0))
+    new_room.properties.ph.ph_bldg_segment = new_model.rooms[0].properties.ph.ph_bldg_segment
+    new_model.add_room(new_room)
+
+    patch = PhModelPatch.from_models(old_model, new_model)
+    assert patch.removed == {"rooms": ["Room_1"]}
+    assert "room" in patch.added["rooms"]["Room_9"]
+
+    patch.apply(old_model)
+    assert sorted(rm.identifier for rm in old_model.rooms) == ["Room_0", "Room_2", "Room_3", "Room_9"]
+    assert ph_object_dicts(old_model)["rooms"] == ph_object_dicts(new_model)["rooms"]
+    assert old_model.rooms[-1].properties.ph.ph_bldg_segment is old_model.rooms[0].properties.ph.ph_bldg_segment
+
+
+def test_patch_from_dict_type_error():
+    with pytest.raises(ValueError):
+        PhModelPatch.from_dict({"type": "Model"})
+
+
+def test_added_room_without_room_dict():
+    patch = PhModelPatch.from_dict({"type": "PhModelPatch", "added": {"rooms": {"Room_9": {"ph": {}}}}})
+    with pytest.raises(ValueError):
+        patch.apply(_model())
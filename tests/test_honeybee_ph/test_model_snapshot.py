@@ -0,0 +1,87 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee_energy.load.people import People
+from ladybug_geometry.geometry3d.pointvector import Point3D
+
+from honeybee_energy_ph.properties.load.people import PhDwellings
+from honeybee_ph.model_snapshot import FrozenDict, PhModelSnapshot
+from honeybee_ph.space import Space
+from honeybee_phhvac.hot_water_system import PhHotWaterSystem
+
+
+def _model():
+    dwelling = PhDwellings(1)
+    hw_system = PhHotWaterSystem()
+    rooms = []
+    for i in range(3):
+        room = Room.from_box("Room_{}".format(i), 5, 5, 3, origin=Point3D(i * 5, 0, 0))
+        room.properties.ph.add_new_space(Space.from_room(room, 2.5))
+        if i < 2:
+            people = People("People_{}".format(i), 0.05)
+            people.properties.ph.dwellings = dwelling
+            people.properties.ph.number_bedrooms = 2
+            room.properties.energy.people = people
+            room.properties.ph_hvac.set_hot_water_system(hw_system)
+        rooms.append(room)
+    return Model("SnapshotModel", rooms=rooms)
+
+
+def test_freeze_model():
+    model = _model()
+    snapshot = model.properties.ph.freeze()
+
+    assert isinstance(snapshot, PhModelSnapshot)
+    assert [rm.identifier for rm in snapshot.rooms] == ["Room_0", "Room_1", "Room_2"]
+    assert snapshot.total_floor_area == pytest.approx(75.0)
+    assert snapshot.total_weighted_floor_area == pytest.approx(sum(sp.weighted_floor_area for sp in snapshot.spaces))
+    assert snapshot.dwellings == (("Room_0", "Room_1"), ("Room_2",))
+    assert snapshot.total_dwelling_count == 1
+    assert snapshot.get_room("Room_1").number_bedrooms == 2
+    assert snapshot.get_room("Room_9") is None
+    assert sorted(snapshot.bldg_segments.values()) == [("Room_0",), ("Room_1",), ("Room_2",)]
+
+    (hw_snapshot,) = snapshot.hot_water_systems.values()
+    assert hw_snapshot.room_ids == ("Room_0", "Room_1")
+    assert hw_snapshot.total_distribution_pipe_length == 0
+
+
+def test_snapshot_is_immutable():
+    snapshot = _model().properties.ph.freeze()
+
+    with pytest.raises(AttributeError):
+        snapshot.rooms = ()
+    with pytest.raises(TypeError):
+        snapshot.bldg_segments["new"] = ()
+    with pytest.raises(TypeError):
+        snapshot.hot_water_systems.update({})
+    assert copy.deepcopy(snapshot) == snapshot
+    assert hash(snapshot) == hash(copy.copy(snapshot))
+
+
+def test_snapshot_does_not_change_with_model():
+    model = _model()
+    snapshot = model.properties.ph.freeze()
+    model.remove_rooms(["Room_2"])
+
+    assert len(snapshot.rooms) == 3
+    assert len(model.properties.ph.freeze().rooms) == 2
+
+
+def test_snapshot_shared_across_threads():
+    snapshot = _model().properties.ph.freeze()
+    with ThreadPoolExecutor(4) as pool:
+        areas = list(pool.map(lambda s: s.total_weighted_floor_area, [snapshot] * 16))
+    assert len(set(areas)) == 1
+
+
+def test_frozen_dict_pickle():
+    import pickle
+
+    d = FrozenDict({"a": 1})
+    d2 = pickle.loads(pickle.dumps(d))
+    assert d2 == d and isinstance(d2, FrozenDict)
@@ -0,0 +1,95 @@
+from honeybee.model import Model
+from honeybee.room import Room
+from ladybug_geometry.geometry3d import Face3D, Point3D
+
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_ph.parallel_load import ParallelLoad, build_room_ph_objects
+from honeybee_ph.space import Space, SpaceFloor, SpaceFloorSegment, SpaceVolume
+
+NUM_ROOMS = 12
+NUM_BLDG_SEGMENTS = 2
+SPACES_PER_ROOM = 2
+
+
+def _add_spaces(_room, _origin):
+    """Split the room's 4m x 4m floor into strips and add a PH-Space for each."""
+    strip_width = 4.0 / SPACES_PER_ROOM
+    for i in range(SPACES_PER_ROOM):
+        x = _origin.x + i * strip_width
+        geometry = Face3D(
+            [
+                Point3D(x, _origin.y, _origin.z),
+                Point3D(x + strip_width, _origin.y, _origin.z),
+                Point3D(x + strip_width, _origin.y + 4.0, _origin.z),
+                Point3D(x, _origin.y + 4.0, _origin.z),
+            ]
+        )
+        floor_segment = SpaceFloorSegment()
+        floor_segment.geometry = geometry
+        floor = SpaceFloor()
+        floor.geometry = geometry
+        floor.add_floor_segment(floor_segment)
+        volume = SpaceVolume()
+        volume.floor = floor
+        volume.avg_ceiling_height = 2.5
+
+        space = Space(_room)
+        space.name = "{}_Space_{}".format(_room.display_name, i)
+        space.add_new_volumes([volume])
+        _room.properties.ph.add_new_space(space)
+
+
+def _model():
+    """Return a Model whose Rooms each have PH-Spaces and share the Model's BldgSegments."""
+    segments = [BldgSegment() for _ in range(NUM_BLDG_SEGMENTS)]
+    rooms = []
+    for i in range(NUM_ROOMS):
+        origin = Point3D(i * 4.0, 0, 0)
+        room = Room.from_box("Room_{}".format(i), 4.0, 4.0, 3.0, origin=origin)
+        room.properties.ph.ph_bldg_segment = segments[i % NUM_BLDG_SEGMENTS]
+        _add_spaces(room, origin)
+        rooms.append(room)
+    return Model("ParallelLoadModel", rooms=rooms, tolerance=0.01, angle_tolerance=1.0)
+
+
+def test_parallel_load_matches_serial_load():
+    model_dict = _model().to_dict()
+
+    serial_model = Model.from_dict(model_dict)
+    with ParallelLoad(processes=2, chunk_size=5):
+        parallel_model = Model.from_dict(model_dict)
+
+    assert parallel_model.to_dict() == serial_model.to_dict()
+    for room in parallel_model.rooms:
+        assert room.properties.ph.spaces
+        for sp in room.properties.ph.spaces:
+            assert sp.host is room
+            assert sp.properties.host is sp
+
+    # -- Rooms still share the Model's BldgSegments
+    segments = {id(rm.properties.ph.ph_bldg_segment) for rm in parallel_model.rooms}
+    assert len(segments) == NUM_BLDG_SEGMENTS
+
+
+def test_parallel_load_single_chunk_is_serial():
+    settings = ParallelLoad(processes=2, chunk_size=100)
+    assert settings.build_room_ph_objects([{"spaces": [], "ph_foundations": []}]) is None
+    assert ParallelLoad(processes=1).build_room_ph_objects([None] * 200) is None
+
+
+def test_parallel_load_context_manager():
+    assert ParallelLoad.active() is None
+    with ParallelLoad(processes=2) as settings:
+        assert ParallelLoad.active() is settings
+    assert ParallelLoad.active() is None
+
+
+def test_build_room_ph_objects():
+    model = _model()
+    room = model.rooms[0]
+    spaces, foundations = build_room_ph_objects(room.properties.ph.to_dict(abridged=True)["ph"])
+
+    assert [sp.to_dict() for sp in spaces] == [sp.to_dict() for sp in room.properties.ph.spaces]
+    assert all(sp.host is None for sp in spaces)
+    assert foundations == []
+    assert build_room_ph_objects(None) is None
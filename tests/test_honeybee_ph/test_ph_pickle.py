@@ -0,0 +1,95 @@
+import pickle
+
+from benchmarks import generators
+from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge
+from honeybee_ph import ph_pickle
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_ph.phi import PHPPSettings10
+from honeybee_ph_utils.stable_hash import STABLE_HASH_ATTR
+from ladybug_geometry.geometry3d import LineSegment3D, Point3D
+
+SIZE = generators.ModelSize(
+    rooms=6,
+    stories=2,
+    spaces_per_room=2,
+    bldg_segments=2,
+    thermal_bridges_per_segment=2,
+    apertures_per_wall=1,
+    nonres_room_every=3,
+    dhw_branches=2,
+    dhw_twigs=2,
+    dhw_segments=2,
+    duct_segments=2,
+)
+
+
+def test_round_trip_keeps_shared_systems_and_dwellings():
+    model = generators.synthetic_model(SIZE)
+    room_props = [
+        (rm.properties.ph, rm.properties.ph_hvac, rm.properties.energy.people.properties.ph) for rm in model.rooms
+    ]
+
+    new_props = ph_pickle.loads(ph_pickle.dumps(room_props), model)
+
+    for (ph, ph_hvac, people_ph), (new_ph, new_ph_hvac, new_people_ph) in zip(room_props, new_props):
+        assert new_ph.to_dict() == ph.to_dict()
+        assert new_ph_hvac.to_dict() == ph_hvac.to_dict()
+        assert new_people_ph.to_dict() == people_ph.to_dict()
+        # -- The hosts are references to the Model's objects, not copies
+        assert new_ph.host is ph.host
+        assert new_people_ph._host is people_ph._host
+
+    def _count(_objs):
+        return len({id(o) for o in _objs})
+
+    assert _count(p[1].ventilation_system for p in new_props) == _count(p[1].ventilation_system for p in room_props)
+    assert _count(p[1].hot_water_system for p in new_props) == _count(p[1].hot_water_system for p in room_props)
+    assert _count(p[2].dwellings for p in new_props) == _count(p[2].dwellings for p in room_props)
+    assert _count(p[0].ph_bldg_segment for p in new_props) == SIZE.bldg_segments
+    assert new_props[0][1].ventilation_system is not room_props[0][1].ventilation_system
+
+
+def test_loads_without_hosts():
+    model = generators.synthetic_model(SIZE)
+    new_ph = ph_pickle.loads(ph_pickle.dumps(model.rooms[0].properties.ph))
+    assert new_ph.host is None
+    assert new_ph.ph_bldg_segment.to_dict() == model.rooms[0].properties.ph.ph_bldg_segment.to_dict()
+
+
+def test_host_lookup_from_objects():
+    model = generators.synthetic_model(SIZE)
+    room = model.rooms[0]
+    lookup = ph_pickle.host_lookup([room])
+    assert lookup == {("Room", room.identifier): room}
+    assert ph_pickle.host_key(room.properties.ph) is None
+
+
+def test_phpp_settings_pickle():
+    settings = PHPPSettings10()
+    settings.certification_type = "21-ENERPHIT (COMPONENT METHOD)"
+    settings.tfa_override = 120.0
+
+    new_settings = pickle.loads(pickle.dumps(settings))
+    assert new_settings.certification_type.value == "21-ENERPHIT (COMPONENT METHOD)"
+    assert new_settings.to_dict() == settings.to_dict()
+
+
+def test_pickle_drops_stable_hash_memo():
+    seg = BldgSegment()
+    hash_ = seg.stable_hash()
+    assert STABLE_HASH_ATTR in seg.__dict__
+
+    new_seg = pickle.loads(pickle.dumps(seg))
+    assert STABLE_HASH_ATTR not in new_seg.__dict__
+    assert new_seg.stable_hash() == hash_
+
+
+def test_thermal_bridge_lengths_are_not_re_measured():
+    seg = BldgSegment()
+    tb = PhThermalBridge("tb", LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(10, 0, 0)))
+    seg.add_new_thermal_bridge(tb)
+
+    new_seg = pickle.loads(pickle.dumps(seg))
+    assert new_seg.thermal_bridges.lengths() == seg.thermal_bridges.lengths()
+    assert new_seg.thermal_bridges.total_length == seg.thermal_bridges.total_length
+    assert new_seg.thermal_bridges._totals is not seg.thermal_bridges._totals
@@ -1,3 +1,8 @@
+from honeybee.model import Model
+from honeybee.room import Room
+from ladybug_geometry.geometry3d import Point3D, Vector3D
+
+from honeybee_ph.bldg_segment import BldgSegment, BldgSegmentRegistry
 from honeybee_ph.properties.model import ModelPhProperties
 from honeybee_ph.team import ProjectTeam
 
@@ -56,3 +61,78 @@ def test_ModelPhProperties_load_properties_from_dict():
     bldg_segments, team = ModelPhProperties.load_properties_from_dict(d2)
     assert bldg_segments == {}
     assert team != None
+
+
+def _model_with_shared_segment():
+    seg = BldgSegment()
+    rooms = []
+    for i in range(3):
+        room = Room.from_box("Room_{}".format(i), 5, 5, 3, origin=Point3D(i * 5, 0, 0))
+        room.properties.ph.ph_bldg_segment = seg
+        rooms.append(room)
+    return Model("SegmentModel", rooms=rooms), seg
+
+
+def test_ModelPhProperties_room_duplicate_shares_bldg_segment():
+    model, seg = _model_with_shared_segment()
+    assert model.rooms[0].duplicate().properties.ph.ph_bldg_segment is seg
+    new_prop = model.rooms[0].properties.ph.duplicate(duplicate_bldg_segment=True)
+    assert new_prop.ph_bldg_segment is not seg
+    assert new_prop.ph_bldg_segment.identifier == seg.identifier
+
+
+def test_ModelPhProperties_model_duplicate_owns_bldg_segment():
+    model, seg = _model_with_shared_segment()
+    new_model = model.duplicate()
+
+    new_segs = [rm.properties.ph.ph_bldg_segment for rm in new_model.rooms]
+    assert all(s is new_segs[0] for s in new_segs)
+    assert new_segs[0] is not seg
+    assert new_segs[0].to_dict() == seg.to_dict()
+
+
+def test_ModelPhProperties_intern_bldg_segments():
+    model, seg = _model_with_shared_segment()
+    model.rooms[1].properties.ph.ph_bldg_segment = seg.duplicate()
+
+    registry = model.properties.ph.intern_bldg_segments()
+    assert len(registry) == 1
+    assert all(rm.properties.ph.ph_bldg_segment is seg for rm in model.rooms)
+
+
+def test_ModelPhProperties_same_identifier_different_segments():
+    model, seg = _model_with_shared_segment()
+    other_seg = seg.duplicate()
+    other_seg.display_name = "Other Segment"
+    model.rooms[2].properties.ph.ph_bldg_segment = other_seg
+
+    # -- Serializing keeps the same (first) BldgSegment as interning
+    seg_dicts = model.properties.ph._get_bldg_segment_dicts()
+    assert seg_dicts == [seg.to_dict()]
+
+    model.properties.ph.intern_bldg_segments()
+    assert all(rm.properties.ph.ph_bldg_segment is seg for rm in model.rooms)
+    assert model.properties.ph._get_bldg_segment_dicts() == seg_dicts
+
+
+def test_ModelPhProperties_transform_keeps_bldg_segment_shared():
+    model, seg = _model_with_shared_segment()
+    model.move(Vector3D(1, 0, 0))
+
+    new_segs = [rm.properties.ph.ph_bldg_segment for rm in model.rooms]
+    assert all(s is new_segs[0] for s in new_segs)
+
+
+def test_ModelPhProperties_room_from_dict_in_registry():
+    model, seg = _model_with_shared_segment()
+    room_dicts = [rm.to_dict() for rm in model.rooms]
+
+    with BldgSegmentRegistry():
+        rooms = [Room.from_dict(d) for d in room_dicts]
+    new_segs = [rm.properties.ph.ph_bldg_segment for rm in rooms]
+    assert all(s is new_segs[0] for s in new_segs)
+    assert new_segs[0].to_dict() == seg.to_dict()
+
+    # -- Outside a registry each Room gets its own BldgSegment
+    rooms = [Room.from_dict(d) for d in room_dicts]
+    assert rooms[0].properties.ph.ph_bldg_segment is not rooms[1].properties.ph.ph_bldg_segment
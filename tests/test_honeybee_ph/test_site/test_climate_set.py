@@ -0,0 +1,100 @@
+import csv
+import json
+
+import pytest
+
+from honeybee_ph.climate_set import CSV_COLUMNS, HOURS_PER_MONTH, ClimateSet
+from honeybee_ph.site import (
+    Climate,
+    Climate_MonthlyRadiationCollection,
+    Climate_MonthlyTempCollection,
+    Climate_MonthlyValueSet,
+    ClimateProvenance,
+)
+from tests.test_honeybee_ph.test_site.epw_fixture import write_synthetic_epw
+
+
+def _climate(_name, _air_temps, _south):
+    temps = Climate_MonthlyTempCollection(_air=Climate_MonthlyValueSet(_air_temps))
+    radiation = Climate_MonthlyRadiationCollection(_south=Climate_MonthlyValueSet(_south))
+    provenance = ClimateProvenance(source_type="user_defined", source_uri="{}.epw".format(_name))
+    return Climate(_name, _monthly_temps=temps, _monthly_radiation=radiation, _provenance=provenance)
+
+
+@pytest.fixture
+def climates():
+    cold = _climate("Cold", [-5.0] * 3 + [10.0] * 6 + [-5.0] * 3, [20.0] * 12)
+    warm = _climate("Warm", [15.0] * 6 + [30.0] * 6, [40.0] * 6 + [10.0] * 6)
+    mild = _climate("Mild", [float(m) for m in range(12)], [30.0] * 12)
+    return ClimateSet([cold, warm, mild])
+
+
+def test_columns(climates):
+    assert len(climates) == 3
+    assert climates.names == ["Cold", "Warm", "Mild"]
+    assert climates.monthly_column("air_temps", 12) == [-5.0, 30.0, 11.0]
+    assert climates.monthly_values("south")[1] == [40.0] * 6 + [10.0] * 6
+    assert climates.annual_totals("south") == [240.0, 300.0, 360.0]
+    assert climates.annual_means("air_temps")[2] == pytest.approx(5.5)
+    with pytest.raises(ValueError):
+        climates.annual_totals("not_a_field")
+
+
+def test_degree_hours(climates):
+    heating = climates.heating_degree_hours(20.0)
+    expected_cold = sum((20.0 - t) * h for t, h in zip([-5.0] * 3 + [10.0] * 6 + [-5.0] * 3, HOURS_PER_MONTH))
+    assert heating[0] == pytest.approx(expected_cold)
+    assert heating[1] == pytest.approx(5.0 * sum(HOURS_PER_MONTH[:6]))
+    assert climates.cooling_degree_hours(25.0) == pytest.approx([0.0, 5.0 * sum(HOURS_PER_MONTH[6:]), 0.0])
+
+
+def test_peak_months_and_ranking(climates):
+    assert climates.peak_months("air_temps") == [4, 7, 12]
+    assert climates.peak_months("air_temps", _lowest=True) == [1, 1, 1]
+
+    ranking = climates.rank_by_radiation("south")
+    assert [(c.display_name, total) for c, total in ranking] == [("Mild", 360.0), ("Warm", 300.0), ("Cold", 240.0)]
+    summer = climates.rank_by_radiation("south", _months=[1, 2, 3])
+    assert [c.display_name for c, _ in summer] == ["Warm", "Mild", "Cold"]
+    with pytest.raises(ValueError):
+        climates.rank_by_radiation("air_temps")
+
+
+def test_refresh_after_edit(climates):
+    climates[0].monthly_radiation.south.values = [0.0] * 12
+    assert climates.annual_totals("south")[0] == 240.0
+    climates.refresh()
+    assert climates.annual_totals("south")[0] == 0.0
+
+
+def test_export_csv_and_json(climates, tmp_path):
+    with open(str(climates.to_csv(str(tmp_path / "climates.csv")))) as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == CSV_COLUMNS
+    assert len(rows) == 1 + 3 * 9
+    south_row = [r for r in rows if r[0] == "Warm" and r[2] == "south"][0]
+    assert float(south_row[CSV_COLUMNS.index("annual")]) == 300.0
+    assert south_row[CSV_COLUMNS.index("source_uri")] == "Warm.epw"
+    # -- Temperatures are averaged, not totaled
+    air_row = [r for r in rows if r[0] == "Mild" and r[2] == "air_temps"][0]
+    assert float(air_row[CSV_COLUMNS.index("annual")]) == pytest.approx(5.5)
+
+    with open(str(climates.to_json(str(tmp_path / "climates.json")))) as f:
+        d = json.load(f)
+    assert d["names"] == ["Cold", "Warm", "Mild"]
+    assert d["monthly"]["air_temps"][2] == [float(m) for m in range(12)]
+    assert d["provenance"][0]["source_type"] == "user_defined"
+
+
+def test_from_epw_files(tmp_path):
+    paths = [
+        str(write_synthetic_epw(tmp_path / "a.epw")),
+        str(write_synthetic_epw(tmp_path / "b.epw", monthly_means=[float(m) + 10.0 for m in range(1, 13)])),
+    ]
+
+    climates = ClimateSet.from_epw_files(paths)
+
+    assert len(climates) == 2
+    assert climates.annual_means("air_temps") == pytest.approx([6.5, 16.5])
+    assert climates.heating_degree_hours()[0] > climates.heating_degree_hours()[1]
+    assert [c.provenance.source_type for c in climates] == ["epw_derived", "epw_derived"]
@@ -6,6 +6,7 @@ from ladybug.epw import EPW
 from ladybug.skymodel import calc_horizontal_infrared, calc_sky_temperature
 from ladybug.wea import Wea
 
+from honeybee_ph import _epw
 from honeybee_ph._epw import convert_epw
 from tests.test_honeybee_ph.test_site.epw_fixture import write_synthetic_epw
 
@@ -471,3 +472,82 @@ def test_complete_monthly_outputs_have_twelve_finite_values(tmp_path):
         values = getattr(result, output_name)
         assert len(values) == 12
         assert all(math.isfinite(value) for value in values)
+
+
+BACKENDS = [False, pytest.param(True, marks=pytest.mark.skipif(_epw.np is None, reason="NumPy is not installed"))]
+
+
+def _datetime_monthly_means(collection):
+    """The monthly means, grouped by the DateTime of each hour."""
+    sums = [0.0] * 12
+    counts = [0] * 12
+    for value, dt in zip(collection.values, collection.datetimes):
+        sums[dt.month - 1] += value
+        counts[dt.month - 1] += 1
+    return [total / count for total, count in zip(sums, counts)]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("is_leap_year", [False, True])
+def test_hour_index_statistics_match_datetime_grouping(tmp_path, use_numpy, is_leap_year):
+    monthly_means = [30.0, 29.0, 5.0, 4.0, 3.0, 2.0, 1.0, 2.0, 3.0, 4.0, 5.0, 28.0]
+    daily_ranges = [2.0, 4.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 12.0]
+    epw_path = write_synthetic_epw(
+        tmp_path / "indexed.epw",
+        monthly_means=monthly_means,
+        daily_ranges=daily_ranges,
+        horizontal_infrared=None,
+        is_leap_year=is_leap_year,
+        field_overrides={"horizontal_infrared_radiation_intensity": {100: 310.0, 5000: 250.0}},
+    )
+
+    result = convert_epw(str(epw_path), use_numpy=use_numpy)
+
+    epw = EPW(str(epw_path))
+    horizontal_ir = [
+        calc_horizontal_infrared(sky, db, dp) if ir >= 9999 else ir
+        for ir, sky, db, dp in zip(
+            epw.horizontal_infrared_radiation_intensity.values,
+            epw.opaque_sky_cover.values,
+            epw.dry_bulb_temperature.values,
+            epw.dew_point_temperature.values,
+        )
+    ]
+    epw.horizontal_infrared_radiation_intensity.values = horizontal_ir
+    february_days = 29 if is_leap_year else 28
+    assert result.issues == []
+    assert result.monthly_air_temperatures == pytest.approx(_datetime_monthly_means(epw.dry_bulb_temperature))
+    assert result.monthly_dewpoint_temperatures == pytest.approx(_datetime_monthly_means(epw.dew_point_temperature))
+    assert result.monthly_sky_temperatures == pytest.approx(_datetime_monthly_means(epw.sky_temperature))
+    assert result.monthly_global_radiation == pytest.approx(_monthly_totals_kwh(epw.global_horizontal_radiation))
+    assert result.summer_daily_temperature_swing == pytest.approx(
+        ((31 * 2.0) + (february_days * 4.0) + (31 * 12.0)) / (62 + february_days)
+    )
+
+
+@pytest.mark.skipif(_epw.np is None, reason="NumPy is not installed")
+def test_numpy_backend_reports_the_same_issues(tmp_path):
+    epw_path = write_synthetic_epw(
+        tmp_path / "issues.epw",
+        horizontal_infrared=None,
+        field_overrides={
+            "opaque_sky_cover": {4: 99, 20: 99},
+            "horizontal_infrared_radiation_intensity": {10: -1.0},
+        },
+    )
+
+    numpy_result = convert_epw(str(epw_path), use_numpy=True)
+    python_result = convert_epw(str(epw_path), use_numpy=False)
+
+    assert len(numpy_result.issues) == 3
+    assert numpy_result.issues == python_result.issues
+    assert numpy_result.monthly_sky_temperatures is None
+
+
+def test_use_numpy_requires_numpy(tmp_path, monkeypatch):
+    epw_path = write_synthetic_epw(tmp_path / "no-numpy.epw")
+    monkeypatch.setattr(_epw, "np", None)
+
+    with pytest.raises(ImportError):
+        convert_epw(str(epw_path), use_numpy=True)
+    assert convert_epw(str(epw_path)).issues == []
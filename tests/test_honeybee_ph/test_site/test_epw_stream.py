@@ -0,0 +1,169 @@
+import pytest
+
+from honeybee_ph._epw import convert_epw
+from honeybee_ph._epw_stream import MAX_ISSUES_PER_FIELD, convert_epw_stream
+from honeybee_ph.site import Site
+from tests.test_honeybee_ph.test_site.epw_fixture import write_synthetic_epw
+
+MONTHLY_FIELDS = (
+    "monthly_air_temperatures",
+    "monthly_dewpoint_temperatures",
+    "monthly_sky_temperatures",
+    "monthly_ground_temperatures",
+    "monthly_north_radiation",
+    "monthly_east_radiation",
+    "monthly_south_radiation",
+    "monthly_west_radiation",
+    "monthly_global_radiation",
+)
+
+
+def _read_lines(epw_path):
+    with open(str(epw_path)) as f:
+        return f.read().splitlines()
+
+
+def _write_lines(epw_path, lines):
+    with open(str(epw_path), "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return epw_path
+
+
+def _sub_hourly_copy(hourly_path, epw_path, records_per_hour):
+    """Repeat each hourly record, with the minutes of each sub-hourly record."""
+    lines = _read_lines(hourly_path)
+    header, records = lines[:8], lines[8:]
+    data_periods = header[7].split(",")
+    data_periods[2] = str(records_per_hour)
+    header[7] = ",".join(data_periods)
+    sub_hourly = []
+    for record in records:
+        fields = record.split(",")
+        for i in range(1, records_per_hour + 1):
+            fields[4] = str(i * 60 // records_per_hour)
+            sub_hourly.append(",".join(fields))
+    return _write_lines(epw_path, header + sub_hourly)
+
+
+def _multi_year_copy(hourly_path, epw_path, years):
+    """Repeat all the hourly records once for each year."""
+    lines = _read_lines(hourly_path)
+    records = []
+    for year in years:
+        records.extend(str(year) + record[4:] for record in lines[8:])
+    return _write_lines(epw_path, lines[:8] + records)
+
+
+def _assert_same_monthly_values(result, expected, temperature_tolerance=None, radiation_tolerance=None):
+    for field_name in MONTHLY_FIELDS:
+        if "temperatures" in field_name:
+            expected_values = pytest.approx(getattr(expected, field_name), abs=temperature_tolerance)
+        else:
+            expected_values = pytest.approx(getattr(expected, field_name), rel=radiation_tolerance)
+        assert getattr(result, field_name) == expected_values, field_name
+    assert result.average_wind_speed == pytest.approx(expected.average_wind_speed)
+    assert result.summer_daily_temperature_swing == pytest.approx(
+        expected.summer_daily_temperature_swing, abs=temperature_tolerance
+    )
+
+
+@pytest.mark.parametrize("diffuse_model", ["isotropic", "anisotropic"])
+def test_stream_matches_ladybug_conversion_of_hourly_file(tmp_path, diffuse_model):
+    epw_path = write_synthetic_epw(
+        tmp_path / "hourly.epw",
+        monthly_means=[20.0 - abs(6 - m) * 3.0 for m in range(12)],
+        daily_ranges=[float(m) for m in range(1, 13)],
+        horizontal_infrared=None,
+    )
+
+    expected = convert_epw(str(epw_path), diffuse_model=diffuse_model)
+    result = convert_epw_stream(str(epw_path), diffuse_model=diffuse_model)
+
+    assert result.issues == []
+    _assert_same_monthly_values(result, expected)
+    assert result.location_name == expected.location_name
+    assert result.source_checksum == expected.source_checksum
+    assert result.provenance.monthly_data_available is True
+    assert result.provenance.conversion_method == "streaming_epw_monthly"
+    assert result.provenance.assumptions["source_timestep_minutes"] == 60
+    assert result.provenance.assumptions["source_record_count"] == 8760
+
+
+def test_sub_hourly_records_give_the_same_monthly_values(tmp_path):
+    hourly_path = write_synthetic_epw(tmp_path / "hourly.epw")
+    epw_path = _sub_hourly_copy(hourly_path, tmp_path / "quarter_hourly.epw", 4)
+
+    expected = convert_epw_stream(str(hourly_path))
+    result = convert_epw_stream(str(epw_path))
+
+    assert result.issues == []
+    # -- The 24:00 readings now count for only 1 of the 4 readings in their hour, and
+    # -- the vertical radiation uses the sun position at the middle of each 15 minutes.
+    _assert_same_monthly_values(result, expected, temperature_tolerance=0.15, radiation_tolerance=0.02)
+    assert result.monthly_global_radiation == expected.monthly_global_radiation
+    assert result.provenance.assumptions["source_timestep_minutes"] == 15
+    assert result.provenance.assumptions["source_record_count"] == 8760 * 4
+    # -- Ladybug can only load hourly files
+    assert convert_epw(str(epw_path)).issues
+
+
+def test_multi_year_radiation_totals_are_averaged_per_year(tmp_path):
+    hourly_path = write_synthetic_epw(tmp_path / "hourly.epw")
+    epw_path = _multi_year_copy(hourly_path, tmp_path / "three_years.epw", [2017, 2018, 2019])
+
+    expected = convert_epw_stream(str(hourly_path))
+    result = convert_epw_stream(str(epw_path))
+
+    assert result.issues == []
+    _assert_same_monthly_values(result, expected)
+    assert result.monthly_global_radiation[0] == pytest.approx(100.0 * 744 / 1000.0)
+    assert result.provenance.assumptions["source_years"] == [2017, 2018, 2019]
+
+
+def test_invalid_records_are_reported_and_capped(tmp_path):
+    overrides = {"dry_bulb_temperature": {i: 99.9 for i in range(MAX_ISSUES_PER_FIELD + 5)}}
+    epw_path = write_synthetic_epw(tmp_path / "missing.epw", field_overrides=overrides)
+    lines = _read_lines(epw_path)
+    lines[8] = "2017,1,1"
+    _write_lines(epw_path, lines)
+
+    result = convert_epw_stream(str(epw_path))
+
+    assert result.monthly_air_temperatures is None
+    assert result.summer_daily_temperature_swing is None
+    assert result.monthly_sky_temperatures is None
+    assert result.monthly_global_radiation is not None
+    assert result.provenance.monthly_data_available is False
+    dry_bulb_issues = [issue for issue in result.issues if "dry_bulb_temperature" in issue]
+    assert len(dry_bulb_issues) == MAX_ISSUES_PER_FIELD + 1
+    assert "dry_bulb_temperature record 2: observed missing sentinel 99.9." in dry_bulb_issues[0]
+    assert dry_bulb_issues[-1].endswith("dry_bulb_temperature: 4 more issues not listed.")
+    assert any(
+        issue.endswith(": record 1: expected a valid year, month, day, hour and minute; observed '2017,1,1'.")
+        for issue in result.issues
+    )
+    assert not any("record record" in issue for issue in result.issues)
+
+
+def test_bad_data_periods_header(tmp_path):
+    epw_path = write_synthetic_epw(tmp_path / "bad_header.epw")
+    lines = _read_lines(epw_path)
+    lines[7] = "DATA PERIODS,1,7,Data,Sunday, 1/ 1,12/31"
+    _write_lines(epw_path, lines)
+
+    result = convert_epw_stream(str(epw_path))
+
+    assert len(result.issues) == 1
+    assert "header.data_periods" in result.issues[0]
+
+
+def test_site_from_epw_stream(tmp_path):
+    hourly_path = write_synthetic_epw(tmp_path / "hourly.epw")
+    epw_path = _sub_hourly_copy(hourly_path, tmp_path / "half_hourly.epw", 2)
+
+    site = Site.from_epw(str(epw_path), stream=True)
+
+    assert site.climate.monthly_temps.air_temps.values == pytest.approx(list(range(1, 13)), abs=0.05)
+    assert site.climate.provenance.conversion_method == "streaming_epw_monthly"
+    with pytest.raises(ValueError):
+        Site.from_epw(str(epw_path))
@@ -105,7 +105,8 @@ def test_epw_site_survives_building_segment_and_room_property_paths(tmp_path):
     room_properties = RoomPhProperties(_host=None)
     room_properties.ph_bldg_segment = segment
     room_round_trip = RoomPhProperties.from_dict(room_properties.to_dict()["ph"], host=None)
-    room_duplicate = room_properties.duplicate()
+    room_duplicate = room_properties.duplicate(duplicate_bldg_segment=True)
+    assert room_properties.duplicate().ph_bldg_segment is segment
 
     for candidate in (
         segment_round_trip.site,
@@ -550,10 +550,17 @@ def test_room_property_default_site_graphs_are_independent():
         assert _resolve(_room_site(left), path) is not _resolve(_room_site(right), path)
 
 
-def test_room_duplicate_owns_complete_site_graph():
+def test_room_duplicate_shares_bldg_segment_site():
     room, original_site = _room_with_populated_site()
 
-    duplicate_site = _room_site(room.duplicate())
+    assert _room_site(room.duplicate()) is original_site
+
+
+def test_room_duplicate_with_bldg_segment_owns_complete_site_graph():
+    room, original_site = _room_with_populated_site()
+
+    new_prop = room.properties.ph.duplicate(duplicate_bldg_segment=True)
+    duplicate_site = new_prop.ph_bldg_segment.site
 
     assert duplicate_site.to_dict() == original_site.to_dict()
     for path in SITE_MUTABLE_PATHS:
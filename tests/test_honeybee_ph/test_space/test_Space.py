@@ -1,4 +1,5 @@
 import pytest
+from ladybug_geometry.geometry3d.face import Face3D
 from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
 
 from honeybee_ph import space
@@ -355,3 +356,43 @@ def test_Space_duplicate(floor_segment_geometry):
     assert new_sp.name == sp.name
     assert new_sp.number == sp.number
     assert new_sp.host == sp.host
+
+
+def test_Space_floor_segments_mesh_dict():
+    sp = space.Space()
+    volumes = []
+    for x in (0, 5):
+        flr_seg = space.SpaceFloorSegment()
+        flr_seg.geometry = Face3D([Point3D(x, 0, 0), Point3D(x + 5, 0, 0), Point3D(x + 5, 5, 0), Point3D(x, 5, 0)])
+        flr_seg.weighting_factor = 0.5
+        floor = space.SpaceFloor()
+        floor.add_floor_segment(flr_seg)
+        vol = space.SpaceVolume()
+        vol.floor = floor
+        volumes.append(vol)
+    sp.add_new_volumes(volumes)
+
+    mesh_dict = sp.floor_segments_mesh_dict()
+    assert mesh_dict["type"] == "SpaceFloorSegmentsMesh"
+    assert len(mesh_dict["vertices"]) == 6  # -- The two shared vertices are only included once
+    assert len(mesh_dict["faces"]) == 4
+    assert mesh_dict["face_segment_indices"] == [0, 0, 1, 1]
+    assert [s["identifier"] for s in mesh_dict["segments"]] == [s.identifier for s in sp.floor_segments]
+    assert mesh_dict["segments"][0]["weighted_floor_area"] == pytest.approx(12.5)
+
+    # -- Every face of every segment mesh is in the merged mesh
+    for seg_index, flr_seg in enumerate(sp.floor_segments):
+        expected = {tuple(tuple(flr_seg.mesh3d.vertices[i]) for i in f) for f in flr_seg.mesh3d.faces}
+        merged = {
+            tuple(mesh_dict["vertices"][i] for i in f)
+            for f, s in zip(mesh_dict["faces"], mesh_dict["face_segment_indices"])
+            if s == seg_index
+        }
+        assert merged == expected
+
+
+def test_Space_floor_segments_mesh_dict_empty():
+    mesh_dict = space.Space().floor_segments_mesh_dict()
+    assert mesh_dict["vertices"] == []
+    assert mesh_dict["faces"] == []
+    assert mesh_dict["segments"] == []
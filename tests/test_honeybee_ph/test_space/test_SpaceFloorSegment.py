@@ -361,3 +361,75 @@ def test_floor_segment_reflect_no_geometry():
     seg2 = seg.reflect(Vector3D(0, 1, 0), Point3D(0, 0, 0))
     assert seg.floor_area == 0
     assert seg2.floor_area == 0
+
+
+# -- Geometry Cache --
+
+
+def test_floor_segment_mesh_and_area_are_cached(floor_segment_geometry):
+    seg = space.SpaceFloorSegment()
+    seg.geometry = floor_segment_geometry.flr_segment_1
+
+    assert seg.mesh3d is seg.mesh3d
+    d1 = seg.to_dict(include_mesh=True)
+    d2 = seg.to_dict(include_mesh=True)
+    assert d1 == d2
+    assert d1["geometry"]["mesh"] == floor_segment_geometry.flr_segment_1.triangulated_mesh3d.to_dict()
+    assert d1["floor_area"] == pytest.approx(100)
+
+
+def test_floor_segment_mesh_dict_copy_is_independent(floor_segment_geometry):
+    seg = space.SpaceFloorSegment()
+    seg.geometry = floor_segment_geometry.flr_segment_1
+    expected = seg.to_dict(include_mesh=True)["geometry"]["mesh"]
+    mesh_dict = seg.to_dict(include_mesh=True)["geometry"]["mesh"]
+    mesh_dict["type"] = "Changed"
+    mesh_dict["vertices"].append("X")
+    assert seg.to_dict(include_mesh=True)["geometry"]["mesh"] == expected
+
+
+def test_floor_segment_cache_reset_by_new_geometry(floor_segment_geometry):
+    seg = space.SpaceFloorSegment()
+    seg.geometry = floor_segment_geometry.flr_segment_1
+    assert seg.floor_area == pytest.approx(100)
+
+    seg.geometry = floor_segment_geometry.flr_segment_1.scale(2)
+    assert seg.floor_area == pytest.approx(400)
+    assert seg.mesh3d.area == pytest.approx(400)
+
+    seg.geometry = None
+    assert seg.floor_area == 0
+    assert seg.mesh3d is None
+
+
+def test_floor_segment_cache_invalidated_by_transforms(floor_segment_geometry):
+    seg = space.SpaceFloorSegment()
+    seg.geometry = floor_segment_geometry.flr_segment_1
+    mesh = seg.mesh3d
+
+    moved = seg.move(Vector3D(0, 0, 5))
+    assert moved.mesh3d is not mesh
+    assert all(pt.z == pytest.approx(5) for pt in moved.mesh3d.vertices)
+
+    scaled = seg.scale(0.5)
+    assert scaled.floor_area == pytest.approx(25)
+    assert scaled.to_dict(include_mesh=True)["geometry"]["mesh"] == scaled.geometry.triangulated_mesh3d.to_dict()
+
+    rotated = seg.rotate_xy(90, Point3D(0, 0, 0))
+    assert rotated.floor_area == pytest.approx(100)
+    assert {round(pt.x, 6) for pt in rotated.mesh3d.vertices} == {0, -10}
+
+    reflected = seg.reflect(Vector3D(1, 0, 0), Point3D(0, 0, 0))
+    assert {round(pt.x, 6) for pt in reflected.mesh3d.vertices} == {0, -10}
+
+    assert seg.mesh3d is mesh
+
+
+def test_floor_segment_duplicate_keeps_cache(floor_segment_geometry):
+    seg = space.SpaceFloorSegment()
+    seg.geometry = floor_segment_geometry.flr_segment_1
+    d1 = seg.to_dict(include_mesh=True)
+
+    dup = seg.duplicate()
+    assert dup.mesh3d is seg.mesh3d
+    assert dup.to_dict(include_mesh=True) == d1
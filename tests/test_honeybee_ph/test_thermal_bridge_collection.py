@@ -0,0 +1,139 @@
+import pickle
+
+import pytest
+from ladybug_geometry.geometry3d import LineSegment3D, Point3D, Polyline3D, Vector3D
+
+from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_ph.thermal_bridge_collection import PhThermalBridgeCollection
+
+
+def _line(_length, _y=0):
+    return LineSegment3D.from_end_points(Point3D(0, _y, 0), Point3D(_length, _y, 0))
+
+
+def _tb(_identifier, _length, _psi=0.1, _group=15, _quantity=1.0, _interior_pipe=False):
+    tb = PhThermalBridge(_identifier, _line(_length))
+    tb.psi_value = _psi
+    tb.group_type = _group
+    tb.quantity = _quantity
+    tb.is_interior_pipe = _interior_pipe
+    return tb
+
+
+def _walk_totals(_tbs):
+    """The totals, the slow way."""
+    totals = {}
+    for tb in _tbs:
+        length, psi_length = totals.get(tb.group_type.value, (0.0, 0.0))
+        totals[tb.group_type.value] = (
+            length + tb.length * tb.quantity,
+            psi_length + tb.length * tb.quantity * tb.psi_value,
+        )
+    return totals
+
+
+def _assert_totals_match(_collection):
+    expected = _walk_totals(_collection.values())
+    totals = _collection.group_totals
+    assert sorted(totals) == sorted(expected)
+    for group_type, (length, psi_length) in expected.items():
+        assert totals[group_type].length == pytest.approx(length)
+        assert totals[group_type].psi_length == pytest.approx(psi_length)
+
+
+def test_group_totals_add_and_remove():
+    collection = PhThermalBridgeCollection()
+    collection.add(_tb("a", 10.0, 0.1, 15))
+    collection.add(_tb("b", 5.0, 0.2, 15, _quantity=2))
+    collection.add(_tb("c", 4.0, 0.05, 16))
+    collection.add(_tb("d", 3.0, 0.5, 15, _interior_pipe=True))
+
+    ambient = collection.get_group_totals(15)
+    assert ambient.count == 3
+    assert ambient.quantity == 4
+    assert ambient.length == pytest.approx(23.0)
+    assert ambient.psi_length == pytest.approx(1.0 + 2.0 + 1.5)
+    assert ambient.radiative_length == pytest.approx(20.0)
+    assert ambient.radiative_psi_length == pytest.approx(3.0)
+    assert collection.total_length == pytest.approx(27.0)
+    _assert_totals_match(collection)
+
+    collection.remove("b")
+    del collection["c"]
+    assert "16-PERIMETER" not in collection.group_totals
+    assert collection.get_group_totals("16-Perimeter").count == 0
+    _assert_totals_match(collection)
+
+    collection.clear()
+    assert collection.group_totals == {}
+
+
+def test_group_totals_follow_edits():
+    collection = PhThermalBridgeCollection()
+    tb = _tb("a", 10.0, 0.1, 15)
+    collection.add(tb)
+
+    tb.psi_value = 0.3
+    tb.group_type = 17
+    tb.geometry = _line(2.0)
+    assert collection.get_group_totals(17).psi_length == pytest.approx(0.6)
+    assert collection.get_group_totals(15).count == 0
+
+    # -- Replacing a thermal bridge with the same identifier
+    collection["a"] = _tb("a", 1.0, 0.1, 16)
+    _assert_totals_match(collection)
+
+
+def test_add_from_geometry():
+    collection = PhThermalBridgeCollection()
+    geometry = [_line(1.0 + i, i) for i in range(100)]
+    geometry.append(Polyline3D([Point3D(0, 0, 0), Point3D(1, 0, 0), Point3D(1, 1, 0)]))
+    new_tbs = collection.add_from_geometry(geometry, 0.02, "16-Perimeter", _quantity=2)
+
+    assert len(new_tbs) == len(collection) == 101
+    assert all(tb.group_type.value == "16-PERIMETER" for tb in collection.values())
+    assert collection.get_group_totals(16).length == pytest.approx(2 * (sum(1.0 + i for i in range(100)) + 2.0))
+    _assert_totals_match(collection)
+
+
+def test_add_from_geometry_identifiers():
+    collection = PhThermalBridgeCollection()
+    collection.add_from_geometry([_line(1.0), _line(2.0)], _identifiers=["TB_1", "TB_2"])
+    assert sorted(collection) == ["TB_1", "TB_2"]
+
+    with pytest.raises(ValueError):
+        collection.add_from_geometry([_line(1.0)], _identifiers=["TB_3", "TB_4"])
+
+
+def test_bldg_segment_thermal_bridge_totals_transform():
+    seg = BldgSegment()
+    seg.add_new_thermal_bridge(_tb("a", 10.0, 0.1, 15))
+    seg.add_new_thermal_bridge(_tb("b", 4.0, 0.2, 16))
+
+    for new_seg in (
+        seg.duplicate(),
+        seg.move(Vector3D(1, 2, 3)),
+        seg.rotate_xy(45, Point3D(0, 0, 0)),
+        seg.scale(2.0),
+        BldgSegment.from_dict(seg.to_dict()),
+    ):
+        assert isinstance(new_seg.thermal_bridges, PhThermalBridgeCollection)
+        _assert_totals_match(new_seg.thermal_bridges)
+
+    assert seg.scale(2.0).thermal_bridges.total_length == pytest.approx(28.0)
+
+
+def test_bldg_segment_thermal_bridges_setter():
+    seg = BldgSegment()
+    seg.thermal_bridges = {"a": _tb("a", 10.0)}
+    assert isinstance(seg.thermal_bridges, PhThermalBridgeCollection)
+    assert seg.thermal_bridges.total_psi_length == pytest.approx(1.0)
+
+
+def test_collection_pickle():
+    collection = PhThermalBridgeCollection()
+    collection.add(_tb("a", 10.0))
+    new_collection = pickle.loads(pickle.dumps(collection))
+    assert sorted(new_collection) == ["a"]
+    _assert_totals_match(new_collection)
@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee_energy.construction.window import WindowConstruction
+from honeybee_energy.constructionset import ConstructionSet
+from honeybee_energy.material.glazing import EnergyWindowMaterialSimpleGlazSys
+from ladybug_geometry.geometry3d.pointvector import Point3D
+
+from honeybee_energy_ph.construction.window import PhApertureInstallType, PhWindowFrame, PhWindowGlazing
+from honeybee_ph import hbjson_stream
+from honeybee_ph.properties.aperture import AperturePsiInstalls
+from honeybee_ph.window_library import PhWindowLibrary, compact_model_dict, content_hash, is_compact
+
+
+def _construction(_name, _frame_u=1.0):
+    construction = WindowConstruction(_name, [EnergyWindowMaterialSimpleGlazSys(_name + "_Glass", 0.8, 0.5)])
+    construction.properties.ph.ph_frame = PhWindowFrame("Frame")
+    for element in construction.properties.ph.ph_frame.elements:
+        element.u_factor = _frame_u
+    construction.properties.ph.ph_glazing = PhWindowGlazing("Glazing")
+    return construction
+
+
+def _model():
+    install_type = PhApertureInstallType("Mid_Wall")
+    install_type.psi_install = 0.025
+
+    constructions = [_construction("Window_A"), _construction("Window_B"), _construction("Window_C", 0.8)]
+    rooms = []
+    for i, construction in enumerate(constructions):
+        room = Room.from_box("Room_{}".format(i), 5, 5, 3, origin=Point3D(i * 5, 0, 0))
+        room.faces[1].apertures_by_ratio(0.4)
+        for aperture in room.faces[1].apertures:
+            aperture.properties.energy.construction = construction
+            aperture.properties.ph.install_types.top = install_type.duplicate()
+            aperture.properties.ph.install_types.bottom = install_type.duplicate()
+        rooms.append(room)
+    return Model("WindowModel", rooms=rooms)
+
+
+def test_content_hash_ignores_key_order():
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_compact_model_dict_deduplicates():
+    model_dict = _model().to_dict()
+    compact = compact_model_dict(model_dict)
+
+    assert is_compact(compact)
+    assert not is_compact(model_dict)
+    library = compact["properties"]["ph"]["window_library"]
+
+    # -- Two distinct frames share the identifier 'Frame', and the frame elements are shared
+    assert len(library["frames"]) == 2
+    assert len(library["frame_elements"]) == 2
+    assert len(library["glazings"]) == 1
+    assert len(library["install_types"]) == 1
+    assert len(json.dumps(compact)) < len(json.dumps(model_dict))
+
+    # -- Already compact dicts are returned as they are
+    assert compact_model_dict(compact) is compact
+
+
+def test_compact_model_dict_round_trip():
+    model = _model()
+    new_model = Model.from_dict(compact_model_dict(model.to_dict()))
+
+    assert new_model.to_dict() == model.to_dict()
+
+    # -- Constructions and apertures share the library objects
+    aps = new_model.apertures
+    frame_a = aps[0].properties.energy.construction.properties.ph.ph_frame
+    frame_b = aps[1].properties.energy.construction.properties.ph.ph_frame
+    assert frame_a is frame_b
+    assert aps[0].properties.ph.install_types.top is aps[1].properties.ph.install_types.bottom
+    assert aps[0].properties.ph.install_types.top.psi_install == 0.025
+
+
+def test_compact_model_dict_round_trip_construction_set_only_window():
+    model = _model()
+    construction_set = ConstructionSet("PH_Set")
+    construction_set.aperture_set.skylight_construction = _construction("Skylight", 0.7)
+    model.rooms[0].properties.energy.construction_set = construction_set
+
+    new_model = Model.from_dict(compact_model_dict(model.to_dict()))
+
+    new_set = new_model.rooms[0].properties.energy.construction_set
+    prop_ph = new_set.aperture_set.skylight_construction.properties.ph
+    assert not prop_ph.has_library_refs
+    assert prop_ph.ph_frame.top.u_factor == 0.7
+    assert new_model.to_dict() == model.to_dict()
+
+
+def test_window_construction_unresolved_reference_to_dict():
+    construction = _construction("Window_A")
+    prop_ph = construction.properties.ph.__class__.from_dict(
+        {"type": "WindowConstructionPhProperties", "id_num": 0, "ph_frame_ref": "Frame"}, construction
+    )
+    with pytest.raises(ValueError):
+        prop_ph.to_dict()
+
+
+def test_window_library_from_dict():
+    compact = compact_model_dict(_model().to_dict())
+    library = PhWindowLibrary.from_model_dict(compact)
+
+    assert len(library.frames) == 2
+    frame = library.frames["Frame"]
+    assert frame.top is frame.bottom
+    assert PhWindowLibrary.from_model_dict(_model().to_dict()) is None
+
+
+def test_iter_hbjson_rooms_compact(tmp_path):
+    path = str(tmp_path / "compact.hbjson")
+    with open(path, "w") as f:
+        json.dump(compact_model_dict(_model().to_dict()), f)
+
+    rooms = list(hbjson_stream.iter_hbjson_rooms(path))
+    assert rooms[0].faces[1].apertures[0].properties.ph.install_types.top.psi_install == 0.025
+
+
+def test_aperture_install_type_reference_without_library():
+    with pytest.raises(ValueError):
+        AperturePsiInstalls.from_dict({"top": "Mid_Wall"})
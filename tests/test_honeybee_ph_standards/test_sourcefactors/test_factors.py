@@ -46,3 +46,58 @@ def test_FactorCollection_get_existing_factor():
     factor = factor_collection.get_factor("ABC")
     assert factor.value == 1.0
     assert factor.unit == "KWH/KWH"
+
+
+def test_FactorCollection_index_uses_clean_fuel_names():
+    factor_collection = factors.FactorCollection()
+    factor_collection.add_factor(factors.Factor("natural gas", 1.1, "KWH/KWH"))
+    assert factor_collection.get_value("Natural Gas ") == 1.1
+    assert factor_collection.get_factor("NATURAL_GAS") is factor_collection.factors[0]
+
+    # -- The index follows added, replaced and edited factors
+    factor_collection.add_factor(factors.Factor("wood", 0.2, "KWH/KWH"))
+    factor_collection.add_factor(factors.Factor("natural gas", 1.2, "KWH/KWH"))
+    factor_collection.get_factor("WOOD").value = 0.3
+    assert factor_collection.get_value("natural gas") == 1.2
+    assert factor_collection.get_value("wood") == 0.3
+
+    new_collection = factors.FactorCollection.from_dict(factor_collection.to_dict())
+    assert sorted(new_collection.index.keys()) == ["NATURAL_GAS", "WOOD"]
+    assert factor_collection.duplicate().get_value("WOOD") == 0.3
+
+
+def test_convert_energy_table():
+    source_energy_factors = factors.FactorCollection(
+        "Source_Energy", factors.build_factors_from_library({"ELECTRICITY_MIX": {"value": 2.0, "unit": "kWh/kWh"}})
+    )
+    source_energy_factors.add_factor(factors.Factor("NATURAL_GAS", 1.1, "KWH/KWH"))
+    co2e_factors = factors.FactorCollection("CO2")
+    co2e_factors.add_factor(factors.Factor("ELECTRICITY_MIX", 500.0, "G/KWH"))
+    co2e_factors.add_factor(factors.Factor("NATURAL_GAS", 200.0, "G/KWH"))
+    table = {"Electricity Mix": [100.0, 0.0, 10.0], "natural gas": [0.0, 1000.0, 10.0]}
+
+    assert source_energy_factors.convert_table(table) == {
+        "ELECTRICITY_MIX": [200.0, 0.0, 20.0],
+        "NATURAL_GAS": [0.0, 1100.0, 11.0],
+    }
+    source_energy, co2e = factors.convert_energy_table(table, source_energy_factors, co2e_factors)
+    assert source_energy == pytest.approx([200.0, 1100.0, 31.0])
+    assert co2e == pytest.approx([50000.0, 200000.0, 7000.0])
+
+    with pytest.raises(ValueError):
+        factors.convert_energy_table({"OIL": [1.0]}, source_energy_factors, co2e_factors)
+
+
+def test_convert_energy_table_rejects_short_columns():
+    collection = factors.FactorCollection()
+    collection.add_factor(factors.Factor("ELECTRICITY_MIX", 2.0, "KWH/KWH"))
+    collection.add_factor(factors.Factor("NATURAL_GAS", 1.1, "KWH/KWH"))
+    table = {"ELECTRICITY_MIX": [1.0, 2.0, 3.0], "NATURAL_GAS": [1.0, 2.0]}
+
+    with pytest.raises(ValueError):
+        collection.convert_table(table)
+    with pytest.raises(ValueError):
+        factors.row_totals(table)
+    with pytest.raises(ValueError):
+        factors.convert_energy_table(table, collection, collection)
+    assert factors.row_totals({}) == []
@@ -163,6 +163,77 @@ def test_effective_frame_without_ph_frame_raises():
         aperture_psi_install.resolve_effective_frame(hb_aperture)
 
 
+def test_effective_frame_is_shared_and_read_only():
+    hb_aperture_1 = _build_hb_aperture(_psi_install=0.04)
+    hb_aperture_2 = _build_hb_aperture(_psi_install=0.04)
+    hb_aperture_1.properties.ph.install_types.bottom = _install_type("Sill", 0.01)
+    hb_aperture_2.properties.ph.install_types.bottom = _install_type("Sill", 0.01)
+
+    effective_frame = aperture_psi_install.resolve_effective_frame(hb_aperture_1)
+    assert aperture_psi_install.resolve_effective_frame(hb_aperture_2) is effective_frame
+    assert isinstance(effective_frame, window.PhWindowFrame)
+
+    with pytest.raises(AttributeError):
+        effective_frame.bottom.psi_install = 0.5
+    with pytest.raises(AttributeError):
+        effective_frame.top = window.PhWindowFrameElement("new")
+
+    editable = effective_frame.duplicate()
+    editable.bottom.psi_install = 0.5
+    assert effective_frame.bottom.psi_install == 0.01
+
+
+def test_effective_frame_cache_follows_changes():
+    hb_aperture = _build_hb_aperture(_psi_install=0.04)
+    install_type = _install_type("Sill", 0.01)
+    hb_aperture.properties.ph.install_types.bottom = install_type
+    effective_frame = aperture_psi_install.resolve_effective_frame(hb_aperture)
+
+    install_type.psi_install = 0.02
+    assert aperture_psi_install.resolve_effective_frame(hb_aperture).bottom.psi_install == 0.02
+
+    aperture_psi_install.get_ph_frame(hb_aperture).top.u_factor = 0.7
+    new_frame = aperture_psi_install.resolve_effective_frame(hb_aperture)
+    assert new_frame.top.u_factor == 0.7
+    assert new_frame is not effective_frame
+
+
+def test_effective_frame_does_not_share_user_data():
+    aperture_psi_install.clear_effective_frame_cache()
+    hb_aperture_1 = _build_hb_aperture(_psi_install=0.04)
+    hb_aperture_2 = _build_hb_aperture(_psi_install=0.04)
+    aperture_psi_install.get_ph_frame(hb_aperture_1).user_data = {"source": "Aperture 1"}
+    aperture_psi_install.get_ph_frame(hb_aperture_2).user_data = {"source": "Aperture 2"}
+
+    effective_frame = aperture_psi_install.resolve_effective_frame(hb_aperture_1)
+    assert aperture_psi_install.resolve_effective_frame(hb_aperture_2) is effective_frame
+    assert effective_frame.user_data == {}
+
+
+def test_resolve_all():
+    from honeybee.model import Model
+    from honeybee.room import Room
+
+    room = Room.from_box("room", 5, 5, 3)
+    room.faces[1].apertures_by_ratio(0.4)
+    room.faces[2].apertures_by_ratio(0.4)
+    construction = _build_hb_aperture().properties.energy.construction
+    for aperture in room.faces[1].apertures + room.faces[2].apertures:
+        aperture.properties.energy.construction = construction
+    room.faces[2].apertures[0].properties.ph.install_types.left = _install_type("Party Wall", 0.0)
+    room.faces[3].apertures_by_ratio(0.4)
+    model = Model("model", rooms=[room])
+
+    frames = aperture_psi_install.resolve_all(model)
+    assert len(frames) == 3
+    frame_1 = frames[room.faces[1].apertures[0].identifier]
+    frame_2 = frames[room.faces[2].apertures[0].identifier]
+    assert frame_1.left.psi_install == 0.04
+    assert frame_2.left.psi_install == 0.0
+    assert frame_1 is aperture_psi_install.resolve_effective_frame(room.faces[1].apertures[0])
+    assert frames[room.faces[3].apertures[0].identifier] is None
+
+
 # -----------------------------------------------------------------------------
 # -- ISO 10077-1 integration
 
@@ -0,0 +1,173 @@
+import pytest
+from ladybug_geometry.geometry3d.face import Face3D
+from ladybug_geometry.geometry3d.pointvector import Point3D
+from ladybug_geometry.geometry3d.polyline import LineSegment3D, Polyline3D
+
+from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge
+from honeybee_ph import space
+from honeybee_ph_utils import geometry_encoding
+from honeybee_phhvac import hot_water_piping
+from honeybee_phhvac.ducting import PhDuctElement, PhDuctSegment
+
+
+def _face(_x=0.0, _size=10.0):
+    return Face3D(
+        [
+            Point3D(_x, 0, 0),
+            Point3D(_x + _size, 0, 0),
+            Point3D(_x + _size, _size, 0),
+            Point3D(_x, _size, 0),
+        ]
+    )
+
+
+def _pipe_trunk():
+    trunk = hot_water_piping.PhHvacPipeTrunk()
+    trunk.pipe_element.add_segment(
+        hot_water_piping.PhHvacPipeSegment(LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(5, 0, 0)))
+    )
+    branch = hot_water_piping.PhHvacPipeBranch()
+    branch.pipe_element.add_segment(
+        hot_water_piping.PhHvacPipeSegment(LineSegment3D.from_end_points(Point3D(5, 0, 0), Point3D(5, 5, 0)))
+    )
+    trunk.add_branch(branch)
+    return trunk
+
+
+def _space():
+    seg = space.SpaceFloorSegment()
+    seg.geometry = _face()
+    floor = space.SpaceFloor()
+    floor.add_floor_segment(seg)
+    floor.geometry = _face()
+    vol = space.SpaceVolume()
+    vol.floor = floor
+    vol.avg_ceiling_height = 2.5
+    vol.geometry = [_face(), _face(10.0)]
+    sp = space.Space()
+    sp.add_new_volumes([vol])
+    return sp
+
+
+# -- VertexTable
+
+
+def test_vertex_table_deduplicates():
+    table = geometry_encoding.VertexTable()
+    assert table.add((1, 2, 3)) == 0
+    assert table.add((4, 5, 6)) == 1
+    assert table.add([1.0, 2.0, 3.0]) == 0
+    assert len(table) == 2
+
+
+def test_vertex_table_round_trip_float64():
+    table = geometry_encoding.VertexTable()
+    table.add((0.1, 1.0 / 3.0, -12345.6789))
+    new_table = geometry_encoding.VertexTable.from_dict(table.to_dict("float64"))
+    assert new_table.vertices == table.vertices
+
+
+def test_vertex_table_round_trip_float32():
+    table = geometry_encoding.VertexTable()
+    table.add((0.1, 1.0 / 3.0, -12345.6789))
+    d = table.to_dict("float32")
+    assert d["dtype"] == "float32"
+    new_table = geometry_encoding.VertexTable.from_dict(d)
+    assert new_table.vertices[0] == pytest.approx(table.vertices[0], rel=1e-6)
+
+
+def test_vertex_table_unsupported_dtype():
+    with pytest.raises(ValueError):
+        geometry_encoding.VertexTable().to_dict("int8")
+
+
+def test_vertex_table_bad_count():
+    d = geometry_encoding.VertexTable().to_dict()
+    d["count"] = 3
+    with pytest.raises(ValueError):
+        geometry_encoding.VertexTable.from_dict(d)
+
+
+# -- pack / unpack
+
+
+def test_plain_dict_is_unchanged_by_unpack():
+    d = _face().to_dict()
+    assert not geometry_encoding.is_packed(d)
+    assert geometry_encoding.unpack_geometry(d) is d
+    assert geometry_encoding.encode_geometry(d, None) is d
+
+
+def test_pack_unpack_face_with_holes():
+    face = Face3D(
+        [Point3D(0, 0, 0), Point3D(10, 0, 0), Point3D(10, 10, 0), Point3D(0, 10, 0)],
+        holes=[[Point3D(2, 2, 0), Point3D(4, 2, 0), Point3D(4, 4, 0), Point3D(2, 4, 0)]],
+    )
+    d = face.to_dict()
+    packed = geometry_encoding.pack_geometry(d)
+
+    assert geometry_encoding.is_packed(packed)
+    assert all(isinstance(i, int) for i in packed["boundary"])
+    assert Face3D.from_dict(geometry_encoding.unpack_geometry(packed)).area == pytest.approx(face.area)
+
+
+def test_pack_does_not_modify_input():
+    d = _face().to_dict()
+    boundary = [list(pt) for pt in d["boundary"]]
+    geometry_encoding.pack_geometry(d)
+    assert [list(pt) for pt in d["boundary"]] == boundary
+
+
+# -- Honeybee-PH objects
+
+
+def test_pipe_trunk_packed_round_trip():
+    trunk = _pipe_trunk()
+    d1 = trunk.to_dict()
+    packed = trunk.to_dict(geometry_encoding="float64")
+
+    assert geometry_encoding.is_packed(packed)
+    # -- The shared end-point of the trunk and branch is stored once
+    assert packed["vertex_table"]["count"] < 4 * 2
+
+    trunk2 = hot_water_piping.PhHvacPipeTrunk.from_dict(packed)
+    assert trunk2.to_dict() == d1
+
+
+def test_duct_element_packed_round_trip():
+    ele = PhDuctElement("duct")
+    ele.add_segment(PhDuctSegment(LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(0, 0, 12))))
+    d1 = ele.to_dict()
+
+    ele2 = PhDuctElement.from_dict(ele.to_dict(geometry_encoding="float32"))
+    assert ele2.to_dict() == d1
+
+
+def test_thermal_bridge_packed_round_trip():
+    for geom in (
+        LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(3, 0, 0)),
+        Polyline3D([Point3D(0, 0, 0), Point3D(3, 0, 0), Point3D(3, 3, 0)]),
+    ):
+        tb = PhThermalBridge("tb_1", geom)
+        d1 = tb.to_dict()
+        tb2 = PhThermalBridge.from_dict(tb.to_dict(geometry_encoding="float64"))
+        assert tb2.to_dict() == d1
+
+
+def test_space_packed_round_trip_with_mesh():
+    sp = _space()
+    d1 = sp.to_dict(include_mesh=True)
+    packed = sp.to_dict(include_mesh=True, geometry_encoding="float64")
+
+    assert geometry_encoding.is_packed(packed)
+    assert "vertex_table" not in packed["volumes"][0]
+
+    sp2 = space.Space.from_dict(packed, None)
+    assert sp2.to_dict(include_mesh=True) == d1
+    assert sp2.net_floor_area == pytest.approx(sp.net_floor_area)
+
+
+def test_space_volume_from_plain_dict():
+    vol = _space().volumes[0]
+    vol2 = space.SpaceVolume.from_dict(vol.to_dict())
+    assert vol2.to_dict() == vol.to_dict()
@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from honeybee_ph_utils.input_tools import BoundedCache, memoize
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = BoundedCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # -- 'a' is now the most-recently-used
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get("b", "missing") == "missing"
+    assert len(cache) == 2
+
+
+def test_bounded_cache_size_error():
+    with pytest.raises(ValueError):
+        BoundedCache(0)
+
+
+def test_memoize_outside_grasshopper():
+    calls = []
+
+    @memoize
+    def square(x, power=2):
+        calls.append(x)
+        return x**power
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(3, power=3) == 27
+    assert calls == [3, 3]
+    assert square.__name__ == "square"
+    assert len(square.cache) == 2
+
+
+def test_memoize_thread_pool():
+    @memoize
+    def double(x):
+        return x * 2
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(double, [i % 10 for i in range(1000)]))
+    assert results == [(i % 10) * 2 for i in range(1000)]
+    assert len(double.cache) == 10
@@ -0,0 +1,89 @@
+import pytest
+from ladybug_geometry.geometry2d.pointvector import Point2D
+from ladybug_geometry.geometry2d.polygon import Polygon2D
+
+from honeybee_ph_utils import polygon2d_tools
+from honeybee_ph_utils.polygon2d_tools import cluster_polygon2Ds, merge_polygon2Ds_by_cluster
+
+TOL = 0.01
+
+
+def _rect(_x, _y, _w=1.0, _h=1.0):
+    return Polygon2D([Point2D(_x, _y), Point2D(_x + _w, _y), Point2D(_x + _w, _y + _h), Point2D(_x, _y + _h)])
+
+
+def _floor_plates():
+    # -- Two rows of 10 overlapping 'rooms' each, far apart, plus one separate room.
+    polygons = [_rect(i * 0.9, 0) for i in range(10)]
+    polygons += [_rect(i * 0.9, 50) for i in range(10)]
+    polygons.append(_rect(100, 100))
+    return polygons
+
+
+def test_cluster_polygon2Ds():
+    clusters = cluster_polygon2Ds(_floor_plates(), TOL)
+    assert clusters == [list(range(10)), list(range(10, 20)), [20]]
+
+
+def test_cluster_polygon2Ds_chained_overlap():
+    # -- The first and last don't overlap, but are joined through the middle one
+    clusters = cluster_polygon2Ds([_rect(0, 0), _rect(5, 0), _rect(0.9, 0, 4.2)], TOL)
+    assert clusters == [[0, 1, 2]]
+
+
+def _courtyard_with_tail(_x=0.0):
+    # -- 8 squares around an open courtyard, plus a tail of 6 squares
+    ring = [_rect(_x + i, j) for i in range(3) for j in range(3) if (i, j) != (1, 1)]
+    tail = [_rect(_x + 3 + i, 0) for i in range(6)]
+    return ring + tail
+
+
+@pytest.mark.parametrize(
+    "polygons",
+    [
+        _courtyard_with_tail(),
+        _courtyard_with_tail() + [_rect(10 + i, j) for i in range(3) for j in range(3) if (i, j) != (1, 1)],
+    ],
+)
+def test_merge_keeps_courtyard_holes(polygons):
+    tolerance = 0.001
+    expected = Polygon2D.boolean_union_all(list(polygons), tolerance)
+
+    merged = polygon2d_tools.merge_polygon_2ds(polygons, tolerance)
+
+    assert sorted(p.area for p in merged) == pytest.approx(sorted(p.area for p in expected))
+    assert sorted(p.area for p in merged)[0] == pytest.approx(1.0)
+
+
+def test_merge_polygon2Ds_by_cluster():
+    result = merge_polygon2Ds_by_cluster(_floor_plates(), TOL)
+    assert result.succeeded
+    assert len(result.polygon2Ds) == 3
+    assert [p.area for p in result.polygon2Ds] == pytest.approx([9.1, 9.1, 1.0], abs=TOL)
+
+
+def test_merge_polygon2Ds_by_cluster_process_pool():
+    result = merge_polygon2Ds_by_cluster(_floor_plates(), TOL, _processes=2)
+    assert result.succeeded
+    assert [p.area for p in result.polygon2Ds] == pytest.approx([9.1, 9.1, 1.0], abs=TOL)
+
+
+def test_merge_polygon2Ds_by_cluster_reports_failed_clusters(monkeypatch):
+    original = Polygon2D.boolean_union_all
+
+    def _union_all(polygons, tolerance):
+        if any(p.min.y > 10 for p in polygons):
+            raise ValueError("Bad geometry")
+        return original(polygons, tolerance)
+
+    monkeypatch.setattr(Polygon2D, "boolean_union_all", staticmethod(_union_all))
+    result = merge_polygon2Ds_by_cluster(_floor_plates(), TOL)
+
+    assert not result.succeeded
+    assert list(result.failed_clusters) == [1]
+    assert "Bad geometry" in result.failed_clusters[1]
+    # -- The other clusters are still merged, the failed one is kept unmerged
+    assert len(result.polygon2Ds) == 1 + 10 + 1
+
+    with pytest.warns(UserWarning):
+        polygon2d_tools.merge_polygon_2ds(_floor_plates(), TOL)
@@ -0,0 +1,188 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
+from ladybug_geometry.geometry3d.polyline import LineSegment3D
+
+from honeybee_energy_ph.construction.thermal_bridge import PhThermalBridge
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_phhvac.heating import PhHeatingSystemBuilder, PhHeatingDirectElectric
+from honeybee_ph_utils import profiling
+
+SEGMENT_TO_DICT = "honeybee_ph.bldg_segment.BldgSegment.to_dict"
+SEGMENT_FROM_DICT = "honeybee_ph.bldg_segment.BldgSegment.from_dict"
+TB_TO_DICT = "honeybee_energy_ph.construction.thermal_bridge.PhThermalBridge.to_dict"
+
+
+def _segment(_num_tbs=2):
+    seg = BldgSegment()
+    for i in range(_num_tbs):
+        line = LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(i + 1, 0, 0))
+        seg.add_new_thermal_bridge(PhThermalBridge("tb-{}".format(i), line))
+    return seg
+
+
+def test_profiler_records_calls_and_objects():
+    seg = _segment(3)
+    with profiling.Profiler() as prof:
+        d = seg.to_dict()
+        BldgSegment.from_dict(d)
+
+    results = prof.to_dict()
+    assert results["calls"][SEGMENT_TO_DICT]["count"] == 1
+    assert results["calls"][SEGMENT_FROM_DICT]["count"] == 1
+    assert results["calls"][TB_TO_DICT]["count"] == 3
+    assert results["calls"][SEGMENT_TO_DICT]["cumulative_time_s"] > 0
+    assert results["objects"]["honeybee_ph.bldg_segment.BldgSegment"] == 1
+    assert results["objects"]["honeybee_energy_ph.construction.thermal_bridge.PhThermalBridge"] == 3
+
+
+def test_profiler_restores_originals():
+    original_to_dict = BldgSegment.__dict__["to_dict"]
+    original_from_dict = BldgSegment.__dict__["from_dict"]
+    had_init = "__init__" in PhThermalBridge.__dict__
+
+    with profiling.Profiler():
+        assert BldgSegment.__dict__["to_dict"] is not original_to_dict
+
+    assert BldgSegment.__dict__["to_dict"] is original_to_dict
+    assert BldgSegment.__dict__["from_dict"] is original_from_dict
+    assert ("__init__" in PhThermalBridge.__dict__) == had_init
+    assert profiling.active_profiler() is None
+
+
+def test_profiler_nothing_recorded_when_stopped():
+    prof = profiling.Profiler()
+    with prof:
+        pass
+    _segment().to_dict()
+    assert prof.to_dict()["calls"] == {}
+
+
+def test_classmethods_and_builders_still_work():
+    heater = PhHeatingDirectElectric()
+    with profiling.Profiler() as prof:
+        new_heater = PhHeatingSystemBuilder.from_dict(heater.to_dict())
+        new_seg = BldgSegment.from_dict(_segment().to_dict())
+
+    assert isinstance(new_heater, PhHeatingDirectElectric)
+    assert isinstance(new_seg, BldgSegment)
+    assert prof.calls["honeybee_phhvac.heating.PhHeatingSystemBuilder.from_dict"].count == 1
+
+
+def test_transforms_are_instrumented():
+    seg = _segment()
+    with profiling.Profiler() as prof:
+        seg.move(Vector3D(1, 0, 0))
+    assert prof.calls["honeybee_ph.bldg_segment.BldgSegment.move"].count == 1
+
+
+def test_only_one_profiler_may_run():
+    with profiling.Profiler():
+        with pytest.raises(profiling.ProfilerError):
+            profiling.Profiler().start()
+
+
+def test_recursive_time_is_not_double_counted():
+    prof = profiling.Profiler()
+
+    def _recurse(n):
+        if n:
+            return wrapped(n - 1)
+        return 0
+
+    wrapped = prof._timed(_recurse, "recurse")
+    wrapped(5)
+    stats = prof.calls["recurse"]
+    assert stats.count == 6
+    assert stats._local.depth == 0
+    assert stats.cumulative_time < 1.0
+
+
+def test_overlapping_calls_on_threads_are_each_timed():
+    prof = profiling.Profiler()
+    first_entered = threading.Event()
+    release_first = threading.Event()
+
+    def _work(_wait):
+        if _wait:
+            first_entered.set()
+            release_first.wait(5)
+        else:
+            time.sleep(0.05)
+
+    wrapped = prof._timed(_work, "work")
+    first = threading.Thread(target=wrapped, args=(True,))
+    first.start()
+    first_entered.wait(5)
+    # -- The second call starts and ends while the first is still running
+    second = threading.Thread(target=wrapped, args=(False,))
+    second.start()
+    second.join()
+    release_first.set()
+    first.join()
+
+    stats = prof.calls["work"]
+    assert stats.count == 2
+    assert stats.cumulative_time >= 0.1
+
+
+def test_reset():
+    with profiling.Profiler(trace=True) as prof:
+        _segment().to_dict()
+        prof.reset()
+    assert prof.to_dict()["calls"] == {}
+    assert prof.trace_events == []
+
+
+def test_write_json_and_chrome_trace(tmp_path):
+    with profiling.Profiler(trace=True) as prof:
+        _segment(2).to_dict()
+
+    json_path = prof.write_json(str(tmp_path / "profile.json"))
+    with open(json_path) as f:
+        data = json.load(f)
+    assert data["calls"][TB_TO_DICT]["count"] == 2
+
+    trace_path = prof.write_chrome_trace(str(tmp_path / "profile.trace.json"))
+    with open(trace_path) as f:
+        trace = json.load(f)
+    events = trace["traceEvents"]
+    assert len(events) == sum(s.count for s in prof.calls.values())
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    names = [e["name"] for e in events]
+    assert names.count("bldg_segment.BldgSegment.to_dict") == 1
+    assert names.count("construction.thermal_bridge.PhThermalBridge.to_dict") == 2
+
+    assert "BldgSegment.to_dict" in prof.report()
+
+
+def test_max_trace_events():
+    with profiling.Profiler(trace=True, max_trace_events=1) as prof:
+        _segment(2).to_dict()
+    assert len(prof.trace_events) == 1
+    assert prof.dropped_trace_events == sum(s.count for s in prof.calls.values()) - 1
+
+
+def test_enable_from_environment_disabled(monkeypatch):
+    monkeypatch.delenv(profiling.ENV_VAR, raising=False)
+    assert profiling.enable_from_environment() is None
+    monkeypatch.setenv(profiling.ENV_VAR, "0")
+    assert profiling.enable_from_environment() is None
+
+
+def test_enable_from_environment_writes_at_exit(tmp_path):
+    out_path = tmp_path / "env_profile.json"
+    script = "import honeybee_ph.bldg_segment as b; b.BldgSegment().to_dict()"
+    env = dict(os.environ)
+    env[profiling.ENV_VAR] = str(out_path)
+    subprocess.check_call([sys.executable, "-c", script], env=env)
+
+    with open(str(out_path)) as f:
+        data = json.load(f)
+    assert data["calls"][SEGMENT_TO_DICT]["count"] == 1
@@ -0,0 +1,88 @@
+import pytest
+from honeybee_energy.lib.programtypes import office_program
+from honeybee_energy.schedule.fixedinterval import ScheduleFixedInterval
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+
+from honeybee_energy_ph.load.phius_mf import PhiusNonResProgram
+from honeybee_ph_utils import schedule_statistics as ss
+from honeybee_ph_utils.histogram import generate_histogram
+
+
+def test_statistics_match_expanded_values():
+    schedule = office_program.lighting.schedule
+    values = schedule.values()
+    stats = ss.ScheduleStatisticsCache().get(schedule)
+
+    assert stats.identifier == schedule.identifier
+    assert stats.value_count == 8760
+    assert stats.full_load_hours == sum(values)
+    assert stats.mean == sum(values) / len(values)
+    assert stats.peak == max(values)
+    assert stats.minimum == min(values)
+    assert stats.daily_operating_hours == pytest.approx(24 * sum(values) / len(values))
+    assert stats.histogram == generate_histogram(values, 4)
+
+
+def test_fixed_interval_schedule():
+    schedule = ScheduleFixedInterval("fixed", [0.5] * 4380 + [1.0] * 4380)
+    stats = ss.ScheduleStatisticsCache().get(schedule)
+    assert stats.value_count == 8760
+    assert stats.mean == pytest.approx(0.75)
+    assert stats.peak == 1.0
+
+
+def test_empty_values():
+    stats = ss.ScheduleStatistics.from_values("empty", [])
+    assert stats.mean == 0.0
+    assert stats.daily_operating_hours == 0.0
+    assert stats.histogram == {}
+
+
+def test_cache_hits_and_misses():
+    cache = ss.ScheduleStatisticsCache()
+    schedule = ScheduleRuleset.from_constant_value("constant", 0.5)
+
+    first = cache.get(schedule)
+    assert cache.get(schedule) is first
+    assert cache.get(schedule.duplicate()) is first  # -- Same identifier and content
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert schedule in cache
+
+
+def test_edited_schedule_is_recalculated():
+    cache = ss.ScheduleStatisticsCache()
+    schedule = ScheduleRuleset.from_constant_value("constant", 0.5)
+    assert cache.get(schedule).mean == pytest.approx(0.5)
+
+    schedule.default_day_schedule.replace_value(0, 1.0)
+    assert cache.get(schedule).mean == pytest.approx(1.0)
+    assert cache.misses == 2
+
+
+def test_least_recently_used_is_evicted():
+    cache = ss.ScheduleStatisticsCache(2)
+    a, b, c = [ScheduleRuleset.from_constant_value(n, 0.1) for n in "abc"]
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)  # -- 'b' is now the least-recently-used
+    cache.get(c)
+
+    assert len(cache) == 2
+    assert a in cache and c in cache and b not in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        ss.ScheduleStatisticsCache(0)
+
+
+def test_phius_non_res_program_uses_statistics():
+    schedule = office_program.lighting.schedule
+    values = schedule.values()
+    program = PhiusNonResProgram()
+    assert program._operating_hours_day_from_hb_schedule(schedule) == sum(values) / len(values) * 24
+    assert schedule in ss.SCHEDULE_STATISTICS
@@ -0,0 +1,177 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from honeybee_ph_utils.sky_matrix_cache import (
+    MTX_HEADER_LINE_COUNT,
+    PATCH_ROW_COEFF,
+    PATCHES_PER_ROW,
+    SkyMatrixCache,
+    broadband_radiation,
+    file_content_hash,
+    iter_mtx_values,
+    parse_mtx_lines,
+    run_gendaymtx,
+    sky_matrix_cache_key,
+)
+
+
+def _fake_mtx_text(_sky_density=1):
+    header = [
+        "#?RADIANCE",
+        "gendaymtx -m 1 -d -O1 -A test.wea",
+        "LATLONG= 40.0 -75.0",
+        "NROWS=146",
+        "NCOLS=1",
+        "NCOMP=3",
+        "FORMAT=ascii",
+        "",
+        "0.5 0.5 0.5",  # -- ground patch
+    ]
+    assert len(header) == MTX_HEADER_LINE_COUNT
+    patches = []
+    for i in range(sum(PATCHES_PER_ROW[_sky_density])):
+        patches.append("{} {} {}".format(i * 0.1, i * 0.2, i * 0.3))
+    return "\n".join(header + patches) + "\n"
+
+
+def _expected_values(_text, _wea_duration, _sky_density=1):
+    patch_lines = _text.split("\n")[MTX_HEADER_LINE_COUNT:-1]
+    values = []
+    counter = 0
+    for row_number, row_count in enumerate(PATCHES_PER_ROW[_sky_density]):
+        for line in patch_lines[counter : counter + row_count]:
+            values.append(broadband_radiation(line, row_number, _wea_duration, _sky_density))
+        counter += row_count
+    return values
+
+
+@pytest.fixture
+def gendaymtx_stand_in(tmp_path):
+    """A local executable which prints a fixed gendaymtx-style matrix."""
+    data_file = tmp_path / "mtx.txt"
+    data_file.write_text(_fake_mtx_text())
+    exe = tmp_path / "gendaymtx"
+    exe.write_text("#!{}\nimport sys\nsys.stdout.write(open({!r}).read())\n".format(sys.executable, str(data_file)))
+    exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+    return str(exe)
+
+
+# -----------------------------------------------------------------------------
+# -- Parser
+
+
+def test_parse_mtx_lines_matches_row_by_row_calculation():
+    text = _fake_mtx_text()
+    values = parse_mtx_lines(text.splitlines(), 8760)
+    assert len(values) == 145
+    assert values == pytest.approx(_expected_values(text, 8760))
+
+
+def test_parse_mtx_lines_accepts_bytes():
+    text = _fake_mtx_text()
+    lines = [l.encode("utf-8") for l in text.splitlines(True)]
+    assert parse_mtx_lines(lines, 100) == pytest.approx(parse_mtx_lines(text.splitlines(), 100))
+
+
+def test_iter_mtx_values_is_lazy():
+    consumed = []
+
+    def _lines():
+        for line in _fake_mtx_text().splitlines():
+            consumed.append(line)
+            yield line
+
+    values = iter_mtx_values(_lines(), 8760)
+    assert consumed == []
+    first = next(values)
+    assert len(consumed) == MTX_HEADER_LINE_COUNT + 1
+    assert first == pytest.approx(0.0)
+
+
+def test_parse_mtx_lines_first_row_coefficient():
+    text = _fake_mtx_text()
+    values = parse_mtx_lines(text.splitlines(), 1000)
+    weighted = 0.265074126 * 0.1 + 0.670114631 * 0.2 + 0.064811243 * 0.3
+    assert values[1] == pytest.approx(weighted * PATCH_ROW_COEFF[1][0])
+
+
+def test_parse_mtx_lines_too_short_raises():
+    lines = _fake_mtx_text().splitlines()[:50]
+    with pytest.raises(ValueError):
+        parse_mtx_lines(lines, 8760)
+
+    with pytest.raises(ValueError):
+        parse_mtx_lines(lines[:3], 8760)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Stand-in executable uses a shebang.")
+def test_run_gendaymtx_with_stand_in_executable(gendaymtx_stand_in, tmp_path):
+    values = run_gendaymtx(gendaymtx_stand_in, str(tmp_path / "test.wea"), 8760, 1, "-d")
+    assert values == pytest.approx(_expected_values(_fake_mtx_text(), 8760))
+
+
+# -----------------------------------------------------------------------------
+# -- Cache
+
+
+def test_file_content_hash(tmp_path):
+    a = tmp_path / "a.epw"
+    b = tmp_path / "b.epw"
+    a.write_text("LOCATION,Somewhere")
+    b.write_text("LOCATION,Somewhere")
+    assert file_content_hash(str(a)) == file_content_hash(str(b))
+    assert file_content_hash(str(a), _chunk_size=3) == file_content_hash(str(a))
+
+    b.write_text("LOCATION,Elsewhere")
+    assert file_content_hash(str(a)) != file_content_hash(str(b))
+
+
+def test_sky_matrix_cache_key_depends_on_all_inputs():
+    base = sky_matrix_cache_key("abc", (1, 12), 0.0, 1)
+    assert base == sky_matrix_cache_key("abc", (1, 12), 0, 1)
+    assert base != sky_matrix_cache_key("abd", (1, 12), 0.0, 1)
+    assert base != sky_matrix_cache_key("abc", (1, 6), 0.0, 1)
+    assert base != sky_matrix_cache_key("abc", (1, 12), 15.0, 1)
+    assert base != sky_matrix_cache_key("abc", (1, 12), 0.0, 2)
+    assert base != sky_matrix_cache_key("abc", (1, 12), 0.0, 1, 0.3)
+
+
+def test_sky_matrix_cache_round_trip(tmp_path):
+    cache = SkyMatrixCache(str(tmp_path / "cache"))
+    assert cache.get("missing") is None
+    assert len(cache) == 0
+
+    data = {"north": 0, "direct": [1.0, 2.0], "diffuse": [3.0, 4.0]}
+    path = cache.set("key", data)
+    assert os.path.exists(path)
+    assert len(cache) == 1
+
+    result = cache.get("key")
+    assert result["direct"] == [1.0, 2.0]
+    assert result["diffuse"] == [3.0, 4.0]
+
+    # -- A second instance (ie: a new process) sees the same entry
+    assert SkyMatrixCache(str(tmp_path / "cache")).get("key") == result
+
+
+def test_sky_matrix_cache_ignores_corrupt_and_old_files(tmp_path):
+    cache = SkyMatrixCache(str(tmp_path))
+    with open(cache.path_for("corrupt"), "w") as f:
+        f.write("{not json")
+    assert cache.get("corrupt") is None
+
+    with open(cache.path_for("old"), "w") as f:
+        f.write('{"cache_format_version": -1}')
+    assert cache.get("old") is None
+
+
+def test_sky_matrix_cache_clear(tmp_path):
+    cache = SkyMatrixCache(str(tmp_path / "cache"))
+    assert cache.clear() == 0
+    cache.set("a", {})
+    cache.set("b", {})
+    assert cache.clear() == 2
+    assert len(cache) == 0
@@ -0,0 +1,64 @@
+from honeybee_ph.bldg_segment import BldgSegment
+from honeybee_ph_utils import stable_hash
+from honeybee_phhvac import hot_water_devices, ventilation
+
+
+def test_canonical_dict_removes_identifiers():
+    d = {
+        "identifier": "abc",
+        "display_name": "abc",
+        "ph_bldg_segment_id": "xyz",
+        "devices": {"1": {"identifier": "1", "value": 2}, "2": {"identifier": "2", "value": 1}},
+        "values": [3, 2, 1],
+    }
+    assert stable_hash.canonical_dict(d) == {"devices": [{"value": 1}, {"value": 2}], "values": [3, 2, 1]}
+
+    d["display_name"] = "A Name"
+    assert stable_hash.canonical_dict(d)["display_name"] == "A Name"
+
+
+def test_equivalent_objects_have_the_same_hash():
+    v1 = ventilation.Ventilator()
+    v2 = ventilation.Ventilator()
+    assert v1.identifier != v2.identifier
+    assert v1.stable_hash() == v2.stable_hash()
+
+    v2.sensible_heat_recovery = 0.5
+    assert v1.stable_hash() != v2.stable_hash()
+
+
+def test_stable_hash_is_memoized_until_mutation():
+    seg = BldgSegment()
+    h1 = seg.stable_hash()
+    assert seg.stable_hash() == h1
+
+    seg.num_floor_levels = 3
+    h2 = seg.stable_hash()
+    assert h2 != h1
+
+    # -- In-place changes to containers and nested objects are detected too
+    seg.user_data["note"] = "changed"
+    h3 = seg.stable_hash()
+    assert h3 != h2
+
+    seg.set_points.winter = 18.0
+    assert seg.stable_hash() != h3
+
+
+def test_memo_does_not_change_equality():
+    t1 = hot_water_devices.PhHvacHotWaterTank()
+    t2 = t1.duplicate()
+    t1.stable_hash()
+    assert t1 == t2
+
+
+def test_unique_and_changed_objects():
+    v1, v2, v3 = ventilation.Ventilator(), ventilation.Ventilator(), ventilation.Ventilator()
+    v3.sensible_heat_recovery = 0.5
+    assert stable_hash.unique_by_stable_hash([v1, v2, v3]) == [v1, v3]
+
+    previous = stable_hash.stable_hashes([v1, v2, v3])
+    assert stable_hash.changed_objects([v1, v2, v3], previous) == []
+
+    v2.sensible_heat_recovery = 0.9
+    assert stable_hash.changed_objects([v1, v2, v3], previous) == [v2]